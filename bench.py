@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+bench.py - Kenni Command Benchmark
+
+Runs commands end to end through kenni.dispatch, with HTTP answered from
+recorded responses, and reports what each one costs the bot itself: CPU
+time and memory allocations, separately from the (simulated) network time.
+
+Record fixtures from the live services once:
+    ./bench.py --record
+then replay them as often as needed:
+    ./bench.py -n 20 --latency 0.15 '.ud hello' '.u 263A'
+"""
+import concurrent.futures
+import optparse
+import os
+import sys
+import time
+import tracemalloc
+
+home = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, home)
+
+import bot
+import irc
+import web
+from configs import Configs
+
+FIXTURES = '~/Kenni/fixtures'
+COMMANDS = ['.wiki Python (programming language)', '.ud hello', '.nws 10001',
+            '.cc btc', '.u 263A', '.title https://www.python.org/']
+SOURCE = 'bench!bench@bench.example'
+CHANNEL = '#bench'
+
+
+class BenchConfig(object):
+    nick = 'kenni'
+    ident = 'kenni'
+    name = 'Kenni benchmark'
+    channels = [CHANNEL]
+    host = 'bench.example'
+    port = 6667
+    prefix = r'\.'
+    owner = 'bench.example'
+    admins = []
+    sasl = False
+
+
+class BenchBot(bot.kenni):
+    '''A kenni that never connects: what it would send is collected in
+    `sent`, and every handler runs in the dispatching thread so a command
+    is done when dispatch returns (bar its async handlers).'''
+    def __init__(self, config):
+        self.sent = list()
+        bot.kenni.__init__(self, config)
+        for func in self.variables.values():
+            func.thread = False
+
+    def write(self, args, text=None, raw=False):
+        self.sent.append((' '.join(args), text))
+
+    def msg(self, recipient, text, log=False, x=False, wait_time=3):
+        self.sent.append((recipient, text))
+
+    def run_command(self, text):
+        origin = irc.Origin(self, SOURCE, ['PRIVMSG', CHANNEL, text])
+        self.dispatch(origin, (text, 'PRIVMSG', CHANNEL, text))
+        concurrent.futures.wait(list(self.tasks))
+        # Let replies queued by async handlers go out too
+        self.outbox.submit(lambda: None).result()
+
+
+def clear_caches():
+    web.cache.clear()
+    url = sys.modules.get('url')
+    if url is not None:
+        url.title_cache = url.TitleCache()
+
+
+def measure(kenni, text, warm):
+    '''Run `text` once, returning (wall, network, cpu) in seconds.'''
+    if not warm:
+        clear_caches()
+    network = web.transport.network
+    wall, cpu = time.time(), time.process_time()
+    kenni.run_command(text)
+    wall, cpu = time.time() - wall, time.process_time() - cpu
+    return wall, web.transport.network - network, cpu
+
+
+def allocations(kenni, text, warm):
+    '''Run `text` once under tracemalloc, returning (blocks, peak bytes).'''
+    if not warm:
+        clear_caches()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kenni.run_command(text)
+    after = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'lineno') if stat.count_diff > 0)
+    return blocks, peak
+
+
+def main(argv=None):
+    parser = optparse.OptionParser('%prog [options] [command ...]')
+    parser.add_option('-c', '--config', metavar='fn',
+        help='use this configuration file instead of a built-in one')
+    parser.add_option('-f', '--fixtures', metavar='dir', default=FIXTURES,
+        help='where recorded responses are kept (default %default)')
+    parser.add_option('-r', '--record', action='store_true',
+        help='fetch from the network and record responses, then stop')
+    parser.add_option('-n', '--runs', type='int', default=10,
+        help='times to run each command (default %default)')
+    parser.add_option('-l', '--latency', type='float', default=0,
+        help='seconds of simulated network delay per request')
+    parser.add_option('-w', '--warm', action='store_true',
+        help='keep the response and title caches between runs')
+    opts, commands = parser.parse_args(argv)
+    commands = commands or COMMANDS
+
+    if opts.config:
+        config_modules = list()
+        Configs([opts.config]).load_modules(config_modules)
+        config = config_modules[0]
+    else:
+        config = BenchConfig()
+
+    store = web.FixtureStore(opts.fixtures)
+    if opts.record:
+        web.set_transport(web.RecordTransport(store, overwrite=True))
+    else:
+        web.set_transport(web.ReplayTransport(store, opts.latency))
+
+    kenni = BenchBot(config)
+
+    if opts.record:
+        for text in commands:
+            del kenni.sent[:]
+            kenni.run_command(text)
+            print('%s -> %r' % (text, kenni.sent[-1][1] if kenni.sent else None))
+        return
+
+    print('%-36s %9s %9s %9s %9s %9s' % ('command', 'wall ms', 'net ms', 'cpu ms', 'blocks', 'peak KiB'))
+    for text in commands:
+        # The first run imports and warms up whatever the handler needs
+        kenni.run_command(text)
+        del kenni.sent[:]
+        times = [measure(kenni, text, opts.warm) for i in range(opts.runs)]
+        blocks, peak = allocations(kenni, text, opts.warm)
+        wall, network, cpu = (sorted(column)[len(column) // 2] for column in zip(*times))
+        print('%-36s %9.2f %9.2f %9.2f %9d %9.1f' % (text[:36], wall * 1000, network * 1000,
+                                                     cpu * 1000, blocks, peak / 1024.0))
+        if not kenni.sent:
+            print('    (no reply)')
+
+if __name__ == '__main__':
+    main()
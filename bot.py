@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 import time, sys, os, re, threading, imp
+import asyncio, concurrent.futures
 import irc, os
 import traceback
+import web
 
 home = os.getcwd()
 
@@ -25,6 +27,8 @@ class kenni(irc.Bot):
         self.stats = {}
         self.times = {}
         self.excludes = {}
+        self.tasks = set()
+        self.previewers = {}
         if hasattr(config, 'excludes'):
             self.excludes = config.excludes
         self.setup()
@@ -132,7 +136,12 @@ class kenni(irc.Bot):
             if not hasattr(func, 'priority'):
                 func.priority = 'medium'
 
-            if not hasattr(func, 'thread'):
+            if asyncio.iscoroutinefunction(func):
+                # async def handlers run on the web event loop instead
+                func.thread = False
+                if not hasattr(func, 'timeout'):
+                    func.timeout = 120
+            elif not hasattr(func, 'thread'):
                 func.thread = True
 
             if not hasattr(func, 'event'):
@@ -167,7 +176,7 @@ class kenni(irc.Bot):
                     elif len(func.rule) == 2 and isinstance(func.rule[0], list):
                         commands, pattern = func.rule
                         for command in commands:
-                            command = r'(?i)(%s)\b(?: +(?:%s))?' % (command, pattern)
+                            command = r'(%s)\b(?: +(?:%s))?' % (command, pattern)
                             bind_commandrule(self, func.priority, command, func)
 
                     # 3) e.g. ('$nick', ['p', 'q'], '(.*)')
@@ -175,20 +184,27 @@ class kenni(irc.Bot):
                         prefix, commands, pattern = func.rule
                         prefix = sub(prefix)
                         for command in commands:
-                            command = r'(?i)(%s) +' % command
-                            regexp = re.compile(prefix + command + pattern)
+                            # Python 3.11 only takes flags at the very start
+                            command = r'(%s) +' % command
+                            regexp = re.compile('(?i)' + prefix + command + pattern)
                             bind_rules(self, func.priority, regexp, func)
 
             if hasattr(func, 'commands'):
                 for command in func.commands:
                     bind_command(self, func.priority, command, func)
-    def wrapped(self, origin, text, match):
+    def wrapped(self, origin, text, match, asynchronous=False):
         class kenniWrapper(object):
             def __init__(self, kenni):
                 self._bot = kenni
 
             def __getattr__(self, attr):
                 sender = origin.sender or text
+                # msg() sleeps for flood control, which must not hold up
+                # the event loop async handlers run on
+                if attr == 'say' and asynchronous:
+                    return lambda msg: self._bot.msg_later(sender, msg)
+                if attr == 'msg' and asynchronous:
+                    return self._bot.msg_later
                 if attr == 'say':
                     return lambda msg: self._bot.msg(sender, msg)
                 return getattr(self._bot, attr)
@@ -261,13 +277,37 @@ class kenni(irc.Bot):
             print("Error attempting to block:", str(func.name))
             self.error(origin)
 
+        if asyncio.iscoroutinefunction(func):
+            return self.call_async(func, origin, kenni, input)
+
         try:
             func(kenni, input)
         except Exception as e:
             self.error(origin)
 
+    def call_async(self, func, origin, kenni, input):
+        coro = func(kenni, input)
+        if func.timeout:
+            coro = asyncio.wait_for(coro, func.timeout)
+        future = asyncio.run_coroutine_threadsafe(coro, web.get_loop())
+        self.tasks.add(future)
+
+        def done(future):
+            self.tasks.discard(future)
+            try: future.result()
+            except concurrent.futures.CancelledError: pass
+            except Exception as e:
+                self.outbox.submit(self.error, origin, traceback.format_exc())
+        future.add_done_callback(done)
+        return future
+
+    def cancel_tasks(self):
+        '''Cancel every async handler that is still running.'''
+        for future in list(self.tasks):
+            future.cancel()
+
     def dispatchcommand(self,origin,args,  text, match, event, func):
-        kenni = self.wrapped(origin, text, match)
+        kenni = self.wrapped(origin, text, match, asyncio.iscoroutinefunction(func))
         input = self.input(origin, text, match, event, args)
         nick = (input.nick).lower()
         # blocking ability
@@ -379,7 +419,7 @@ class kenni(irc.Bot):
                         prefix = self.config.prefix
                         if origin.sender in self.config.prefixes:
                             prefix = self.config.prefixes[origin.sender]
-                    commandrule = re.compile(prefix + commandrule)
+                    commandrule = re.compile('(?i)' + prefix + commandrule)
                     match = commandrule.match(text)
                     if match:
                         self.dispatchcommand(origin,args, text, match, event, func)
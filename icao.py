@@ -1,8253 +1,106 @@
 #!/usr/bin/env python3
-data = {
-    "AGAF": (-9.19138888889, 160.948333333),
-    "AGAR": (-9.85472222222, 161.979166667),
-    "AGAT": (-8.87333333333, 161.011388889),
-    "AGGA": (-8.69777777778, 160.680833333),
-    "AGGB": (-11.3016666667, 159.798055556),
-    "AGGC": (-6.71194444444, 156.396111111),
-    "AGGD": (-9.7475, 159.838888889),
-    "AGGE": (-6.9925, 155.888333333),
-    "AGGF": (-8.10722222222, 159.5775),
-    "AGGH": (-9.42805555556, 160.054722222),
-    "AGGK": (-10.4494444444, 161.898333333),
-    "AGGL": (-10.7197222222, 165.797777778),
-    "AGGM": (-8.32796944444, 157.263091667),
-    "AGGN": (-8.09861111111, 156.864166667),
-    "AGGO": (-7.41611111111, 155.565277778),
-    "AGGR": (-11.55, 160.062777778),
-    "AGGS": (-8.57805555556, 157.875),
-    "AGGT": (-10.8480555556, 162.454166667),
-    "AGGU": (-9.86166666667, 160.825),
-    "AGGV": (-7.58583333333, 158.731388889),
-    "AGGY": (-9.09277777778, 159.218888889),
-    "AGKG": (-7.33277777778, 157.586944444),
-    "AGOK": (-8.73916666667, 158.203055556),
-    "AGRM": (-8.16805555556, 157.6425),
-    "ANYN": (-0.547458333333, 166.9191),
-    "AYBK": (-5.42222222222, 154.6725),
-    "AYCH": (-6.02416666667, 144.970277778),
-    "AYDU": (-9.08666666667, 143.207777778),
-    "AYGA": (-6.08166666667, 145.391666667),
-    "AYGN": (-10.3113888889, 150.333611111),
-    "AYGR": (-8.80444444444, 148.308888889),
-    "AYHK": (-5.46216944444, 150.404944444),
-    "AYKI": (-6.12566666667, 141.282),
-    "AYKK": (-7.42472222222, 144.249722222),
-    "AYKM": (-7.96361111111, 145.771388889),
-    "AYKT": (-6.30333333333, 155.723333333),
-    "AYKV": (-2.57916666667, 150.807777778),
-    "AYKY": (-3.0424, 152.6279),
-    "AYLA": (-6.73305555556, 146.995833333),
-    "AYMD": (-5.20694444444, 145.788611111),
-    "AYMH": (-5.82611111111, 144.296111111),
-    "AYMN": (-6.14773888889, 143.657163889),
-    "AYMO": (-2.06194444444, 147.424166667),
-    "AYMR": (-6.36333333333, 143.238055556),
-    "AYMS": (-10.6891666667, 152.838055556),
-    "AYNZ": (-6.56972222222, 146.726111111),
-    "AYPY": (-9.44333333333, 147.22),
-    "AYRB": (-4.34027777778, 152.379444444),
-    "AYTA": (-5.845, 142.948055556),
-    "AYTB": (-5.27861111111, 141.225833333),
-    "AYTK": (-4.34027777778, 152.379444444),
-    "AYVN": (-2.69716666667, 141.302286111),
-    "AYWD": (-5.64330277778, 143.895411111),
-    "AYWK": (-3.58361111111, 143.669166667),
-    "BGAA": (68.7219444444, -52.7847222222),
-    "BGAG": (72.8869444444, -55.5961111111),
-    "BGAK": (68.7442777778, -52.3403611111),
-    "BGAM": (65.6122222222, -37.6183333333),
-    "BGAP": (60.4644444444, -45.5777777778),
-    "BGAQ": (60.1519444444, -44.2880555556),
-    "BGAS": (60.5969444444, -45.3838888889),
-    "BGAT": (67.9416666667, -53.6333333333),
-    "BGBW": (61.1611111111, -45.4275),
-    "BGCH": (68.8172222222, -51.1747222222),
-    "BGCO": (70.7394444444, -22.6458333333),
-    "BGET": (60.6241666667, -45.9141666667),
-    "BGFD": (60.0036111111, -44.6536111111),
-    "BGGH": (64.1908333333, -51.6780555556),
-    "BGGN": (69.2511111111, -53.5380555556),
-    "BGIA": (70.4955555556, -51.3030555556),
-    "BGIG": (68.1466666667, -53.2),
-    "BGIK": (68.15, -53.45),
-    "BGIL": (69.08, -51.1166666667),
-    "BGIN": (73.1997222222, -56.0472222222),
-    "BGIS": (65.5413888889, -38.9733333333),
-    "BGIT": (68.6322222222, -51.8336111111),
-    "BGJH": (60.7158333333, -46.0294444444),
-    "BGJN": (69.2333333333, -51.0666666667),
-    "BGKA": (68.3066666667, -53.4716666667),
-    "BGKK": (65.5833333333, -37.15),
-    "BGKL": (72.1566666667, -55.5333333333),
-    "BGKM": (65.8583333333, -37.0083333333),
-    "BGKQ": (74.5794444444, -57.2352777778),
-    "BGKS": (72.38, -55.5452777778),
-    "BGKT": (68.8566666667, -53.125),
-    "BGLL": (71.2416666667, -53.5666666667),
-    "BGMO": (76.7638888889, -69.9972222222),
-    "BGMQ": (65.4125, -52.9394444444),
-    "BGNK": (68.2483333333, -52.88),
-    "BGNN": (60.14, -45.2316666667),
-    "BGNQ": (71.5583333333, -53.2166666667),
-    "BGNS": (60.9166666667, -46.0586111111),
-    "BGNT": (70.7916666667, -53.6666666667),
-    "BGNU": (74.11, -57.065),
-    "BGPT": (62.0147222222, -49.6708333333),
-    "BGQE": (70.0, -51.2830555556),
-    "BGQQ": (77.4886111111, -69.3886111111),
-    "BGQT": (60.7791666667, -47.1525),
-    "BGSC": (70.4883333333, -21.9719444444),
-    "BGSF": (67.0169444444, -50.6891666667),
-    "BGSG": (65.9038888889, -36.3744444444),
-    "BGSI": (77.7833333333, -70.7666666667),
-    "BGSO": (60.5377777778, -46.0247222222),
-    "BGSQ": (70.0166666667, -51.9333333333),
-    "BGSS": (66.9513888889, -53.7294444444),
-    "BGST": (70.8116666667, -51.6333333333),
-    "BGSV": (76.0208333333, -65.0833333333),
-    "BGTA": (73.3730555556, -56.0602777778),
-    "BGTL": (76.5311111111, -68.7030555556),
-    "BGTN": (65.8833333333, -37.7672222222),
-    "BGTQ": (60.1936111111, -44.8113888889),
-    "BGUK": (72.7902777778, -56.1305555556),
-    "BGUM": (70.6797222222, -52.1172222222),
-    "BGUQ": (70.7341666667, -52.6961111111),
-    "BGUT": (71.0552777778, -51.8833333333),
-    "BIAR": (65.6597222222, -18.0725),
-    "BIBA": (63.5561111111, -20.1375),
-    "BIBD": (65.6413888889, -23.5461111111),
-    "BIEG": (65.2833333333, -14.4013888889),
-    "BIGJ": (65.9933083333, -21.3296222222),
-    "BIGR": (66.5466666667, -18.0186111111),
-    "BIHN": (64.2955555556, -15.2272222222),
-    "BIHU": (65.9522222222, -17.4258333333),
-    "BIIS": (66.0580555556, -23.1352777778),
-    "BIKF": (63.985, -22.6055555556),
-    "BIKP": (66.3136111111, -16.4611111111),
-    "BIKR": (65.7316666667, -19.5727777778),
-    "BIPA": (65.5558333333, -23.965),
-    "BIRK": (64.13, -21.9405555556),
-    "BISF": (63.9291666667, -21.0377777778),
-    "BISI": (66.1333333333, -18.9166666667),
-    "BITN": (66.2183333333, -15.3355555556),
-    "BIVM": (63.4241666667, -20.2786111111),
-    "BIVO": (65.7205555556, -14.8505555556),
-    "BKPR": (42.5727777778, 21.0358333333),
-    "CYAC": (51.7272222222, -91.8244444444),
-    "CYAD": (53.5716666667, -76.1963888889),
-    "CYAG": (48.6544444444, -93.4405555556),
-    "CYAH": (53.7547222222, -73.6752777778),
-    "CYAL": (50.5822222222, -126.915555556),
-    "CYAM": (46.485, -84.5094444444),
-    "CYAQ": (53.5247222222, -88.6430555556),
-    "CYAS": (60.0272222222, -69.9991666667),
-    "CYAT": (52.9275, -82.4319444444),
-    "CYAU": (44.2305555556, -64.8561111111),
-    "CYAV": (50.0563888889, -97.0325),
-    "CYAW": (44.6397222222, -63.4994444444),
-    "CYAX": (50.2947222222, -96.01),
-    "CYAY": (51.3916666667, -56.0844444444),
-    "CYAZ": (49.0822222222, -125.7725),
-    "CYBA": (51.2083333333, -115.540277778),
-    "CYBB": (68.5344444444, -89.8080555556),
-    "CYBC": (49.1322222222, -68.2072222222),
-    "CYBD": (52.3875, -126.595833333),
-    "CYBE": (59.5613888889, -108.481388889),
-    "CYBF": (54.3047222222, -110.741111111),
-    "CYBG": (48.3305555556, -70.9963888889),
-    "CYBK": (64.2988888889, -96.0777777778),
-    "CYBL": (49.9508333333, -125.270833333),
-    "CYBN": (49.0361111111, -122.314166667),
-    "CYBP": (50.6341666667, -111.926388889),
-    "CYBQ": (58.7061111111, -98.5122222222),
-    "CYBR": (49.91, -99.9519444444),
-    "CYBT": (57.8894444444, -101.679166667),
-    "CYBU": (53.3325, -104.008888889),
-    "CYBV": (52.3588888889, -97.0180555556),
-    "CYBW": (51.1052777778, -114.371388889),
-    "CYBX": (51.4419444444, -57.1861111111),
-    "CYCA": (53.6825, -57.0419444444),
-    "CYCB": (69.1080555556, -105.138333333),
-    "CYCC": (45.0927777778, -74.5677777778),
-    "CYCD": (49.0522222222, -123.87),
-    "CYCE": (43.2858333333, -81.5063888889),
-    "CYCG": (49.2963888889, -117.6325),
-    "CYCH": (47.0077777778, -65.4491666667),
-    "CYCK": (42.3058333333, -82.0825),
-    "CYCL": (47.9905555556, -66.3313888889),
-    "CYCN": (49.1066666667, -81.0152777778),
-    "CYCO": (67.8166666667, -115.143888889),
-    "CYCP": (52.1247222222, -119.292777778),
-    "CYCQ": (55.6872222222, -121.626666667),
-    "CYCR": (54.6108333333, -97.7602777778),
-    "CYCS": (63.3472222222, -90.7311111111),
-    "CYCT": (52.075, -111.445277778),
-    "CYCW": (49.1527777778, -121.938888889),
-    "CYCX": (49.0361111111, -122.314166667),
-    "CYCY": (70.4861111111, -68.5166666667),
-    "CYCZ": (50.3319444444, -115.873611111),
-    "CYDA": (64.0430555556, -139.127777778),
-    "CYDB": (61.3711111111, -139.040555556),
-    "CYDC": (49.4675, -120.511944444),
-    "CYDF": (49.2108333333, -57.3913888889),
-    "CYDH": (49.0361111111, -122.314166667),
-    "CYDL": (58.4222222222, -130.032222222),
-    "CYDM": (61.9705555556, -132.422222222),
-    "CYDN": (51.1008333333, -100.0525),
-    "CYDO": (48.7783333333, -72.375),
-    "CYDP": (56.5505555556, -61.6822222222),
-    "CYDQ": (55.7416666667, -120.181944444),
-    "CYEA": (50.9336111111, -110.013611111),
-    "CYED": (53.6666666667, -113.466666667),
-    "CYEE": (44.6847222222, -79.9294444444),
-    "CYEG": (53.3097222222, -113.579722222),
-    "CYEK": (61.0941666667, -94.0708333333),
-    "CYEL": (46.3516666667, -82.5611111111),
-    "CYEM": (45.8425, -81.8575),
-    "CYEN": (49.2102777778, -102.965833333),
-    "CYER": (56.0188888889, -87.6761111111),
-    "CYES": (47.4905555556, -68.4819444444),
-    "CYET": (53.5788888889, -116.465),
-    "CYEU": (79.9947222222, -85.8133333333),
-    "CYEV": (68.3041666667, -133.482777778),
-    "CYEY": (48.565, -78.2491666667),
-    "CYFA": (52.2036111111, -81.6958333333),
-    "CYFB": (63.7563888889, -68.5558333333),
-    "CYFC": (45.8694444444, -66.5316666667),
-    "CYFD": (43.1325, -80.3413888889),
-    "CYFE": (48.7461111111, -69.0972222222),
-    "CYFH": (51.5619444444, -87.9077777778),
-    "CYFJ": (46.4091666667, -74.78),
-    "CYFO": (54.6780555556, -101.681666667),
-    "CYFR": (61.1808333333, -113.689722222),
-    "CYFS": (61.7602777778, -121.236666667),
-    "CYFT": (55.0772222222, -59.1877777778),
-    "CYGB": (49.6941666667, -124.517777778),
-    "CYGD": (43.7677777778, -81.7108333333),
-    "CYGE": (51.2991666667, -116.982222222),
-    "CYGH": (66.2405555556, -128.6475),
-    "CYGK": (44.2252777778, -76.5969444444),
-    "CYGL": (53.6252777778, -77.7041666667),
-    "CYGM": (50.6280555556, -97.0433333333),
-    "CYGO": (54.5588888889, -94.4913888889),
-    "CYGP": (48.7752777778, -64.4786111111),
-    "CYGQ": (49.7783333333, -86.9394444444),
-    "CYGR": (47.4247222222, -61.7780555556),
-    "CYGT": (69.3647222222, -81.8163888889),
-    "CYGV": (50.2819444444, -63.6111111111),
-    "CYGW": (55.2833333333, -77.7666666667),
-    "CYGX": (56.35, -94.7),
-    "CYGZ": (76.4261111111, -82.9094444444),
-    "CYHA": (61.0463888889, -69.6177777778),
-    "CYHB": (52.8166666667, -102.311388889),
-    "CYHC": (49.2944444444, -123.111388889),
-    "CYHD": (49.8316666667, -92.7441666667),
-    "CYHE": (49.3683333333, -121.498055556),
-    "CYHF": (49.7138888889, -83.6869444444),
-    "CYHH": (51.6911111111, -76.1355555556),
-    "CYHI": (70.7630555556, -117.805833333),
-    "CYHK": (68.6355555556, -95.8497222222),
-    "CYHM": (43.1730555556, -79.935),
-    "CYHN": (49.1930555556, -84.7594444444),
-    "CYHO": (55.4488888889, -60.2280555556),
-    "CYHR": (50.4688888889, -59.6366666667),
-    "CYHT": (60.7894444444, -137.545277778),
-    "CYHU": (45.5175, -73.4169444444),
-    "CYHY": (60.8397222222, -115.782777778),
-    "CYHZ": (44.8808333333, -63.5086111111),
-    "CYIB": (48.7738888889, -91.6386111111),
-    "CYID": (44.5458333333, -65.7858333333),
-    "CYIF": (51.2097222222, -58.6575),
-    "CYIK": (62.4172222222, -77.9252777778),
-    "CYIO": (72.6833333333, -77.9666666667),
-    "CYIV": (53.8572222222, -94.6536111111),
-    "CYJA": (52.9966666667, -118.059444444),
-    "CYJF": (60.2355555556, -123.47),
-    "CYJM": (54.3972222222, -124.262777778),
-    "CYJN": (45.2944444444, -73.2811111111),
-    "CYJP": (61.3191666667, -117.606111111),
-    "CYJQ": (52.1397222222, -128.063611111),
-    "CYJT": (48.5441666667, -58.55),
-    "CYKA": (50.7022222222, -120.441944444),
-    "CYKC": (58.2361111111, -103.6775),
-    "CYKD": (68.2233333333, -135.005555556),
-    "CYKF": (43.4588888889, -80.3844444444),
-    "CYKG": (61.5886111111, -71.9294444444),
-    "CYKJ": (57.2563888889, -105.6175),
-    "CYKL": (54.805, -66.8052777778),
-    "CYKM": (44.2013888889, -81.6055555556),
-    "CYKO": (60.8186111111, -78.1486111111),
-    "CYKQ": (51.4733333333, -78.7583333333),
-    "CYKX": (48.2102777778, -79.9813888889),
-    "CYKY": (51.5175, -109.180833333),
-    "CYKZ": (43.8622222222, -79.37),
-    "CYLA": (59.2966666667, -69.5997222222),
-    "CYLB": (54.7702777778, -112.031666667),
-    "CYLC": (62.8480555556, -69.8772222222),
-    "CYLD": (47.82, -83.3463888889),
-    "CYLH": (52.1955555556, -87.9341666667),
-    "CYLI": (50.6747222222, -121.893611111),
-    "CYLJ": (54.1252777778, -108.522777778),
-    "CYLK": (62.4183333333, -110.682222222),
-    "CYLL": (53.3091666667, -110.0725),
-    "CYLQ": (47.4097222222, -72.7888888889),
-    "CYLR": (56.5133333333, -99.9852777778),
-    "CYLS": (44.4861111111, -79.5555555556),
-    "CYLT": (82.5177777778, -62.2805555556),
-    "CYLU": (58.7113888889, -65.9927777778),
-    "CYLW": (49.9561111111, -119.377777778),
-    "CYMA": (63.6166666667, -135.866666667),
-    "CYME": (48.8563888889, -67.4522222222),
-    "CYMG": (49.0833333333, -85.8611111111),
-    "CYMH": (52.3027777778, -55.8477777778),
-    "CYMJ": (50.3302777778, -105.559166667),
-    "CYML": (47.5975, -70.2238888889),
-    "CYMM": (56.6533333333, -111.221944444),
-    "CYMO": (51.2911111111, -80.6077777778),
-    "CYMT": (49.7719444444, -74.5280555556),
-    "CYMU": (56.5361111111, -76.5183333333),
-    "CYMW": (46.2744444444, -75.99),
-    "CYMX": (45.6797222222, -74.0386111111),
-    "CYNA": (50.1897222222, -61.7891666667),
-    "CYNC": (53.0105555556, -78.8311111111),
-    "CYND": (45.5213888889, -75.5641666667),
-    "CYNE": (53.9583333333, -97.8441666667),
-    "CYNH": (56.0355555556, -121.975833333),
-    "CYNJ": (49.1008333333, -122.630833333),
-    "CYNL": (58.2766666667, -104.0825),
-    "CYNM": (49.7616666667, -77.8027777778),
-    "CYNN": (59.4875, -97.7802777778),
-    "CYNR": (57.3816666667, -111.701111111),
-    "CYOA": (64.6988888889, -110.614722222),
-    "CYOC": (67.5705555556, -139.839166667),
-    "CYOD": (54.405, -110.279444444),
-    "CYOH": (54.9330555556, -95.2788888889),
-    "CYOJ": (58.6213888889, -117.164722222),
-    "CYOO": (43.9227777778, -78.8966666667),
-    "CYOP": (58.4913888889, -119.407777778),
-    "CYOS": (44.5905555556, -80.8383333333),
-    "CYOW": (45.3225, -75.6691666667),
-    "CYOY": (46.9027777778, -71.5036111111),
-    "CYP2": (49.0361111111, -122.314166667),
-    "CYPA": (53.2141666667, -105.672777778),
-    "CYPC": (69.3605555556, -124.075833333),
-    "CYPD": (45.6563888889, -61.3683333333),
-    "CYPE": (56.2269444444, -117.447222222),
-    "CYPG": (49.9027777778, -98.2747222222),
-    "CYPH": (58.4719444444, -78.0769444444),
-    "CYPK": (49.2161111111, -122.71),
-    "CYPL": (51.4463888889, -90.2141666667),
-    "CYPM": (51.8197222222, -93.9733333333),
-    "CYPN": (49.8363888889, -64.2886111111),
-    "CYPO": (54.9880555556, -85.4433333333),
-    "CYPP": (47.9319444444, -74.6080555556),
-    "CYPQ": (44.23, -78.3633333333),
-    "CYPR": (54.2861111111, -130.444722222),
-    "CYPS": (50.3022222222, -122.739444444),
-    "CYPT": (41.7775, -82.6780555556),
-    "CYPU": (52.1127777778, -124.144722222),
-    "CYPW": (49.8341666667, -124.500277778),
-    "CYPX": (60.0522222222, -77.2875),
-    "CYPY": (58.7672222222, -111.117222222),
-    "CYPZ": (54.3763888889, -125.951388889),
-    "CYQA": (44.9747222222, -79.3033333333),
-    "CYQB": (46.7883333333, -71.3975),
-    "CYQD": (53.9713888889, -101.091111111),
-    "CYQF": (52.1786111111, -113.893055556),
-    "CYQG": (42.2755555556, -82.9555555556),
-    "CYQH": (60.1177777778, -128.821944444),
-    "CYQI": (43.8272222222, -66.0883333333),
-    "CYQK": (49.7883333333, -94.3630555556),
-    "CYQL": (49.6302777778, -112.799722222),
-    "CYQM": (46.1122222222, -64.6786111111),
-    "CYQN": (50.1827777778, -86.6963888889),
-    "CYQQ": (49.7108333333, -124.886666667),
-    "CYQR": (50.4319444444, -104.665833333),
-    "CYQS": (42.77, -81.1097222222),
-    "CYQT": (48.3719444444, -89.3238888889),
-    "CYQU": (55.1797222222, -118.885),
-    "CYQV": (51.2647222222, -102.461666667),
-    "CYQW": (52.7691666667, -108.243611111),
-    "CYQX": (48.9369444444, -54.5680555556),
-    "CYQY": (46.1613888889, -60.0477777778),
-    "CYQZ": (53.0261111111, -122.51),
-    "CYRA": (64.1161111111, -117.309722222),
-    "CYRB": (74.7169444444, -94.9694444444),
-    "CYRC": (48.5208333333, -71.0505555556),
-    "CYRI": (47.7644444444, -69.5847222222),
-    "CYRJ": (48.52, -72.2655555556),
-    "CYRL": (51.0672222222, -93.7930555556),
-    "CYRM": (52.4297222222, -114.904166667),
-    "CYRO": (45.4602777778, -75.6461111111),
-    "CYRP": (45.3225, -76.0222222222),
-    "CYRQ": (46.3516666667, -72.6805555556),
-    "CYRS": (54.1675, -93.5575),
-    "CYRT": (62.8113888889, -92.1158333333),
-    "CYRV": (50.9666666667, -118.183333333),
-    "CYSA": (43.4158333333, -80.9341666667),
-    "CYSB": (46.625, -80.7988888889),
-    "CYSC": (45.4380555556, -71.6905555556),
-    "CYSD": (49.0361111111, -122.314166667),
-    "CYSE": (49.7816666667, -123.161944444),
-    "CYSF": (59.2502777778, -105.841388889),
-    "CYSG": (46.0963888889, -70.7147222222),
-    "CYSH": (44.9458333333, -75.9402777778),
-    "CYSJ": (45.3161111111, -65.8902777778),
-    "CYSK": (56.5369444444, -79.25),
-    "CYSL": (47.1572222222, -67.8363888889),
-    "CYSM": (60.0222222222, -111.960277778),
-    "CYSN": (43.1916666667, -79.1711111111),
-    "CYSP": (48.7572222222, -86.3458333333),
-    "CYSQ": (59.5763888889, -133.671388889),
-    "CYSR": (72.9822222222, -84.6136111111),
-    "CYST": (53.8455555556, -94.8522222222),
-    "CYSU": (46.4427777778, -63.8311111111),
-    "CYSW": (49.8333333333, -114.883333333),
-    "CYSY": (71.9938888889, -125.2425),
-    "CYSZ": (49.12, -66.5288888889),
-    "CYTA": (45.8644444444, -77.2513888889),
-    "CYTB": (42.9275, -80.7469444444),
-    "CYTE": (64.23, -76.5266666667),
-    "CYTF": (48.5086111111, -71.6413888889),
-    "CYTH": (55.8011111111, -97.8641666667),
-    "CYTL": (53.8177777778, -89.8969444444),
-    "CYTN": (45.6119444444, -62.6211111111),
-    "CYTQ": (58.6677777778, -69.9558333333),
-    "CYTR": (44.1188888889, -77.5280555556),
-    "CYTS": (48.5697222222, -81.3766666667),
-    "CYTZ": (43.6275, -79.3961111111),
-    "CYUB": (69.4333333333, -133.026388889),
-    "CYUL": (45.4680555556, -73.7413888889),
-    "CYUT": (66.5213888889, -86.2247222222),
-    "CYUX": (68.7761111111, -81.2436111111),
-    "CYUY": (48.2061111111, -78.8355555556),
-    "CYVB": (48.0711111111, -65.4602777778),
-    "CYVC": (55.1513888889, -105.261944444),
-    "CYVD": (49.8783333333, -100.918333333),
-    "CYVG": (53.3558333333, -110.823888889),
-    "CYVK": (50.2461111111, -119.330833333),
-    "CYVM": (67.5458333333, -64.0313888889),
-    "CYVO": (48.0533333333, -77.7827777778),
-    "CYVP": (58.0961111111, -68.4269444444),
-    "CYVQ": (65.2825, -126.800277778),
-    "CYVR": (49.195, -123.181944444),
-    "CYVT": (55.8419444444, -108.4175),
-    "CYVV": (44.7458333333, -81.1072222222),
-    "CYVZ": (52.6558333333, -94.0613888889),
-    "CYWA": (45.9522222222, -77.3191666667),
-    "CYWE": (64.1916666667, -114.078888889),
-    "CYWG": (49.91, -97.2344444444),
-    "CYWH": (48.4227777778, -123.3875),
-    "CYWJ": (65.2111111111, -123.436388889),
-    "CYWK": (52.9219444444, -66.8644444444),
-    "CYWL": (52.1830555556, -122.054166667),
-    "CYWM": (54.7430555556, -113.205277778),
-    "CYWP": (52.9594444444, -87.3752777778),
-    "CYWV": (52.7958333333, -110.8575),
-    "CYWY": (63.2094444444, -123.436666667),
-    "CYXC": (49.6102777778, -115.7825),
-    "CYXD": (53.5725, -113.520555556),
-    "CYXE": (52.1708333333, -106.699722222),
-    "CYXH": (50.0188888889, -110.720833333),
-    "CYXJ": (56.2380555556, -120.740277778),
-    "CYXK": (48.4777777778, -68.4963888889),
-    "CYXL": (50.1144444444, -91.9041666667),
-    "CYXN": (62.24, -92.5980555556),
-    "CYXP": (66.145, -65.7136111111),
-    "CYXQ": (62.4102777778, -140.868888889),
-    "CYXR": (47.695, -79.8488888889),
-    "CYXS": (53.8894444444, -122.678888889),
-    "CYXT": (54.4663888889, -128.5775),
-    "CYXU": (43.0355555556, -81.1538888889),
-    "CYXX": (49.0252777778, -122.363333333),
-    "CYXY": (60.7094444444, -135.068333333),
-    "CYXZ": (47.9669444444, -84.7863888889),
-    "CYYB": (46.3636111111, -79.4227777778),
-    "CYYC": (51.1138888889, -114.020277778),
-    "CYYD": (54.8247222222, -127.182777778),
-    "CYYE": (58.8363888889, -122.596944444),
-    "CYYF": (49.4627777778, -119.602222222),
-    "CYYG": (46.29, -63.1211111111),
-    "CYYH": (69.5466666667, -93.5766666667),
-    "CYYJ": (48.6469444444, -123.425833333),
-    "CYYL": (56.8638888889, -101.076111111),
-    "CYYM": (49.6363888889, -114.094444444),
-    "CYYN": (50.2919444444, -107.690555556),
-    "CYYO": (51.81, -104.17),
-    "CYYQ": (58.7391666667, -94.065),
-    "CYYR": (53.3191666667, -60.4258333333),
-    "CYYT": (47.6186111111, -52.7519444444),
-    "CYYU": (49.4138888889, -82.4675),
-    "CYYW": (50.2902777778, -88.9097222222),
-    "CYYY": (48.6086111111, -68.2080555556),
-    "CYYZ": (43.6772222222, -79.6305555556),
-    #"CYZD": (43.7425, -79.4655555556),
-    "CYZE": (45.8852777778, -82.5677777778),
-    "CYZF": (62.4627777778, -114.440277778),
-    "CYZG": (62.1794444444, -75.6672222222),
-    "CYZH": (55.2933333333, -114.778333333),
-    "CYZP": (53.2541666667, -131.813888889),
-    "CYZR": (42.9994444444, -82.3088888889),
-    "CYZS": (64.1933333333, -83.3594444444),
-    "CYZT": (50.6805555556, -127.366666667),
-    "CYZU": (54.1438888889, -115.786666667),
-    "CYZV": (50.2233333333, -66.2655555556),
-    "CYZW": (60.1727777778, -132.742777778),
-    "CYZX": (44.9844444444, -64.9169444444),
-    "CYZY": (55.2994444444, -123.133333333),
-    "CZAC": (56.0894444444, -96.0891666667),
-    "CZAM": (50.6825, -119.228611111),
-    "CZBA": (43.4413888889, -79.8502777778),
-    "CZBB": (49.0741666667, -123.0075),
-    "CZBD": (56.0516666667, -95.6180555556),
-    "CZBF": (47.6297222222, -65.7388888889),
-    "CZBM": (45.2908333333, -72.7419444444),
-    "CZEE": (56.0366666667, -96.5061111111),
-    "CZEL": (52.185, -128.156666667),
-    "CZEM": (52.2263888889, -78.5225),
-    "CZFA": (62.2075, -133.375833333),
-    "CZFD": (59.3344444444, -107.181944444),
-    "CZFG": (55.7491666667, -101.266388889),
-    "CZFM": (67.4077777778, -134.860277778),
-    "CZFN": (64.9097222222, -125.5725),
-    "CZGF": (49.0155555556, -118.430555556),
-    "CZGI": (54.8397222222, -94.0786111111),
-    "CZGR": (52.045, -95.4661111111),
-    "CZHP": (53.3936111111, -116.475833333),
-    "CZJG": (54.5188888889, -98.0461111111),
-    "CZJN": (52.1213888889, -101.234444444),
-    "CZKE": (52.2825, -81.6777777778),
-    "CZLQ": (55.3188888889, -97.7077777778),
-    "CZMD": (53.4413888889, -91.7627777778),
-    "CZML": (51.7366666667, -121.332777778),
-    "CZMN": (55.5894444444, -97.1636111111),
-    "CZMT": (54.0272222222, -132.125),
-    "CZNG": (52.9963888889, -97.2736111111),
-    "CZNL": (49.4941666667, -117.300555556),
-    "CZPB": (53.8911111111, -92.1963888889),
-    "CZPC": (49.5205555556, -113.997222222),
-    "CZPO": (55.5280555556, -106.582222222),
-    "CZRJ": (52.9436111111, -91.3125),
-    "CZSJ": (53.0641666667, -93.3444444444),
-    "CZSN": (56.7927777778, -98.9072222222),
-    "CZST": (55.9333333333, -129.983333333),
-    "CZSW": (54.3333333333, -130.283333333),
-    "CZTA": (51.7844444444, -96.6922222222),
-    "CZTM": (55.8630555556, -92.0813888889),
-    "CZUC": (49.4297222222, -91.7177777778),
-    "CZUM": (53.5625, -64.1058333333),
-    "CZVL": (53.6683333333, -113.852222222),
-    "CZWH": (58.6141666667, -101.468888889),
-    "CZWL": (58.1069444444, -103.1725),
-    "DAAB": (36.5036111111, 2.81416666667),
-    "DAAD": (35.3325, 4.20638888889),
-    "DAAE": (36.7119444444, 5.06972222222),
-    "DAAG": (36.6908333333, 3.21527777778),
-    "DAAJ": (24.2925, 9.45222222222),
-    "DAAK": (36.5458333333, 2.87611111111),
-    "DAAM": (36.1086111111, 6.36444444444),
-    "DAAN": (26.71, 0.285555555556),
-    "DAAP": (26.5733333333, 8.48361111111),
-    "DAAQ": (35.5252777778, 2.87861111111),
-    "DAAS": (36.1780555556, 5.32444444444),
-    "DAAT": (22.8108333333, 5.45083333333),
-    "DAAV": (36.795, 5.87333333333),
-    "DAAY": (33.5358333333, -0.242222222222),
-    "DAAZ": (35.7522222222, 0.626111111111),
-    "DABB": (36.8222222222, 7.80916666667),
-    "DABC": (36.2766666667, 6.62388888889),
-    "DABP": (36.8627222222, 6.95108333333),
-    "DABS": (35.4313888889, 8.12055555556),
-    "DABT": (35.7518055556, 6.30925),
-    "DAFH": (32.9297222222, 3.31222222222),
-    "DAFI": (34.6671388889, 3.349),
-    "DAOB": (35.3411111111, 1.46305555556),
-    "DAOE": (35.7352777778, -0.805277777778),
-    "DAOF": (27.7002777778, -8.16694444444),
-    "DAOI": (36.2125, 1.33166666667),
-    "DAOL": (35.5422222222, -0.532222222222),
-    "DAON": (35.0166666667, -1.45),
-    "DAOO": (35.6236111111, -0.621111111111),
-    "DAOR": (31.6546666667, -2.26119444444),
-    "DAOS": (35.1716666667, -0.593055555556),
-    "DAOV": (35.2075, 0.146944444444),
-    "DATG": (19.5605277778, 5.74963888889),
-    "DATM": (21.3778333333, 0.927),
-    "DAUA": (27.8375, -0.186388888889),
-    "DAUB": (34.7930555556, 5.73805555556),
-    "DAUE": (30.5711111111, 2.85944444444),
-    "DAUG": (32.3838888889, 3.79388888889),
-    "DAUH": (31.6727777778, 6.14027777778),
-    "DAUI": (27.2508333333, 2.51194444444),
-    "DAUK": (33.0677777778, 6.08861111111),
-    "DAUL": (33.7638888889, 2.92722222222),
-    "DAUO": (33.5128888889, 6.78258333333),
-    "DAUT": (29.2369444444, 0.275833333333),
-    "DAUU": (31.9172222222, 5.41277777778),
-    "DAUZ": (28.0513888889, 9.64277777778),
-    "DBBB": (6.35722222222, 2.38416666667),
-    "DBBC": (7.12541666667, 2.04680555556),
-    "DBBD": (9.69211111111, 1.63747222222),
-    "DBBK": (11.1450555556, 2.94044444444),
-    "DBBN": (10.3769722222, 1.3605),
-    "DBBO": (11.04675, 0.993277777778),
-    "DBBP": (9.35694444444, 2.60888888889),
-    "DBBR": (10.2730555556, 2.69586111111),
-    "DBBS": (8.01825, 2.46447222222),
-    "DFCA": (13.0773611111, -1.10027777778),
-    "DFCC": (13.5629444444, -2.42313888889),
-    "DFCJ": (14.125, -1.62472222222),
-    "DFCL": (11.1054166667, -2.10161111111),
-    "DFCP": (11.1791388889, -1.14847222222),
-    "DFEA": (12.6579722222, -0.568777777778),
-    "DFEB": (12.9813888889, -0.162611111111),
-    "DFED": (12.0604722222, 1.78488888889),
-    "DFEE": (14.0245277778, -0.0653611111111),
-    "DFEF": (12.0406666667, 0.364333333333),
-    "DFEG": (14.4553611111, -0.217694444444),
-    "DFEL": (12.4646388889, 1.49358333333),
-    "DFEM": (14.7908333333, 0.0411111111111),
-    "DFEP": (11.2552222222, 0.698222222222),
-    "DFES": (13.4566666667, 0.503333333333),
-    "DFET": (11.8023333333, -0.3715),
-    "DFEZ": (11.1666666667, -0.616666666667),
-    "DFFD": (12.3530555556, -1.51222222222),
-    "DFOB": (10.6893611111, -4.72752777778),
-    "DFOD": (12.4608055556, -3.48855555556),
-    "DFON": (12.7435277778, -3.86302777778),
-    "DFOO": (11.16, -4.33083333333),
-    "DFOT": (13.0590555556, -3.07725),
-    "DFOU": (10.9481666667, -3.24986111111),
-    "DFOY": (14.2152777778, -0.895555555556),
-    "DGAA": (5.60277777778, -0.168055555556),
-    "DGLE": (9.56333333333, -0.863333333333),
-    "DGLN": (10.9427777778, -1.08722222222),
-    "DGLW": (10.0825, -2.5075),
-    "DGLY": (9.425, -0.00472222222222),
-    "DGSI": (6.71444444444, -1.59055555556),
-    "DGSN": (7.36166666667, -2.32861111111),
-    "DGTK": (4.89333333333, -1.775),
-    "DIAO": (5.43305555556, -3.26666666667),
-    "DIAP": (5.25972222222, -3.92638888889),
-    "DIAU": (6.71555555556, -3.47027777778),
-    "DIBI": (9.53305555556, -6.46694444444),
-    "DIBK": (7.73861111111, -5.07361111111),
-    "DIBN": (9.25388888889, -3.03388888889),
-    "DIBU": (8.01722222222, -2.76194444444),
-    "DIDK": (6.65083333333, -4.64111111111),
-    "DIDL": (6.7925, -6.47305555556),
-    "DIDV": (5.79305555556, -5.35444444444),
-    "DIFK": (9.6, -5.2),
-    "DIGA": (7.73888888889, -5.07361111111),
-    "DIGL": (6.525, -7.47861111111),
-    "DIKO": (9.38694444444, -5.55638888889),
-    "DIMN": (7.27194444444, -7.58694444444),
-    "DIOD": (9.5, -7.56694444444),
-    "DIOF": (9.6, -4.05),
-    "DISG": (7.96833333333, -6.71083333333),
-    "DISP": (4.74666666667, -6.66055555556),
-    "DISS": (4.92833333333, -6.13277777778),
-    "DITB": (4.43777777778, -7.36277777778),
-    "DITM": (8.29305555556, -7.67361111111),
-    "DIYO": (6.90305555556, -5.36583333333),
-    "DNAA": (9.00666666667, 7.26305555556),
-    "DNAI": (4.87583333333, 8.09888888889),
-    "DNAK": (7.24666666667, 5.30083333333),
-    "DNBE": (6.31722222222, 5.59944444444),
-    "DNCA": (4.97583333333, 8.34694444444),
-    "DNEN": (6.47416666667, 7.56194444444),
-    "DNGU": (12.1716666667, 6.69611111111),
-    "DNIB": (7.36222222222, 3.97833333333),
-    "DNIL": (8.44, 4.49388888889),
-    "DNIM": (5.42694444444, 7.20583333333),
-    "DNJO": (9.63972222222, 8.86888888889),
-    "DNKA": (10.6958333333, 7.32),
-    "DNKN": (12.0475, 8.52444444444),
-    "DNMA": (11.8552777778, 13.0808333333),
-    "DNMK": (7.70361111111, 8.61388888889),
-    "DNMM": (6.57722222222, 3.32111111111),
-    "DNMN": (9.65194444444, 6.46222222222),
-    "DNPO": (5.01527777778, 6.94944444444),
-    "DNSO": (12.9161111111, 5.20694444444),
-    "DNYO": (9.26027777778, 12.4297222222),
-    "DNZA": (11.13, 7.68555555556),
-    "DRRA": (13.7669444444, 8.01694444444),
-    "DRRC": (13.6669444444, 4.1),
-    "DRRD": (13.0480555556, 3.22083333333),
-    "DRRE": (13.95, 0.733055555556),
-    "DRRG": (11.8830555556, 3.43305555556),
-    "DRRL": (14.2, 1.46694444444),
-    "DRRM": (13.5025, 7.12666666667),
-    "DRRN": (13.4813888889, 2.18361111111),
-    "DRRP": (12.4830555556, 2.4),
-    "DRRT": (14.8755555556, 5.26527777778),
-    "DRRU": (14.3330555556, 2.08305555556),
-    "DRZA": (16.9647222222, 7.99694444444),
-    "DRZD": (18.9686111111, 12.8686111111),
-    "DRZF": (13.3727777778, 12.6266666667),
-    "DRZG": (13.9836111111, 10.275),
-    "DRZI": (19.0669444444, 8.36694444444),
-    "DRZL": (18.7888888889, 7.36),
-    "DRZM": (13.2055555556, 12.0322222222),
-    "DRZR": (13.7788888889, 8.98361111111),
-    "DRZT": (14.9994444444, 8.76694444444),
-    "DTKA": (36.98, 8.87694444444),
-    "DTMB": (35.7580555556, 10.7547222222),
-    "DTNZ": (36.0758333333, 10.4386111111),
-    "DTTA": (36.8508333333, 10.2269444444),
-    "DTTB": (37.2452777778, 9.79138888889),
-    "DTTD": (32.3061111111, 10.3819444444),
-    "DTTF": (34.4219444444, 8.8225),
-    "DTTG": (33.8766666667, 10.1033333333),
-    "DTTI": (36.7211111111, 9.94305555556),
-    "DTTJ": (33.875, 10.7752777778),
-    "DTTR": (31.7041666667, 9.25444444444),
-    "DTTX": (34.7177777778, 10.6908333333),
-    "DTTZ": (33.9397222222, 8.11055555556),
-    "DXAK": (7.51666666667, 1.2),
-    "DXDP": (10.8013888889, 0.242222222222),
-    "DXKP": (7.8, 1.28333333333),
-    "DXMG": (10.3591666667, -0.470833333333),
-    "DXNG": (9.76722222222, 1.09111111111),
-    "DXSK": (8.99555555556, 1.1525),
-    "DXXX": (6.16555555556, 1.25388888889),
-    "EBAM": (50.7394444444, 3.48611111111),
-    "EBAW": (51.19, 4.46277777778),
-    "EBBE": (50.7586111111, 4.76833333333),
-    "EBBL": (51.1677777778, 5.47083333333),
-    "EBBR": (50.9022222222, 4.49861111111),
-    "EBBT": (51.3333333333, 4.5),
-    "EBBX": (49.8872222222, 5.22861111111),
-    "EBCI": (50.4591666667, 4.45361111111),
-    "EBCV": (50.5758333333, 3.83083333333),
-    "EBFN": (51.09, 2.65277777778),
-    "EBFS": (50.2436111111, 4.64861111111),
-    "EBGB": (50.9494444444, 4.39333333333),
-    "EBHN": (51.3052777778, 4.39055555556),
-    "EBKH": (51.1791666667, 5.22222222222),
-    "EBKT": (50.8177777778, 3.20833333333),
-    "EBLG": (50.6372222222, 5.44305555556),
-    "EBMB": (50.9013888889, 4.48444444444),
-    "EBNM": (50.4894444444, 4.76972222222),
-    "EBOS": (51.1988888889, 2.86222222222),
-    "EBSL": (50.9483333333, 5.59166666667),
-    "EBST": (50.7883333333, 5.19277777778),
-    "EBSU": (50.0333333333, 5.43805555556),
-    "EBUL": (51.1438888889, 3.47416666667),
-    "EBWE": (51.395, 4.96055555556),
-    "EBZR": (51.2655555556, 4.75472222222),
-    "EBZW": (51.0151666667, 5.52572222222),
-    "EDAB": (51.1933333333, 14.5197222222),
-    "EDAC": (50.9816666667, 12.5061111111),
-    "EDAD": (51.8319444444, 12.1858333333),
-    "EDAE": (52.1972222222, 14.5855555556),
-    "EDAH": (53.8786111111, 14.1522222222),
-    "EDAK": (51.3080555556, 13.5547222222),
-    "EDAM": (51.3627777778, 11.9408333333),
-    "EDAP": (51.6838888889, 14.4238888889),
-    "EDAQ": (51.5519444444, 12.0525),
-    "EDAU": (51.2944444444, 13.3588888889),
-    "EDAX": (53.3063888889, 12.7530555556),
-    "EDAY": (52.5797222222, 13.9155555556),
-    "EDAZ": (52.2033333333, 13.1586111111),
-    "EDBC": (51.8558333333, 11.4180555556),
-    "EDBG": (35.4605555556, -77.9647222222),
-    "EDBH": (54.3380555556, 12.71),
-    "EDBJ": (50.9172222222, 11.7136111111),
-    "EDBK": (52.9186111111, 12.4252777778),
-    "EDBM": (52.0736111111, 11.6263888889),
-    "EDBN": (51.3280555556, 12.6566666667),
-    "EDBR": (51.3644444444, 14.9519444444),
-    "EDCA": (53.8325, 13.6688888889),
-    "EDCD": (51.8894444444, 14.5316666667),
-    "EDCI": (51.2783333333, 14.5108333333),
-    "EDCK": (51.7211111111, 11.9616666667),
-    "EDCM": (51.2961111111, 14.1288888889),
-    "EDCP": (54.1577777778, 13.7727777778),
-    "EDDB": (52.38, 13.5225),
-    "EDDC": (51.1325, 13.7669444444),
-    "EDDE": (50.98, 10.9580555556),
-    "EDDF": (50.0263888889, 8.54305555556),
-    "EDDG": (52.1344444444, 7.68472222222),
-    "EDDH": (53.6302777778, 9.98805555556),
-    "EDDI": (52.4727777778, 13.4038888889),
-    "EDDK": (50.8658333333, 7.1425),
-    "EDDL": (51.2894444444, 6.76666666667),
-    "EDDM": (48.3536111111, 11.7858333333),
-    "EDDN": (49.4986111111, 11.0780555556),
-    "EDDP": (51.4238888889, 12.2361111111),
-    "EDDR": (49.2144444444, 7.10944444444),
-    "EDDS": (48.6897222222, 9.22194444444),
-    "EDDT": (52.5594444444, 13.2875),
-    "EDDV": (52.4608333333, 9.685),
-    "EDDW": (53.0475, 8.78666666667),
-    "EDFE": (49.9608333333, 8.64361111111),
-    "EDFH": (49.9497222222, 7.26388888889),
-    "EDFM": (49.4725, 8.51361111111),
-    "EDFQ": (51.0352777778, 8.67888888889),
-    "EDFV": (49.6063888889, 8.36833333333),
-    "EDFZ": (49.9688888889, 8.1475),
-    "EDGE": (50.9927777778, 10.4725),
-    "EDGS": (50.7075, 8.08194444444),
-    "EDHE": (53.6469444444, 9.70444444444),
-    "EDHI": (53.5352777778, 9.83527777778),
-    "EDHK": (54.3794444444, 10.145),
-    "EDHL": (53.8052777778, 10.7191666667),
-    "EDIU": (-26.5083333333, 28.3916666667),
-    "EDKA": (50.8227777778, 6.18722222222),
-    "EDKV": (50.4058333333, 6.52805555556),
-    "EDKZ": (51.0994444444, 7.60194444444),
-    "EDLA": (51.4833333333, 7.89916666667),
-    "EDLC": (51.5302777778, 6.53694444444),
-    "EDLE": (51.4013888889, 6.93583333333),
-    "EDLN": (51.2302777778, 6.50444444444),
-    "EDLP": (51.6141666667, 8.61611111111),
-    "EDLS": (51.9958333333, 6.84027777778),
-    "EDLV": (51.6025, 6.14222222222),
-    "EDLW": (51.5180555556, 7.61222222222),
-    "EDMA": (48.425, 10.9316666667),
-    "EDMB": (48.1108333333, 9.76277777778),
-    "EDME": (48.3961111111, 12.7236111111),
-    "EDMO": (48.0813888889, 11.2833333333),
-    "EDMS": (48.9008333333, 12.5180555556),
-    "EDMT": (48.0116666667, 10.1008333333),
-    "EDMV": (48.6363888889, 13.1952777778),
-    "EDNL": (47.8588888889, 10.0144444444),
-    "EDNY": (47.6711111111, 9.51138888889),
-    "EDOP": (53.4269444444, 11.7833333333),
-    "EDOV": (52.6288888889, 11.8197222222),
-    "EDPA": (48.7777777778, 10.2644444444),
-    "EDQC": (50.2625, 10.9958333333),
-    "EDQD": (49.9841666667, 11.6383333333),
-    "EDQE": (49.7941666667, 11.1322222222),
-    "EDQG": (49.65, 9.95),
-    "EDQH": (49.5666666667, 10.8833333333),
-    "EDQM": (50.2886111111, 11.8547222222),
-    "EDQP": (49.8627777778, 11.7877777778),
-    "EDQT": (50.0177777778, 10.5294444444),
-    "EDRB": (49.9452777778, 6.565),
-    "EDRK": (50.3247222222, 7.53083333333),
-    "EDRT": (49.8633333333, 6.78888888889),
-    "EDRY": (49.3025, 8.45111111111),
-    "EDRZ": (49.2094444444, 7.40055555556),
-    "EDSB": (48.7794444444, 8.08055555556),
-    "EDTB": (48.7911111111, 8.18694444444),
-    "EDTD": (47.9730555556, 8.52222222222),
-    "EDTF": (48.0202777778, 7.83361111111),
-    "EDTK": (48.9822222222, 8.33333333333),
-    "EDTL": (48.36925, 7.82772222222),
-    "EDTM": (48.0536111111, 9.37277777778),
-    "EDTY": (49.1180555556, 9.77722222222),
-    "EDUS": (51.6075, 13.7377777778),
-    "EDVE": (52.3191666667, 10.5561111111),
-    "EDVK": (51.4083333333, 9.3775),
-    "EDVM": (52.1775, 9.94555555556),
-    "EDWB": (53.5033333333, 8.57333333333),
-    "EDWD": (53.1430555556, 8.62333333333),
-    "EDWE": (53.3911111111, 7.22722222222),
-    "EDWF": (53.2719444444, 7.44277777778),
-    "EDWI": (53.5047222222, 8.05333333333),
-    "EDWR": (53.5952777778, 6.70916666667),
-    "EDWY": (53.7066666667, 7.23),
-    "EDXB": (54.1536111111, 8.89861111111),
-    "EDXF": (54.7716666667, 9.37805555556),
-    "EDXH": (54.1858333333, 7.91444444444),
-    "EDXR": (54.2208333333, 9.60055555556),
-    "EDXW": (54.9130555556, 8.34027777778),
-    "EECL": (59.4466666667, 24.7527777778),
-    "EEEI": (59.2594444444, 24.2044444444),
-    "EEHU": (58.9116666667, 23.4883333333),
-    "EEKA": (58.9905555556, 22.8305555556),
-    "EEKE": (58.2297222222, 22.5094444444),
-    "EEKU": (58.1480555556, 24.0030555556),
-    "EENI": (58.8615972222, 25.7350027778),
-    "EEPU": (58.4188888889, 24.4727777778),
-    "EERI": (57.9427777778, 26.9519444444),
-    "EERU": (57.7838888889, 23.2661111111),
-    "EETA": (59.235, 25.9516666667),
-    "EETN": (59.4130555556, 24.8327777778),
-    "EETR": (58.405, 26.7766666667),
-    "EETU": (58.3072222222, 26.6902777778),
-    "EFAH": (64.8952777778, 25.7522222222),
-    "EFAL": (62.5547222222, 23.5733333333),
-    "EFET": (68.3625, 23.4241666667),
-    "EFEU": (61.1161111111, 22.2013888889),
-    "EFFO": (60.8019444444, 23.6455555556),
-    "EFHA": (61.8558333333, 24.7863888889),
-    "EFHE": (60.1477777778, 24.9241666667),
-    "EFHF": (60.2544444444, 25.0427777778),
-    "EFHK": (60.32, 24.9561111111),
-    "EFHM": (61.6894444444, 23.0736111111),
-    "EFHN": (59.8486111111, 23.0833333333),
-    "EFHV": (60.6544444444, 24.8811111111),
-    "EFIK": (60.4625, 23.6525),
-    "EFIL": (62.6936111111, 22.8319444444),
-    "EFIM": (61.2491666667, 28.9036111111),
-    "EFIT": (62.1661111111, 30.0736111111),
-    "EFIV": (68.6072222222, 27.4052777778),
-    "EFJM": (61.7786111111, 22.7161111111),
-    "EFJO": (62.6588888889, 29.6244444444),
-    "EFJY": (62.3994444444, 25.6780555556),
-    "EFKA": (63.1269444444, 23.0513888889),
-    "EFKE": (65.7816666667, 24.5988888889),
-    "EFKI": (64.2852777778, 27.6922222222),
-    "EFKJ": (62.4625, 22.3930555556),
-    "EFKK": (63.7211111111, 23.1430555556),
-    "EFKM": (66.7127777778, 27.1566666667),
-    "EFKO": (64.2286111111, 23.8263888889),
-    "EFKS": (65.9875, 29.2391666667),
-    "EFKT": (67.7008333333, 24.8466666667),
-    "EFKU": (63.0069444444, 27.7975),
-    "EFKV": (63.1252777778, 25.1241666667),
-    "EFKY": (60.5713888889, 26.8961111111),
-    "EFLA": (61.1438888889, 25.6933333333),
-    "EFLP": (61.0444444444, 28.1441666667),
-    "EFMA": (60.1219444444, 19.8980555556),
-    "EFME": (62.9466666667, 23.5188888889),
-    "EFMI": (61.6863888889, 27.2016666667),
-    "EFNU": (60.3338888889, 24.2963888889),
-    "EFOU": (64.93, 25.3544444444),
-    "EFPI": (61.2455555556, 22.1933333333),
-    "EFPK": (62.2647222222, 27.0027777778),
-    "EFPO": (61.4616666667, 21.7997222222),
-    "EFPU": (65.4022222222, 26.9469444444),
-    "EFPY": (63.7316666667, 25.9261111111),
-    "EFRH": (64.6880555556, 24.6958333333),
-    "EFRN": (62.0652777778, 28.3563888889),
-    "EFRO": (66.5647222222, 25.8302777778),
-    "EFRU": (65.9730555556, 26.3652777778),
-    "EFRV": (63.7055555556, 26.6163888889),
-    "EFRY": (60.7447222222, 24.1077777778),
-    "EFSA": (61.9430555556, 28.945),
-    "EFSE": (61.0622222222, 26.7986111111),
-    "EFSI": (62.6936111111, 22.8319444444),
-    "EFSO": (67.395, 26.6188888889),
-    "EFTP": (61.4138888889, 23.6041666667),
-    "EFTS": (61.7733333333, 24.0269444444),
-    "EFTU": (60.5138888889, 22.2627777778),
-    "EFUT": (60.8963888889, 26.9383333333),
-    "EFVA": (63.0511111111, 21.7613888889),
-    "EFVR": (62.1711111111, 27.8686111111),
-    "EFYL": (64.0602777778, 24.7158333333),
-    "EGAA": (54.6575, -6.21583333333),
-    "EGAB": (54.3988888889, -7.65166666667),
-    "EGAC": (54.6180555556, -5.8725),
-    "EGAD": (54.5811111111, -5.69194444444),
-    "EGAE": (55.0427777778, -7.16111111111),
-    "EGAH": (75.581667, -26.541167),
-    "EGAR": (-67.5666666667, -68.1333333333),
-    "EGBB": (52.4536111111, -1.74777777778),
-    "EGBC": (51.9258333333, -2.05444444444),
-    "EGBD": (52.8597222222, -1.6175),
-    "EGBE": (52.3697222222, -1.47972222222),
-    "EGBG": (52.6077777778, -1.03194444444),
-    "EGBJ": (51.8941666667, -2.16722222222),
-    "EGBK": (52.3061111111, -0.791388888889),
-    "EGBM": (52.8147222222, -1.76111111111),
-    "EGBN": (52.92, -1.07916666667),
-    "EGBO": (52.5175, -2.25972222222),
-    "EGBP": (51.6680555556, -2.05694444444),
-    "EGBS": (52.2416666667, -2.88111111111),
-    "EGBT": (52.0408333333, -1.09555555556),
-    "EGBV": (52.0713888889, -1.01666666667),
-    "EGBW": (52.1922222222, -1.61444444444),
-    "EGCA": (53.3047222222, -1.43055555556),
-    "EGCB": (53.4716666667, -2.38972222222),
-    "EGCC": (53.3536111111, -2.27472222222),
-    "EGCD": (53.3380555556, -2.14888888889),
-    "EGCF": (53.5597222222, -0.858333333333),
-    "EGCI": (53.5072222222, -1.105),
-    "EGCJ": (53.7841666667, -1.21777777778),
-    "EGCK": (53.1016666667, -4.3375),
-    "EGCL": (52.7394444444, -0.03),
-    "EGCN": (53.4752777778, -1.00416666667),
-    "EGCR": (51.3563888889, -0.117222222222),
-    "EGCS": (53.3805555556, -0.688611111111),
-    "EGCV": (52.8347222222, -2.77027777778),
-    "EGCW": (52.6294444444, -3.1525),
-    "EGDC": (51.0869444444, -4.15027777778),
-    "EGDG": (50.4405555556, -4.99527777778),
-    "EGDJ": (51.2905555556, -1.77833333333),
-    "EGDL": (51.505, -1.99333333333),
-    "EGDM": (51.1519444444, -1.74722222222),
-    "EGDO": (49.9991666667, -5.23055555556),
-    "EGDP": (50.5688888889, -2.45194444444),
-    "EGDR": (50.0858333333, -5.25555555556),
-    "EGDV": (51.525, -2.13333333333),
-    "EGDW": (50.9641666667, -2.93833333333),
-    "EGDX": (51.4047222222, -3.43555555556),
-    "EGDY": (51.0091666667, -2.63861111111),
-    "EGEC": (55.4372222222, -5.68638888889),
-    "EGED": (59.1905555556, -2.77222222222),
-    "EGEF": (59.5352777778, -1.61722222222),
-    "EGEH": (60.3766666667, -0.927222222222),
-    "EGEN": (59.3675, -2.43444444444),
-    "EGEO": (56.4636111111, -5.4),
-    "EGEP": (59.3516666667, -2.90027777778),
-    "EGER": (59.1552777778, -2.64138888889),
-    "EGES": (59.2502777778, -2.57666666667),
-    "EGET": (60.1919444444, -1.24361111111),
-    "EGEW": (59.3502777778, -2.95055555556),
-    "EGFA": (52.1147222222, -4.55944444444),
-    "EGFC": (51.4675, -3.1375),
-    "EGFE": (51.8330555556, -4.96111111111),
-    "EGFF": (51.3966666667, -3.34333333333),
-    "EGFH": (51.6052777778, -4.06777777778),
-    "EGFP": (51.7138888889, -4.31222222222),
-    "EGGD": (51.3825, -2.71888888889),
-    "EGGP": (53.3336111111, -2.84972222222),
-    "EGGW": (51.8744444444, -0.368333333333),
-    "EGHA": (50.9672222222, -2.15361111111),
-    "EGHC": (50.1027777778, -5.67055555556),
-    "EGHD": (50.4227777778, -4.10583333333),
-    "EGHE": (49.9133333333, -6.29166666667),
-    "EGHG": (50.94, -2.65861111111),
-    "EGHH": (50.78, -1.8425),
-    "EGHI": (50.95, -1.35666666667),
-    "EGHJ": (50.6780555556, -1.10944444444),
-    "EGHK": (50.1280555556, -5.51833333333),
-    "EGHL": (51.185, -1.03222222222),
-    "EGHN": (50.6530555556, -1.18222222222),
-    "EGHO": (51.2105555556, -1.6),
-    "EGHP": (51.1944444444, -1.23611111111),
-    "EGHQ": (50.4408333333, -4.99527777778),
-    "EGHT": (49.9455555556, -6.33138888889),
-    "EGHU": (50.9286111111, -3.98944444444),
-    "EGHY": (50.2786111111, -5.1425),
-    "EGJA": (49.7066666667, -2.21444444444),
-    "EGJB": (49.4347222222, -2.60194444444),
-    "EGJJ": (49.2077777778, -2.19527777778),
-    "EGKA": (50.8355555556, -0.297222222222),
-    "EGKB": (51.3308333333, 0.0325),
-    "EGKF": (50.8158333333, -0.5775),
-    "EGKG": (50.9005555556, -0.739722222222),
-    "EGKH": (51.1566666667, 0.6425),
-    "EGKK": (51.1480555556, -0.190277777778),
-    "EGKR": (51.2136111111, -0.138611111111),
-    "EGLA": (50.4997222222, -4.66583333333),
-    "EGLC": (51.505, 0.0541666666667),
-    "EGLD": (51.5883333333, -0.513055555556),
-    "EGLF": (51.2758333333, -0.776111111111),
-    "EGLG": (51.8019444444, -0.158333333333),
-    "EGLJ": (51.6761111111, -1.08083333333),
-    "EGLK": (51.3238888889, -0.8475),
-    "EGLL": (51.4775, -0.461388888889),
-    "EGLM": (51.5008333333, -0.774444444444),
-    "EGLP": (51.3838888889, -1.16916666667),
-    "EGLS": (51.0988888889, -1.78416666667),
-    "EGLT": (51.4205555556, -0.659166666667),
-    "EGLW": (51.47, -0.179444444444),
-    "EGMC": (51.5713888889, 0.695555555556),
-    "EGMD": (50.9561111111, 0.939166666667),
-    "EGMH": (51.3422222222, 1.34611111111),
-    "EGMJ": (52.1666666667, -0.153888888889),
-    "EGMK": (51.0833333333, 1.01666666667),
-    "EGML": (51.5286111111, 0.245555555556),
-    "EGNA": (53.0144444444, -1.21833333333),
-    "EGNB": (53.7194444444, -0.566111111111),
-    "EGNC": (54.9375, -2.80916666667),
-    "EGNE": (53.2805555556, -0.951388888889),
-    "EGNF": (53.3169444444, -1.19638888889),
-    "EGNG": (54.2166666667, -1.28333333333),
-    "EGNH": (53.7716666667, -3.02861111111),
-    "EGNJ": (53.5744444444, -0.350833333333),
-    "EGNL": (54.1297222222, -3.25611111111),
-    "EGNM": (53.8658333333, -1.66055555556),
-    "EGNO": (53.745, -2.88305555556),
-    "EGNR": (53.1780555556, -2.97777777778),
-    "EGNS": (54.0833333333, -4.62388888889),
-    "EGNT": (55.0375, -1.69166666667),
-    "EGNU": (53.9805555556, -0.864722222222),
-    "EGNV": (54.5091666667, -1.42916666667),
-    "EGNW": (53.3169444444, -0.348888888889),
-    "EGNX": (52.8311111111, -1.32805555556),
-    "EGNY": (53.8983333333, -0.361388888889),
-    "EGOD": (52.8116666667, -4.12333333333),
-    "EGOE": (52.8711111111, -2.53333333333),
-    "EGOQ": (53.2583333333, -4.37333333333),
-    "EGOS": (52.7980555556, -2.66777777778),
-    "EGOV": (53.2480555556, -4.53527777778),
-    "EGOW": (53.5813888889, -3.05527777778),
-    "EGOY": (54.8511111111, -4.94777777778),
-    "EGPA": (58.9580555556, -2.905),
-    "EGPB": (59.8788888889, -1.29555555556),
-    "EGPC": (58.4586111111, -3.09277777778),
-    "EGPD": (57.2041666667, -2.20027777778),
-    "EGPE": (57.54, -4.05),
-    "EGPF": (55.8719444444, -4.43305555556),
-    "EGPG": (55.9747222222, -3.97555555556),
-    "EGPH": (55.95, -3.3725),
-    "EGPI": (55.6819444444, -6.25666666667),
-    "EGPJ": (56.1833333333, -3.22027777778),
-    "EGPK": (55.5077777778, -4.58666666667),
-    "EGPL": (57.4811111111, -7.36277777778),
-    "EGPM": (60.4322222222, -1.29805555556),
-    "EGPN": (56.4525, -3.02583333333),
-    "EGPO": (58.2136111111, -6.32888888889),
-    "EGPR": (57.0252777778, -7.44972222222),
-    "EGPT": (56.4391666667, -3.37222222222),
-    "EGPU": (56.4991666667, -6.86916666667),
-    "EGPY": (58.5833333333, -3.72777777778),
-    "EGQK": (57.6494444444, -3.56055555556),
-    "EGQL": (56.3727777778, -2.86833333333),
-    "EGQM": (55.4069444444, -1.62305555556),
-    "EGQS": (57.705, -3.33916666667),
-    "EGRR": (51.3833333333, -0.783333333333),
-    "EGSC": (52.205, 0.175),
-    "EGSD": (52.6363888889, 1.72305555556),
-    "EGSE": (52.0308333333, 1.19472222222),
-    "EGSF": (52.4680555556, -0.251111111111),
-    "EGSG": (51.6525, 0.156111111111),
-    "EGSH": (52.6758333333, 1.28277777778),
-    "EGSJ": (52.5111111111, 1.41722222222),
-    "EGSK": (52.5644444444, 1.17083333333),
-    "EGSL": (51.895, 0.449166666667),
-    "EGSM": (52.4352777778, 1.61833333333),
-    "EGSN": (52.2105555556, -0.0425),
-    "EGSO": (52.1711111111, 1.11111111111),
-    "EGSP": (52.5558333333, -0.386388888889),
-    "EGSQ": (51.785, 1.13),
-    "EGSR": (51.9144444444, 0.6825),
-    "EGSS": (51.885, 0.235),
-    "EGSU": (52.0922222222, 0.159444444444),
-    "EGSV": (52.4975, 1.05194444444),
-    "EGSX": (51.7216666667, 0.154166666667),
-    "EGSY": (53.3941666667, -1.38833333333),
-    "EGTB": (51.6116666667, -0.808333333333),
-    "EGTC": (52.0722222222, -0.616666666667),
-    "EGTD": (51.1166666667, -0.534444444444),
-    "EGTE": (50.7344444444, -3.41388888889),
-    "EGTF": (51.3480555556, -0.558611111111),
-    "EGTG": (51.5194444444, -2.59083333333),
-    "EGTH": (51.7666666667, 0.25),
-    "EGTI": (51.6933333333, -0.419722222222),
-    "EGTK": (51.8369444444, -1.32),
-    "EGTN": (51.9297222222, -1.4275),
-    "EGTO": (51.3519444444, 0.502777777778),
-    "EGTP": (50.3305555556, -5.17944444444),
-    "EGTR": (51.6558333333, -0.325833333333),
-    "EGTU": (50.86, -3.23472222222),
-    "EGUB": (51.6161111111, -1.09555555556),
-    "EGUD": (51.6908333333, -1.31666666667),
-    "EGUL": (52.4091666667, 0.560833333333),
-    "EGUN": (52.3608333333, 0.488333333333),
-    "EGUO": (51.4391666667, -2.28638888889),
-    "EGUW": (52.1272222222, 0.955833333333),
-    "EGUY": (52.3572222222, -0.107777777778),
-    "EGVA": (51.6819444444, -1.79),
-    "EGVN": (51.7497222222, -1.58361111111),
-    "EGVO": (51.2341666667, -0.942777777778),
-    "EGWA": (51.2086111111, -1.52527777778),
-    "EGWC": (52.64, -2.30555555556),
-    "EGWE": (52.0155555556, -0.303333333333),
-    "EGWN": (51.7916666667, -0.736111111111),
-    "EGWU": (51.5527777778, -0.418055555556),
-    "EGXC": (53.0927777778, -0.165833333333),
-    "EGXD": (54.1369444444, -1.42),
-    "EGXE": (54.2922222222, -1.535),
-    "EGXG": (53.8341666667, -1.19527777778),
-    "EGXH": (52.3425, 0.772777777778),
-    "EGXJ": (52.7355555556, -0.648611111111),
-    "EGXP": (53.3075, -0.550833333333),
-    "EGXT": (52.6125, -0.476388888889),
-    "EGXU": (54.0494444444, -1.25194444444),
-    "EGXW": (53.1661111111, -0.523611111111),
-    "EGXY": (53.0233333333, -0.911666666667),
-    "EGXZ": (54.2055555556, -1.38222222222),
-    "EGYC": (52.7547222222, 1.35722222222),
-    "EGYD": (53.0305555556, -0.481111111111),
-    "EGYE": (52.9622222222, -0.561388888889),
-    "EGYM": (52.6483333333, 0.550277777778),
-    "EGYP": (-51.8227777778, -58.4472222222),
-    "EHAM": (52.3086111111, 4.76388888889),
-    "EHBD": (51.2552777778, 5.60138888889),
-    "EHBK": (50.9113888889, 5.77),
-    "EHDL": (52.0605555556, 5.87305555556),
-    "EHDP": (51.5261111111, 5.85944444444),
-    "EHDR": (53.1191666667, 6.12972222222),
-    "EHEH": (51.45, 5.37444444444),
-    "EHGG": (53.1194444444, 6.57944444444),
-    "EHGR": (51.5677777778, 4.93305555556),
-    "EHHO": (52.7308333333, 6.51611111111),
-    "EHHV": (52.1919444444, 5.14694444444),
-    "EHKD": (52.9233333333, 4.78055555556),
-    "EHLE": (52.4602777778, 5.52722222222),
-    "EHLW": (53.2286111111, 5.76055555556),
-    "EHMC": (52.2352777778, 5.75),
-    "EHMZ": (51.5122222222, 3.73111111111),
-    "EHOW": (53.2080555556, 7.03166666667),
-    "EHRD": (51.9572222222, 4.44166666667),
-    "EHSB": (52.1269444444, 5.27638888889),
-    "EHSE": (51.5547222222, 4.5525),
-    "EHST": (52.9986111111, 7.02277777778),
-    "EHTE": (52.2447222222, 6.04666666667),
-    "EHTL": (52.0572222222, 5.92444444444),
-    "EHTW": (52.27, 6.87416666667),
-    "EHTX": (53.1152777778, 4.83361111111),
-    "EHVB": (52.1697222222, 4.42611111111),
-    "EHVE": (51.3930555556, 6.06277777778),
-    "EHVK": (51.6572222222, 5.69083333333),
-    "EHWO": (51.4488888889, 4.34194444444),
-    "EHYP": (52.0833333333, 4.31666666667),
-    "EIAB": (53.5913888889, -7.64277777778),
-    "EIBN": (51.6688888889, -9.48444444444),
-    "EIBR": (53.0708333333, -7.89861111111),
-    "EICA": (53.2305555556, -9.46777777778),
-    "EICK": (51.8427777778, -8.49194444444),
-    "EICL": (53.2497222222, -7.12333333333),
-    "EICM": (53.3013888889, -8.93916666667),
-    "EICN": (52.6663888889, -8.68194444444),
-    "EIDL": (55.0441666667, -8.34083333333),
-    "EIDW": (53.4211111111, -6.27),
-    "EIIM": (53.1069444444, -9.65388888889),
-    "EIKL": (52.6508333333, -7.29611111111),
-    "EIKN": (53.9102777778, -8.81833333333),
-    "EIKY": (52.1808333333, -9.52361111111),
-    "EIME": (53.3027777778, -6.44277777778),
-    "EIMG": (52.8538888889, -7.98361111111),
-    "EIMY": (52.7030833333, -7.7055),
-    "EINN": (52.7019444444, -8.92472222222),
-    "EIRT": (52.1055555556, -8.98333333333),
-    "EISG": (54.28, -8.59916666667),
-    "EIWF": (52.1869444444, -7.08694444444),
-    "EIWT": (53.3522222222, -6.48833333333),
-    "EKAH": (56.3041666667, 10.6194444444),
-    "EKBI": (55.7402777778, 9.15166666667),
-    "EKCH": (55.6177777778, 12.6558333333),
-    "EKEB": (55.5258333333, 8.55333333333),
-    "EKGH": (55.9411111111, 12.3822222222),
-    "EKHG": (56.1847222222, 9.04444444444),
-    "EKHO": (56.3966666667, 8.44333333333),
-    "EKKA": (56.2972222222, 9.12444444444),
-    "EKLS": (57.2777777778, 11.0013888889),
-    "EKLV": (56.5030472222, 8.31155277778),
-    "EKMB": (54.6991666667, 11.44),
-    "EKOD": (55.4761111111, 10.3291666667),
-    "EKPB": (54.8702777778, 9.27916666667),
-    "EKRD": (56.5049527778, 10.0324472222),
-    "EKRK": (55.5855555556, 12.1313888889),
-    "EKRN": (55.0630555556, 14.7594444444),
-    "EKSB": (54.9641666667, 9.79166666667),
-    "EKSN": (57.5033333333, 10.2291666667),
-    "EKSP": (55.2252777778, 9.26388888889),
-    "EKSV": (56.55, 9.17277777778),
-    "EKTS": (57.0686111111, 8.705),
-    "EKVA": (55.6969444444, 9.19333333333),
-    "EKVD": (55.4361111111, 9.33083333333),
-    "EKVG": (62.0636111111, -7.27694444444),
-    "EKVH": (56.8469444444, 9.45861111111),
-    "EKVJ": (55.99, 8.35388888889),
-    "EKVL": (55.7672222222, 12.3433333333),
-    "EKYT": (57.0927777778, 9.84888888889),
-    "ELLX": (49.6263888889, 6.21138888889),
-    "ENAL": (62.5602777778, 6.11),
-    "ENAN": (69.2925, 16.1441666667),
-    "ENAS": (78.9277777778, 11.8747222222),
-    "ENAT": (69.9769444444, 23.3661111111),
-    "ENBJ": (74.5166666667, 19.0166666667),
-    "ENBL": (61.3925, 5.76416666667),
-    "ENBM": (60.6386111111, 6.50138888889),
-    "ENBN": (65.4591666667, 12.2136111111),
-    "ENBO": (67.2688888889, 14.3633333333),
-    "ENBR": (60.2933333333, 5.21805555556),
-    "ENBS": (70.6, 29.6925),
-    "ENBV": (70.8713888889, 29.0341666667),
-    "ENCN": (58.2041666667, 8.08527777778),
-    "ENDI": (60.4166666667, 8.51388888889),
-    "ENDR": (64.355556, 7.791667),
-    "ENDU": (69.0555555556, 18.5402777778),
-    "ENEN": (67.9672222222, 14.9925),
-    "ENEV": (68.4911111111, 16.6780555556),
-    "ENFB": (59.8955555556, 10.6169444444),
-    "ENFG": (61.0111111111, 9.29305555556),
-    "ENFL": (61.5838888889, 5.025),
-    "ENFR": (59.933333, 2),
-    "ENGC": (61.2149444444, 2.27386944444),
-    "ENGK": (58.5166666667, 8.7),
-    "ENGM": (60.1938888889, 11.1002777778),
-    "ENHA": (60.8183333333, 11.0672222222),
-    "ENHD": (59.345, 5.20833333333),
-    "ENHE": (65.325, 2.326667),
-    "ENHF": (70.6797222222, 23.6686111111),
-    "ENHK": (70.4866666667, 22.1397222222),
-    "ENHV": (71.0097222222, 25.9836111111),
-    "ENJA": (70.9611111111, -8.57583333333),
-    "ENJB": (59.3, 10.3666666667),
-    "ENKB": (63.1116666667, 7.82444444444),
-    "ENKJ": (59.9691666667, 11.0358333333),
-    "ENKR": (69.725, 29.8875),
-    "ENLI": (58.1002777778, 6.625),
-    "ENLK": (68.1525, 13.6094444444),
-    "ENMH": (71.0288888889, 27.8263888889),
-    "ENML": (62.7461111111, 7.2725),
-    "ENMS": (65.7838888889, 13.2147222222),
-    "ENNA": (70.0686111111, 24.9733333333),
-    "ENNK": (68.4358333333, 17.3880555556),
-    "ENNM": (64.4666666667, 11.6),
-    "ENNO": (59.5655555556, 9.21166666667),
-    "ENOL": (63.6988888889, 9.60388888889),
-    "ENOP": (62.6497222222, 9.84666666667),
-    "ENOV": (62.1786111111, 6.07583333333),
-    "ENRA": (66.3638888889, 14.3016666667),
-    "ENRK": (59.3975, 11.3469444444),
-    "ENRM": (64.8383333333, 11.1461111111),
-    "ENRO": (62.5783333333, 11.3422222222),
-    "ENRS": (67.5277777778, 12.1033333333),
-    "ENRY": (59.3788888889, 10.7855555556),
-    "ENSA": (77.8969444444, 16.725),
-    "ENSB": (78.2461111111, 15.4655555556),
-    "ENSD": (61.83, 6.10583333333),
-    "ENSG": (61.1561111111, 7.13638888889),
-    "ENSH": (68.2433, 14.6692),
-    "ENSK": (68.5808333333, 15.0261111111),
-    "ENSN": (59.185, 9.56694444444),
-    "ENSO": (59.7916666667, 5.34083333333),
-    "ENSR": (69.7869444444, 20.9594444444),
-    "ENSS": (70.3552777778, 31.0447222222),
-    "ENST": (65.9566666667, 12.4688888889),
-    "ENTC": (69.6833333333, 18.9188888889),
-    "ENTO": (59.1866666667, 10.2586111111),
-    "ENUK": (60.7908333333, 9.05055555556),
-    "ENVA": (63.4575, 10.9397222222),
-    "ENVD": (70.0652777778, 29.8447222222),
-    "ENVR": (67.6544444444, 12.7269444444),
-    "ENZV": (58.8766666667, 5.63777777778),
-    "EPBK": (53.6019444444, 24.0538888889),
-    "EPBY": (53.0966666667, 17.9777777778),
-    "EPGD": (54.3775, 18.4661111111),
-    "EPKK": (50.0775, 19.7847222222),
-    "EPKM": (50.2383333333, 19.035),
-    "EPKO": (54.0422222222, 16.2636111111),
-    "EPKR": (49.6833333333, 21.7336111111),
-    "EPKS": (52.3302777778, 16.9655555556),
-    "EPKT": (50.4741666667, 19.08),
-    "EPLB": (51.2361111111, 22.7152777778),
-    "EPLK": (51.5516666667, 19.1791666667),
-    "EPLL": (51.7219444444, 19.3980555556),
-    "EPLU": (51.4227777778, 16.1961111111),
-    "EPML": (50.3222222222, 21.4619444444),
-    "EPMO": (52.4511111111, 20.6516666667),
-    "EPNL": (49.7452777778, 20.6233333333),
-    "EPNT": (49.4625, 20.0502777778),
-    "EPOK": (54.5797222222, 18.5172222222),
-    "EPPO": (52.4211111111, 16.8263888889),
-    "EPRZ": (50.11, 22.0188888889),
-    "EPSC": (53.5847222222, 14.9019444444),
-    "EPSD": (53.3919444444, 14.6336111111),
-    "EPSK": (54.4788888889, 17.1075),
-    "EPSN": (53.7905555556, 15.8280555556),
-    "EPSY": (53.4819444444, 20.9377777778),
-    "EPTO": (53.0291666667, 18.5458333333),
-    "EPWA": (52.1655555556, 20.9669444444),
-    "EPWR": (51.1025, 16.8858333333),
-    "EPZG": (52.1386111111, 15.7986111111),
-    "ESCF": (58.4022222222, 15.5255555556),
-    "ESCK": (58.6108333333, 16.1033333333),
-    "ESCM": (59.8972222222, 17.5883333333),
-    "ESCN": (59.1808333333, 17.9122222222),
-    "ESDB": (56.2958333333, 12.8469444444),
-    "ESDF": (56.2666666667, 15.265),
-    "ESFH": (58.4091666667, 13.2625),
-    "ESFI": (56.1836111111, 14.1322222222),
-    "ESFM": (58.5980555556, 14.1136111111),
-    "ESFQ": (56.8441666667, 15.4525),
-    "ESFR": (58.4980555556, 13.0530555556),
-    "ESFY": (56.785, 13.6016666667),
-    "ESGG": (57.6627777778, 12.2797222222),
-    "ESGJ": (57.7575, 14.0686111111),
-    "ESGK": (58.1697222222, 13.5877777778),
-    "ESGL": (58.4652777778, 13.1741666667),
-    "ESGP": (57.7747222222, 11.8702777778),
-    "ESGR": (58.4563888889, 13.9725),
-    "ESGT": (58.3180555556, 12.345),
-    "ESIA": (58.5136111111, 14.5069444444),
-    "ESIB": (58.4263888889, 12.7141666667),
-    "ESKA": (60.1327777778, 18.105),
-    "ESKB": (59.4186111111, 17.8905555556),
-    "ESKK": (59.3458333333, 14.4958333333),
-    "ESKM": (60.9577777778, 14.5111111111),
-    "ESKN": (58.7886111111, 16.9119444444),
-    "ESKS": (59.3138888889, 17.1091666667),
-    "ESKV": (59.6758333333, 12.6391666667),
-    "ESKX": (58.7908333333, 16.5708333333),
-    "ESMA": (56.6105555556, 15.6047222222),
-    "ESMG": (56.9502777778, 13.9216666667),
-    "ESMK": (55.9216666667, 14.0852777778),
-    "ESML": (55.9447222222, 12.8608333333),
-    "ESMN": (55.6875, 13.2116666667),
-    "ESMO": (57.3502777778, 16.4977777778),
-    "ESMP": (57.2641666667, 13.5991666667),
-    "ESMQ": (56.6852777778, 16.2875),
-    "ESMS": (55.53, 13.3713888889),
-    "ESMT": (56.6911111111, 12.82),
-    "ESMV": (57.2922222222, 14.1372222222),
-    "ESMX": (56.9288888889, 14.7277777778),
-    "ESNA": (63.7383333333, 15.4583333333),
-    "ESNC": (62.4088888889, 13.7472222222),
-    "ESND": (62.0477777778, 14.4227777778),
-    "ESNF": (61.8980555556, 15.7052777778),
-    "ESNG": (67.1322222222, 20.8144444444),
-    "ESNH": (61.7680555556, 17.0805555556),
-    "ESNI": (63.6336111111, 17.9397222222),
-    "ESNJ": (66.4961111111, 20.1469444444),
-    "ESNK": (63.0483333333, 17.7686111111),
-    "ESNL": (64.5480555556, 18.7161111111),
-    "ESNM": (63.1286111111, 14.8027777778),
-    "ESNN": (62.5280555556, 17.4438888889),
-    "ESNO": (63.4083333333, 18.99),
-    "ESNP": (65.3994444444, 21.2652777778),
-    "ESNQ": (67.8219444444, 20.3366666667),
-    "ESNR": (61.19, 14.7125),
-    "ESNS": (64.6247222222, 21.0766666667),
-    "ESNT": (62.4811111111, 17.0027777778),
-    "ESNU": (63.7916666667, 20.2825),
-    "ESNV": (64.5788888889, 16.8333333333),
-    "ESNX": (65.59, 19.2816666667),
-    "ESNZ": (63.1941666667, 14.5019444444),
-    "ESOE": (59.2236111111, 15.0377777778),
-    "ESOH": (60.02, 13.5788888889),
-    "ESOK": (59.4447222222, 13.3375),
-    "ESOW": (59.5894444444, 16.6336111111),
-    "ESPA": (65.5436111111, 22.1219444444),
-    "ESPC": (63.1938888889, 14.5019444444),
-    "ESPE": (65.8752777778, 20.1497222222),
-    "ESPJ": (65.8361111111, 21.4713888889),
-    "ESQO": (59.3863888889, 15.9238888889),
-    "ESSA": (59.6519444444, 17.9186111111),
-    "ESSB": (59.3541666667, 17.9413888889),
-    "ESSD": (60.4219444444, 15.515),
-    "ESSF": (57.5255555556, 15.8238888889),
-    "ESSK": (60.5933333333, 16.9513888889),
-    "ESSL": (58.4061111111, 15.6802777778),
-    "ESSP": (58.5861111111, 16.2505555556),
-    "ESST": (60.1575, 12.9911111111),
-    "ESSU": (59.3508333333, 16.7083333333),
-    "ESSV": (57.6627777778, 18.3461111111),
-    "ESTA": (56.2961111111, 12.8472222222),
-    "ESTT": (55.3944444444, 13.025),
-    "ESUA": (64.5705555556, 19.3141666667),
-    "ESUD": (64.9608333333, 17.6963888889),
-    "ESUE": (61.8686111111, 12.6905555556),
-    "ESUF": (65.1063888889, 20.7605555556),
-    "ESUK": (67.7647222222, 20.2572222222),
-    "ESUP": (67.2455555556, 23.0688888889),
-    "ESUT": (65.8061111111, 15.0827777778),
-    "ETAD": (49.9725, 6.6925),
-    "ETAR": (49.4375, 7.60138888889),
-    "ETEJ": (49.9202777778, 10.9141666667),
-    "ETEK": (49.65, 7.3),
-    "ETEU": (49.6480555556, 9.96638888889),
-    "ETHA": (47.835, 10.8711111111),
-    "ETHB": (52.2783333333, 9.08194444444),
-    "ETHC": (52.5911111111, 10.0219444444),
-    "ETHE": (52.2911111111, 7.38694444444),
-    "ETHF": (51.1144444444, 9.28583333333),
-    "ETHI": (53.9944444444, 9.57833333333),
-    "ETHL": (48.2202777778, 9.91),
-    "ETHM": (50.3658333333, 7.315),
-    "ETHN": (49.3916666667, 9.95805555556),
-    "ETHR": (49.2175, 11.1005555556),
-    "ETHS": (52.9191666667, 10.1836111111),
-    "ETHT": (51.7677777778, 14.2919444444),
-    "ETIC": (49.6994444444, 11.9411111111),
-    "ETID": (50.1691666667, 8.96138888889),
-    "ETIE": (49.3933333333, 8.65194444444),
-    "ETIH": (49.2180555556, 11.8361111111),
-    "ETIN": (49.7430555556, 10.2005555556),
-    "ETME": (54.6247222222, 9.34138888889),
-    "ETMN": (53.7675, 8.65833333333),
-    "ETND": (52.5852777778, 8.34055555556),
-    "ETNG": (50.9608333333, 6.0425),
-    "ETNH": (54.3119444444, 9.53805555556),
-    "ETNJ": (53.5333333333, 7.88861111111),
-    "ETNL": (53.9180555556, 12.2791666667),
-    "ETNN": (50.8311111111, 6.65805555556),
-    "ETNP": (52.3386111111, 7.54111111111),
-    "ETNR": (51.6636111111, 14.6336111111),
-    "ETNS": (54.4591666667, 9.51611111111),
-    "ETNT": (53.5477777778, 7.66722222222),
-    "ETNU": (53.6019444444, 13.3058333333),
-    "ETNW": (52.4572222222, 9.42694444444),
-    "ETOI": (49.6336111111, 11.7672222222),
-    "ETOR": (49.5633333333, 8.46333333333),
-    "ETOU": (50.0497222222, 8.32527777778),
-    "ETSA": (48.0705555556, 10.9058333333),
-    "ETSB": (50.1736111111, 7.06333333333),
-    "ETSE": (48.3222222222, 11.9486111111),
-    "ETSF": (48.2055555556, 11.2669444444),
-    "ETSH": (51.7677777778, 13.1675),
-    "ETSI": (48.7155555556, 11.5338888889),
-    "ETSL": (48.1861111111, 10.8622222222),
-    "ETSM": (47.9886111111, 10.2394444444),
-    "ETSN": (48.7108333333, 11.2111111111),
-    "ETUL": (51.6016666667, 6.1425),
-    "ETUO": (51.9227777778, 8.30611111111),
-    "ETUR": (51.1997222222, 6.13194444444),
-    "EVAD": (57.0985, 24.2662),
-    "EVDA": (55.9416666667, 26.6683333333),
-    "EVEA": (56.6716666667, 23.6783333333),
-    "EVFA": (56.405, 21.8866666667),
-    "EVGA": (56.7783333333, 24.8533333333),
-    "EVKA": (56.535, 25.8916666667),
-    "EVLA": (56.5175, 21.0969444444),
-    "EVRA": (56.9236111111, 23.9711111111),
-    "EVRC": (56.8833333333, 24.2266666667),
-    "EVRS": (56.9911111111, 24.075),
-    "EVSM": (56.6655555556, 24.9033333333),
-    "EVTA": (56.9416666667, 23.2233333333),
-    "EVVA": (57.3577777778, 21.5441666667),
-    "EYKA": (54.9638888889, 24.0847222222),
-    "EYKL": (55.7119444444, 21.2427777778),
-    "EYKR": (54.8066666667, 23.5316666667),
-    "EYKS": (54.88, 23.8816666667),
-    "EYND": (55.3277777778, 21.0458333333),
-    "EYPA": (55.9733333333, 21.0938888889),
-    "EYPP": (55.73, 24.46),
-    "EYPR": (54.655, 24.0583333333),
-    "EYRU": (55.01, 24.3633333333),
-    "EYSA": (55.8938888889, 23.3947222222),
-    "EYSB": (56.0705555556, 23.5580555556),
-    "EYVI": (54.6369444444, 25.2877777778),
-    "FAAB": (-28.575, 16.5333333333),
-    "FAAG": (-29.2816666667, 18.8136111111),
-    "FAAP": (-25.9436111111, 29.81),
-    "FABB": (-26.2386111111, 28.3016666667),
-    "FABE": (-32.8969444444, 27.2788888889),
-    "FABL": (-29.0925, 26.3022222222),
-    "FABM": (-28.2483333333, 28.3361111111),
-    "FABO": (-27.3666666667, 26.6291666667),
-    "FACN": (-30.9875, 22.1305555556),
-    "FACR": (-26.3694444444, 27.35),
-    "FACT": (-33.9647222222, 18.6016666667),
-    "FACV": (-31.5002777778, 19.7258333333),
-    "FADA": (-30.6366666667, 23.92),
-    "FADB": (-24.805, 26.8316666667),
-    "FADD": (-28.1825, 30.2244444444),
-    "FADN": (-29.97, 30.9502777778),
-    "FAEL": (-33.0355555556, 27.8258333333),
-    "FAEO": (-26.4952777778, 29.98),
-    "FAER": (-23.7261111111, 27.6875),
-    "FAFB": (-28.8230555556, 27.9088888889),
-    "FAFK": (-33.7694444444, 18.7333333333),
-    "FAGC": (-25.9861111111, 28.14),
-    "FAGG": (-34.0052777778, 22.3788888889),
-    "FAGI": (-23.2836111111, 30.6497222222),
-    "FAGM": (-26.2425, 28.1511111111),
-    "FAGT": (-33.2847222222, 26.4980555556),
-    "FAGY": (-29.1219444444, 30.5866666667),
-    "FAHA": (-28.0786111111, 26.8611111111),
-    "FAHE": (-25.9794444444, 29.6186111111),
-    "FAHG": (-26.5061111111, 28.3938888889),
-    "FAHL": (-28.0083333333, 32.275),
-    "FAHO": (-27.2783333333, 27.9958333333),
-    "FAHR": (-28.235, 29.1061111111),
-    "FAHS": (-24.3686111111, 31.0486111111),
-    "FAHV": (-30.5619444444, 25.5280555556),
-    "FAJS": (-26.1391666667, 28.2458333333),
-    "FAKD": (-26.8708333333, 26.7177777778),
-    "FAKG": (-26.0933333333, 29.4547222222),
-    "FAKL": (-26.2516666667, 29.1944444444),
-    "FAKM": (-28.8027777778, 24.765),
-    "FAKN": (-25.3833333333, 31.1055555556),
-    "FAKO": (-32.5769444444, 27.8880555556),
-    "FAKP": (-25.4405555556, 31.9297222222),
-    "FAKR": (-26.0808333333, 27.7255555556),
-    "FAKS": (-27.6605555556, 27.3155555556),
-    "FAKU": (-27.4566666667, 23.4113888889),
-    "FAKZ": (-29.6883333333, 17.0938888889),
-    "FALA": (-25.9383333333, 27.9261111111),
-    "FALB": (-29.1811111111, 27.4530555556),
-    "FALE": (-29.6166666667, 31.1083333333),
-    "FALI": (-26.1755555556, 26.1844444444),
-    "FALM": (-23.16, 29.6966666667),
-    "FALT": (-23.1597222222, 29.6963888889),
-    "FALW": (-32.9688888889, 18.1602777778),
-    "FALY": (-28.5816666667, 29.7497222222),
-    "FAMB": (-25.6847222222, 29.44),
-    "FAMG": (-30.8572222222, 30.3427777778),
-    "FAMI": (-24.9888888889, 29.2830555556),
-    "FAMJ": (-27.0791666667, 29.7783333333),
-    "FAMK": (-25.7527777778, 25.6119444444),
-    "FAMM": (-25.7983333333, 25.5477777778),
-    "FAMN": (-25.4733333333, 31.5655555556),
-    "FAMS": (-22.3558333333, 29.9863888889),
-    "FAMU": (-27.6258333333, 32.0441666667),
-    "FANC": (-27.7705555556, 29.9766666667),
-    "FANS": (-25.5005555556, 30.9133333333),
-    "FANY": (-24.6858333333, 28.4347222222),
-    "FAOB": (-34.5552777778, 20.2502777778),
-    "FAOH": (-33.6069444444, 22.1888888889),
-    "FAOR": (-26.1391666667, 28.2461111111),
-    "FAPA": (-33.5541666667, 26.8797222222),
-    "FAPB": (-23.8452777778, 29.4586111111),
-    "FAPE": (-33.9847222222, 25.6172222222),
-    "FAPG": (-34.0902777778, 23.3277777778),
-    "FAPH": (-23.9369444444, 31.1552777778),
-    "FAPI": (-23.9258333333, 29.4841666667),
-    "FAPJ": (-31.6058333333, 29.5197222222),
-    "FAPM": (-29.6488888889, 30.3986111111),
-    "FAPN": (-25.3336111111, 27.1733333333),
-    "FAPP": (-24.2302777778, 28.9836111111),
-    "FAPQ": (-25.8469444444, 23.5377777778),
-    "FAPS": (-26.6708333333, 27.0816666667),
-    "FAPY": (-26.8891666667, 27.5033333333),
-    "FAQT": (-31.92, 26.8819444444),
-    "FARB": (-28.7408333333, 32.0919444444),
-    "FARG": (-25.6441666667, 27.2711111111),
-    "FARS": (-33.8119444444, 19.9027777778),
-    "FASB": (-29.6891666667, 17.9394444444),
-    "FASC": (-26.5238888889, 29.17),
-    "FASD": (-32.9638888889, 17.9691666667),
-    "FASE": (-24.9455555556, 31.4702777778),
-    "FASI": (-26.2483333333, 28.3975),
-    "FASK": (-25.8094444444, 28.1644444444),
-    "FASS": (-27.6483333333, 22.9991666667),
-    "FASU": (-25.9613888889, 29.2086111111),
-    "FASZ": (-24.9608333333, 31.5886111111),
-    "FATF": (-28.26, 22.9930555556),
-    "FATH": (-23.0786111111, 30.3833333333),
-    "FATN": (-29.3191666667, 26.8233333333),
-    "FATP": (-29.0327777778, 26.1575),
-    "FATT": (-26.7763888889, 29.3386111111),
-    "FATZ": (-23.8241666667, 30.3291666667),
-    "FAUL": (-28.3205555556, 31.4163888889),
-    "FAUP": (-28.4008333333, 21.2605555556),
-    "FAUT": (-31.5477777778, 28.6741666667),
-    "FAVB": (-26.9822222222, 24.7286111111),
-    "FAVG": (-29.7705555556, 31.0583333333),
-    "FAVP": (-26.6922222222, 27.7777777778),
-    "FAVR": (-31.6408333333, 18.5447222222),
-    "FAVV": (-26.5661111111, 27.9605555556),
-    "FAVY": (-27.7866666667, 30.7952777778),
-    "FAWB": (-25.6536111111, 28.2241666667),
-    "FAWI": (-25.8322222222, 29.1919444444),
-    "FAWK": (-25.83, 28.2225),
-    "FAWM": (-27.9977777778, 26.6694444444),
-    "FAWS": (-27.8472222222, 26.3497222222),
-    "FAYP": (-33.9, 18.4980555556),
-    "FAZR": (-25.5988888889, 26.0422222222),
-    "FBFT": (-21.1594444444, 27.4744444444),
-    "FBGM": (-19.3666666667, 22.1666666667),
-    "FBGZ": (-21.6936111111, 21.6577777778),
-    "FBJW": (-24.6022222222, 24.6908333333),
-    "FBKE": (-17.8327777778, 25.1622222222),
-    "FBKG": (-23.6780555556, 22.8177777778),
-    "FBKR": (-19.1494444444, 23.7877777778),
-    "FBKY": (-25.0502777778, 25.3186111111),
-    "FBLO": (-25.1975, 25.7138888889),
-    "FBMM": (-20.3102777778, 23.9086111111),
-    "FBMN": (-19.9725, 23.4308333333),
-    "FBNN": (-19.6802777778, 22.1994444444),
-    "FBNT": (-20.2161111111, 26.1588888889),
-    "FBOR": (-21.2663888889, 25.3202777778),
-    "FBPY": (-22.5636111111, 27.1377777778),
-    "FBRK": (-21.0, 24.3333333333),
-    "FBSK": (-24.555, 25.9180555556),
-    "FBSN": (-20.5533333333, 26.1155555556),
-    "FBSP": (-22.0583333333, 27.8286111111),
-    "FBSR": (-22.4233333333, 26.7566666667),
-    "FBSV": (-18.5205555556, 24.0766666667),
-    "FBSW": (-18.3741666667, 21.8311111111),
-    "FBTE": (-24.0166666667, 21.8833333333),
-    "FBTL": (-22.1833333333, 29.1166666667),
-    "FBTS": (-26.0341666667, 22.4013888889),
-    "FBXG": (-19.0666666667, 23.0666666667),
-    "FCBB": (-4.25166666667, 15.2527777778),
-    "FCBD": (-2.53333333333, 14.75),
-    "FCBK": (-3.95, 14.5166666667),
-    "FCBL": (-2.45, 14.5333333333),
-    "FCBM": (-4.01472222222, 13.9663888889),
-    "FCBS": (-3.74638888889, 13.4113888889),
-    "FCBY": (-4.21666666667, 13.2833333333),
-    "FCBZ": (-2.85, 13.8166666667),
-    "FCMM": (-2.95, 12.7),
-    "FCOB": (-1.03333333333, 15.3833333333),
-    "FCOE": (-0.883333333333, 14.8),
-    "FCOG": (-1.86666666667, 15.8666666667),
-    "FCOI": (1.58944444444, 18.0469444444),
-    "FCOK": (-0.0833333333333, 14.5333333333),
-    "FCOM": (-0.0213888888889, 15.5752777778),
-    "FCOO": (-0.531111111111, 15.95),
-    "FCOS": (2.06666666667, 14.1333333333),
-    "FCOT": (3.05, 18.5),
-    "FCOU": (1.61583333333, 16.0377777778),
-    "FCPA": (-3.48333333333, 12.6166666667),
-    "FCPD": (-4.20777777778, 12.6608333333),
-    "FCPL": (-4.20611111111, 12.6597222222),
-    "FCPP": (-4.81333333333, 11.8858333333),
-    "FDMS": (-26.5288888889, 31.3075),
-    "FEFA": (5.02225, 21.1983611111),
-    "FEFB": (5.40422222222, 26.4873055556),
-    "FEFC": (4.93333333333, 15.9),
-    "FEFE": (4.37477777778, 21.1321666667),
-    "FEFF": (4.39833333333, 18.5186111111),
-    "FEFG": (4.78444444444, 22.7813888889),
-    "FEFI": (10.2361111111, 22.7172222222),
-    "FEFL": (5.26694444444, 17.6330555556),
-    "FEFM": (5.84694444444, 20.6494444444),
-    "FEFN": (8.42666666667, 20.635),
-    "FEFO": (5.95805555556, 15.6375),
-    "FEFP": (7.25175, 16.4407222222),
-    "FEFR": (6.52805555556, 21.9888888889),
-    "FEFS": (6.49197222222, 17.4294444444),
-    "FEFT": (4.22138888889, 15.7861111111),
-    "FEFU": (5.72444444444, 19.1063333333),
-    "FEFW": (8.01075, 22.3979444444),
-    "FEFY": (45.1541666667, -89.1108333333),
-    "FEFZ": (5.00166666667, 25.1022222222),
-    "FEGC": (6.92433333333, 15.6240555556),
-    "FEGE": (5.33297222222, 25.9316111111),
-    "FEGF": (7.31436111111, 18.3089722222),
-    "FEGL": (9.58333333333, 21.7333333333),
-    "FEGM": (5.69397222222, 22.8002777778),
-    "FEGO": (8.90691666667, 22.7976666667),
-    "FEGR": (4.98863888889, 23.9280833333),
-    "FEGU": (6.51705555556, 18.2725555556),
-    "FEGZ": (6.34416666667, 16.3220555556),
-    "FGAB": (-1.41027777778, 5.62194444444),
-    "FGBT": (1.90527777778, 9.80555555556),
-    "FGSL": (3.75527777778, 8.70861111111),
-    "FHAW": (-7.96944444444, -14.3936111111),
-    "FIMP": (-20.43, 57.6833333333),
-    "FIMR": (-19.7577777778, 63.3619444444),
-    "FJDG": (-7.31305555556, 72.4108333333),
-    "FKKB": (2.87433333333, 9.97716666667),
-    "FKKC": (4.08916666667, 9.36027777778),
-    "FKKD": (4.00583333333, 9.71944444444),
-    "FKKF": (5.7045, 9.30577777778),
-    "FKKG": (5.89536111111, 10.0338888889),
-    "FKKH": (10.0928888889, 14.4445),
-    "FKKI": (4.47305555556, 14.3636111111),
-    "FKKJ": (10.3565277778, 15.2376944444),
-    "FKKL": (10.4513888889, 14.2572222222),
-    "FKKM": (5.63666666667, 10.7505555556),
-    "FKKN": (7.35694444444, 13.5591666667),
-    "FKKO": (4.54991666667, 13.7258888889),
-    "FKKR": (9.33583333333, 13.37),
-    "FKKS": (5.44747222222, 10.0679444444),
-    "FKKU": (5.53694444444, 10.3541666667),
-    "FKKV": (6.03916666667, 10.1225),
-    "FKKW": (2.87738888889, 11.1841666667),
-    "FKKY": (3.83527777778, 11.5236111111),
-    "FKYS": (3.7225, 11.5533333333),
-    "FLCP": (-13.5569444444, 32.5869444444),
-    "FLKE": (-12.5727777778, 27.8938888889),
-    "FLKL": (-14.9975, 22.6475),
-    "FLLC": (-15.4138888889, 28.3305555556),
-    "FLLI": (-17.8216666667, 25.8225),
-    "FLLS": (-15.3305555556, 28.4525),
-    "FLMA": (-11.1380555556, 28.875),
-    "FLMF": (-13.2586111111, 31.9363888889),
-    "FLMG": (-15.2544444444, 23.1622222222),
-    "FLML": (-12.5647222222, 28.2986111111),
-    "FLND": (-12.9980555556, 28.6647222222),
-    "FLSO": (-12.9002777778, 28.1497222222),
-    "FLSW": (-12.1741666667, 26.3666666667),
-    "FLZB": (-13.5386111111, 23.1097222222),
-    "FMCH": (-11.5336111111, 43.2716666667),
-    "FMCI": (-12.2980555556, 43.7663888889),
-    "FMCN": (-11.7105555556, 43.2436111111),
-    "FMCV": (-12.1316666667, 44.4302777778),
-    "FMCZ": (-12.8047222222, 45.2811111111),
-    "FMEE": (-20.8869444444, 55.5102777778),
-    "FMEP": (-21.3208333333, 55.4247222222),
-    "FMMA": (-19.0291666667, 47.1719444444),
-    "FMMG": (-18.7, 44.6169444444),
-    "FMMI": (-18.7966666667, 47.4786111111),
-    "FMMK": (-18.8, 45.2833333333),
-    "FMML": (-19.6866666667, 44.5419444444),
-    "FMMN": (-19.5627777778, 45.4508333333),
-    "FMMO": (-18.0505555556, 44.0322222222),
-    "FMMR": (-17.85, 44.9208333333),
-    "FMMS": (-17.0938888889, 49.8158333333),
-    "FMMT": (-18.1094444444, 49.3925),
-    "FMMU": (-17.4761111111, 43.9730555556),
-    "FMMV": (-20.2847222222, 44.3175),
-    "FMMX": (-18.7636111111, 46.0519444444),
-    "FMMZ": (-17.7958333333, 48.4433333333),
-    "FMNA": (-12.3491666667, 49.2916666667),
-    "FMNC": (-16.1638888889, 49.7736111111),
-    "FMND": (-14.6516666667, 49.6205555556),
-    "FMNE": (-13.1883333333, 48.9877777778),
-    "FMNG": (-15.5833333333, 47.6166666667),
-    "FMNH": (-14.9991666667, 50.32),
-    "FMNJ": (-13.6333333333, 48.45),
-    "FMNL": (-14.6294444444, 47.7636111111),
-    "FMNM": (-15.6672222222, 46.3516666667),
-    "FMNN": (-13.3122222222, 48.3138888889),
-    "FMNO": (-16.0830555556, 45.3669444444),
-    "FMNQ": (-16.7419444444, 44.4813888889),
-    "FMNR": (-15.4366666667, 49.6883333333),
-    "FMNS": (-14.2786111111, 50.1747222222),
-    "FMNT": (-16.75, 47.6169444444),
-    "FMNV": (-13.3758333333, 50.0027777778),
-    "FMNW": (-14.8986111111, 47.9938888889),
-    "FMNZ": (-13.4847222222, 48.6325),
-    "FMSD": (-25.0380555556, 46.9561111111),
-    "FMSF": (-21.4413888889, 47.1116666667),
-    "FMSG": (-22.8052777778, 47.8205555556),
-    "FMSJ": (-21.4166666667, 44.3166666667),
-    "FMSK": (-22.1197222222, 48.0216666667),
-    "FMSM": (-21.2016666667, 48.3580555556),
-    "FMSR": (-21.7536111111, 43.3752777778),
-    "FMST": (-23.3833333333, 43.7283333333),
-    "FNAM": (-7.86266666667, 13.1156111111),
-    "FNBC": (-6.26972222222, 14.2469444444),
-    "FNBG": (-12.6088888889, 13.4036111111),
-    "FNCA": (-5.59694444444, 12.1883333333),
-    "FNCF": (-8.78347222222, 17.9905555556),
-    "FNCH": (-7.3575, 20.8036111111),
-    "FNCT": (-9.42947222222, 20.3111111111),
-    "FNCV": (-15.1604722222, 19.1571944444),
-    "FNCX": (-8.37361111111, 18.9236111111),
-    "FNCZ": (-11.8936111111, 22.9161111111),
-    "FNDU": (-7.40063888889, 20.8185277778),
-    "FNGI": (-17.0447222222, 15.6869444444),
-    "FNHU": (-12.8086111111, 15.7602777778),
-    "FNKU": (-12.4044444444, 16.9472222222),
-    "FNLB": (-12.3711111111, 13.5363888889),
-    "FNLK": (-8.44152777778, 20.7328333333),
-    "FNLU": (-8.85833333333, 13.2311111111),
-    "FNMA": (-9.525, 16.3122222222),
-    "FNME": (-14.6575, 17.7197222222),
-    "FNMO": (-15.2611111111, 12.1466666667),
-    "FNNG": (-7.75444444444, 15.2875),
-    "FNPA": (-10.7219444444, 13.7652777778),
-    "FNSA": (-9.68888888889, 20.4316666667),
-    "FNSO": (-6.14083333333, 12.3716666667),
-    "FNTO": (-7.14722222222, 14.2480555556),
-    "FNUA": (-10.7151944444, 22.2305),
-    "FNUB": (-14.92675, 13.57675),
-    "FNUE": (-11.7680555556, 19.8975),
-    "FNUG": (-7.60305555556, 15.0277777778),
-    "FNWK": (-11.4264166667, 15.1015),
-    "FNXA": (-16.7552777778, 14.9652777778),
-    "FNZE": (-7.25902777778, 12.8625833333),
-    "FNZG": (-7.71652777778, 21.3578611111),
-    "FOGA": (-1.13972222222, 13.9033333333),
-    "FOGO": (1.54111111111, 11.5808333333),
-    "FOGQ": (-0.665277777778, 13.6730555556),
-    "FOGR": (-0.704166666667, 10.2455555556),
-    "FOOB": (2.07555555556, 11.4930555556),
-    "FOOD": (-1.5375, 13.2691666667),
-    "FOOG": (-0.711666666667, 8.75416666667),
-    "FOOH": (-1.57472222222, 9.26277777778),
-    "FOOK": (0.579166666667, 12.8908333333),
-    "FOOL": (0.458333333333, 9.41222222222),
-    "FOOM": (0.775555555556, 11.5525),
-    "FOON": (-1.65611111111, 13.4377777778),
-    "FOOR": (-0.826388888889, 12.7466666667),
-    "FOOT": (-2.88888888889, 10.9194444444),
-    "FPPA": (0.0333333333333, 6.51666666667),
-    "FPPR": (1.66277777778, 7.41166666667),
-    "FPST": (0.378055555556, 6.71194444444),
-    "FQAG": (-16.1819444444, 39.9447222222),
-    "FQBR": (-19.7963888889, 34.9075),
-    "FQCB": (-14.82, 36.5319444444),
-    "FQCH": (-19.1511111111, 33.4288888889),
-    "FQES": (-15.7341666667, 32.7566666667),
-    "FQIN": (-23.8763888889, 35.4083333333),
-    "FQLC": (-13.2738888889, 35.2661111111),
-    "FQLU": (-15.0330555556, 40.6716666667),
-    "FQMA": (-25.9208333333, 32.5725),
-    "FQMD": (-11.6727777778, 39.5630555556),
-    "FQMP": (-11.3616666667, 40.3547222222),
-    "FQMR": (-13.225, 37.5519444444),
-    "FQNC": (-14.4880555556, 40.7122222222),
-    "FQNP": (-15.1055555556, 39.2816666667),
-    "FQPB": (-12.9866666667, 40.5222222222),
-    "FQQL": (-17.8555555556, 36.8691666667),
-    "FQSG": (-15.6025, 32.7730555556),
-    "FQTT": (-16.1047222222, 33.64),
-    "FQUG": (-14.7044444444, 34.3522222222),
-    "FQVL": (-22.0183333333, 35.3130555556),
-    "FSAL": (-7.00472222222, 52.7261111111),
-    "FSAS": (-9.73485, 46.5002916667),
-    "FSDR": (-5.69583333333, 53.6544444444),
-    "FSFA": (-10.1094444444, 51.1761111111),
-    "FSIA": (-4.67416666667, 55.5216666667),
-    "FSPP": (-4.31916666667, 55.6913888889),
-    "FSSB": (-3.72146944444, 55.2086972222),
-    "FSSC": (-7.16416666667, 56.2638888889),
-    "FSSD": (-3.800325, 55.6644527778),
-    "FSSF": (-4.58388611111, 55.9462722222),
-    "FTTA": (9.15111111111, 18.3794444444),
-    "FTTB": (10.2883333333, 15.3797222222),
-    "FTTC": (13.8469444444, 20.8441666667),
-    "FTTD": (8.62027777778, 16.0683333333),
-    "FTTE": (14.5239722222, 20.9116666667),
-    "FTTF": (17.1883333333, 21.5116666667),
-    "FTTG": (12.2107222222, 21.4588333333),
-    "FTTH": (9.39766666667, 16.3124166667),
-    "FTTI": (13.2397222222, 18.3135833333),
-    "FTTJ": (12.1336111111, 15.0338888889),
-    "FTTK": (12.3855, 17.0709444444),
-    "FTTL": (13.4435277778, 14.73925),
-    "FTTM": (12.17025, 18.6753611111),
-    "FTTN": (11.0354722222, 20.2749444444),
-    "FTTP": (9.37916666667, 14.9258333333),
-    "FTTR": (20.449, 16.5705555556),
-    "FTTS": (10.4916944444, 16.7204444444),
-    "FTTU": (14.1464444444, 15.3151388889),
-    "FTTY": (17.9169444444, 19.1108333333),
-    "FTTZ": (21.4511944444, 17.0595),
-    "FVBU": (-20.0172222222, 28.6177777778),
-    "FVCP": (-17.7513888889, 30.9244444444),
-    "FVCZ": (-21.0080555556, 31.5783333333),
-    "FVFA": (-18.0961111111, 25.8391666667),
-    "FVGR": (-18.9775, 32.4505555556),
-    "FVHA": (-17.9316666667, 31.0927777778),
-    "FVKB": (-16.5197222222, 28.8847222222),
-    "FVMT": (-17.4316666667, 32.1844444444),
-    "FVMU": (-18.9975, 32.6272222222),
-    "FVMV": (-20.0552777778, 30.8588888889),
-    "FVOT": (-16.985, 32.6727777778),
-    "FVSH": (-20.2894444444, 30.0883333333),
-    "FVTL": (-19.4366666667, 29.8616666667),
-    "FVWN": (-18.6297222222, 27.0208333333),
-    "FVZC": (-19.0286111111, 29.7219444444),
-    "FWCL": (-15.6788888889, 34.9738888889),
-    "FWCM": (-14.3069444444, 35.1325),
-    "FWKA": (-9.95333333333, 33.8927777778),
-    "FWKG": (-13.0144444444, 33.4683333333),
-    "FWKI": (-13.7891666667, 33.7808333333),
-    "FWMG": (30.8377777778, -85.1816666667),
-    "FWUU": (-11.4447222222, 34.0116666667),
-    "FWZA": (-15.3852777778, 35.3844444444),
-    "FXMM": (-29.4622222222, 27.5525),
-    "FXMU": (-29.3038888889, 27.5033333333),
-    "FXSM": (-29.8383333333, 28.06),
-    "FYAR": (-22.4622222222, 14.98),
-    "FYEN": (-17.4830555556, 16.3219444444),
-    "FYGF": (-19.6019444444, 18.1225),
-    "FYKT": (-26.5397222222, 18.1113888889),
-    "FYLZ": (-26.6875, 15.2427777778),
-    "FYMP": (-17.6341666667, 24.1763888889),
-    "FYOA": (-17.8780555556, 15.9525),
-    "FYOG": (-28.5847222222, 16.4466666667),
-    "FYRU": (-17.9563888889, 19.7194444444),
-    "FYSM": (-22.6583333333, 14.5666666667),
-    "FYTM": (-19.2616666667, 17.7325),
-    "FYWB": (-22.9797222222, 14.6452777778),
-    "FYWE": (-22.6122222222, 17.0805555556),
-    "FYWH": (-22.4866666667, 17.4625),
-    "FZAA": (-4.38555555556, 15.4444444444),
-    "FZAB": (-4.32472222222, 15.3283333333),
-    "FZAG": (-5.93083333333, 12.3516666667),
-    "FZAI": (-5.91805555556, 12.4475),
-    "FZAJ": (-5.85416666667, 13.0636111111),
-    "FZAM": (-5.79944444444, 13.4408333333),
-    "FZBA": (-1.94722222222, 18.2858333333),
-    "FZBI": (-2.7175, 17.6847222222),
-    "FZBO": (-3.31111111111, 17.3816666667),
-    "FZBT": (-1.45, 19.0),
-    "FZCA": (-5.03555555556, 18.7855555556),
-    "FZCB": (-5.0, 19.6),
-    "FZDO": (-1.53777777778, 13.2694444444),
-    "FZEA": (0.0225, 18.2886111111),
-    "FZEN": (1.22472222222, 19.7888888889),
-    "FZFD": (4.25305555556, 20.9752777778),
-    "FZFK": (3.23527777778, 19.7711111111),
-    "FZFP": (4.1575, 21.6508333333),
-    "FZFU": (2.18277777778, 22.4816666667),
-    "FZGA": (2.17055555556, 21.4966666667),
-    "FZGN": (-0.283333333333, 20.8833333333),
-    "FZIA": (0.5175, 25.155),
-    "FZIC": (0.481666666667, 25.3380555556),
-    "FZIR": (0.8, 24.45),
-    "FZJH": (2.8275, 27.5880555556),
-    "FZKA": (1.56555555556, 30.2208333333),
-    "FZKJ": (2.81777777778, 24.7938888889),
-    "FZMA": (-2.30888888889, 28.8086111111),
-    "FZNA": (-1.67055555556, 29.2383333333),
-    "FZNP": (0.575, 29.4738888889),
-    "FZOA": (-2.91916666667, 25.9152777778),
-    "FZQA": (-11.5911111111, 27.5308333333),
-    "FZQC": (-8.46861111111, 28.8897222222),
-    "FZQM": (-10.7658333333, 25.5055555556),
-    "FZRF": (-5.87555555556, 29.25),
-    "FZRQ": (-5.39444444444, 26.99),
-    "FZSA": (-8.64194444444, 25.2527777778),
-    "FZSB": (-8.728889, 24.992222),
-    "FZTL": (-9.46944444444, 25.7588888889),
-    "FZUA": (-5.9, 22.4691666667),
-    "FZUK": (-6.43833333333, 20.7947222222),
-    "FZVA": (-3.39722222222, 23.4444444444),
-    "FZVI": (-4.96166666667, 23.3783333333),
-    "FZVR": (-4.31666666667, 20.4333333333),
-    "FZWA": (-6.12111111111, 23.5688888889),
-    "FZWC": (-6.73333333333, 23.95),
-    "GAAO": (15.7, 0.5),
-    "GABD": (14.3330555556, -3.6),
-    "GABF": (13.8, -10.85),
-    "GABG": (11.45, -7.51694444444),
-    "GABR": (17.0330555556, -0.4),
-    "GABS": (12.5333333333, -7.94972222222),
-    "GADZ": (15.0, -2.91694444444),
-    "GAGM": (16.3613888889, -3.59972222222),
-    "GAGO": (16.2483333333, -0.00527777777778),
-    "GAKA": (12.8391666667, -11.2527777778),
-    "GAKD": (14.4811111111, -11.4044444444),
-    "GAKL": (18.4330555556, 1.41694444444),
-    "GAKN": (13.5330555556, -8.05),
-    "GAKO": (12.3830555556, -5.46694444444),
-    "GAKT": (13.0666666667, -9.48333333333),
-    "GAKY": (14.4311111111, -11.4394444444),
-    "GAMA": (13.7, -6.06694444444),
-    "GAMB": (14.5127777778, -4.07944444444),
-    "GAMK": (15.85, 2.43333333333),
-    "GANF": (15.9333333333, -4.01666666667),
-    "GANK": (15.2286111111, -7.26138888889),
-    "GANR": (15.2386111111, -9.57638888889),
-    "GASK": (11.3330555556, -5.7),
-    "GATB": (16.7302777778, -3.0075),
-    "GATS": (20.2461111111, 0.980833333333),
-    "GAYE": (15.1330555556, -10.5669444444),
-    "GBYD": (13.3377777778, -16.6519444444),
-    "GCFV": (28.4525, -13.8636111111),
-    "GCGM": (28.0297222222, -17.2147222222),
-    "GCHI": (27.8147222222, -17.8869444444),
-    "GCLA": (28.6263888889, -17.7555555556),
-    "GCLP": (27.9316666667, -15.3863888889),
-    "GCRR": (28.9452777778, -13.605),
-    "GCTS": (28.0444444444, -16.5722222222),
-    "GCXO": (28.4825, -16.3413888889),
-    "GECE": (35.8925, -5.30583333333),
-    "GEML": (35.2797222222, -2.95611111111),
-    "GFBN": (7.53194444444, -12.5183333333),
-    "GFBO": (7.94388888889, -11.7616666667),
-    "GFGK": (7.76694444444, -12.3830555556),
-    "GFHA": (8.39444444444, -13.1283333333),
-    "GFKB": (9.638056, -11.515556),
-    "GFKE": (7.89277777778, -11.175),
-    "GFLL": (8.61638888889, -13.1952777778),
-    "GFYE": (8.61530833333, -11.0471916667),
-    "GGBU": (11.2972222222, -15.8380555556),
-    "GGCF": (11.2880555556, -15.1805555556),
-    "GGOV": (11.8947222222, -15.6536111111),
-    "GLBU": (5.90388888889, -10.0575),
-    "GLCP": (4.37888888889, -7.69694444444),
-    "GLGE": (5.03444444444, -9.06666666667),
-    "GLLB": (5.86694444444, -10.05),
-    "GLMR": (6.28888888889, -10.7586111111),
-    "GLNA": (7.5, -8.6),
-    "GLRB": (6.23361111111, -10.3622222222),
-    "GLST": (4.66666666667, -8.43333333333),
-    "GLTN": (6.06638888889, -8.13666666667),
-    "GLVA": (8.4, -9.76694444444),
-    "GMAA": (30.3811111111, -9.54611111111),
-    "GMAD": (30.325, -9.41305555556),
-    "GMAT": (28.4480555556, -11.1611111111),
-    "GMFF": (33.9272222222, -4.97777777778),
-    "GMFI": (33.5052777778, -5.15277777778),
-    "GMFK": (31.9488888889, -4.40055555556),
-    "GMFM": (33.8788888889, -5.515),
-    "GMFN": (35.1533333333, -2.92),
-    "GMFO": (34.7869444444, -1.92388888889),
-    "GMMB": (33.6555555556, -7.22138888889),
-    "GMMC": (33.5533333333, -7.66138888889),
-    "GMME": (34.0513888889, -6.75138888889),
-    "GMMF": (29.3688888889, -10.18),
-    "GMMI": (31.4038888889, -9.68472222222),
-    "GMMN": (33.3677777778, -7.58777777778),
-    "GMMW": (34.9888888889, -3.02833333333),
-    "GMMX": (31.6066666667, -8.03611111111),
-    "GMMY": (34.2988888889, -6.59583333333),
-    "GMMZ": (30.9388888889, -6.90916666667),
-    "GMSL": (34.2305555556, -6.05027777778),
-    "GMTA": (35.1769444444, -3.83944444444),
-    "GMTN": (35.5941666667, -5.32),
-    "GMTT": (35.7266666667, -5.91666666667),
-    "GOGG": (12.5555555556, -16.2816666667),
-    "GOGK": (12.88, -14.9552777778),
-    "GOGS": (12.41, -16.7461111111),
-    "GOOK": (14.1466666667, -16.0511111111),
-    "GOOY": (14.7394444444, -17.49),
-    "GOSM": (15.5936111111, -13.3227777778),
-    "GOSP": (16.6780555556, -14.965),
-    "GOSR": (16.4375, -15.6572222222),
-    "GOSS": (16.0497222222, -16.4611111111),
-    "GOTB": (14.8472222222, -12.4680555556),
-    "GOTK": (12.5722222222, -12.2202777778),
-    "GOTS": (13.0466666667, -13.2947222222),
-    "GOTT": (13.7366666667, -13.6530555556),
-    "GQNA": (16.7111111111, -9.63777777778),
-    "GQNB": (17.5330555556, -14.6830555556),
-    "GQNC": (18.45, -9.51694444444),
-    "GQND": (18.5702777778, -11.4230555556),
-    "GQNE": (16.6333333333, -14.2),
-    "GQNF": (16.5897222222, -11.4061111111),
-    "GQNH": (16.2330555556, -8.16694444444),
-    "GQNI": (16.6219444444, -7.31444444444),
-    "GQNJ": (19.7330555556, -14.3833333333),
-    "GQNK": (16.1594444444, -13.5075),
-    "GQNL": (17.75, -12.5),
-    "GQNM": (16.3, -8.05),
-    "GQNN": (18.0977777778, -15.9477777778),
-    "GQNS": (15.1794444444, -12.2072222222),
-    "GQNT": (17.2330555556, -10.8169444444),
-    "GQPA": (20.5066666667, -13.0430555556),
-    "GQPF": (22.6669444444, -12.7330555556),
-    "GQPP": (20.9283333333, -17.0311111111),
-    "GQPT": (25.2366666667, -11.5886111111),
-    "GQPZ": (22.7566666667, -12.0411111111),
-    "GSMA": (26.7316666667, -11.6844444444),
-    "GSVO": (23.7180555556, -15.9319444444),
-    "GUCY": (9.57688888889, -13.6119611111),
-    "GUFA": (10.3505555556, -13.5691666667),
-    "GUFH": (10.0355555556, -10.7697222222),
-    "GUGO": (9.24611111111, -9.29527777778),
-    "GUKR": (10.6511111111, -14.5336111111),
-    "GUKU": (9.16055555556, -10.1244444444),
-    "GULB": (11.3261111111, -12.2869444444),
-    "GUMA": (8.48111111111, -9.52583333333),
-    "GUNZ": (7.80583333333, -8.70166666667),
-    "GUOK": (10.9658333333, -14.2811111111),
-    "GUSA": (11.1169444444, -13.8330555556),
-    "GUSB": (12.5727777778, -13.3586111111),
-    "GUSI": (11.4330555556, -9.16694444444),
-    "GUXN": (10.4485, -9.22733333333),
-    "GVAC": (16.7413888889, -22.9494444444),
-    "GVAN": (17.2030555556, -25.0908333333),
-    "GVBA": (16.1366666667, -22.8888888889),
-    "GVFM": (14.9244444444, -23.4933333333),
-    "GVMA": (15.1558333333, -23.2136111111),
-    "GVMT": (15.0451111111, -24.34),
-    "GVNP": (14.9242, -23.4939),
-    "GVSF": (14.883, -24.48),
-    "GVSN": (16.5883333333, -24.2844444444),
-    "GVSV": (16.8338888889, -25.0566666667),
-    "HAAB": (8.97694444444, 38.8),
-    "HAAL": (9.00361111111, 38.7255555556),
-    "HAAM": (6.03972222222, 37.5902777778),
-    "HAAX": (14.1369444444, 38.7761111111),
-    "HABD": (11.6080555556, 37.3213888889),
-    "HABE": (9.39194444444, 34.5191666667),
-    "HADC": (11.0825, 39.7113888889),
-    "HADD": (8.55, 34.85),
-    "HADM": (10.3166666667, 37.7333333333),
-    "HADR": (9.625, 41.8541666667),
-    "HADT": (11.885, 38.0088888889),
-    "HAGB": (7.11888888889, 40.045),
-    "HAGH": (7.15, 40.7166666667),
-    "HAGM": (8.12833333333, 34.5633333333),
-    "HAGN": (12.5183333333, 37.4322222222),
-    "HAGO": (5.93527777778, 43.5786111111),
-    "HAGR": (8.16166666667, 35.5525),
-    "HAHM": (8.71555555556, 39.0080555556),
-    "HAHU": (13.8302777778, 36.8816666667),
-    "HAJM": (7.66583333333, 36.8163888889),
-    "HAKD": (6.73280555556, 44.2415555556),
-    "HALA": (7.06694444444, 38.5),
-    "HALL": (11.9747222222, 38.9797222222),
-    "HAMK": (13.4672222222, 39.5333333333),
-    "HAMT": (6.96666666667, 35.5333333333),
-    "HANG": (5.28333333333, 39.75),
-    "HANK": (9.05, 36.6),
-    "HASO": (10.0183333333, 34.5861111111),
-    "HATP": (7.2025, 35.415),
-    "HAWC": (7.16694444444, 37.1669444444),
-    "HBBA": (-3.32388888889, 29.3183333333),
-    "HBBE": (-3.43333333333, 29.9166666667),
-    "HBBO": (-2.54722222222, 30.0941666667),
-    "HCMA": (11.9586111111, 50.7483333333),
-    "HCMB": (3.09861111111, 43.6241666667),
-    "HCMC": (11.4944444444, 49.9086111111),
-    "HCMD": (2.33671666667, 42.3077),
-    "HCME": (7.91666666667, 49.8),
-    "HCMF": (11.2755555556, 49.15),
-    "HCMG": (9.54305555556, 49.1177777778),
-    "HCMH": (9.51805555556, 44.0886111111),
-    "HCMI": (10.3891666667, 44.9408333333),
-    "HCMK": (-0.377222222222, 42.4591666667),
-    "HCMM": (2.01361111111, 45.3047222222),
-    "HCMN": (4.7595, 45.233),
-    "HCMO": (5.35138888889, 48.5255555556),
-    "HCMR": (6.78083333333, 47.4544444444),
-    "HCMU": (10.6422222222, 47.3880555556),
-    "HCMV": (9.51666666667, 45.5666666667),
-    "HCMW": (8.46083333333, 48.5722222222),
-    "HDAG": (12.2, 42.6333333333),
-    "HDAM": (11.5333333333, 43.15),
-    "HDAS": (11.15, 42.7166666667),
-    "HDCH": (11.5166666667, 43.0666666667),
-    "HDDK": (11.1, 42.35),
-    "HDHE": (12.4333333333, 43.3),
-    "HDMO": (11.7166666667, 43.2),
-    "HDOB": (11.9683333333, 43.2786111111),
-    "HDTJ": (11.7833333333, 42.9166666667),
-    "HEAR": (31.0733333333, 33.8358333333),
-    "HEAT": (27.0463888889, 31.0119444444),
-    "HEAX": (31.1838888889, 29.9488888889),
-    "HEBA": (30.9177777778, 29.6963888889),
-    "HEBL": (22.3758333333, 31.6116666667),
-    "HECA": (30.1219444444, 31.4055555556),
-    "HECW": (30.1161111111, 30.9152777778),
-    "HEEM": (30.0744444444, 31.1919444444),
-    "HEGN": (27.1838888889, 33.7983333333),
-    "HEGR": (31.0688888889, 34.1291666667),
-    "HELX": (25.6708333333, 32.7063888889),
-    "HEMA": (25.5569444444, 34.5836111111),
-    "HEMM": (31.3252777778, 27.2216666667),
-    "HEOW": (22.5806, 28.7207),
-    "HEPS": (31.2794444444, 32.24),
-    "HESC": (28.6852777778, 34.0625),
-    "HESH": (27.9772222222, 34.3947222222),
-    "HESN": (23.9641666667, 32.8197222222),
-    "HETB": (29.5877777778, 34.7780555556),
-    "HETR": (28.2088888889, 33.6452777778),
-    "HHAS": (15.2918527778, 38.9106666667),
-    "HHMS": (15.6833333333, 39.3680555556),
-    "HHSB": (13.0716666667, 42.645),
-    "HKAM": (-2.64222222222, 37.25),
-    "HKEL": (0.404166666667, 35.2380555556),
-    "HKES": (3.23638888889, 35.9744444444),
-    "HKFG": (3.49, 35.84),
-    "HKGA": (-0.463333333333, 39.6480555556),
-    "HKHO": (-1.52, 40.0038888889),
-    "HKIS": (0.339166666667, 37.5908333333),
-    "HKJK": (-1.31861111111, 36.9258333333),
-    "HKKG": (0.271111111111, 34.7872222222),
-    "HKKI": (-0.0861111111111, 34.7288888889),
-    "HKKL": (-2.9, 38.0738888889),
-    "HKKR": (-0.385, 35.245),
-    "HKKT": (0.971944444444, 34.9583333333),
-    "HKLK": (4.20416666667, 34.3480555556),
-    "HKLO": (3.12194444444, 35.6086111111),
-    "HKLU": (-2.25222222222, 40.9130555556),
-    "HKLY": (2.76305555556, 36.7183333333),
-    "HKMA": (3.93361111111, 41.8441666667),
-    "HKMB": (2.345, 37.9991666667),
-    "HKMK": (0.230277777778, 38.1702777778),
-    "HKML": (-3.22916666667, 40.1016666667),
-    "HKMO": (-4.03472222222, 39.5941666667),
-    "HKMY": (3.46972222222, 39.1013888889),
-    "HKNI": (-0.368888888889, 36.98),
-    "HKNK": (-0.299722222222, 36.1605555556),
-    "HKNV": (-0.787777777778, 36.4333333333),
-    "HKNW": (-1.32166666667, 36.8147222222),
-    "HKNY": (-0.0608333333333, 37.0386111111),
-    "HKRE": (-1.27722222222, 36.8622222222),
-    "HKSB": (0.519166666667, 37.53),
-    "HKWJ": (1.73305555556, 40.0913888889),
-    "HLFL": (28.7952777778, 22.0808333333),
-    "HLGL": (28.6383333333, 21.4377777778),
-    "HLGT": (25.1455555556, 10.1425),
-    "HLKF": (24.1786111111, 23.3138888889),
-    "HLLB": (32.0966666667, 20.2694444444),
-    "HLLM": (32.9, 13.2833333333),
-    "HLLQ": (32.7886111111, 21.9641666667),
-    "HLLS": (26.9869444444, 14.4725),
-    "HLLT": (32.6633333333, 13.1588888889),
-    "HLMB": (30.3780555556, 19.5763888889),
-    "HLNF": (30.5, 18.5269444444),
-    "HLON": (29.11, 15.9655555556),
-    "HLRA": (29.4697222222, 17.9311111111),
-    "HLTD": (30.1516666667, 9.71527777778),
-    "HLZA": (28.59, 17.2941666667),
-    "HRYG": (-1.67694444444, 29.2586111111),
-    "HRYI": (-2.595, 29.74),
-    "HRYR": (-1.96861111111, 30.1394444444),
-    "HRYU": (-1.5, 29.6336111111),
-    "HRZA": (-2.46222222222, 28.9077777778),
-    "HSAK": (7.83333333333, 33.0),
-    "HSAT": (17.7097222222, 34.0569444444),
-    "HSAW": (8.79305555556, 27.3602777778),
-    "HSBR": (6.19638888889, 31.6013888889),
-    "HSBT": (9.77, 29.3975),
-    "HSDN": (19.1536111111, 30.43),
-    "HSDZ": (11.7858333333, 34.3363888889),
-    "HSFS": (13.615, 25.3247222222),
-    "HSGG": (12.5330555556, 35.0669444444),
-    "HSGN": (13.4833333333, 22.4666666667),
-    "HSGO": (8.54, 28.1),
-    "HSKA": (15.3858333333, 36.3280555556),
-    "HSKG": (14.925, 35.8780555556),
-    "HSKI": (13.1894444444, 32.6980555556),
-    "HSKJ": (3.91694444444, 31.6669444444),
-    "HSKP": (4.78, 33.585),
-    "HSMD": (4.90277777778, 29.4433333333),
-    "HSMK": (6.83333333333, 29.6666666667),
-    "HSMR": (18.45, 31.8330555556),
-    "HSNH": (12.6669444444, 28.3330555556),
-    "HSNL": (12.0536111111, 24.9552777778),
-    "HSNM": (3.59805555556, 32.09),
-    "HSNN": (12.0536111111, 24.9561111111),
-    "HSOB": (13.1530555556, 30.2325),
-    "HSPA": (7.18, 34.095),
-    "HSPI": (6.79361111111, 33.1302777778),
-    "HSPN": (19.4336111111, 37.2341666667),
-    "HSRJ": (8.465, 25.68),
-    "HSRN": (11.9, 32.8),
-    "HSSJ": (4.87194444444, 31.6011111111),
-    "HSSM": (9.55861111111, 31.6525),
-    "HSSP": (19.5763888889, 37.2158333333),
-    "HSSS": (15.5894444444, 32.5530555556),
-    "HSSW": (21.8002777778, 31.5163888889),
-    "HSTO": (7.26611111111, 28.6625),
-    "HSTR": (4.41111111111, 32.5788888889),
-    "HSTU": (5.6, 27.4725),
-    "HSWW": (7.72555555556, 27.9794444444),
-    "HSYA": (4.57, 28.4255555556),
-    "HSYE": (4.1325, 30.7213888889),
-    "HSYL": (6.56, 30.51),
-    "HTAR": (-3.36777777778, 36.6333333333),
-    "HTBU": (-1.33222222222, 31.8211111111),
-    "HTDA": (-6.87805555556, 39.2025),
-    "HTDO": (-6.17027777778, 35.7525),
-    "HTIR": (-7.66861111111, 35.7519444444),
-    "HTKA": (-4.885, 29.6702777778),
-    "HTKI": (-8.91111111111, 39.5086111111),
-    "HTKJ": (-3.42916666667, 37.0744444444),
-    "HTLI": (-9.85, 39.7586111111),
-    "HTLM": (-3.37611111111, 35.8180555556),
-    "HTMA": (-7.91388888889, 39.6777777778),
-    "HTMB": (-8.91861111111, 33.4622222222),
-    "HTMD": (-3.51416666667, 33.6188888889),
-    "HTMI": (-10.7383333333, 38.7713888889),
-    "HTMP": (-6.35532777778, 31.0825222222),
-    "HTMS": (-3.36277777778, 37.3233333333),
-    "HTMT": (-10.3388888889, 40.1816666667),
-    "HTMU": (-1.50277777778, 33.8022222222),
-    "HTMW": (-2.44444444444, 32.9325),
-    "HTNA": (-10.3583333333, 38.78),
-    "HTNG": (-6.71722222222, 38.1536111111),
-    "HTPE": (-5.25722222222, 39.8113888889),
-    "HTSO": (-10.6808333333, 35.5811111111),
-    "HTSU": (-7.94888888889, 31.6102777778),
-    "HTSY": (-3.60944444444, 33.5041666667),
-    "HTTB": (-5.07611111111, 32.8305555556),
-    "HTTG": (-5.09222222222, 39.0711111111),
-    "HTZA": (-6.22194444444, 39.2247222222),
-    "HUAJ": (3.33861111111, 31.7688888889),
-    "HUAR": (3.04722222222, 30.9122222222),
-    "HUBU": (0.71, 30.065),
-    "HUEN": (0.0422222222222, 32.4433333333),
-    "HUGU": (2.80555555556, 32.2716666667),
-    "HUJI": (0.4525, 33.1930555556),
-    "HUKB": (-1.22333333333, 29.96),
-    "HUKC": (0.326111111111, 32.5925),
-    "HUKF": (2.32638888889, 31.4977777778),
-    "HUKO": (2.94916666667, 34.1475),
-    "HUKS": (0.19, 30.1025),
-    "HUMA": (-0.555, 30.6),
-    "HUMI": (1.755, 31.7366666667),
-    "HUPA": (2.2025, 31.5544444444),
-    "HUSO": (1.7275, 33.6227777778),
-    "HUTO": (0.68, 34.1677777778),
-    "KAAA": (40.1586111111, -89.335),
-    "KAAF": (29.7275, -85.0275),
-    "KAAO": (37.7475, -97.2211111111),
-    "KAAS": (37.3583333333, -85.3094444444),
-    "KAAT": (41.4830555556, -120.565277778),
-    "KABE": (40.6523333333, -75.4404722222),
-    "KABI": (32.4111111111, -99.6816666667),
-    "KABQ": (35.0393333333, -106.610777778),
-    "KABR": (45.4482777778, -98.42275),
-    "KABY": (31.5355555556, -84.1944444444),
-    "KACB": (44.9886111111, -85.1983333333),
-    "KACJ": (32.1105555556, -84.1886111111),
-    "KACK": (41.2527777778, -70.06),
-    "KACP": (30.7505555556, -92.6886111111),
-    "KACQ": (44.0733333333, -93.5530555556),
-    "KACT": (31.6111111111, -97.2302777778),
-    "KACV": (40.9777777778, -124.108333333),
-    "KACY": (39.4575, -74.5769444444),
-    "KACZ": (34.7177777778, -78.0036111111),
-    "KADC": (46.4502777778, -95.2108333333),
-    "KADG": (41.8677777778, -84.0772222222),
-    "KADH": (34.8044444444, -96.6713888889),
-    "KADM": (34.3030555556, -97.0194444444),
-    "KADS": (32.9686111111, -96.8363888889),
-    "KADT": (39.84, -101.041944444),
-    "KADU": (41.7013888889, -94.9205555556),
-    "KADW": (38.8105555556, -76.8669444444),
-    "KAEG": (35.1452777778, -106.795277778),
-    "KAEL": (43.6816666667, -93.3672222222),
-    "KAEX": (31.3272222222, -92.5483333333),
-    "KAFF": (38.9902777778, -104.858333333),
-    "KAFJ": (40.1363888889, -80.2902777778),
-    "KAFK": (40.6055555556, -95.8677777778),
-    "KAFN": (42.8051341667, -72.0030219444),
-    "KAFO": (42.7088888889, -110.942222222),
-    "KAFP": (35.0205555556, -80.0772222222),
-    "KAFW": (32.9877777778, -97.3188888889),
-    "KAGC": (40.3544, -79.9301666667),
-    "KAGO": (33.2275, -93.2169444444),
-    "KAGR": (27.6511888889, -81.3434638889),
-    "KAGS": (33.3697222222, -81.9644444444),
-    "KAHC": (40.2658333333, -120.150555556),
-    "KAHH": (45.2811111111, -92.3752777778),
-    "KAHN": (33.9486111111, -83.3263888889),
-    "KAHQ": (41.2405555556, -96.5944444444),
-    "KAIA": (42.0533333333, -102.803888889),
-    "KAID": (40.1086111111, -85.6130555556),
-    "KAIG": (45.1541666667, -89.1108333333),
-    "KAIK": (33.6494444444, -81.685),
-    "KAIO": (41.4072222222, -95.0469444444),
-    "KAIT": (46.5483333333, -93.6766666667),
-    "KAIV": (33.1063888889, -88.1977777778),
-    "KAIY": (39.36, -74.4561111111),
-    "KAIZ": (38.0960333333, -92.5494861111),
-    "KAJO": (33.8977777778, -117.6025),
-    "KAJR": (34.4997222222, -83.5566666667),
-    "KAKH": (35.2027777778, -81.1497222222),
-    "KAKO": (40.1755555556, -103.221944444),
-    "KAKR": (41.0375, -81.4666666667),
-    "KALB": (42.7480555556, -73.8027777778),
-    "KALI": (27.7408333333, -98.0269444444),
-    "KALM": (32.84, -105.990555556),
-    "KALN": (38.8902777778, -90.0461111111),
-    "KALO": (42.5569444444, -92.4002777778),
-    "KALS": (37.435, -105.866388889),
-    "KALW": (46.0947222222, -118.288888889),
-    "KALX": (32.9147222222, -85.9630555556),
-    "KAMA": (35.2191666667, -101.705833333),
-    "KAMN": (43.3222222222, -84.6880555556),
-    "KAMT": (38.8513888889, -83.5661111111),
-    "KAMW": (41.9919444444, -93.6216666667),
-    "KANB": (33.5880555556, -85.8580555556),
-    "KAND": (34.495, -82.7091666667),
-    "KANE": (45.145, -93.2102777778),
-    "KANJ": (46.4791666667, -84.3683333333),
-    "KANK": (38.5383333333, -106.048611111),
-    #"KANP": (38.9427777778, -76.5683333333),
-    "KANQ": (41.6397222222, -85.0836111111),
-    "KANW": (42.5791666667, -99.9930555556),
-    "KANY": (37.1586111111, -98.0797222222),
-    "KAOH": (40.7083333333, -84.0275),
-    "KAOO": (40.2963888889, -78.32),
-    "KAOV": (36.9719444444, -92.6819444444),
-    "KAPA": (39.57, -104.849444444),
-    "KAPC": (38.2131944444, -122.280694444),
-    "KAPF": (26.1525, -81.7755555556),
-    "KAPG": (39.4661111111, -76.1694444444),
-    "KAPH": (38.0688888889, -77.3183333333),
-    "KAPN": (45.0780555556, -83.5602777778),
-    "KAPT": (35.0605555556, -85.5852777778),
-    "KAPV": (34.5753333333, -117.186194444),
-    "KAQO": (30.7836111111, -98.6619444444),
-    "KAQR": (34.3983333333, -96.1480555556),
-    "KAQW": (42.6958333333, -73.1702777778),
-    "KARA": (30.0375, 91.8838888889),
-    "KARB": (42.2230555556, -83.7455555556),
-    "KARG": (36.1247222222, -90.925),
-    "KARM": (29.2541666667, -96.1541666667),
-    "KARR": (41.7719444444, -88.4755555556),
-    "KART": (43.9916666667, -76.0216666667),
-    "KARV": (45.9277777778, -89.7308333333),
-    "KARW": (32.4122222222, -80.6344444444),
-    "KASD": (30.3463888889, -89.8208333333),
-    "KASE": (39.2230555556, -106.868888889),
-    "KASG": (36.1763888889, -94.1191666667),
-    "KASH": (42.7816666667, -71.5147222222),
-    "KASJ": (36.2975, -77.1708333333),
-    "KASL": (32.5205555556, -94.3077777778),
-    "KASN": (33.5694444444, -86.0511111111),
-    "KAST": (46.1580555556, -123.878611111),
-    "KASW": (41.2747222222, -85.84),
-    "KASX": (46.5486111111, -90.9188888889),
-    "KASY": (46.0247222222, -99.3516666667),
-    "KATL": (33.6402777778, -84.4269444444),
-    "KATS": (32.8525, -104.467777778),
-    "KATW": (44.2580555556, -88.5191666667),
-    "KATY": (44.9138888889, -97.1547222222),
-    "KAUG": (44.3205555556, -69.7972222222),
-    "KAUH": (40.8941666667, -97.9944444444),
-    "KAUM": (43.6625, -92.9327777778),
-    "KAUN": (38.9547222222, -121.081666667),
-    "KAUO": (32.615, -85.4338888889),
-    "KAUS": (30.1944444444, -97.6697222222),
-    "KAUW": (44.9261111111, -89.6266666667),
-    "KAVK": (36.7736111111, -98.6702777778),
-    "KAVL": (35.4361111111, -82.5416666667),
-    "KAVO": (27.5913888889, -81.5288888889),
-    "KAVP": (41.3383333333, -75.7233333333),
-    "KAVQ": (32.4095555556, -111.218388889),
-    "KAVX": (33.405, -118.415833333),
-    "KAWM": (35.135, -90.2344444444),
-    "KAWO": (48.1608333333, -122.158888889),
-    "KAXA": (43.0777777778, -94.2719444444),
-    "KAXH": (29.5061111111, -95.4769444444),
-    "KAXN": (45.8663888889, -95.3947222222),
-    "KAXQ": (41.225, -79.4422222222),
-    "KAXS": (34.6988888889, -99.3383333333),
-    "KAXV": (40.4936111111, -84.2980555556),
-    "KAYS": (31.2491666667, -82.3955555556),
-    "KAYX": (35.3925, -86.0858333333),
-    "KAZC": (36.96, -113.013888889),
-    "KAZO": (42.235, -85.5519444444),
-    "KBAB": (39.1358333333, -121.436388889),
-    "KBAD": (32.5016666667, -93.6625),
-    "KBAF": (42.1580555556, -72.7158333333),
-    "KBAK": (39.2619444444, -85.8963888889),
-    "KBAM": (40.5997222222, -116.876111111),
-    "KBAN": (38.2625, -119.225833333),
-    "KBAX": (43.7802777778, -82.9855555556),
-    "KBAZ": (29.7044444444, -98.0422222222),
-    "KBBB": (45.3319444444, -95.6505555556),
-    "KBBD": (31.1791666667, -99.3238888889),
-    "KBBG": (36.5319444444, -93.2005555556),
-    "KBBP": (34.6216666667, -79.7344444444),
-    "KBBW": (41.4363888889, -99.6422222222),
-    "KBCB": (37.2077777778, -80.4077777778),
-    "KBCE": (37.7063888889, -112.145),
-    "KBCK": (44.2508333333, -90.8552777778),
-    "KBCT": (26.3783333333, -80.1075),
-    "KBDE": (48.7283333333, -94.6122222222),
-    "KBDG": (37.5833333333, -109.483333333),
-    "KBDJ": (46.1375, -89.6461111111),
-    "KBDL": (41.9388888889, -72.6830555556),
-    "KBDN": (44.0944444444, -121.2),
-    "KBDQ": (35.1361111111, -92.7136111111),
-    "KBDR": (41.1633333333, -73.1261111111),
-    "KBDU": (40.0394444444, -105.225833333),
-    "KBEC": (37.6944444444, -97.215),
-    "KBED": (42.4697222222, -71.2888888889),
-    "KBEH": (42.1286111111, -86.4261111111),
-    "KBFD": (41.8030555556, -78.64),
-    "KBFF": (41.8738888889, -103.595555556),
-    "KBFI": (47.5297222222, -122.301944444),
-    "KBFK": (36.8633333333, -99.6186111111),
-    "KBFL": (35.4333333333, -119.056666667),
-    "KBFM": (30.6263888889, -88.0677777778),
-    "KBFR": (38.84, -86.4452777778),
-    "KBFW": (47.2486111111, -91.4155555556),
-    "KBGD": (35.7008333333, -101.393611111),
-    "KBGE": (30.9716666667, -84.6375),
-    "KBGF": (35.1775, -86.0661111111),
-    "KBGM": (42.2086111111, -75.9797222222),
-    "KBGR": (44.8072222222, -68.8280555556),
-    "KBHB": (44.4497222222, -68.3616666667),
-    "KBHK": (46.3477777778, -104.259444444),
-    "KBHM": (33.5627777778, -86.7533333333),
-    "KBID": (41.1680555556, -71.5777777778),
-    "KBIF": (31.8494444444, -106.38),
-    "KBIH": (37.3730555556, -118.363611111),
-    "KBIL": (45.8077777778, -108.542777778),
-    "KBIS": (46.7727777778, -100.745833333),
-    "KBIV": (42.7427777778, -86.1077777778),
-    "KBIX": (30.4108333333, -88.9236111111),
-    "KBJC": (39.9088888889, -105.117222222),
-    "KBJI": (47.5108333333, -94.9347222222),
-    "KBJJ": (40.8747222222, -81.8883333333),
-    "KBJN": (37.7947222222, -116.778611111),
-    "KBKE": (44.8372222222, -117.809166667),
-    "KBKF": (39.7016666667, -104.751388889),
-    "KBKL": (41.5175, -81.6833333333),
-    "KBKN": (36.745, -97.3494444444),
-    "KBKT": (37.0738888889, -77.9525),
-    "KBKV": (28.4736111111, -82.4555555556),
-    "KBKW": (37.7872222222, -81.1241666667),
-    "KBKX": (44.3047222222, -96.8169444444),
-    "KBLF": (37.2958333333, -81.2077777778),
-    "KBLH": (33.6147222222, -114.713333333),
-    "KBLI": (48.7925, -122.5375),
-    "KBLM": (40.1866666667, -74.1244444444),
-    "KBLU": (39.275, -120.709722222),
-    "KBLV": (38.545, -89.835),
-    "KBMC": (41.5525, -112.062222222),
-    "KBMG": (39.1461111111, -86.6166666667),
-    "KBMI": (40.4772222222, -88.9158333333),
-    "KBML": (44.5752777778, -71.1758333333),
-    "KBMQ": (30.7388888889, -98.2386111111),
-    "KBMT": (30.0702777778, -94.215),
-    "KBNA": (36.1244444444, -86.6780555556),
-    "KBNG": (33.9225, -116.850555556),
-    "KBNO": (43.5919444444, -118.955555556),
-    "KBNW": (42.0494444444, -93.8475),
-    "KBOI": (43.5641666667, -116.222777778),
-    "KBOS": (42.3641666667, -71.005),
-    "KBOW": (27.9433333333, -81.7833333333),
-    "KBPG": (32.2125, -101.521666667),
-    "KBPI": (42.585, -110.111111111),
-    "KBPK": (36.3688888889, -92.4705555556),
-    "KBPP": (46.1869444444, -103.428055556),
-    "KBPT": (29.9508333333, -94.0205555556),
-    "KBQK": (31.2588888889, -81.4663888889),
-    "KBQR": (42.9222222222, -78.6122222222),
-    "KBRD": (46.4022222222, -94.1355555556),
-    "KBRL": (40.7830555556, -91.1255555556),
-    "KBRO": (25.9066666667, -97.4258333333),
-    "KBRY": (37.8144444444, -85.4997222222),
-    "KBST": (44.4094444444, -69.0119444444),
-    "KBTF": (40.8694444444, -111.927222222),
-    "KBTL": (42.3063888889, -85.25),
-    "KBTM": (45.9547222222, -112.4975),
-    "KBTN": (45.815, -97.7427777778),
-    "KBTP": (40.7769444444, -79.9497222222),
-    "KBTR": (30.5330555556, -91.1494444444),
-    "KBTV": (44.4716666667, -73.1530555556),
-    "KBTY": (36.8611111111, -116.786944444),
-    "KBUF": (42.9402777778, -78.7319444444),
-    "KBUR": (34.2005555556, -118.358611111),
-    "KBUU": (42.6908333333, -88.3047222222),
-    "KBUY": (36.0486111111, -79.475),
-    "KBVI": (40.7725, -80.3913888889),
-    "KBVN": (41.7286111111, -98.0558333333),
-    "KBVO": (36.7641666667, -96.0111111111),
-    "KBVS": (48.4708333333, -122.420833333),
-    "KBVU": (35.9475, -114.861111111),
-    "KBVX": (35.7261111111, -91.6475),
-    "KBVY": (42.5841666667, -70.9165),
-    "KBWC": (32.9930555556, -115.516944444),
-    "KBWD": (31.7936111111, -98.9563888889),
-    "KBWG": (36.9644444444, -86.4197222222),
-    "KBWI": (39.1752777778, -76.6683333333),
-    "KBWP": (46.2441666667, -96.6072222222),
-    "KBXK": (33.4205555556, -112.686111111),
-    "KBXM": (43.8922222222, -69.9388888889),
-    "KBYH": (35.9641666667, -89.9433333333),
-    "KBYI": (42.5425, -113.771666667),
-    "KBYS": (35.2802777778, -116.63),
-    "KBYY": (28.9733333333, -95.8633333333),
-    "KBZN": (45.7775, -111.151944444),
-    "KCAD": (44.2753111111, -85.418925),
-    "KCAE": (33.9386111111, -81.1194444444),
-    "KCAG": (40.4952777778, -107.521666667),
-    "KCAK": (40.9161111111, -81.4422222222),
-    "KCAO": (36.4463888889, -103.149722222),
-    "KCAR": (46.8713888889, -68.0177777778),
-    "KCAV": (42.7419444444, -93.7588888889),
-    "KCBE": (39.6155555556, -78.7608333333),
-    "KCBF": (41.26, -95.7586111111),
-    "KCBG": (45.5575, -93.2641666667),
-    "KCBK": (39.4275, -101.046666667),
-    "KCBM": (33.6438888889, -88.4436111111),
-    "KCCA": (35.5977777778, -92.4516666667),
-    "KCCB": (34.1116666667, -117.6875),
-    "KCCO": (33.3116666667, -84.7697222222),
-    "KCCR": (37.9897222222, -122.056944444),
-    "KCCY": (43.0725, -92.6108333333),
-    "KCDA": (44.5691666667, -72.0180555556),
-    "KCDC": (37.7008333333, -113.098611111),
-    "KCDD": (48.2666666667, -92.4836111111),
-    "KCDH": (33.6227777778, -92.7633333333),
-    "KCDI": (39.975, -81.5775),
-    "KCDK": (29.1341666667, -83.0505555556),
-    "KCDN": (34.2836111111, -80.565),
-    "KCDR": (42.8375, -103.095277778),
-    "KCDS": (34.4336111111, -100.288055556),
-    "KCDW": (40.8752777778, -74.2813888889),
-    "KCEA": (37.6486111111, -97.2505555556),
-    "KCEC": (41.7802777778, -124.236666667),
-    "KCEF": (42.1980555556, -72.5341666667),
-    "KCEU": (34.6719166667, -82.8868055556),
-    "KCEV": (39.6983333333, -85.1311111111),
-    "KCEW": (30.7786111111, -86.5219444444),
-    "KCEY": (36.6644444444, -88.3727777778),
-    "KCEZ": (37.3030555556, -108.628055556),
-    "KCFD": (30.7155555556, -96.3311111111),
-    "KCFE": (45.1591666667, -93.8433333333),
-    "KCFS": (43.4586111111, -83.4452777778),
-    "KCFT": (32.9569444444, -109.211111111),
-    "KCFV": (37.0941666667, -95.5719444444),
-    "KCGC": (28.8672222222, -82.5713888889),
-    "KCGE": (38.5394444444, -76.0302777778),
-    "KCGF": (41.565, -81.4863888889),
-    "KCGI": (37.2252777778, -89.5708333333),
-    "KCGS": (38.9805833333, -76.9223055556),
-    "KCGZ": (32.955, -111.766944444),
-    "KCHA": (35.0352777778, -85.2036111111),
-    "KCHD": (33.2691666667, -111.811111111),
-    "KCHK": (35.0972222222, -97.9677777778),
-    "KCHN": (27.5149055556, -81.8804638889),
-    "KCHO": (38.1386388889, -78.4528611111),
-    "KCHQ": (36.8422222222, -89.3597222222),
-    "KCHS": (32.8986111111, -80.0402777778),
-    "KCHU": (43.5963888889, -91.5038888889),
-    "KCIC": (39.7952777778, -121.858333333),
-    "KCID": (41.8846944444, -91.7108055556),
-    "KCII": (47.8283333333, -112.168333333),
-    "KCIN": (42.0461111111, -94.7888888889),
-    "KCIU": (46.2508333333, -84.4725),
-    "KCJR": (38.5255555556, -77.8597222222),
-    "KCKA": (36.7380555556, -98.1261111111),
-    "KCKB": (39.2966666667, -80.2280555556),
-    "KCKC": (47.8383333333, -90.3830555556),
-    "KCKF": (31.9888888889, -83.7738888889),
-    "KCKN": (47.8408333333, -96.6216666667),
-    "KCKV": (36.6219444444, -87.415),
-    "KCLE": (41.4116666667, -81.8497222222),
-    "KCLI": (44.6133333333, -88.7308333333),
-    "KCLK": (35.5382722222, -98.9327777778),
-    "KCLL": (30.5883333333, -96.3636111111),
-    "KCLM": (48.1202777778, -123.499722222),
-    "KCLR": (33.1313888889, -115.521388889),
-    "KCLT": (35.2138888889, -80.9430555556),
-    "KCMA": (34.2138888889, -119.094444444),
-    "KCMH": (39.9977777778, -82.8916666667),
-    "KCMI": (40.0391666667, -88.2780555556),
-    "KCMR": (35.3054722222, -112.194388889),
-    "KCMX": (47.1683333333, -88.4891666667),
-    "KCMY": (43.9583333333, -90.7377777778),
-    "KCNH": (43.3705555556, -72.3686111111),
-    "KCNK": (39.5491666667, -97.6522222222),
-    "KCNM": (32.3372222222, -104.263055556),
-    "KCNO": (33.9747222222, -117.636666667),
-    "KCNU": (37.6688888889, -95.485),
-    "KCNW": (31.6377777778, -97.0738888889),
-    "KCNY": (38.755, -109.754722222),
-    "KCOD": (44.5202777778, -109.023888889),
-    "KCOE": (47.7744444444, -116.819444444),
-    "KCOF": (28.2347222222, -80.61),
-    "KCOI": (28.3416666667, -80.6855555556),
-    "KCOM": (31.8411111111, -99.4033333333),
-    "KCON": (43.2027777778, -71.5022222222),
-    "KCOQ": (46.7011111111, -92.5036111111),
-    "KCOS": (38.8055555556, -104.7),
-    "KCOT": (28.4580555556, -99.22),
-    "KCOU": (38.8180555556, -92.2194444444),
-    "KCPC": (34.2727777778, -78.715),
-    "KCPK": (36.6655555556, -76.3205555556),
-    "KCPM": (33.89, -118.243611111),
-    "KCPR": (42.9077777778, -106.464166667),
-    "KCPS": (38.5708333333, -90.1561111111),
-    "KCPT": (32.3538888889, -97.4338888889),
-    "KCPU": (38.1461111111, -120.648055556),
-    "KCQB": (35.7238888889, -96.8202777778),
-    "KCQF": (30.4605555556, -87.8769444444),
-    "KCQW": (34.7127777778, -79.9569444444),
-    "KCQX": (41.6883333333, -69.9894444444),
-    "KCRE": (33.8116666667, -78.7238888889),
-    "KCRG": (30.3363888889, -81.5144444444),
-    "KCRO": (36.1027777778, -119.594722222),
-    "KCRP": (27.7702777778, -97.5011111111),
-    "KCRQ": (33.1283333333, -117.28),
-    "KCRS": (32.0280555556, -96.4005555556),
-    "KCRT": (33.1783333333, -91.8802777778),
-    "KCRW": (38.3758333333, -81.5930555556),
-    "KCRX": (34.915, -88.6036111111),
-    "KCRZ": (40.9941666667, -94.755),
-    "KCSB": (40.3066666667, -100.162222222),
-    "KCSG": (32.5163888889, -84.9388888889),
-    "KCSM": (35.3397222222, -99.2005555556),
-    "KCSQ": (41.0213888889, -94.3633333333),
-    "KCTB": (48.6083333333, -112.376111111),
-    "KCTJ": (33.6316666667, -85.1522222222),
-    "KCTK": (40.5691666667, -90.0747222222),
-    "KCTY": (29.6355555556, -83.1047222222),
-    "KCTZ": (34.975, -78.3655555556),
-    "KCUB": (33.9705555556, -80.9952777778),
-    "KCUH": (35.95, -96.7733333333),
-    "KCVG": (39.0461111111, -84.6619444444),
-    "KCVH": (36.8933333333, -121.410277778),
-    "KCVK": (36.265, -91.5627777778),
-    "KCVN": (34.4252777778, -103.079166667),
-    "KCVO": (44.4972222222, -123.289444444),
-    "KCVS": (34.3825, -103.321944444),
-    "KCVX": (45.3047222222, -85.2752777778),
-    "KCWA": (44.7775, -89.6666666667),
-    "KCWF": (30.2105555556, -93.1430555556),
-    "KCWI": (41.8311111111, -90.3291666667),
-    "KCWS": (35.0808333333, -92.425),
-    "KCXL": (32.6694444444, -115.513055556),
-    "KCXO": (30.3516666667, -95.4144444444),
-    "KCXP": (39.1922222222, -119.734444444),
-    "KCXY": (40.2172222222, -76.8513888889),
-    "KCYS": (41.1555555556, -104.811666667),
-    "KCYW": (39.3872222222, -97.1572222222),
-    "KCZG": (42.0786111111, -76.0963888889),
-    "KCZK": (45.6769444444, -121.878888889),
-    "KCZL": (34.4555555556, -84.9391666667),
-    "KDAA": (38.715, -77.1811111111),
-    "KDAB": (29.1847222222, -81.0605555556),
-    "KDAF": (44.0333333333, -90.085),
-    "KDAG": (34.8536111111, -116.786666667),
-    "KDAL": (32.8469444444, -96.8516666667),
-    "KDAN": (36.5727777778, -79.3361111111),
-    "KDAW": (43.2841666667, -70.9291666667),
-    "KDAY": (39.9022222222, -84.2191666667),
-    "KDBN": (32.5644444444, -82.9852777778),
-    "KDBQ": (42.4019444444, -90.7094444444),
-    "KDCA": (38.8519444444, -77.0375),
-    "KDCU": (34.6541666667, -86.9452777778),
-    "KDCY": (38.7005555556, -87.1297222222),
-    "KDDC": (37.7630555556, -99.9655555556),
-    "KDDH": (42.8911111111, -73.2461111111),
-    "KDEC": (39.8344444444, -88.8655555556),
-    "KDED": (29.0669444444, -81.2838888889),
-    "KDEH": (43.2755555556, -91.7394444444),
-    "KDEN": (39.8583333333, -104.666944444),
-    "KDEQ": (34.0469444444, -94.3994444444),
-    "KDET": (42.4091666667, -83.0097222222),
-    "KDEW": (47.9669444444, -117.428611111),
-    "KDFI": (41.3375, -84.4288888889),
-    "KDFW": (32.8963888889, -97.0375),
-    "KDGL": (31.3425, -109.506388889),
-    "KDGW": (42.7972222222, -105.385833333),
-    "KDHN": (31.3211111111, -85.4494444444),
-    "KDHT": (36.0225, -102.547222222),
-    "KDIJ": (43.7425, -111.0975),
-    "KDIK": (46.7972222222, -102.801944444),
-    "KDKB": (39.0705555556, -88.5336111111),
-    "KDKK": (42.4933333333, -79.2719444444),
-    "KDKR": (31.3069444444, -95.4038888889),
-    "KDKX": (35.9638888889, -83.8736111111),
-    "KDLC": (34.4491666667, -79.3686111111),
-    "KDLF": (29.3594444444, -100.777777778),
-    "KDLH": (46.8419444444, -92.1936111111),
-    "KDLL": (43.5219444444, -89.7708333333),
-    "KDLN": (45.2552777778, -112.5525),
-    "KDLO": (35.7455555556, -119.236388889),
-    "KDLS": (45.6186111111, -121.167222222),
-    "KDMA": (32.1663888889, -110.883055556),
-    "KDMN": (32.2622222222, -107.720555556),
-    "KDMO": (38.7075, -93.1758333333),
-    "KDMW": (39.6083333333, -77.0077777778),
-    "KDNL": (33.4663888889, -82.0394444444),
-    "KDNN": (34.7230555556, -84.8702777778),
-    "KDNS": (41.9866666667, -95.3805555556),
-    "KDNV": (40.1991666667, -87.5955555556),
-    "KDOV": (39.13, -75.4663888889),
-    "KDPA": (41.9077777778, -88.2486111111),
-    "KDPG": (40.1994444444, -112.9375),
-    "KDPL": (35.0, -77.9816666667),
-    "KDQH": (31.4766666667, -82.8605555556),
-    "KDRA": (36.6194444444, -116.032777778),
-    "KDRI": (30.8316666667, -93.3397222222),
-    "KDRO": (37.1513888889, -107.753611111),
-    "KDRT": (29.3727777778, -100.925833333),
-    "KDSM": (41.5338888889, -93.6625),
-    "KDSV": (42.5708333333, -77.7130555556),
-    "KDTA": (39.3805555556, -112.507777778),
-    "KDTL": (46.8252777778, -95.8847222222),
-    "KDTN": (32.5402777778, -93.745),
-    "KDTO": (33.2008333333, -97.1980555556),
-    "KDTS": (30.4, -86.4713888889),
-    "KDTW": (42.2122222222, -83.3533333333),
-    "KDUA": (33.9422222222, -96.3944444444),
-    "KDUC": (34.4708333333, -97.96),
-    "KDUG": (31.4688888889, -109.603611111),
-    "KDUH": (41.7358333333, -83.6558333333),
-    "KDUJ": (41.1783333333, -78.8986111111),
-    "KDUX": (35.8572222222, -102.013055556),
-    "KDVK": (37.5777777778, -84.7697222222),
-    "KDVL": (48.1144444444, -98.9083333333),
-    "KDVN": (41.6102777778, -90.5883333333),
-    "KDVO": (38.1436111111, -122.556111111),
-    "KDVT": (33.6883333333, -112.0825),
-    "KDWH": (30.0619444444, -95.5527777778),
-    "KDWU": (38.5544444444, -82.7380555556),
-    "KDXR": (41.3716666667, -73.4822222222),
-    "KDXX": (44.9863888889, -96.1777777778),
-    "KDXZ": (37.0363888889, -113.510277778),
-    "KDYA": (32.4638888889, -87.9541666667),
-    "KDYB": (33.0633333333, -80.2794444444),
-    "KDYL": (40.3330555556, -75.1219444444),
-    "KDYR": (35.9980555556, -89.4066666667),
-    "KDYS": (32.4205555556, -99.8544444444),
-    "KDZJ": (34.8544444444, -83.9972222222),
-    "KEAR": (40.7269444444, -99.0066666667),
-    "KEAT": (47.3980555556, -120.205833333),
-    "KEAU": (44.8658333333, -91.4841666667),
-    "KEBG": (26.4416666667, -98.1222222222),
-    "KEBS": (42.4363888889, -93.8691666667),
-    "KECG": (36.2605555556, -76.1744444444),
-    "KEDC": (30.3966666667, -97.5733333333),
-    "KEDE": (36.0277777778, -76.5672222222),
-    "KEDJ": (40.3722222222, -83.8188888889),
-    "KEDN": (31.2997222222, -85.8997222222),
-    "KEDU": (38.5313888889, -121.786388889),
-    "KEDW": (34.9052777778, -117.883611111),
-    "KEED": (34.7663888889, -114.623333333),
-    "KEEN": (42.8983333333, -72.2708333333),
-    "KEET": (33.1777777778, -86.7830555556),
-    "KEFD": (29.6072222222, -95.1586111111),
-    "KEFK": (44.8888888889, -72.2291666667),
-    "KEFT": (42.615, -89.5902777778),
-    "KEGE": (39.6425, -106.917777778),
-    "KEGI": (30.6502777778, -86.5227777778),
-    "KEGP": (28.7, -100.479444444),
-    "KEGT": (37.3236111111, -97.3883333333),
-    "KEGV": (45.9322222222, -89.2683333333),
-    "KEHA": (37.0008333333, -101.88),
-    "KEHO": (35.2558333333, -81.6008333333),
-    "KEHR": (37.8077777778, -87.6855555556),
-    "KEIK": (40.0102777778, -105.048055556),
-    "KEKA": (40.8033333333, -124.112777778),
-    "KEKM": (41.7194444444, -86.0033333333),
-    "KEKN": (38.8894444444, -79.8569444444),
-    "KEKO": (40.825, -115.791666667),
-    "KEKQ": (36.8552777778, -84.8561111111),
-    "KEKX": (37.6861111111, -85.925),
-    "KEKY": (33.3125, -86.9263888889),
-    "KELD": (33.2208333333, -92.8130555556),
-    "KELM": (42.16, -76.8916666667),
-    "KELN": (47.0330555556, -120.530555556),
-    "KELO": (47.8244444444, -91.8308333333),
-    "KELP": (31.8066666667, -106.377777778),
-    "KELY": (39.2997222222, -114.841944444),
-    "KELZ": (42.1094444444, -77.99),
-    "KEMM": (41.8241666667, -110.556944444),
-    "KEMP": (38.3305555556, -96.1899444444),
-    "KEMT": (34.0861111111, -118.034722222),
-    "KEND": (36.3397222222, -97.9161111111),
-    "KENV": (40.7186111111, -114.030833333),
-    "KENW": (42.5955555556, -87.9277777778),
-    "KEOK": (40.46, -91.4286111111),
-    "KEOP": (39.1669444444, -82.9280555556),
-    "KEOS": (36.8108333333, -94.3916666667),
-    "KEPH": (47.3080555556, -119.516944444),
-    "KEPM": (44.91, -67.0127777778),
-    "KEQA": (37.7741666667, -96.8175),
-    "KEQY": (35.0188888889, -80.6202777778),
-    "KERI": (42.0819444444, -80.1761111111),
-    "KERV": (29.9766666667, -99.0855555556),
-    "KERY": (46.311, -85.4571666667),
-    "KESC": (45.7227777778, -87.0936111111),
-    "KESF": (31.3947222222, -92.2955555556),
-    "KESN": (38.8041666667, -76.0688888889),
-    "KESW": (47.2541666667, -121.185555556),
-    "KETB": (43.4222222222, -88.1277777778),
-    "KEUF": (31.9513888889, -85.1288888889),
-    "KEUG": (44.1230555556, -123.218611111),
-    "KEUL": (43.6419444444, -116.635833333),
-    "KEVB": (29.0555555556, -80.9488888889),
-    "KEVU": (40.3533333333, -94.9166666667),
-    "KEVV": (38.0383333333, -87.5308333333),
-    "KEVY": (39.5202777778, -75.7205555556),
-    "KEWB": (41.6761111111, -70.9569444444),
-    "KEWK": (38.0583333333, -97.2744444444),
-    "KEWN": (35.0727777778, -77.0427777778),
-    "KEWR": (40.6922222222, -74.1686111111),
-    "KEXX": (35.7811111111, -80.3038888889),
-    "KEYE": (39.8308333333, -86.2944444444),
-    "KEYF": (34.6016666667, -78.5791666667),
-    "KEYQ": (29.9352777778, -95.6397222222),
-    "KEYW": (24.5561111111, -81.7594444444),
-    "KEZM": (32.2163888889, -83.1286111111),
-    "KEZS": (44.7872222222, -88.56),
-    "KFAF": (37.1325, -76.6086111111),
-    "KFAR": (46.9205555556, -96.8158333333),
-    "KFAT": (36.7761111111, -119.718055556),
-    "KFAY": (34.9911111111, -78.8802777778),
-    "KFBG": (35.1319444444, -78.9363888889),
-    "KFCA": (48.3105555556, -114.256111111),
-    "KFCH": (36.7322222222, -119.820277778),
-    "KFCI": (37.4066666667, -77.525),
-    "KFCM": (44.8272222222, -93.4572222222),
-    "KFCS": (38.6783333333, -104.756388889),
-    "KFCT": (46.6694444444, -120.458333333),
-    "KFCY": (34.9419444444, -90.775),
-    "KFDK": (39.4175, -77.3744444444),
-    "KFDR": (34.3522222222, -98.9838888889),
-    "KFDW": (34.3155555556, -81.1088888889),
-    "KFDY": (41.0119444444, -83.6686111111),
-    "KFET": (41.4491666667, -96.5202777778),
-    "KFFA": (36.0183333333, -75.6713888889),
-    "KFFC": (33.3572222222, -84.5719444444),
-    "KFFL": (41.0558333333, -91.9808333333),
-    "KFFM": (46.2844444444, -96.1566666667),
-    "KFFO": (39.8261111111, -84.0483333333),
-    "KFFT": (38.1819444444, -84.9061111111),
-    "KFFZ": (33.4608333333, -111.728333333),
-    "KFGX": (38.5416666667, -83.7433333333),
-    "KFHB": (30.6119444444, -81.4611111111),
-    "KFHR": (48.5219444444, -123.024444444),
-    "KFHU": (31.5883333333, -110.344166667),
-    "KFIG": (41.0491666667, -78.4152777778),
-    "KFIT": (42.5541666667, -71.7588888889),
-    "KFKA": (43.6761111111, -92.1794444444),
-    "KFKL": (41.3777777778, -79.8602777778),
-    "KFKN": (36.6980555556, -76.9038888889),
-    "KFKS": (44.6252777778, -86.2008333333),
-    "KFLD": (43.7711111111, -88.4883333333),
-    "KFLG": (35.1402777778, -111.669166667),
-    "KFLL": (26.0725, -80.1525),
-    "KFLO": (34.1852777778, -79.7238888889),
-    "KFLP": (36.2908333333, -92.5902777778),
-    "KFLV": (39.3683333333, -94.9144444444),
-    "KFLX": (39.4991666667, -118.748888889),
-    "KFLY": (38.9458333333, -104.57),
-    "KFME": (39.0852777778, -76.7591666667),
-    "KFMH": (41.6583333333, -70.5213888889),
-    "KFMM": (40.3338888889, -103.804166667),
-    "KFMN": (36.7411111111, -108.229722222),
-    "KFMY": (26.5863888889, -81.8630555556),
-    "KFMZ": (40.5861111111, -97.5730555556),
-    "KFNB": (40.0786111111, -95.5919444444),
-    "KFNL": (40.4519444444, -105.011388889),
-    "KFNT": (42.9655555556, -83.7436111111),
-    "KFOD": (42.5513888889, -94.1925),
-    "KFOE": (38.9508333333, -95.6636111111),
-    "KFOK": (40.8436111111, -72.6316666667),
-    "KFOM": (38.9580555556, -112.363055556),
-    "KFOT": (40.5538888889, -124.132777778),
-    "KFPK": (42.5744444444, -84.8113888889),
-    "KFPR": (27.495, -80.3683333333),
-    "KFRG": (40.7288888889, -73.4133333333),
-    "KFRH": (38.5061111111, -86.6369444444),
-    "KFRI": (39.055, -96.7644444444),
-    "KFRM": (43.6438888889, -94.4155555556),
-    "KFRR": (38.9175, -78.2533333333),
-    "KFSD": (43.5819444444, -96.7419444444),
-    "KFSI": (34.6497222222, -98.4019444444),
-    "KFSK": (37.7983333333, -94.7694444444),
-    "KFSM": (35.3363888889, -94.3672222222),
-    "KFSO": (44.9402777778, -73.0975),
-    "KFST": (30.91525, -102.912777778),
-    "KFSU": (34.4877777778, -104.216944444),
-    "KFTG": (39.7852777778, -104.543055556),
-    "KFTK": (37.9069444444, -85.9719444444),
-    "KFTW": (32.8197222222, -97.3622222222),
-    "KFTY": (33.7791666667, -84.5213888889),
-    "KFUL": (33.8720138889, -117.979783333),
-    "KFVE": (47.2855555556, -68.3127777778),
-    "KFWA": (40.9783333333, -85.1952777778),
-    "KFWC": (38.3786111111, -88.4127777778),
-    "KFWN": (41.2002777778, -74.6230555556),
-    "KFWQ": (40.2097222222, -79.8313888889),
-    "KFWS": (32.5652777778, -97.3080555556),
-    "KFXE": (26.1972222222, -80.1705555556),
-    "KFXY": (43.2347222222, -93.6241666667),
-    "KFYE": (35.2077777778, -89.3944444444),
-    "KFYM": (35.0597222222, -86.5638888889),
-    "KFYV": (36.005, -94.17),
-    "KFZI": (41.1908333333, -83.3944444444),
-    "KFZY": (43.3508333333, -76.3880555556),
-    "KGAB": (38.9241666667, -117.958888889),
-    "KGAD": (33.9727777778, -86.0891666667),
-    "KGAG": (36.2952777778, -99.7763888889),
-    "KGAI": (39.1683333333, -77.166),
-    "KGBD": (38.3441666667, -98.8591666667),
-    "KGBN": (32.8875, -112.72),
-    "KGBR": (42.1842141667, -73.4032416667),
-    "KGCC": (44.3488888889, -105.539444444),
-    "KGCD": (44.1382083333, -118.981613889),
-    "KGCK": (37.9275, -100.724166667),
-    "KGCM": (36.2927777778, -95.4797222222),
-    "KGCN": (35.9522222222, -112.146944444),
-    "KGDJ": (32.4444444444, -97.8169444444),
-    "KGDM": (42.55, -72.0161111111),
-    "KGDV": (47.1386111111, -104.807222222),
-    "KGDY": (37.2325, -82.125),
-    "KGED": (38.6877777778, -75.3583333333),
-    "KGEG": (47.6197222222, -117.533611111),
-    "KGEU": (33.5269444444, -112.295),
-    "KGEV": (36.4325, -81.4197222222),
-    "KGFA": (47.5047222222, -111.187222222),
-    "KGFK": (47.9491666667, -97.1761111111),
-    "KGGE": (33.3113888889, -79.3202777778),
-    "KGGF": (40.8705555556, -101.733888889),
-    "KGGG": (32.3847222222, -94.7113888889),
-    "KGGW": (48.2125, -106.614722222),
-    "KGHG": (42.0983333333, -70.6722222222),
-    "KGHM": (35.8375, -87.4452777778),
-    "KGIC": (45.9425, -116.123333333),
-    "KGIF": (28.0627777778, -81.7533333333),
-    "KGJT": (39.1225, -108.526666667),
-    "KGKJ": (41.6266666667, -80.2147222222),
-    "KGKT": (35.8577777778, -83.5286111111),
-    "KGKY": (32.6638888889, -97.0941666667),
-    "KGLH": (33.4827777778, -90.9855555556),
-    "KGLS": (29.2652777778, -94.8602777778),
-    "KGLW": (37.0316666667, -85.9538888889),
-    "KGMJ": (36.6066666667, -94.7386111111),
-    "KGMU": (34.8480555556, -82.35),
-    "KGNF": (33.8325, -89.7980555556),
-    "KGNI": (29.2627777778, -89.9611111111),
-    "KGNT": (35.1652777778, -107.900555556),
-    "KGNV": (29.69, -82.2716666667),
-    "KGOK": (35.8513888889, -97.4161111111),
-    "KGON": (41.33, -72.045),
-    "KGOO": (39.2238888889, -121.003055556),
-    "KGOV": (44.6802777778, -84.7288888889),
-    "KGPI": (48.1786111111, -114.303611111),
-    "KGPT": (30.4072222222, -89.07),
-    "KGRB": (44.485, -88.1294444444),
-    "KGRD": (34.2486111111, -82.1591666667),
-    "KGRF": (47.0791666667, -122.580555556),
-    "KGRI": (40.9675, -98.3097222222),
-    "KGRK": (31.0672222222, -97.8288888889),
-    "KGRR": (42.8808333333, -85.5227777778),
-    "KGSB": (35.3391666667, -77.9605555556),
-    "KGSO": (36.0977777778, -79.9372222222),
-    "KGSP": (34.8955555556, -82.2188888889),
-    "KGSW": (32.8313888889, -97.0491666667),
-    "KGTB": (44.0555555556, -75.7194444444),
-    "KGTF": (47.4819444444, -111.370555556),
-    "KGTG": (45.7980555556, -92.6644444444),
-    "KGTR": (33.4483333333, -88.5913888889),
-    "KGTU": (30.6788083333, -97.6793833333),
-    "KGUC": (38.5338888889, -106.933055556),
-    "KGUP": (35.5111111111, -108.789444444),
-    "KGUS": (40.6480555556, -86.1519444444),
-    "KGUY": (36.685, -101.507777778),
-    "KGVQ": (43.0316666667, -78.1697222222),
-    "KGVT": (33.0677777778, -96.0652777778),
-    "KGVW": (38.8433333333, -94.5605555556),
-    "KGWO": (33.4941666667, -90.0844444444),
-    "KGWR": (46.2186111111, -97.6436111111),
-    "KGWW": (35.4605555556, -77.965),
-    "KGXY": (40.4375, -104.633055556),
-    "KGYB": (30.1691666667, -96.98),
-    "KGYH": (34.7583333333, -82.3763888889),
-    "KGYI": (33.7141666667, -96.6736111111),
-    "KGYR": (33.4280555556, -112.374444444),
-    "KGYY": (41.6163888889, -87.4127777778),
-    "KGZH": (31.4158333333, -87.0441666667),
-    "KGZL": (35.2880555556, -95.0938888889),
-    "KHAB": (34.1175, -87.9983333333),
-    "KHAE": (39.7252777778, -91.4438888889),
-    "KHAF": (37.5133333333, -122.501111111),
-    "KHAO": (39.36375, -84.5219444444),
-    "KHBI": (35.6544444444, -79.8947222222),
-    "KHBR": (34.9911111111, -99.0511111111),
-    "KHBZ": (35.5116666667, -92.0130555556),
-    "KHCD": (44.86, -94.3825),
-    "KHDN": (40.4811111111, -107.217777778),
-    "KHDO": (29.3591666667, -99.1775),
-    "KHEE": (34.5763888889, -90.6758333333),
-    "KHEF": (38.7213888889, -77.5155555556),
-    "KHEG": (30.2777777778, -81.8058333333),
-    "KHEI": (46.015, -102.656111111),
-    "KHEY": (31.3461111111, -85.6544444444),
-    "KHEZ": (31.6136111111, -91.2972222222),
-    "KHFD": (41.7361111111, -72.65),
-    "KHFF": (35.0363888889, -79.4975),
-    "KHGR": (39.7086111111, -77.7263888889),
-    "KHHR": (33.9227777778, -118.335),
-    "KHHW": (34.0347222222, -95.5419444444),
-    "KHIB": (47.3863888889, -92.8388888889),
-    "KHIE": (44.3676138889, -71.5444694444),
-    "KHIF": (41.1238888889, -111.972777778),
-    "KHII": (34.5711111111, -114.358333333),
-    "KHIO": (45.5403938889, -122.949825),
-    "KHJO": (36.3166666667, -119.627777778),
-    "KHKA": (35.9405555556, -89.8308333333),
-    "KHKS": (32.3347222222, -90.2225),
-    "KHKY": (35.7411111111, -81.3894444444),
-    "KHLC": (39.3802777778, -99.8313888889),
-    "KHLG": (40.175, -80.6463888889),
-    "KHLN": (46.6066666667, -111.9825),
-    "KHLR": (31.1386111111, -97.7144444444),
-    "KHMN": (32.8525, -106.106388889),
-    "KHMS": (46.3055555556, -119.304166667),
-    "KHMT": (33.7338888889, -117.0225),
-    "KHMZ": (40.0861111111, -78.5135),
-    "KHND": (35.9727777778, -115.134444444),
-    "KHOB": (32.6875, -103.216944444),
-    "KHOE": (31.0558333333, -82.7741666667),
-    "KHON": (44.385, -98.2283333333),
-    "KHOP": (36.6683333333, -87.4961111111),
-    "KHOT": (34.4780555556, -93.0961111111),
-    "KHOU": (29.6452777778, -95.2788888889),
-    "KHPN": (41.0669444444, -73.7075),
-    "KHQG": (37.1630555556, -101.370555556),
-    "KHQM": (46.9711111111, -123.936666667),
-    "KHQZ": (32.7469444444, -96.5305555556),
-    "KHRI": (45.8283333333, -119.259166667),
-    "KHRJ": (35.3802777778, -78.7322222222),
-    "KHRL": (26.2283333333, -97.6541666667),
-    "KHRO": (36.2613888889, -93.1547222222),
-    "KHRT": (30.4277777778, -86.6891666667),
-    "KHRU": (38.6947222222, -96.8080555556),
-    "KHSA": (30.3677777778, -89.4547222222),
-    "KHSE": (35.2327777778, -75.6177777778),
-    "KHSI": (40.6052777778, -98.4277777778),
-    "KHSR": (43.3683333333, -103.388333333),
-    "KHST": (25.4883333333, -80.3836111111),
-    "KHSV": (34.6372222222, -86.775),
-    "KHTH": (38.5444444444, -118.634166667),
-    "KHTL": (44.3597222222, -84.6711111111),
-    "KHTO": (40.9594444444, -72.2516666667),
-    "KHTS": (38.3669444444, -82.5586111111),
-    "KHUA": (34.6786111111, -86.6847222222),
-    "KHUF": (39.4513888889, -87.3075),
-    "KHUL": (46.1230555556, -67.7919444444),
-    "KHUM": (29.5663888889, -90.6605555556),
-    "KHUT": (38.0655555556, -97.8605555556),
-    "KHVC": (36.8569444444, -87.455),
-    "KHVN": (41.2638888889, -72.8866666667),
-    "KHVR": (48.5427777778, -109.762222222),
-    "KHVS": (34.4030555556, -80.1191666667),
-    "KHWD": (37.6588888889, -122.121666667),
-    "KHWO": (26.0013888889, -80.2402777778),
-    "KHWQ": (46.4486111111, -109.852777778),
-    "KHWV": (40.8219444444, -72.8669444444),
-    "KHWY": (38.5863888889, -77.7105555556),
-    "KHXD": (32.2244444444, -80.6975),
-    "KHXF": (43.3491666667, -88.3913888889),
-    "KHYA": (41.6694444444, -70.2802777778),
-    "KHYI": (29.8927777778, -97.8630555556),
-    "KHYR": (46.0252777778, -91.4441666667),
-    "KHYS": (38.8422222222, -99.2730555556),
-    "KHYW": (33.8286111111, -79.1222222222),
-    "KHYX": (43.4334166667, -83.8623333333),
-    "KHZE": (47.29, -101.581111111),
-    "KHZL": (40.9866666667, -75.995),
-    "KIAB": (37.6227777778, -97.2672222222),
-    "KIAD": (38.9444444444, -77.4555555556),
-    "KIAG": (43.1072222222, -78.9461111111),
-    "KIAH": (29.9802777778, -95.3397222222),
-    "KICR": (43.3902777778, -99.8422222222),
-    "KICT": (37.6497222222, -97.4330555556),
-    "KIDA": (43.5136111111, -112.070833333),
-    "KIDI": (40.6322222222, -79.1055555556),
-    "KIDL": (33.4858333333, -90.6788888889),
-    "KIDP": (37.1583333333, -95.7783333333),
-    "KIEN": (43.0225, -102.511111111),
-    "KIFP": (35.1575, -114.559444444),
-    "KIGM": (35.2594444444, -113.938055556),
-    "KIGX": (35.935, -79.0658333333),
-    "KIIB": (42.4569444444, -91.9477777778),
-    "KIJD": (41.7441666667, -72.1802777778),
-    "KIKK": (41.0713888889, -87.8461111111),
-    "KIKR": (35.04, -106.609166667),
-    "KIKW": (43.6627777778, -84.2613888889),
-    "KILE": (31.0858333333, -97.6863888889),
-    "KILG": (39.6786111111, -75.6063888889),
-    "KILM": (34.2705555556, -77.9025),
-    "KILN": (39.4280555556, -83.7922222222),
-    "KIMM": (26.4338888889, -81.4013888889),
-    "KIMS": (38.76, -85.4647222222),
-    "KIND": (39.7172222222, -86.2941666667),
-    "KINJ": (32.0836111111, -97.0972222222),
-    "KINK": (31.7794444444, -103.201111111),
-    "KINL": (48.5661111111, -93.4030555556),
-    "KINS": (36.5869444444, -115.673333333),
-    "KINT": (36.1336111111, -80.2219444444),
-    "KINW": (35.0219444444, -110.7225),
-    "KIOW": (41.6392444444, -91.5465027778),
-    "KIPJ": (35.4833333333, -81.1611111111),
-    "KIPL": (32.8341666667, -115.578611111),
-    "KIPT": (41.2419444444, -76.9211111111),
-    "KISM": (28.2897222222, -81.4372222222),
-    "KISN": (48.1777777778, -103.642222222),
-    "KISO": (35.3313888889, -77.6088888889),
-    "KISP": (40.795, -73.1),
-    "KISW": (44.3602777778, -89.8388888889),
-    "KITH": (42.4913888889, -76.4586111111),
-    "KITR": (39.2425, -102.285277778),
-    "KIWA": (33.3077777778, -111.655555556),
-    "KIWI": (43.9613888889, -69.7125),
-    "KIXD": (38.8308333333, -94.8902777778),
-    "KIYK": (35.6586111111, -117.829444444),
-    "KIZA": (34.6069444444, -120.075555556),
-    "KIZG": (43.9911111111, -70.9477777778),
-    "KJAC": (43.6072222222, -110.737777778),
-    "KJAN": (32.3111111111, -90.0758333333),
-    "KJAX": (30.4938888889, -81.6877777778),
-    "KJBR": (35.8316666667, -90.6461111111),
-    "KJDN": (47.3288888889, -106.952777778),
-    "KJEF": (38.5911111111, -92.1561111111),
-    "KJFK": (40.6397222222, -73.7788888889),
-    "KJFX": (33.9019444444, -87.3141666667),
-    "KJHN": (37.5852777778, -101.732222222),
-    "KJHW": (42.1533333333, -79.2580555556),
-    "KJKA": (30.2897222222, -87.6716666667),
-    "KJMS": (46.9297222222, -98.6783333333),
-    "KJQF": (35.3877777778, -80.7091666667),
-    "KJRA": (40.7547222222, -74.0069444444),
-    "KJRB": (40.7011111111, -74.0088888889),
-    "KJST": (40.3155555556, -78.8347222222),
-    "KJSV": (35.4383333333, -94.8027777778),
-    "KJVW": (32.3044444444, -90.4105555556),
-    "KJWG": (35.8644444444, -98.4208333333),
-    "KJWN": (36.1822222222, -86.8866666667),
-    "KJYO": (39.0780555556, -77.5575),
-    "KJYR": (40.8963888889, -97.6241666667),
-    "KJZI": (32.7008333333, -80.0027777778),
-    "KJZP": (34.4533333333, -84.4572222222),
-    "KKIC": (36.2286111111, -121.121388889),
-    "KKLS": (46.1180555556, -122.898333333),
-    "KKNB": (37.0111111111, -112.531111111),
-    "KLAA": (38.0697222222, -102.688611111),
-    "KLAF": (40.4122222222, -86.9369444444),
-    "KLAL": (27.9888888889, -82.0186111111),
-    "KLAM": (35.8797222222, -106.268611111),
-    "KLAN": (42.7786111111, -84.5872222222),
-    "KLAR": (41.3119444444, -105.675),
-    "KLAS": (36.0802777778, -115.152222222),
-    "KLAW": (34.5677777778, -98.4163888889),
-    "KLAX": (33.9425, -118.408055556),
-    "KLBB": (33.6636111111, -101.822777778),
-    "KLBE": (40.2747222222, -79.4066666667),
-    "KLBF": (41.1261111111, -100.683611111),
-    "KLBL": (37.0441666667, -100.96),
-    "KLBR": (33.5930555556, -95.0636111111),
-    "KLBT": (34.6097222222, -79.0594444444),
-    "KLCH": (30.1261111111, -93.2233333333),
-    "KLCI": (43.5727777778, -71.4188888889),
-    "KLCK": (39.8136111111, -82.9277777778),
-    "KLCQ": (30.1819444444, -82.5769444444),
-    "KLDJ": (40.6175, -74.2444444444),
-    "KLDM": (43.9625, -86.4077777778),
-    "KLEB": (43.6261111111, -72.3041666667),
-    "KLEE": (28.8230833333, -81.8087222222),
-    "KLEW": (44.0486111111, -70.2836111111),
-    "KLEX": (38.0363888889, -84.6058333333),
-    "KLFI": (37.0827777778, -76.3602777778),
-    "KLFK": (31.2338888889, -94.75),
-    "KLFT": (30.2052777778, -91.9875),
-    "KLGA": (40.7772222222, -73.8725),
-    "KLGB": (33.8175, -118.151388889),
-    "KLGD": (45.2902777778, -118.007222222),
-    "KLGF": (32.86, -114.396666667),
-    "KLGU": (41.7912222222, -111.851583333),
-    "KLHB": (30.8722222222, -96.6222222222),
-    "KLHM": (38.9091666667, -121.351388889),
-    "KLHQ": (39.7555555556, -82.6572222222),
-    "KLHV": (41.1358333333, -77.4222222222),
-    "KLHW": (31.8888888889, -81.5622222222),
-    "KLHX": (38.05, -103.509722222),
-    "KLHZ": (36.0233333333, -78.3302777778),
-    "KLIT": (34.7294444444, -92.2241666667),
-    "KLKP": (44.2644444444, -73.9619444444),
-    "KLKR": (34.7227777778, -80.8547222222),
-    "KLKU": (38.0097222222, -77.97),
-    "KLKV": (42.1611111111, -120.399166667),
-    "KLLJ": (44.5236111111, -114.217777778),
-    "KLLQ": (33.6386111111, -91.7511111111),
-    "KLLU": (37.4894444444, -94.3113888889),
-    "KLMO": (40.1641666667, -105.163611111),
-    "KLMT": (42.1561111111, -121.733055556),
-    "KLNA": (26.5927777778, -80.085),
-    "KLNC": (32.5775, -96.7175),
-    "KLND": (42.8155555556, -108.728333333),
-    "KLNK": (40.8508333333, -96.7591666667),
-    "KLNN": (41.6838888889, -81.3897222222),
-    "KLNP": (36.9875, -82.53),
-    "KLNS": (40.1222222222, -76.2944444444),
-    "KLOL": (-17.37, 123.660555556),
-    "KLOR": (31.3558333333, -85.7511111111),
-    "KLOU": (38.2277777778, -85.6636111111),
-    "KLOZ": (37.0869444444, -84.0775),
-    "KLPC": (34.6656194444, -120.467502778),
-    "KLPR": (41.3442777778, -82.1776388889),
-    "KLQK": (34.81, -82.7027777778),
-    "KLRD": (27.5436111111, -99.4613888889),
-    "KLRF": (34.9180555556, -92.1463888889),
-    "KLRG": (45.3622222222, -68.5347222222),
-    "KLRU": (32.2894444444, -106.921944444),
-    "KLSE": (43.8791666667, -91.2566666667),
-    "KLSF": (32.3372222222, -84.9911111111),
-    "KLSN": (37.0627777778, -120.869166667),
-    "KLSV": (36.2361111111, -115.034166667),
-    "KLTS": (34.6669444444, -99.2666666667),
-    "KLTY": (48.5108333333, -110.990833333),
-    "KLUF": (33.535, -112.383055556),
-    "KLUG": (35.5069444444, -86.8038888889),
-    "KLUK": (39.1033333333, -84.4186111111),
-    "KLUL": (31.6730555556, -89.1727777778),
-    "KLVK": (37.6933888889, -121.820361111),
-    "KLVM": (45.6994444444, -110.448055556),
-    "KLVN": (44.6277777778, -93.2280555556),
-    "KLVS": (35.6541666667, -105.1425),
-    "KLWB": (37.8583333333, -80.3994444444),
-    "KLWC": (39.0111111111, -95.2163888889),
-    "KLWL": (41.1172222222, -114.922222222),
-    "KLWM": (42.7172222222, -71.1233333333),
-    "KLWS": (46.3744444444, -117.015277778),
-    "KLWT": (47.0491666667, -109.466666667),
-    "KLWV": (38.7641666667, -87.6055555556),
-    "KLXL": (45.9497222222, -94.3475),
-    "KLXN": (40.7905555556, -99.7758333333),
-    "KLXT": (38.9596944444, -94.3713611111),
-    "KLXV": (39.2202777778, -106.316666667),
-    "KLYH": (37.3252777778, -79.2011111111),
-    "KLZU": (33.9780555556, -83.9625),
-    "KMAE": (36.9886111111, -120.1125),
-    "KMAF": (31.9425, -102.201666667),
-    "KMAI": (30.8377777778, -85.1819444444),
-    "KMAL": (44.8536111111, -74.3288888889),
-    "KMAN": (43.5813888889, -116.523055556),
-    "KMAO": (34.1811111111, -79.3347222222),
-    "KMAW": (36.5983333333, -89.9925),
-    "KMBG": (45.5463888889, -100.406388889),
-    "KMBO": (42.3247222222, -88.0741666667),
-    "KMBS": (43.5327777778, -84.0797222222),
-    "KMBT": (35.8775, -86.3775),
-    "KMCB": (31.1783333333, -90.4719444444),
-    "KMCC": (38.6675, -121.400555556),
-    "KMCE": (37.2847222222, -120.513888889),
-    "KMCF": (27.8491666667, -82.5211111111),
-    "KMCI": (39.2975, -94.7138888889),
-    "KMCK": (40.2063888889, -100.592222222),
-    "KMCN": (32.6927777778, -83.6491666667),
-    "KMCO": (28.4288888889, -81.3158333333),
-    "KMCW": (43.1577777778, -93.3311111111),
-    "KMCZ": (35.8622222222, -77.1783333333),
-    "KMDD": (32.0366666667, -102.101111111),
-    "KMDQ": (34.8613888889, -86.5575),
-    "KMDS": (44.0163888889, -97.0855555556),
-    "KMDT": (40.1933333333, -76.7633333333),
-    "KMDW": (41.7858333333, -87.7522222222),
-    "KMDZ": (45.1013888889, -90.3008333333),
-    "KMEB": (34.7919444444, -79.3658333333),
-    "KMEM": (35.0422222222, -89.9766666667),
-    "KMER": (37.3802777778, -120.568055556),
-    "KMEV": (39.0008333333, -119.751944444),
-    "KMFE": (26.1758333333, -98.2386111111),
-    "KMFI": (44.6369444444, -90.1894444444),
-    "KMFR": (42.3741666667, -122.873611111),
-    "KMFV": (37.6466666667, -75.7608333333),
-    "KMGE": (33.9152777778, -84.5161111111),
-    "KMGG": (45.2361111111, -93.9855555556),
-    "KMGJ": (41.51, -74.2647222222),
-    "KMGM": (32.3005555556, -86.3938888889),
-    "KMGW": (39.6427777778, -79.9163888889),
-    "KMGY": (39.5888888889, -84.225),
-    "KMHE": (43.7747222222, -98.0386111111),
-    "KMHK": (39.1411111111, -96.6716666667),
-    "KMHL": (39.0955555556, -93.2027777778),
-    "KMHR": (38.5538888889, -121.2975),
-    "KMHS": (41.2630555556, -122.272222222),
-    "KMHT": (42.9325, -71.4355555556),
-    "KMHV": (35.0594444444, -118.151666667),
-    "KMIA": (25.7930555556, -80.2905555556),
-    "KMIB": (48.4155555556, -101.3575),
-    "KMIC": (45.0619444444, -93.3538888889),
-    "KMIO": (36.9091666667, -94.8875),
-    "KMIT": (35.5058333333, -119.191666667),
-    "KMIV": (39.3677777778, -75.0722222222),
-    "KMJX": (39.9275, -74.2925),
-    "KMKA": (44.5252777778, -98.9580555556),
-    "KMKE": (42.9472222222, -87.8963888889),
-    "KMKJ": (36.895, -81.3497222222),
-    "KMKL": (35.5997222222, -88.9155555556),
-    "KMKO": (35.6575, -95.3613888889),
-    "KMKT": (44.2216666667, -93.9186111111),
-    "KMKY": (25.995, -81.6725),
-    "KMLB": (28.1025, -80.645),
-    "KMLC": (34.8822222222, -95.7833333333),
-    "KMLE": (41.1961111111, -96.1122222222),
-    "KMLI": (41.4486111111, -90.5075),
-    "KMLS": (46.4280555556, -105.886111111),
-    "KMLT": (45.6477777778, -68.6855555556),
-    "KMLU": (32.5108333333, -92.0375),
-    "KMMH": (37.6241666667, -118.838888889),
-    "KMMI": (35.3972222222, -84.5625),
-    "KMMK": (41.5086111111, -72.8294444444),
-    "KMMT": (33.9208333333, -80.8011111111),
-    "KMMU": (40.7994444444, -74.415),
-    "KMMV": (45.1944444444, -123.135833333),
-    "KMNI": (33.5872222222, -80.2086111111),
-    "KMNM": (45.1263888889, -87.6383333333),
-    "KMNZ": (31.6658333333, -98.1486111111),
-    "KMOB": (30.6913888889, -88.2427777778),
-    "KMOD": (37.6255555556, -120.954166667),
-    "KMOR": (36.1794444444, -83.3755555556),
-    "KMOT": (48.2591666667, -101.280277778),
-    "KMPE": (32.7991666667, -89.1261111111),
-    "KMPI": (37.5108333333, -120.039444444),
-    "KMPJ": (35.1388888889, -92.9091666667),
-    "KMPO": (41.1377777778, -75.38),
-    "KMPV": (44.2033333333, -72.5622222222),
-    "KMQI": (35.9188888889, -75.6955555556),
-    "KMQJ": (39.8436111111, -85.8969444444),
-    "KMQS": (39.9788888889, -75.8655555556),
-    "KMQT": (46.5338888889, -87.5616666667),
-    "KMQY": (36.0088888889, -86.52),
-    "KMRB": (39.4019444444, -77.9847222222),
-    "KMRF": (30.3711111111, -104.0175),
-    "KMRH": (34.7336111111, -76.6605555556),
-    "KMRN": (35.8202777778, -81.6113888889),
-    "KMRY": (36.5869444444, -121.843055556),
-    "KMSL": (34.7452777778, -87.6102777778),
-    "KMSN": (43.1397222222, -89.3375),
-    "KMSO": (46.9163888889, -114.090555556),
-    "KMSP": (44.8802777778, -93.2166666667),
-    "KMSS": (44.9358333333, -74.8452777778),
-    "KMSV": (41.7016666667, -74.795),
-    "KMSY": (29.9933333333, -90.2577777778),
-    "KMTC": (42.6127777778, -82.8316666667),
-    "KMTH": (24.7261111111, -81.0513888889),
-    "KMTJ": (38.5097944444, -107.894241667),
-    "KMTN": (39.3255555556, -76.4138888889),
-    "KMTP": (41.0766666667, -71.9205555556),
-    "KMTV": (36.6308333333, -80.0183333333),
-    "KMTW": (44.1288888889, -87.6805555556),
-    "KMUI": (40.4347222222, -76.5691666667),
-    "KMUO": (43.0433333333, -115.872222222),
-    "KMUT": (41.3677777778, -91.1483333333),
-    "KMVC": (31.4580555556, -87.3511111111),
-    "KMVL": (44.5347222222, -72.6138888889),
-    "KMVM": (44.7030555556, -67.4786111111),
-    "KMVY": (41.3930555556, -70.6144444444),
-    "KMWH": (47.2075, -119.32),
-    "KMWK": (36.4597222222, -80.5530555556),
-    "KMWL": (32.7813888889, -98.06),
-    "KMXA": (35.8944444444, -90.1544444444),
-    "KMXF": (32.3791666667, -86.3625),
-    "KMXO": (42.2202777778, -91.1633333333),
-    "KMYF": (32.8158333333, -117.139444444),
-    "KMYL": (44.8886111111, -116.101666667),
-    "KMYR": (33.6797222222, -78.9283333333),
-    "KMYV": (39.0977777778, -121.569722222),
-    "KMZJ": (32.5097222222, -111.325277778),
-    "KNAB": (31.5986111111, -84.0941666667),
-    "KNBC": (32.4772222222, -80.7230555556),
-    "KNBG": (29.8252777778, -90.035),
-    "KNBJ": (30.3891666667, -87.6352777778),
-    "KNCA": (34.7083333333, -77.4394444444),
-    "KNDY": (38.325, -77.0333333333),
-    "KNEL": (40.0333333333, -74.3533333333),
-    "KNEW": (30.0425, -90.0283333333),
-    "KNFD": (30.5077777778, -87.6455555556),
-    "KNFE": (36.6919444444, -76.1344444444),
-    "KNFG": (33.3011111111, -117.355277778),
-    "KNFJ": (30.5091666667, -86.9577777778),
-    "KNFL": (39.4163888889, -118.700833333),
-    "KNGP": (27.6925, -97.2911111111),
-    "KNGS": (30.6108333333, -86.94),
-    "KNGU": (36.9375, -76.2891666667),
-    "KNGZ": (37.7861111111, -122.318611111),
-    "KNHK": (38.2858333333, -76.4116666667),
-    "KNHZ": (43.8922222222, -69.9386111111),
-    "KNID": (35.6877777778, -117.690555556),
-    "KNIP": (30.2358333333, -81.6805555556),
-    "KNJK": (32.8291666667, -115.671666667),
-    "KNJM": (34.6905555556, -77.0297222222),
-    "KNKT": (34.9025, -76.8808333333),
-    "KNKX": (32.8683333333, -117.1425),
-    "KNLC": (36.3327777778, -119.951944444),
-    "KNMM": (32.5519444444, -88.5555555556),
-    "KNOW": (48.1413888889, -123.413888889),
-    "KNPA": (30.3525, -87.3186111111),
-    "KNQA": (35.3566666667, -89.8702777778),
-    "KNQI": (27.5072222222, -97.8097222222),
-    "KNQX": (24.5758333333, -81.6888888889),
-    "KNRA": (48.1833333333, -122.633333333),
-    "KNRB": (30.3919444444, -81.4236111111),
-    "KNRQ": (30.625, -87.14),
-    "KNRS": (32.5633333333, -117.111666667),
-    "KNSE": (30.7241666667, -87.0219444444),
-    "KNSI": (33.2397222222, -119.458055556),
-    "KNTD": (34.1202777778, -119.120833333),
-    #"KNTK": (33.7061111111, -117.827222222),
-    "KNTU": (36.8205555556, -76.0333333333),
-    "KNUC": (33.0227777778, -118.588611111),
-    "KNUN": (30.4697222222, -87.3380555556),
-    "KNUQ": (37.415, -122.048055556),
-    "KNUW": (48.3516666667, -122.655833333),
-    "KNXP": (34.2961111111, -116.161944444),
-    "KNXX": (40.1997222222, -75.1480555556),
-    "KNYG": (38.5016666667, -77.3052777778),
-    "KNYL": (32.6566666667, -114.606111111),
-    "KNZC": (30.2186111111, -81.8763888889),
-    "KNZJ": (33.6761111111, -117.731111111),
-    "KNZY": (32.6991666667, -117.215277778),
-    "KOAK": (37.7211111111, -122.220555556),
-    "KOAR": (36.6813888889, -121.761666667),
-    "KOBE": (27.2659722222, -80.8511111111),
-    "KOBI": (39.2191666667, -74.7947222222),
-    "KOCF": (29.1725, -82.2241666667),
-    "KOFF": (41.1183333333, -95.9125),
-    "KOFP": (37.7088888889, -77.4363888889),
-    "KOGB": (33.4569444444, -80.8594444444),
-    "KOGD": (41.1955555556, -112.013055556),
-    "KOGS": (44.6819444444, -75.4655555556),
-    "KOIC": (42.5663888889, -75.5241666667),
-    "KOJA": (35.5458333333, -98.6686111111),
-    "KOJC": (38.8475, -94.7375),
-    "KOKB": (33.2180555556, -117.351388889),
-    "KOKC": (35.3930555556, -97.6005555556),
-    "KOKK": (40.5280555556, -86.0588888889),
-    "KOKM": (35.6680555556, -95.9486111111),
-    "KOKV": (39.1438888889, -78.1444444444),
-    "KOLD": (44.9525, -68.6744444444),
-    "KOLE": (42.2411111111, -78.3713888889),
-    "KOLF": (48.0944444444, -105.575),
-    "KOLM": (46.9694444444, -122.9025),
-    "KOLS": (31.4175, -110.847777778),
-    "KOLU": (41.4480555556, -97.3427777778),
-    "KOLV": (34.9788888889, -89.7869444444),
-    "KOMA": (41.3025, -95.8936111111),
-    "KOMH": (38.2472222222, -78.0455555556),
-    "KOMK": (48.4641666667, -119.518055556),
-    "KOMN": (29.3011111111, -81.1138055556),
-    "KONA": (44.0772222222, -91.7083333333),
-    "KONL": (42.4694444444, -98.6872222222),
-    "KONO": (44.0194444444, -117.013055556),
-    "KONP": (44.5802777778, -124.057777778),
-    "KONT": (34.0558333333, -117.601111111),
-    "KONX": (36.3997222222, -76.0155555556),
-    "KOPF": (25.9069444444, -80.2783333333),
-    "KOPL": (30.5583333333, -92.0994444444),
-    "KOQN": (39.99, -75.5819444444),
-    "KOQU": (41.5972222222, -71.4122222222),
-    "KORB": (48.0158333333, -92.8561111111),
-    "KORD": (41.9794444444, -87.9044444444),
-    "KORE": (42.5701263889, -72.2886111111),
-    "KORF": (36.8944444444, -76.2011111111),
-    "KORG": (30.0691666667, -93.8036111111),
-    "KORH": (42.2672222222, -71.8758333333),
-    "KORL": (28.5452777778, -81.3327777778),
-    "KORS": (48.7080555556, -122.910555556),
-    "KOSC": (44.4513888889, -83.3938888889),
-    "KOSH": (43.9844444444, -88.5569444444),
-    "KOSU": (40.0797222222, -83.0730555556),
-    "KOTH": (43.4172222222, -124.262777778),
-    "KOTM": (41.1066666667, -92.4480555556),
-    "KOUN": (35.2455555556, -97.4722222222),
-    "KOVE": (39.4878333333, -121.622),
-    "KOVS": (43.1608333333, -90.6738888889),
-    "KOWB": (37.7388888889, -87.1669444444),
-    "KOWD": (42.1905555556, -71.1730555556),
-    "KOWI": (38.5391666667, -95.2519444444),
-    "KOWK": (44.7155, -69.8664722222),
-    "KOXB": (38.3105555556, -75.1238888889),
-    "KOXC": (41.4786111111, -73.1352777778),
-    "KOXD": (39.5022222222, -84.7844444444),
-    "KOXR": (34.2008333333, -119.207222222),
-    "KOYM": (41.4125, -78.5025),
-    "KOZR": (31.2758333333, -85.7133333333),
-    "KPAE": (47.9061111111, -122.281388889),
-    "KPAM": (30.0697222222, -85.5763888889),
-    "KPAN": (34.2569444444, -111.339166667),
-    "KPAO": (37.4611111111, -122.115),
-    "KPBF": (34.1747222222, -91.9344444444),
-    "KPBG": (44.6508333333, -73.4680555556),
-    "KPBI": (26.6830555556, -80.0955555556),
-    "KPBX": (37.5616666667, -82.5663888889),
-    "KPCM": (28.0002777778, -82.1641666667),
-    "KPCZ": (44.3333333333, -89.0197222222),
-    "KPDC": (43.0191666667, -91.1236111111),
-    "KPDK": (33.8755555556, -84.3019444444),
-    "KPDT": (45.695, -118.841388889),
-    "KPDX": (45.5886111111, -122.5975),
-    "KPEO": (42.6372222222, -77.0527777778),
-    "KPEQ": (31.3825, -103.510833333),
-    "KPFC": (45.1997222222, -123.962222222),
-    "KPFN": (30.2122222222, -85.6827777778),
-    "KPGA": (36.9261111111, -111.448333333),
-    "KPGD": (26.9188888889, -81.9908333333),
-    "KPGR": (36.0638888889, -90.5091666667),
-    "KPGV": (35.6352777778, -77.3852777778),
-    "KPHF": (37.1316666667, -76.4927777778),
-    "KPHH": (33.4516666667, -79.5261111111),
-    "KPHK": (26.785, -80.6933333333),
-    "KPHL": (39.8719444444, -75.2411111111),
-    "KPHN": (42.9108333333, -82.5286111111),
-    "KPHT": (36.3383333333, -88.3827777778),
-    "KPHX": (33.4341666667, -112.008055556),
-    "KPIA": (40.6641666667, -89.6933333333),
-    "KPIB": (31.4672222222, -89.3369444444),
-    "KPIE": (27.9105555556, -82.6872222222),
-    "KPIH": (42.9098055556, -112.595916667),
-    "KPIR": (44.3827777778, -100.286111111),
-    "KPIT": (40.4913888889, -80.2327777778),
-    "KPKB": (39.345, -81.4394444444),
-    "KPKV": (28.6541666667, -96.6813888889),
-    "KPLB": (44.6875, -73.5244444444),
-    "KPLK": (36.6258333333, -93.2288888889),
-    "KPLR": (33.5588888889, -86.2491666667),
-    "KPMB": (48.9425, -97.2408333333),
-    "KPMD": (34.6291666667, -118.084444444),
-    "KPMZ": (35.8108333333, -76.7583333333),
-    "KPNA": (42.7955555556, -109.807222222),
-    "KPNC": (36.7305555556, -97.0997222222),
-    "KPNE": (40.0819444444, -75.0105555556),
-    "KPNM": (45.5597222222, -93.6080555556),
-    "KPNN": (45.2005555556, -67.5644444444),
-    "KPNS": (30.4730555556, -87.1872222222),
-    "KPOB": (35.1708333333, -79.0144444444),
-    "KPOC": (34.0916472222, -117.781777778),
-    "KPOE": (31.0447222222, -93.1913888889),
-    "KPOU": (41.6266666667, -73.8841666667),
-    "KPPF": (37.3308333333, -95.5061111111),
-    "KPQI": (46.6888888889, -68.0447222222),
-    "KPQL": (30.4627777778, -88.5291666667),
-    "KPRB": (35.6727777778, -120.626944444),
-    "KPRC": (34.6544444444, -112.419444444),
-    "KPRN": (31.8455555556, -86.6105555556),
-    "KPRX": (33.6366666667, -95.4508333333),
-    "KPSB": (40.8833333333, -78.0872222222),
-    "KPSC": (46.2646777778, -119.119027778),
-    "KPSF": (42.4269444444, -73.2927777778),
-    "KPSK": (37.1372222222, -80.6786111111),
-    "KPSM": (43.0780555556, -70.8233333333),
-    "KPSO": (37.2880555556, -107.055),
-    "KPSP": (33.8294444444, -116.506666667),
-    "KPSX": (28.7275, -96.2508333333),
-    "KPTD": (44.6766666667, -74.9483333333),
-    "KPTN": (29.7094444444, -91.3388888889),
-    "KPTS": (37.4494444444, -94.7311111111),
-    "KPTT": (37.7025, -98.7469444444),
-    "KPTV": (36.0297222222, -119.062777778),
-    "KPTW": (40.2394444444, -75.5566666667),
-    "KPUB": (38.2888888889, -104.496388889),
-    "KPUJ": (33.9119444444, -84.9405555556),
-    "KPUW": (46.7438888889, -117.109444444),
-    "KPVB": (42.6894444444, -90.4444444444),
-    "KPVC": (42.0719444444, -70.2213888889),
-    "KPVD": (41.7238888889, -71.4280555556),
-    "KPVE": (35.6563888889, -88.1952777778),
-    "KPVF": (38.7241666667, -120.753333333),
-    "KPVG": (36.7802777778, -76.4488888889),
-    "KPVJ": (34.7094444444, -97.2233333333),
-    "KPVU": (40.2191944444, -111.723361111),
-    "KPVW": (34.1688888889, -101.715833333),
-    "KPWA": (35.5341666667, -97.6469444444),
-    "KPWD": (48.7888888889, -104.523055556),
-    "KPWK": (42.1141666667, -87.9016666667),
-    "KPWM": (43.6461111111, -70.3086111111),
-    "KPWT": (47.4902777778, -122.764722222),
-    "KPXE": (32.5105555556, -83.7672222222),
-    "KPYM": (41.9088888889, -70.7288888889),
-    "KPYP": (34.09, -85.61),
-    "KQA7": (32.6266666667, 65.8733333333),
-    "KQAE": (32.7786111111, 44.29),
-    "KQAJ": (33.8, 42.4333333333),
-    "KQAQ": (33.5294444444, 44.2775),
-    "KQCT": (33.4197222222, 43.3125),
-    "KQCU": (35.27, -94.2019444444),
-    "KQD9": (33.2166666667, 69.5666666667),
-    "KQDM": (36.8030555556, 66.9708333333),
-    "KQEZ": (33.3394444444, 43.59),
-    "KQGV": (29.3466666667, 47.5205555556),
-    "KQGX": (24.2483333333, 54.5477777778),
-    "KQIR": (25.1172222222, 51.3147222222),
-    "KQIU": (32.5277777778, 69.2652777778),
-    "KQL5": (34.4341666667, 70.4477777778),
-    "KQMA": (33.3152638889, 43.8831694444),
-    "KQMH": (33.0380555556, 40.2844444444),
-    "KQNC": (35.5322222222, 24.1452777778),
-    "KQNN": (40.8333333333, 14.25),
-    "KQNS": (37.4016666667, 14.9222222222),
-    "KQNT": (63.985, -22.6055555556),
-    "KQNY": (33.4197222222, 43.3125),
-    "KQOS": (33.7522222222, -106.371944444),
-    "KQPD": (34.1397222222, 42.3780555556),
-    "KQRY": (33.55, 68.4166666667),
-    "KQSA": (34.9462222222, 69.2646388889),
-    "KQSE": (36.3333333333, 43.1333333333),
-    "KQSL": (34.6775, 43.5505555556),
-    "KQSM": (40.7052777778, 141.371944444),
-    "KQSR": (33.13, 68.78),
-    "KQTA": (35.4547222222, 139.45),
-    "KQTI": (36.3791666667, 42.4497222222),
-    "KQTO": (33.9333333333, 44.3666666667),
-    "KQTU": (36.3661111111, 43.1161111111),
-    "KQTX": (35.4694444444, 44.3488888889),
-    "KQTZ": (33.2625, 44.2344444444),
-    "KQVO": (34.3669444444, 41.1388888889),
-    "KQWM": (29.6963888889, 47.4247222222),
-    "KQXJ": (30.9357583333, 46.0901111111),
-    "KQXN": (32.0, 44.3333333333),
-    "KQYB": (45.0841666667, 27.2727777778),
-    "KRAC": (42.7605555556, -87.8152777778),
-    "KRAL": (33.9516666667, -117.445),
-    "KRAP": (44.0452777778, -103.057222222),
-    "KRAW": (38.3469444444, -93.3455555556),
-    "KRBD": (32.6808333333, -96.8683333333),
-    "KRBE": (42.5711111111, -99.5694444444),
-    "KRBG": (43.2388888889, -123.355833333),
-    "KRBL": (40.1508333333, -122.252222222),
-    "KRBM": (34.85, -92.3),
-    "KRBW": (32.9211111111, -80.6405555556),
-    "KRCA": (44.145, -103.103333333),
-    "KRCE": (35.4880555556, -97.8236111111),
-    "KRCM": (38.7841666667, -93.8027777778),
-    "KRCT": (43.9, -85.5166666667),
-    "KRDD": (40.5088888889, -122.293333333),
-    "KRDG": (40.3786111111, -75.9652777778),
-    "KRDM": (44.2541666667, -121.149722222),
-    "KRDR": (47.9608333333, -97.4011111111),
-    "KRDU": (35.8775, -78.7872222222),
-    "KRED": (45.1861111111, -109.257777778),
-    "KREI": (34.0852777778, -117.146388889),
-    "KREO": (42.5777777778, -117.885555556),
-    "KRGK": (44.5894444444, -92.485),
-    "KRHP": (35.1952777778, -83.8630555556),
-    "KRHV": (37.3327777778, -121.819722222),
-    "KRIC": (37.505, -77.3194444444),
-    "KRID": (39.7561111111, -84.8427777778),
-    "KRIL": (39.5263888889, -107.726944444),
-    "KRIR": (33.9888888889, -117.41),
-    "KRIU": (38.4886111111, -121.102222222),
-    "KRIV": (33.8805555556, -117.259444444),
-    "KRIW": (43.0641666667, -108.459722222),
-    "KRKD": (44.06, -69.0991666667),
-    "KRKR": (35.0216666667, -94.6211111111),
-    "KRKS": (41.5941666667, -109.065277778),
-    "KRLD": (46.3055555556, -119.304166667),
-    "KRME": (43.2336111111, -75.4069444444),
-    "KRMN": (38.3980555556, -77.4555555556),
-    "KRND": (29.5294444444, -98.2788888889),
-    "KRNM": (33.0391666667, -116.915277778),
-    "KRNO": (39.4983333333, -119.768055556),
-    "KRNT": (47.4930555556, -122.215833333),
-    "KRNV": (33.7611111111, -90.7577777778),
-    "KROA": (37.3255555556, -79.9755555556),
-    "KROC": (43.1186111111, -77.6722222222),
-    "KROG": (36.3725, -94.1069444444),
-    "KROW": (33.3013888889, -104.530555556),
-    "KRPB": (39.8177777778, -97.6597222222),
-    "KRPD": (45.42, -91.7733333333),
-    "KRPX": (46.475, -108.543333333),
-    "KRQE": (35.6519444444, -109.0675),
-    "KRRT": (48.9413888889, -95.3483333333),
-    "KRST": (43.9083333333, -92.5),
-    "KRSW": (26.5361111111, -81.755),
-    "KRTN": (36.7416666667, -104.502222222),
-    "KRTS": (39.6672222222, -119.876111111),
-    "KRUE": (35.2591666667, -93.0933333333),
-    "KRUG": (48.3902777778, -100.024166667),
-    "KRUQ": (35.6458333333, -80.5202777778),
-    "KRUT": (43.53, -72.9497222222),
-    "KRVL": (40.6775, -77.6269444444),
-    "KRVS": (36.0397222222, -95.9847222222),
-    "KRWI": (35.8563888889, -77.8919444444),
-    "KRWL": (41.8055555556, -107.2),
-    "KRWV": (30.5155555556, -96.7041666667),
-    "KRXE": (43.8338888889, -111.805),
-    "KRYN": (32.1422222222, -111.174444444),
-    "KRYV": (43.1697222222, -88.7233333333),
-    "KRYY": (34.0130555556, -84.5986111111),
-    "KRZL": (40.9477777778, -87.1825),
-    "KRZN": (45.8227777778, -92.3725),
-    "KRZZ": (36.4394444444, -77.7094444444),
-    "KSAA": (41.4447222222, -106.823611111),
-    "KSAC": (38.5125, -121.493333333),
-    "KSAD": (32.8533333333, -109.635),
-    "KSAF": (35.6166666667, -106.088055556),
-    "KSAN": (32.7333333333, -117.189444444),
-    "KSAS": (33.2411111111, -115.9525),
-    "KSAT": (29.5336111111, -98.4697222222),
-    "KSAV": (32.1275, -81.2019444444),
-    "KSAW": (46.3536111111, -87.3958333333),
-    "KSBA": (34.4261111111, -119.840277778),
-    "KSBD": (34.0952777778, -117.235),
-    "KSBM": (43.7697222222, -87.8516666667),
-    "KSBN": (41.7083333333, -86.3172222222),
-    "KSBO": (32.6083333333, -82.3686111111),
-    "KSBP": (35.2369444444, -120.641944444),
-    "KSBS": (40.5161111111, -106.866388889),
-    "KSBX": (48.5405555556, -111.871111111),
-    "KSBY": (38.3402777778, -75.5102777778),
-    "KSCB": (41.6102777778, -96.63),
-    "KSCD": (33.1719444444, -86.3055555556),
-    "KSCH": (42.8525, -73.9288888889),
-    "KSCK": (37.8941666667, -121.238611111),
-    "KSDC": (43.2347222222, -77.1194444444),
-    "KSDF": (38.1741666667, -85.7363888889),
-    "KSDL": (33.6227777778, -111.910555556),
-    "KSDM": (32.5722222222, -116.980277778),
-    "KSDY": (47.7069444444, -104.1925),
-    "KSEA": (47.4488888889, -122.309166667),
-    "KSEE": (32.8261111111, -116.9725),
-    "KSEF": (27.4563888889, -81.3425),
-    "KSEG": (40.8211111111, -76.8641666667),
-    "KSEM": (32.3438888889, -86.9877777778),
-    "KSEZ": (34.85, -111.79),
-    "KSFB": (28.7777777778, -81.2375),
-    "KSFF": (47.6827777778, -117.3225),
-    "KSFM": (43.3938888889, -70.7080555556),
-    "KSFO": (37.6188888889, -122.374722222),
-    "KSFQ": (36.6819444444, -76.6011111111),
-    "KSFZ": (41.9205555556, -71.4911111111),
-    "KSGF": (37.2455555556, -93.3886111111),
-    "KSGJ": (29.9591666667, -81.3397222222),
-    "KSGT": (34.5994444444, -91.575),
-    "KSGU": (37.0905555556, -113.593055556),
-    "KSHD": (38.2638888889, -78.8963888889),
-    "KSHR": (44.7691666667, -106.980277778),
-    "KSHV": (32.4463888889, -93.8255555556),
-    "KSIK": (36.8988888889, -89.5616666667),
-    "KSIY": (41.7814416667, -122.468108333),
-    "KSJC": (37.3616666667, -121.928888889),
-    "KSJN": (34.5186111111, -109.378888889),
-    "KSJT": (31.3575, -100.496111111),
-    "KSKA": (47.615, -117.655555556),
-    "KSKF": (29.3841666667, -98.5808333333),
-    "KSKX": (36.4580555556, -105.6725),
-    "KSKY": (41.4333333333, -82.6522222222),
-    "KSLB": (42.5972222222, -95.2406666667),
-    "KSLC": (40.7883333333, -111.9775),
-    "KSLE": (44.9094444444, -123.0025),
-    "KSLG": (36.1919444444, -94.49),
-    "KSLI": (33.79, -118.051388889),
-    "KSLK": (44.3852777778, -74.2061111111),
-    "KSLN": (38.7905555556, -97.6522222222),
-    "KSLR": (33.1597222222, -95.6211111111),
-    "KSMD": (41.1433333333, -85.1527777778),
-    "KSME": (37.0536111111, -84.6155555556),
-    "KSMF": (38.6952777778, -121.590555556),
-    "KSMN": (45.1238888889, -113.881388889),
-    "KSMO": (34.0158333333, -118.451388889),
-    "KSMQ": (40.6261111111, -74.6702777778),
-    "KSMS": (33.995, -80.3613888889),
-    "KSMX": (34.8988888889, -120.4575),
-    "KSNA": (33.6755555556, -117.868055556),
-    "KSNC": (41.3838888889, -72.5058333333),
-    "KSNL": (35.3572222222, -96.9427777778),
-    "KSNS": (36.6627777778, -121.606388889),
-    "KSNT": (45.1005555556, -63.9205555556),
-    "KSNY": (41.0997222222, -102.985),
-    "KSOP": (35.2372222222, -79.3911111111),
-    "KSOW": (34.2655555556, -110.005555556),
-    "KSPA": (34.9158333333, -81.9563888889),
-    "KSPB": (45.7725, -122.862222222),
-    "KSPD": (37.4586111111, -102.618055556),
-    "KSPF": (44.4802777778, -103.783055556),
-    "KSPG": (27.765, -82.6269444444),
-    "KSPS": (33.9886111111, -98.4916666667),
-    "KSPW": (43.1655555556, -95.2027777778),
-    "KSPX": (29.5083333333, -95.0513888889),
-    "KSQL": (37.5119444444, -122.249444444),
-    "KSRC": (35.2105555556, -91.7375),
-    "KSRQ": (27.3955555556, -82.5544444444),
-    "KSRR": (33.4627777778, -105.534722222),
-    "KSSC": (33.9727777778, -80.4727777778),
-    "KSSF": (29.3369444444, -98.4711111111),
-    "KSSQ": (45.7313888889, -91.9205555556),
-    "KSTC": (45.5466666667, -94.06),
-    "KSTF": (33.4330555556, -88.8486111111),
-    "KSTL": (38.7475, -90.3597222222),
-    "KSTP": (44.9344444444, -93.06),
-    "KSTS": (38.5088888889, -122.812777778),
-    "KSUA": (27.1816944444, -80.2210833333),
-    "KSUN": (43.5038888889, -114.295555556),
-    "KSUS": (38.6622222222, -90.6519444444),
-    "KSUT": (33.9308333333, -78.0733333333),
-    "KSUU": (38.2625, -121.927222222),
-    "KSUW": (46.6897222222, -92.0947222222),
-    "KSUX": (42.4025, -96.3841666667),
-    "KSUZ": (34.5902777778, -92.4794444444),
-    "KSVC": (32.6366666667, -108.156388889),
-    "KSVE": (40.3755555556, -120.572777778),
-    "KSVN": (32.01, -81.1455555556),
-    "KSWF": (41.5038888889, -74.1047222222),
-    "KSWI": (33.6241666667, -96.5861111111),
-    "KSWO": (36.1611111111, -97.0855555556),
-    "KSWW": (32.4672222222, -100.466388889),
-    "KSXT": (42.4388888889, -123.328333333),
-    "KSXU": (34.9355555556, -104.6425),
-    "KSYF": (39.7611111111, -101.795833333),
-    "KSYI": (35.5594444444, -86.4425),
-    "KSYL": (35.815, -120.743888889),
-    "KSYN": (44.4755555556, -93.0163888889),
-    "KSYR": (43.1111111111, -76.1061111111),
-    "KSZL": (38.7302777778, -93.5477777778),
-    "KSZP": (34.3469444444, -119.061666667),
-    "KSZT": (48.2994444444, -116.56),
-    "KTAD": (37.2593777778, -104.340675),
-    "KTAN": (41.8741666667, -71.0163888889),
-    "KTBN": (37.7413888889, -92.1405555556),
-    "KTCC": (35.1827777778, -103.603055556),
-    "KTCL": (33.2205555556, -87.6113888889),
-    "KTCM": (47.1375, -122.476388889),
-    "KTCS": (33.2369444444, -107.271666667),
-    "KTCY": (37.6888888889, -121.441666667),
-    "KTDF": (36.2847222222, -78.9847222222),
-    "KTEB": (40.8497222222, -74.0608333333),
-    "KTEL": (38.0177777778, -86.6908333333),
-    "KTEX": (37.9538888889, -107.908611111),
-    "KTHM": (47.5736111111, -115.280555556),
-    "KTHV": (39.9169444444, -76.8730555556),
-    "KTIK": (35.4147222222, -97.3863888889),
-    "KTIW": (47.2680555556, -122.578055556),
-    "KTIX": (28.5148, -80.7992277778),
-    "KTKI": (33.1780555556, -96.5905555556),
-    "KTKO": (39.8047222222, -98.2205555556),
-    "KTLH": (30.3963888889, -84.3502777778),
-    "KTLR": (36.1566666667, -119.326666667),
-    "KTMB": (25.6477777778, -80.4327777778),
-    "KTME": (29.805, -95.8977777778),
-    "KTMK": (45.4183333333, -123.814444444),
-    "KTNP": (34.1316666667, -115.945833333),
-    "KTNT": (25.8616666667, -80.8969444444),
-    "KTNU": (41.6744444444, -93.0216666667),
-    "KTNX": (37.7944444444, -116.778611111),
-    "KTOA": (33.8033333333, -118.339722222),
-    "KTOI": (31.8605555556, -86.0122222222),
-    "KTOL": (41.5868055556, -83.8078333333),
-    "KTPA": (27.9752777778, -82.5330555556),
-    "KTPF": (27.9155555556, -82.4491666667),
-    "KTPH": (38.0602777778, -117.086666667),
-    "KTPL": (31.1519444444, -97.4077777778),
-    "KTQH": (35.9302777778, -95.0044444444),
-    "KTRI": (36.4752777778, -82.4075),
-    "KTRK": (39.32, -120.139444444),
-    "KTRM": (33.6266666667, -116.159722222),
-    "KTRX": (40.0836111111, -93.5905555556),
-    "KTSP": (35.135, -118.439166667),
-    "KTTA": (35.5825, -79.1013888889),
-    "KTTD": (45.5494444444, -122.401111111),
-    "KTTF": (41.9330555556, -83.4361111111),
-    "KTTN": (40.2766666667, -74.8133333333),
-    "KTUL": (36.1983333333, -95.8880555556),
-    "KTUP": (34.2680555556, -88.77),
-    "KTUS": (32.1161111111, -110.941388889),
-    "KTVC": (44.7416666667, -85.5822222222),
-    "KTVL": (38.8938888889, -119.995277778),
-    "KTVY": (40.6125555556, -112.350777778),
-    "KTWF": (42.4818027778, -114.487733333),
-    "KTWT": (37.5416666667, -87.9544444444),
-    "KTXK": (33.4536111111, -93.9908333333),
-    "KTYL": (34.4527777778, -110.114722222),
-    "KTYQ": (40.0305555556, -86.2513888889),
-    "KTYR": (32.3538888889, -95.4022222222),
-    "KTYS": (35.8122222222, -83.9927777778),
-    "KTZR": (39.9011111111, -83.1369444444),
-    "KUAO": (45.2472222222, -122.77),
-    "KUBE": (45.5058333333, -91.9811111111),
-    "KUBS": (33.4652777778, -88.3802777778),
-    "KUCA": (43.145, -75.3838888889),
-    "KUCP": (41.0252777778, -80.4133333333),
-    "KUDD": (33.7483333333, -116.274722222),
-    "KUDG": (34.4494444444, -79.89),
-    "KUES": (43.0411111111, -88.2369444444),
-    "KUGN": (42.4219444444, -87.8677777778),
-    "KUIL": (47.9366666667, -124.5625),
-    "KUIN": (39.9427777778, -91.1947222222),
-    "KUKF": (36.2227777778, -81.0983333333),
-    "KUKI": (39.1258333333, -123.200833333),
-    "KUKL": (38.3025, -95.725),
-    "KUKT": (40.4363888889, -75.3802777778),
-    "KUMP": (39.9352777778, -86.045),
-    "KUNI": (39.2119444444, -82.2291666667),
-    "KUNU": (43.4263888889, -88.7038888889),
-    "KUNV": (40.8491666667, -77.8486111111),
-    "KUOS": (35.2052777778, -85.8980555556),
-    "KUOX": (34.3844444444, -89.5366666667),
-    "KUTS": (30.7469444444, -95.5872222222),
-    "KUUU": (41.5325, -71.2816666667),
-    "KUVA": (29.2113888889, -99.7436111111),
-    "KUZA": (34.9877777778, -81.0572222222),
-    "KVAD": (30.9677777778, -83.1927777778),
-    "KVAY": (39.9427777778, -74.8458333333),
-    "KVBG": (34.7294444444, -120.576666667),
-    "KVBT": (36.3458333333, -94.2194444444),
-    "KVCB": (38.3777777778, -121.961666667),
-    "KVCT": (28.8525, -96.9186111111),
-    "KVCV": (34.5930555556, -117.379444444),
-    "KVDF": (28.0138888889, -82.3452777778),
-    "KVEL": (40.4408333333, -109.51),
-    "KVER": (38.9466666667, -92.6827777778),
-    "KVES": (40.2044444444, -84.5319444444),
-    "KVGT": (36.2105555556, -115.194444444),
-    "KVIS": (36.3186111111, -119.392777778),
-    "KVJI": (36.6872222222, -82.0330555556),
-    "KVKX": (38.7486111111, -76.9558333333),
-    "KVLD": (30.7813888889, -83.2761111111),
-    "KVLL": (42.5430555556, -83.1777777778),
-    "KVNC": (27.0716666667, -82.4402777778),
-    "KVNY": (34.2097222222, -118.49),
-    "KVPS": (30.4830555556, -86.5252777778),
-    "KVPZ": (41.4538888889, -87.0072222222),
-    "KVQQ": (30.2186111111, -81.8766666667),
-    "KVRB": (27.6555555556, -80.4177777778),
-    "KVSF": (43.3436111111, -72.5172222222),
-    "KVTA": (40.0247222222, -82.4619444444),
-    "KVTN": (42.8566666667, -100.548888889),
-    "KVUJ": (35.4166666667, -80.1508333333),
-    "KVUO": (45.6205555556, -122.656388889),
-    "KVVS": (39.9591666667, -79.6572222222),
-    "KVYS": (41.3519444444, -89.1530555556),
-    "KWAL": (37.94, -75.4663888889),
-    "KWAY": (39.9011111111, -80.1305555556),
-    "KWBW": (41.2972222222, -75.8522222222),
-    "KWDG": (36.3783333333, -97.7888888889),
-    "KWHP": (34.259325, -118.413430556),
-    "KWJF": (34.7411111111, -118.218611111),
-    "KWLD": (37.1686111111, -97.0375),
-    "KWLW": (39.5158333333, -122.217222222),
-    "KWMC": (40.8966666667, -117.805833333),
-    "KWRB": (32.64, -83.5916666667),
-    "KWRI": (40.0155555556, -74.5936111111),
-    "KWRL": (43.9627777778, -107.950555556),
-    "KWSD": (32.3413888889, -106.4025),
-    "KWST": (41.3497222222, -71.8033333333),
-    "KWVI": (36.9358333333, -121.789722222),
-    "KWVL": (44.5333333333, -69.6755555556),
-    "KWWD": (39.0083333333, -74.9080555556),
-    "KWWR": (36.4380555556, -99.5227777778),
-    "KWYS": (44.6883333333, -111.117777778),
-    "KXBP": (33.1752777778, -97.8283333333),
-    "KXFL": (29.4675, -81.2063888889),
-    "KXMR": (28.4677777778, -80.5669444444),
-    "KXNA": (36.2816666667, -94.3077777778),
-    "KXNO": (33.6169444444, -81.0830555556),
-    "KXTA": (37.235, -115.811111111),
-    "KXVG": (46.9902777778, -94.2038888889),
-    "KYIP": (42.2377777778, -83.5302777778),
-    "KYKM": (46.5680555556, -120.544166667),
-    "KYKN": (42.9166666667, -97.3858333333),
-    "KYNG": (41.2605555556, -80.6788888889),
-    "KYUM": (32.6563888889, -114.605833333),
-    "KZEF": (36.28, -80.7861111111),
-    "KZER": (40.7063888889, -76.3730555556),
-    "KZPH": (28.2280555556, -82.1558333333),
-    "KZUN": (35.0833333333, -108.791666667),
-    "KZZV": (39.9444444444, -81.8922222222),
-    "LAFK": (41.3110555556, 19.8799722222),
-    "LAGJ": (41.8951666667, 19.5985277778),
-    "LAKO": (40.6488333333, 20.7406666667),
-    "LAKU": (42.0328333333, 20.4149444444),
-    "LAKV": (40.7719444444, 19.9018888889),
-    "LASK": (40.0872222222, 20.1530555556),
-    "LASR": (39.8786111111, 20.0358333333),
-    "LATI": (41.4147222222, 19.7205555556),
-    "LAVL": (40.4765555556, 19.4739722222),
-    "LBBG": (42.5688888889, 27.5138888889),
-    "LBBR": (42.5268055556, 27.2726666667),
-    "LBDB": (42.2833333333, 23.7666666667),
-    "LBED": (43.4836111111, 23.2894444444),
-    "LBGO": (43.1513888889, 25.7127777778),
-    "LBHS": (41.9761111111, 25.5897222222),
-    "LBIA": (42.4547222222, 26.3522222222),
-    "LBLS": (42.6333333333, 23.6333333333),
-    "LBMG": (43.5441666667, 23.2725),
-    "LBMM": (43.4166666667, 23.2333333333),
-    "LBPD": (42.0677777778, 24.8508333333),
-    "LBPG": (42.2902777778, 24.7138888889),
-    "LBPK": (42.6, 23.0333333333),
-    "LBPL": (43.4516388889, 24.5037222222),
-    "LBPR": (42.2666666667, 27.7666666667),
-    "LBPS": (42.1333333333, 24.9333333333),
-    "LBRS": (43.695, 26.0569444444),
-    "LBSD": (42.8122222222, 23.2994444444),
-    "LBSF": (42.695, 23.4061111111),
-    "LBSL": (42.6453055556, 26.3587222222),
-    "LBSS": (44.0549722222, 27.1799166667),
-    "LBSZ": (42.3766666667, 25.655),
-    "LBVD": (44.0222222222, 22.8158333333),
-    "LBWB": (43.4244444444, 28.1808333333),
-    "LBWK": (43.2780555556, 27.7238888889),
-    "LBWN": (43.2319444444, 27.825),
-    "LCEN": (35.1597222222, 33.5),
-    "LCLK": (34.875, 33.6247222222),
-    "LCNC": (35.15, 33.2772222222),
-    "LCPH": (34.7177777778, 32.4855555556),
-    "LCRA": (34.5902777778, 32.9877777778),
-    "LDDU": (42.5611111111, 18.2680555556),
-    "LDLO": (44.5658333333, 14.3930555556),
-    "LDOC": (45.5419444444, 18.6361111111),
-    "LDOS": (45.4625, 18.8113888889),
-    "LDPL": (44.8933333333, 13.9219444444),
-    "LDRG": (45.3794444444, 14.5036111111),
-    "LDRI": (45.2166666667, 14.57),
-    "LDSB": (43.2858333333, 16.6797222222),
-    "LDSP": (43.5388888889, 16.2977777778),
-    "LDVA": (46.2947222222, 16.3811111111),
-    "LDZA": (45.7427777778, 16.0686111111),
-    "LDZD": (44.1080555556, 15.3466666667),
-    "LDZU": (44.5575, 15.7741666667),
-    "LEAB": (38.9483333333, -1.86333333333),
-    "LEAL": (38.2819444444, -0.558055555556),
-    "LEAM": (36.8438888889, -2.37),
-    "LEAS": (43.5633333333, -6.03444444444),
-    "LEBA": (37.8419444444, -4.84861111111),
-    "LEBB": (43.3008333333, -2.91055555556),
-    "LEBG": (42.3575, -3.62055555556),
-    "LEBL": (41.2969444444, 2.07833333333),
-    "LEBZ": (38.8911111111, -6.82111111111),
-    "LECD": (42.3883333333, 1.86666666667),
-    "LECN": (39.999, 0.026),
-    "LECO": (43.3019444444, -8.37722222222),
-    "LECU": (40.3705555556, -3.785),
-    "LEDS": (40.2097222222, 0.0697222222222),
-    "LEGA": (37.1330555556, -3.63555555556),
-    "LEGE": (41.9008333333, 2.76027777778),
-    "LEGR": (37.1886111111, -3.77722222222),
-    "LEGT": (40.2938888889, -3.72361111111),
-    "LEHC": (42.0808333333, -0.323333333333),
-    "LEIB": (38.8727777778, 1.37305555556),
-    "LEJR": (36.7444444444, -6.06),
-    "LELC": (37.7747222222, -0.812222222222),
-    "LELL": (41.5166666667, 2.1),
-    "LELN": (42.5888888889, -5.65555555556),
-    "LELO": (42.4602777778, -2.32027777778),
-    "LEMD": (40.4722222222, -3.56083333333),
-    "LEMG": (36.6736111111, -4.49888888889),
-    "LEMH": (39.8625, 4.21861111111),
-    "LEMM": (40.4166666667, -3.5),
-    "LEMO": (37.1747222222, -5.61583333333),
-    "LEOC": (39.9375, -3.50333333333),
-    "LEPA": (39.55, 2.73333333333),
-    "LEPP": (42.77, -1.64611111111),
-    "LERI": (37.9511111111, -1.23027777778),
-    "LERJ": (42.4602777778, -2.32027777778),
-    "LERL": (38.8563888889, -3.97),
-    "LERS": (41.1472222222, 1.16694444444),
-    "LERT": (36.645, -6.34944444444),
-    "LESA": (40.9519444444, -5.50194444444),
-    "LESB": (39.5988888889, 2.70277777778),
-    "LESJ": (39.5516666667, 2.73861111111),
-    "LESL": (39.8622222222, 4.25833333333),
-    "LESO": (43.3563888889, -1.79055555556),
-    "LEST": (42.8961111111, -8.415),
-    "LESU": (42.3386111111, 1.40916666667),
-    "LETL": (40.4119444444, -1.2175),
-    "LETO": (40.4866666667, -3.45805555556),
-    "LEVC": (39.4891666667, -0.481388888889),
-    "LEVD": (41.7061111111, -4.85194444444),
-    "LEVS": (40.3705555556, -3.785),
-    "LEVT": (42.8827777778, -2.72444444444),
-    "LEVX": (42.2316666667, -8.62666666667),
-    "LEXJ": (43.4269444444, -3.82),
-    "LEZG": (41.6661111111, -1.04138888889),
-    "LEZL": (37.4177777778, -5.89305555556),
-    "LFAC": (50.9619444444, 1.95472222222),
-    "LFAG": (49.8688888889, 3.02777777778),
-    "LFAI": (48.5936111111, 3.005),
-    "LFAK": (51.0422222222, 2.55305555556),
-    "LFAO": (48.5458333333, -0.387222222222),
-    "LFAQ": (49.9713888889, 2.69972222222),
-    "LFAT": (50.5147222222, 1.62722222222),
-    "LFAV": (50.3255555556, 3.46111111111),
-    "LFAY": (49.8713888889, 2.38638888889),
-    "LFBA": (44.1747222222, 0.590555555556),
-    "LFBC": (44.5333333333, -1.125),
-    "LFBD": (44.8283333333, -0.715555555556),
-    "LFBE": (44.8252777778, 0.518611111111),
-    "LFBF": (43.5455555556, 1.3675),
-    "LFBG": (45.6583333333, -0.3175),
-    "LFBH": (46.1791666667, -1.19527777778),
-    "LFBI": (46.5875, 0.306666666667),
-    "LFBK": (46.2244444444, 2.36305555556),
-    "LFBL": (45.8627777778, 1.17944444444),
-    "LFBM": (43.9116666667, -0.5075),
-    "LFBN": (46.3111111111, -0.401388888889),
-    "LFBO": (43.6288888889, 1.36361111111),
-    "LFBP": (43.38, -0.418611111111),
-    "LFBR": (43.4488888889, 1.26333333333),
-    "LFBS": (44.3680555556, -1.13222222222),
-    "LFBT": (43.1786111111, -0.00638888888889),
-    "LFBU": (45.7291666667, 0.221388888889),
-    "LFBV": (45.1508333333, 1.46916666667),
-    "LFBX": (45.1980555556, 0.815555555556),
-    "LFBZ": (43.4683333333, -1.52305555556),
-    "LFCC": (44.3511111111, 1.47527777778),
-    "LFCG": (43.0075, 1.10305555556),
-    "LFCH": (44.5963888889, -1.11083333333),
-    "LFCI": (43.9136111111, 2.11305555556),
-    "LFCK": (43.5561111111, 2.28916666667),
-    "LFCL": (43.5861111111, 1.49916666667),
-    "LFCM": (43.99, 3.18305555556),
-    "LFCR": (44.4077777778, 2.4825),
-    "LFCU": (45.5347222222, 2.42388888889),
-    "LFCW": (44.3969444444, 0.758888888889),
-    "LFCY": (45.6280555556, -0.9725),
-    "LFCZ": (44.1461111111, -1.17444444444),
-    "LFDA": (43.7094444444, -0.245277777778),
-    "LFDB": (44.0255555556, 1.37777777778),
-    "LFDH": (43.6877777778, 0.601666666667),
-    "LFDI": (44.9822222222, -0.134722222222),
-    "LFDJ": (43.0905555556, 1.69583333333),
-    "LFDM": (44.4988888889, 0.200277777778),
-    "LFDN": (45.8877777778, -0.983055555556),
-    "LFEC": (48.4627777778, -5.06388888889),
-    "LFED": (48.0583333333, -2.92166666667),
-    "LFES": (48.0525, -3.66444444444),
-    "LFEY": (46.7186111111, -2.39111111111),
-    "LFFD": (48.8952777778, 1.25138888889),
-    "LFFH": (49.0666666667, 3.35555555556),
-    "LFFI": (47.4080555556, -1.1775),
-    "LFFN": (48.4297222222, 4.48111111111),
-    "LFGA": (48.1097222222, 7.35888888889),
-    "LFGB": (47.7380555556, 7.43222222222),
-    "LFGF": (47.0058333333, 4.89333333333),
-    "LFGG": (47.7011111111, 6.83083333333),
-    "LFGJ": (47.0388888889, 5.42722222222),
-    "LFGK": (47.9922222222, 3.39222222222),
-    "LFGR": (49.1516666667, 5.93166666667),
-    "LFGW": (49.1222222222, 5.46888888889),
-    "LFHM": (45.8236111111, 6.64916666667),
-    "LFHO": (44.5441666667, 4.37194444444),
-    "LFHP": (45.0794444444, 3.76472222222),
-    "LFHQ": (45.0763888889, 2.99361111111),
-    "LFHS": (46.2008333333, 5.29194444444),
-    "LFHU": (45.0877777778, 6.085),
-    "LFHV": (45.9163888889, 4.64055555556),
-    "LFHY": (46.5344444444, 3.42361111111),
-    "LFHZ": (45.95, 6.63888888889),
-    "LFIG": (44.1775, 2.515),
-    "LFIO": (43.5688888889, 1.48083333333),
-    "LFIS": (50.8825, 1.74444444444),
-    "LFJD": (46.0397222222, 5.49666666667),
-    "LFJL": (48.9822222222, 6.25361111111),
-    "LFJR": (47.5602777778, -0.312222222222),
-    "LFKA": (45.6275, 6.32972222222),
-    "LFKB": (42.5538888889, 9.48333333333),
-    "LFKC": (42.5305555556, 8.79305555556),
-    "LFKF": (41.5005555556, 9.09777777778),
-    "LFKG": (42.055, 9.40194444444),
-    "LFKJ": (41.9236111111, 8.80277777778),
-    "LFKO": (41.6630555556, 8.89027777778),
-    "LFKS": (41.9241666667, 9.40583333333),
-    "LFKT": (42.2936111111, 9.19305555556),
-    "LFKX": (45.4075, 6.5775),
-    "LFLA": (47.85, 3.49694444444),
-    "LFLB": (45.6377777778, 5.88),
-    "LFLC": (45.7863888889, 3.16916666667),
-    "LFLD": (47.0580555556, 2.37027777778),
-    "LFLE": (45.5608333333, 5.97555555556),
-    "LFLG": (45.2180555556, 5.84861111111),
-    "LFLH": (46.8258333333, 4.8175),
-    "LFLI": (46.1919444444, 6.26833333333),
-    "LFLJ": (45.3975, 6.63444444444),
-    "LFLL": (45.7261111111, 5.09083333333),
-    "LFLM": (46.295, 4.79555555556),
-    "LFLN": (46.4125, 4.01305555556),
-    "LFLO": (46.0583333333, 4.00138888889),
-    "LFLP": (45.9291666667, 6.09861111111),
-    "LFLS": (45.3627777778, 5.32916666667),
-    "LFLT": (46.3525, 2.57027777778),
-    "LFLU": (44.9213888889, 4.96972222222),
-    "LFLV": (46.1694444444, 3.40361111111),
-    "LFLW": (44.8913888889, 2.42194444444),
-    "LFLX": (46.8619444444, 1.73055555556),
-    "LFLY": (45.7280555556, 4.94472222222),
-    "LFMA": (43.5052777778, 5.36777777778),
-    "LFMC": (43.3844444444, 6.38694444444),
-    "LFMD": (43.5419444444, 6.95333333333),
-    "LFMF": (43.6080555556, 6.70166666667),
-    "LFMH": (45.5402777778, 4.29638888889),
-    "LFMI": (43.5225, 4.92361111111),
-    "LFMK": (43.2158333333, 2.30611111111),
-    "LFML": (43.4355555556, 5.21361111111),
-    "LFMN": (43.6605555556, 7.2175),
-    "LFMO": (44.1402777778, 4.86666666667),
-    "LFMP": (42.7402777778, 2.87055555556),
-    "LFMQ": (43.2525, 5.785),
-    "LFMR": (44.3872222222, 6.60916666667),
-    "LFMS": (44.0694444444, 4.14194444444),
-    "LFMT": (43.5761111111, 3.96277777778),
-    "LFMU": (43.3238888889, 3.35555555556),
-    "LFMV": (43.9072222222, 4.90166666667),
-    "LFMW": (43.3111111111, 1.92),
-    "LFMX": (44.0586111111, 5.99083333333),
-    "LFMY": (43.6063888889, 5.10916666667),
-    "LFMZ": (43.1758333333, 2.73416666667),
-    "LFNB": (44.5019444444, 3.53277777778),
-    "LFNH": (44.0297222222, 5.07805555556),
-    "LFOA": (47.0533333333, 2.6325),
-    "LFOB": (49.4544444444, 2.11277777778),
-    "LFOC": (48.0580555556, 1.37638888889),
-    "LFOD": (47.2566666667, -0.115),
-    "LFOE": (49.0286111111, 1.21972222222),
-    "LFOH": (49.5338888889, 0.0880555555556),
-    "LFOI": (50.1433333333, 1.83166666667),
-    "LFOJ": (47.9877777778, 1.76055555556),
-    "LFOK": (48.7758333333, 4.18444444444),
-    "LFOM": (49.2022222222, -1.50805555556),
-    "LFON": (48.7061111111, 1.36166666667),
-    "LFOP": (49.3841666667, 1.17472222222),
-    "LFOR": (48.4588888889, 1.52388888889),
-    "LFOT": (47.4322222222, 0.7275),
-    "LFOU": (47.0819444444, -0.876944444444),
-    "LFOV": (48.0311111111, -0.742777777778),
-    "LFOZ": (47.8969444444, 2.16333333333),
-    "LFPA": (49.165, 2.31166666667),
-    "LFPB": (48.9694444444, 2.44138888889),
-    "LFPC": (49.2533333333, 2.51888888889),
-    "LFPG": (49.0127777778, 2.55),
-    "LFPK": (48.8375, 3.01611111111),
-    "LFPM": (48.6047222222, 2.67111111111),
-    "LFPN": (48.7516666667, 2.10611111111),
-    "LFPO": (48.7252777778, 2.35944444444),
-    "LFPT": (49.0963888889, 2.04083333333),
-    "LFPV": (48.7741666667, 2.20138888889),
-    "LFPY": (48.5966666667, 2.33138888889),
-    "LFQA": (49.2077777778, 4.15666666667),
-    "LFQB": (48.3227777778, 4.01777777778),
-    "LFQC": (48.5972222222, 6.54472222222),
-    "LFQD": (50.3238888889, 2.80277777778),
-    "LFQE": (49.2266666667, 5.67194444444),
-    "LFQF": (46.9663888889, 4.26027777778),
-    "LFQG": (47.0011111111, 3.11444444444),
-    "LFQI": (50.2216666667, 3.15416666667),
-    "LFQJ": (50.3102777778, 4.03305555556),
-    "LFQM": (47.2083333333, 6.08305555556),
-    "LFQP": (48.7661111111, 7.20027777778),
-    "LFQQ": (50.5616666667, 3.08944444444),
-    "LFQS": (50.3375, 2.99166666667),
-    "LFQT": (50.6183333333, 2.64222222222),
-    "LFQV": (49.7838888889, 4.64694444444),
-    "LFQW": (47.6375, 6.20388888889),
-    "LFRA": (47.4972222222, -0.5725),
-    "LFRB": (48.4477777778, -4.41833333333),
-    "LFRC": (49.65, -1.47027777778),
-    "LFRD": (48.5877777778, -2.08),
-    "LFRE": (47.2894444444, -2.34638888889),
-    "LFRF": (48.8830555556, -1.56416666667),
-    "LFRG": (49.3652777778, 0.154166666667),
-    "LFRH": (47.7605555556, -3.44),
-    "LFRI": (46.7019444444, -1.37861111111),
-    "LFRJ": (48.53, -4.15138888889),
-    "LFRK": (49.1733333333, -0.45),
-    "LFRL": (48.2816666667, -4.445),
-    "LFRM": (47.9486111111, 0.201666666667),
-    "LFRN": (48.0694444444, -1.73472222222),
-    "LFRO": (48.7541666667, -3.47138888889),
-    "LFRQ": (47.9747222222, -4.16777777778),
-    "LFRS": (47.1530555556, -1.61055555556),
-    "LFRT": (48.5377777778, -2.85444444444),
-    "LFRU": (48.6030555556, -3.81555555556),
-    "LFRV": (47.7230555556, -2.71833333333),
-    "LFRZ": (47.3119444444, -2.14916666667),
-    "LFSB": (47.5894444444, 7.52972222222),
-    "LFSC": (47.9219444444, 7.39944444444),
-    "LFSD": (47.2688888889, 5.09),
-    "LFSF": (49.0716666667, 6.13166666667),
-    "LFSG": (48.3247222222, 6.06972222222),
-    "LFSH": (48.7933333333, 7.81611111111),
-    "LFSI": (48.6358333333, 4.89916666667),
-    "LFSL": (48.78, 5.97972222222),
-    "LFSM": (47.4869444444, 6.7925),
-    "LFSN": (48.6919444444, 6.23027777778),
-    "LFSO": (48.5830555556, 5.955),
-    "LFSP": (46.9044444444, 6.32694444444),
-    "LFSR": (49.31, 4.05),
-    "LFST": (48.5380555556, 7.62805555556),
-    "LFSX": (47.7830555556, 6.36388888889),
-    "LFTF": (43.2477777778, 6.12666666667),
-    "LFTH": (43.0972222222, 6.14583333333),
-    "LFTW": (43.7572222222, 4.41611111111),
-    "LFTZ": (43.2063888889, 6.4825),
-    "LFVM": (47.0952777778, -56.3802777778),
-    "LFVP": (46.7625, -56.1752777778),
-    "LFXA": (45.9872222222, 5.32833333333),
-    "LFXI": (44.0566666667, 5.49527777778),
-    "LFYD": (48.0847222222, 5.665),
-    "LFYG": (50.1413888889, 3.26305555556),
-    "LFYH": (47.335, 5.51361111111),
-    "LFYL": (47.7044444444, 6.54583333333),
-    "LFYT": (49.7583333333, 3.21194444444),
-    "LGAD": (37.9205555556, 21.2925),
-    "LGAG": (38.6019444444, 21.3511111111),
-    "LGAL": (40.8558333333, 25.9561111111),
-    "LGAT": (37.8877777778, 23.7316666667),
-    "LGAV": (37.9363888889, 23.9472222222),
-    "LGAX": (40.6511111111, 22.4886111111),
-    "LGBL": (39.2194444444, 22.7941666667),
-    "LGEL": (38.0636111111, 23.5558333333),
-    "LGHI": (38.3430555556, 26.1405555556),
-    "LGHL": (37.2987916667, 23.1489861111),
-    "LGIK": (37.6827166667, 26.3470611111),
-    "LGIO": (39.6963888889, 20.8225),
-    "LGIR": (35.3394444444, 25.1802777778),
-    "LGKA": (40.4494444444, 21.2761111111),
-    "LGKC": (36.2741666667, 23.0169444444),
-    "LGKF": (38.1197222222, 20.5005555556),
-    "LGKJ": (36.1416666667, 29.5763888889),
-    "LGKL": (37.0683333333, 22.0255555556),
-    "LGKM": (40.9722222222, 24.3416666667),
-    "LGKN": (38.1376972222, 23.9515305556),
-    "LGKO": (36.7933333333, 27.0916666667),
-    "LGKP": (35.4213888889, 27.1458333333),
-    "LGKR": (39.6019444444, 19.9116666667),
-    "LGKS": (35.4211111111, 26.91),
-    "LGKV": (40.9130555556, 24.6191666667),
-    "LGKZ": (40.2861111111, 21.8408333333),
-    "LGLE": (37.1847222222, 26.8002777778),
-    "LGLM": (39.9169444444, 25.2361111111),
-    "LGLR": (39.65, 22.4652777778),
-    "LGMG": (37.9811111111, 23.3652777778),
-    "LGMK": (37.435, 25.3480555556),
-    "LGML": (36.6969, 24.4769),
-    "LGMR": (38.145, 24.0141666667),
-    "LGMT": (39.0566666667, 26.5983333333),
-    "LGNX": (37.0810722222, 25.3681583333),
-    "LGPA": (37.0112, 25.128),
-    "LGPL": (36.5798861111, 26.3758222222),
-    "LGPZ": (38.9252777778, 20.7652777778),
-    "LGRD": (36.3830555556, 28.1088888889),
-    "LGRP": (36.4052777778, 28.0861111111),
-    "LGRX": (38.1511111111, 21.4255555556),
-    "LGSA": (35.5316666667, 24.1494444444),
-    "LGSK": (39.1769444444, 23.5036111111),
-    "LGSM": (37.69, 26.9116666667),
-    "LGSO": (37.4227777778, 24.9508333333),
-    "LGSP": (36.9733333333, 22.5261111111),
-    "LGSR": (36.4002777778, 25.4786111111),
-    "LGST": (35.2136111111, 26.0975),
-    "LGSV": (39.48, 22.7672222222),
-    "LGSY": (38.9675, 24.4872222222),
-    "LGTG": (38.3397222222, 23.5647222222),
-    "LGTL": (35.1869444444, 25.3266666667),
-    "LGTP": (37.5308333333, 22.405),
-    "LGTS": (40.5197222222, 22.9708333333),
-    "LGTT": (38.1088888889, 23.7836111111),
-    "LGZA": (37.75, 20.8819444444),
-    "LHBP": (47.4366666667, 19.2555555556),
-    "LHDC": (47.4888888889, 21.6152777778),
-    "LHFM": (47.5827777778, 16.8452777778),
-    "LHGD": (47.5708333333, 19.3386111111),
-    "LHKE": (46.9175, 19.7491666667),
-    "LHKV": (46.3891666667, 17.7313888889),
-    "LHNY": (47.9838888889, 21.6922222222),
-    "LHOY": (46.3038888889, 18.7691666667),
-    "LHPA": (47.3638888889, 17.5008333333),
-    "LHPP": (45.9908333333, 18.2408333333),
-    "LHPR": (47.6244444444, 17.8136111111),
-    "LHSA": (47.0777777778, 17.9683333333),
-    "LHSK": (46.8580555556, 18.0955555556),
-    "LHSM": (46.6863888889, 17.1588888889),
-    "LHSN": (47.1227777778, 20.2352777778),
-    "LHTA": (46.3930555556, 17.9172222222),
-    "LHTL": (47.3452777778, 18.9808333333),
-    "LHUD": (46.2508333333, 20.0891666667),
-    "LIAF": (42.9327777778, 12.71),
-    "LIAP": (42.3797222222, 13.3091666667),
-    "LIAT": (43.65, 10.6166666667),
-    "LIBA": (41.5386111111, 15.7133333333),
-    "LIBC": (38.9972222222, 17.08),
-    "LIBD": (41.1383333333, 16.7605555556),
-    "LIBF": (41.4327777778, 15.535),
-    "LIBG": (40.5161111111, 17.4022222222),
-    "LIBN": (40.2386111111, 18.1330555556),
-    "LIBP": (42.4313888889, 14.1808333333),
-    "LIBR": (40.6575, 17.9469444444),
-    "LIBV": (40.7677777778, 16.9333333333),
-    "LICA": (38.9063888889, 16.2422222222),
-    "LICB": (36.9916666667, 14.6069444444),
-    "LICC": (37.4666666667, 15.0661111111),
-    "LICD": (35.4977777778, 12.6180555556),
-    "LICG": (36.8163888889, 11.9686111111),
-    "LICJ": (38.1758333333, 13.0908333333),
-    "LICP": (38.1108333333, 13.3133333333),
-    "LICR": (38.0711111111, 15.6513888889),
-    "LICT": (37.9125, 12.4880555556),
-    "LICZ": (37.4013888889, 14.9222222222),
-    "LIDB": (46.1666666667, 12.2480555556),
-    "LIDF": (43.8237833333, 13.0255805556),
-    "LIDR": (44.3641666667, 12.225),
-    "LIEA": (40.6319444444, 8.29055555556),
-    "LIED": (39.3541666667, 8.97222222222),
-    "LIEE": (39.2513888889, 9.05416666667),
-    "LIEO": (40.8986111111, 9.5175),
-    "LIER": (39.8952777778, 8.6425),
-    "LIET": (39.9186111111, 9.68277777778),
-    "LIIB": (40.4166666667, 12.3333333333),
-    "LIMA": (45.0861111111, 7.60305555556),
-    "LIMB": (45.5397222222, 9.20222222222),
-    "LIMC": (45.6313888889, 8.72777777778),
-    "LIME": (45.6738888889, 9.70416666667),
-    "LIMF": (45.2005555556, 7.64944444444),
-    "LIMG": (44.0505555556, 8.12722222222),
-    "LIMJ": (44.4119444444, 8.84166666667),
-    "LIML": (45.4452777778, 9.27694444444),
-    "LIMN": (45.5294444444, 8.66916666667),
-    "LIMP": (44.8244444444, 10.2961111111),
-    "LIMS": (44.9130555556, 9.72333333333),
-    "LIMW": (45.7383333333, 7.36777777778),
-    "LIMZ": (44.5463888889, 7.62222222222),
-    "LIPA": (46.0316666667, 12.5963888889),
-    "LIPB": (46.4605555556, 11.3261111111),
-    "LIPC": (44.2236111111, 12.3061111111),
-    "LIPE": (44.5341666667, 11.2902777778),
-    "LIPH": (45.6486111111, 12.1952777778),
-    "LIPI": (45.9805555556, 13.0544444444),
-    "LIPK": (44.1947222222, 12.07),
-    "LIPL": (45.4319444444, 10.2675),
-    "LIPN": (45.4719444444, 10.9277777778),
-    "LIPO": (45.4288888889, 10.3305555556),
-    "LIPQ": (45.8277777778, 13.4663888889),
-    "LIPR": (44.0202777778, 12.6119444444),
-    "LIPS": (45.6844444444, 12.0861111111),
-    "LIPT": (45.5741666667, 11.5305555556),
-    "LIPU": (45.3955555556, 11.8477777778),
-    "LIPV": (45.4288888889, 12.3877777778),
-    "LIPX": (45.3955555556, 10.8883333333),
-    "LIPY": (43.6163416667, 13.3623194444),
-    "LIPZ": (45.505, 12.3516666667),
-    "LIQN": (42.4266666667, 12.85),
-    "LIQS": (43.2572222222, 11.2541666667),
-    "LIRA": (41.7991666667, 12.5947222222),
-    "LIRE": (41.6536111111, 12.4444444444),
-    "LIRF": (41.8127777778, 12.2530555556),
-    "LIRG": (41.9902777778, 12.7408333333),
-    "LIRI": (40.6202777778, 14.9111111111),
-    "LIRJ": (42.7602777778, 10.2394444444),
-    "LIRL": (41.5422222222, 12.9088888889),
-    "LIRM": (41.0608333333, 14.0819444444),
-    "LIRN": (40.8858333333, 14.2905555556),
-    "LIRP": (43.6838888889, 10.3925),
-    "LIRQ": (43.8097222222, 11.205),
-    "LIRS": (42.7608333333, 11.0722222222),
-    "LIRU": (41.9519444444, 12.4988888889),
-    "LIRV": (42.4302777778, 12.0641666667),
-    "LIRZ": (43.0958333333, 12.5130555556),
-    "LJAJ": (45.8887027778, 13.8870722222),
-    "LJBL": (46.3583333333, 14.1780555556),
-    "LJCE": (45.8997222222, 15.53),
-    "LJCL": (46.2436111111, 15.2255555556),
-    "LJLJ": (46.2236111111, 14.4575),
-    "LJMB": (46.4797222222, 15.6861111111),
-    "LJPT": (46.4186111111, 15.9838888889),
-    "LJPZ": (45.4733333333, 13.6147222222),
-    "LJSG": (46.4719444444, 15.1169444444),
-    "LKBR": (50.5666666667, 16.35),
-    "LKCB": (50.0661111111, 12.4113888889),
-    "LKCS": (48.9461111111, 14.4272222222),
-    "LKCT": (49.6844444444, 15.6761111111),
-    "LKCV": (49.9394444444, 15.3816666667),
-    "LKHB": (49.5972222222, 15.5491666667),
-    "LKHK": (50.2530555556, 15.845),
-    "LKJC": (50.43, 15.3330555556),
-    "LKKB": (50.1211111111, 14.5436111111),
-    "LKKU": (49.0294444444, 17.4397222222),
-    "LKKV": (50.2027777778, 12.9147222222),
-    "LKLN": (49.675, 13.2744444444),
-    "LKMH": (50.54, 15.0063888889),
-    "LKMR": (49.9233333333, 12.7266666667),
-    "LKMT": (49.6963888889, 18.1111111111),
-    "LKNA": (49.1658333333, 16.1247222222),
-    "LKPD": (50.0133333333, 15.7386111111),
-    "LKPM": (49.7186111111, 14.0969444444),
-    "LKPO": (49.4258333333, 17.4047222222),
-    "LKPR": (50.1008333333, 14.26),
-    "LKSO": (49.2447222222, 14.7136111111),
-    "LKTB": (49.1511111111, 16.6941666667),
-    "LKVO": (50.2163888889, 14.3955555556),
-    "LKZB": (49.8138888889, 15.2016666667),
-    "LLAZ": (31.3675, 34.2947222222),
-    "LLBG": (32.0094444444, 34.8766666667),
-    "LLBS": (31.2869444444, 34.7227777778),
-    "LLEK": (31.8394444444, 34.8216666667),
-    "LLES": (32.4408333333, 35.0061111111),
-    "LLET": (29.5611111111, 34.96),
-    "LLEY": (30.6230555556, 35.2019444444),
-    "LLFK": (32.7852777778, 35.7172222222),
-    "LLHA": (32.8111111111, 35.0438888889),
-    "LLHB": (31.2333583333, 34.6625583333),
-    "LLHS": (31.7625, 34.7272222222),
-    "LLHZ": (32.1802861111, 34.8339833333),
-    "LLIB": (32.9808333333, 35.5716666667),
-    "LLJR": (31.8666666667, 35.2166666667),
-    "LLKS": (33.2166666667, 35.5966666667),
-    "LLLL": (31.2286111111, 35.1908333333),
-    "LLMG": (32.5986111111, 35.2283333333),
-    "LLMR": (30.6522222222, 34.8066666667),
-    "LLMZ": (31.3280555556, 35.3883333333),
-    "LLNV": (31.2083333333, 35.0122222222),
-    "LLOV": (29.94, 34.9358333333),
-    "LLRD": (32.6602777778, 35.1822222222),
-    "LLRM": (30.7761111111, 34.6666666667),
-    "LLSD": (32.1144444444, 34.7819444444),
-    "LLYT": (29.9011111111, 35.0675),
-    "LMMG": (36.0272222222, 14.2719444444),
-    "LMML": (35.8572222222, 14.4775),
-    "LMMM": (35.9166666667, 14.4166666667),
-    "LNMC": (43.7263888889, 7.42055555556),
-    "LOAD": (48.2, 15.6166666667),
-    "LOAG": (48.4333333333, 15.6),
-    "LOAN": (47.8433333333, 16.26),
-    "LOAV": (47.9666666667, 16.2166666667),
-    "LOGG": (47.0666666667, 16.3166666667),
-    "LOLW": (48.1830555556, 14.0408333333),
-    "LOWG": (47.0, 15.4333333333),
-    "LOWI": (47.26, 11.3438888889),
-    "LOWK": (46.65, 14.3333333333),
-    "LOWL": (48.2333333333, 14.1833333333),
-    "LOWM": (48.0, 16.5),
-    "LOWS": (47.7930555556, 13.0041666667),
-    "LOWW": (48.1102777778, 16.5697222222),
-    "LOXA": (47.5166666667, 14.1333333333),
-    "LOXG": (46.9908333333, 15.4394444444),
-    "LOXK": (46.6425, 14.3375),
-    "LOXL": (48.2330555556, 14.1875),
-    "LOXN": (47.8394166667, 16.2215833333),
-    "LOXT": (48.3208333333, 16.1116666667),
-    "LOXZ": (47.2027777778, 14.7441666667),
-    "LPAR": (38.8830555556, -9.03),
-    "LPAV": (40.6541666667, -8.74361111111),
-    "LPAZ": (36.9713888889, -25.1705555556),
-    "LPBG": (41.8683333333, -6.71194444444),
-    "LPBJ": (38.0788888889, -7.93222222222),
-    "LPBR": (41.5869444444, -8.445),
-    "LPCO": (40.1572222222, -8.47),
-    "LPCR": (39.6708333333, -31.1127777778),
-    "LPCS": (38.725, -9.355),
-    "LPCV": (40.2647222222, -7.47972222222),
-    "LPEV": (38.5333333333, -7.88944444444),
-    "LPFL": (39.455, -31.1311111111),
-    "LPFR": (37.0141666667, -7.96583333333),
-    "LPGR": (39.0919444444, -28.0297222222),
-    "LPHR": (38.5197222222, -28.7158333333),
-    "LPIN": (40.9741666667, -8.64527777778),
-    "LPLA": (38.7641666667, -27.0933333333),
-    "LPMA": (32.6941666667, -16.7780555556),
-    "LPMC": (41.5575, -6.89416666667),
-    "LPMG": (38.7166666667, -9.15583333333),
-    "LPMR": (39.8311111111, -8.88722222222),
-    "LPMT": (38.7036111111, -9.03583333333),
-    "LPOV": (40.9158333333, -8.64583333333),
-    "LPPD": (37.7411111111, -25.6977777778),
-    "LPPI": (38.5544444444, -28.4397222222),
-    "LPPM": (37.1491666667, -8.58388888889),
-    "LPPR": (41.2480555556, -8.68138888889),
-    "LPPS": (33.0733333333, -16.3497222222),
-    "LPPT": (38.7811111111, -9.13583333333),
-    "LPSC": (39.1241666667, -9.38027777778),
-    "LPSJ": (38.6652777778, -28.1755555556),
-    "LPSR": (-2.42472222222, -54.7858333333),
-    "LPST": (38.8308333333, -9.33944444444),
-    "LPTN": (39.475, -8.36444444444),
-    "LPVR": (41.2741666667, -7.72027777778),
-    "LPVZ": (40.7252777778, -7.88888888889),
-    "LQBK": (44.9413888889, 17.2975),
-    "LQBU": (43.8247222222, 18.3313888889),
-    "LQGL": (44.0838888889, 16.8136111111),
-    "LQJL": (44.4576944444, 18.8082777778),
-    "LQLV": (43.833333, 17.016667),
-    "LQMO": (43.2827777778, 17.8458333333),
-    "LQSA": (43.8244444444, 18.3313888889),
-    "LQTZ": (44.4586111111, 18.7247222222),
-    "LRAR": (46.1763888889, 21.2619444444),
-    "LRBC": (46.5219444444, 26.9102777778),
-    "LRBM": (47.6583333333, 23.47),
-    "LRBS": (44.5030555556, 26.1019444444),
-    "LRCK": (44.3622222222, 28.4883333333),
-    "LRCL": (46.785, 23.6861111111),
-    "LRCS": (45.42, 22.2533333333),
-    "LRCV": (44.3180555556, 23.8886111111),
-    "LRFL": (47.3461111111, 25.3594444444),
-    "LRIA": (47.1788888889, 27.62),
-    "LROD": (47.0252777778, 21.9025),
-    "LROP": (44.5736111111, 26.1033333333),
-    "LRSB": (45.7855555556, 24.0911111111),
-    "LRSM": (47.7033333333, 22.8855555556),
-    "LRSV": (47.6875, 26.3538888889),
-    "LRTC": (45.0622222222, 28.7141666667),
-    "LRTM": (46.4675, 24.4125),
-    "LRTR": (45.81, 21.3377777778),
-    "LSAZ": (46.6136111111, 7.67777777778),
-    "LSGC": (47.0836111111, 6.79277777778),
-    "LSGG": (46.2380555556, 6.10888888889),
-    "LSGK": (46.4875, 7.25083333333),
-    "LSGL": (46.5452777778, 6.61666666667),
-    "LSGN": (46.9575, 6.865),
-    "LSGP": (46.4063888889, 6.25805555556),
-    "LSGS": (46.2194444444, 7.32666666667),
-    "LSMA": (46.9438888889, 8.28416666667),
-    "LSMC": (46.5011111111, 8.29555555556),
-    "LSMD": (47.3986111111, 8.64805555556),
-    "LSME": (47.0922222222, 8.305),
-    "LSMF": (47.0786111111, 9.06472222222),
-    "LSMI": (46.6763888889, 7.87916666667),
-    "LSMJ": (46.3038888889, 7.71444444444),
-    "LSMM": (46.7433333333, 8.11),
-    "LSMN": (46.3036111111, 7.82333333333),
-    "LSMP": (46.8430555556, 6.915),
-    "LSMU": (46.9747222222, 8.39888888889),
-    "LSPM": (46.5130555556, 8.68944444444),
-    "LSSW": (47.3833333333, 8.56666666667),
-    "LSXB": (47.0666666667, 9.5),
-    "LSZA": (46.0041666667, 8.91055555556),
-    "LSZB": (46.9138888889, 7.49694444444),
-    "LSZG": (47.1813888889, 7.41694444444),
-    "LSZH": (47.4647222222, 8.54916666667),
-    "LSZL": (46.1652777778, 8.87777777778),
-    "LSZR": (47.485, 9.56055555556),
-    "LSZS": (46.5325, 9.88277777778),
-    "LTAA": (40.0, 32.0),
-    "LTAB": (39.9347222222, 32.7405555556),
-    "LTAC": (40.1280555556, 32.995),
-    "LTAD": (39.9497222222, 32.6886111111),
-    "LTAE": (40.0788888889, 32.5655555556),
-    "LTAF": (36.9819444444, 35.2802777778),
-    "LTAG": (37.0019444444, 35.4258333333),
-    "LTAH": (38.7261111111, 30.6011111111),
-    "LTAI": (36.9013888889, 30.7916666667),
-    "LTAJ": (36.9480555556, 37.4791666667),
-    "LTAK": (36.5733333333, 36.1538888889),
-    "LTAL": (41.3138888889, 33.7958333333),
-    "LTAM": (38.7702777778, 35.4952777778),
-    "LTAN": (37.9788888889, 32.5616666667),
-    "LTAP": (40.8291666667, 35.5219444444),
-    "LTAQ": (41.2763888889, 36.3036111111),
-    "LTAR": (39.8136111111, 36.9033333333),
-    "LTAS": (41.5158333333, 32.0997222222),
-    "LTAT": (38.4358333333, 38.0916666667),
-    "LTAU": (38.7702777778, 35.4952777778),
-    "LTAV": (39.4513888889, 31.3652777778),
-    "LTAW": (40.305, 36.3677777778),
-    "LTAX": (41.2544444444, 31.415),
-    "LTAY": (37.785, 29.7011111111),
-    "LTAZ": (38.7716666667, 34.5341666667),
-    "LTBA": (40.9766666667, 28.8211111111),
-    "LTBD": (37.8158333333, 27.8861111111),
-    "LTBE": (40.2316666667, 29.0091666667),
-    "LTBF": (39.6188888889, 27.9247222222),
-    "LTBG": (40.3177777778, 27.9775),
-    "LTBH": (40.1375, 26.4266666667),
-    "LTBI": (39.7838888889, 30.5819444444),
-    "LTBJ": (38.2922222222, 27.1569444444),
-    "LTBK": (38.3191666667, 27.1597222222),
-    "LTBL": (38.5130555556, 27.01),
-    "LTBM": (37.7852777778, 30.5816666667),
-    "LTBN": (39.4266666667, 30.0163888889),
-    "LTBO": (38.6811111111, 29.4713888889),
-    "LTBP": (40.6833333333, 29.3786111111),
-    "LTBQ": (40.735, 30.0830555556),
-    "LTBR": (40.255, 29.5625),
-    "LTBS": (36.7130555556, 28.7925),
-    "LTBT": (38.8086111111, 27.8336111111),
-    "LTBU": (41.1380555556, 27.9188888889),
-    "LTBV": (37.1402777778, 27.6697222222),
-    "LTBW": (41.1045, 28.55),
-    "LTBX": (40.9927777778, 29.2163888889),
-    "LTBY": (39.8097222222, 30.5194444444),
-    "LTBZ": (39.1113888889, 30.13),
-    "LTCA": (38.6066666667, 39.2913888889),
-    "LTCC": (37.8936111111, 40.2005555556),
-    "LTCD": (39.71, 39.5261111111),
-    "LTCE": (39.9563888889, 41.17),
-    "LTCF": (40.5622222222, 43.115),
-    "LTCG": (40.995, 39.7897222222),
-    "LTCH": (37.0919444444, 38.8461111111),
-    "LTCI": (38.4680555556, 43.3322222222),
-    "LTCJ": (37.9288888889, 41.1161111111),
-    "LTCK": (38.7544444444, 41.6611111111),
-    "LTCL": (37.9786111111, 41.8402777778),
-    "LTCM": (42.0188888889, 35.0791666667),
-    "LTCN": (37.5388888889, 36.9533333333),
-    "LTCO": (39.6544444444, 43.0272222222),
-    "LTCP": (37.7316666667, 38.4688888889),
-    "LTCR": (37.2327777778, 40.6405555556),
-    "LTCS": (37.45, 38.9),
-    "LTCU": (38.8611111111, 40.5925),
-    "LTCV": (37.3638888889, 42.06),
-    "LTDA": (36.3627777778, 36.2822222222),
-    "LTFA": (38.5175, 26.9772222222),
-    "LTFB": (37.9505555556, 27.3288888889),
-    "LTFC": (37.865, 30.3819444444),
-    "LTFD": (39.5544444444, 27.0136111111),
-    "LTFE": (37.2505555556, 27.6641666667),
-    "LTFG": (36.2988888889, 32.3),
-    "LTFH": (41.2655555556, 36.5486111111),
-    "LTFJ": (40.8983333333, 29.3091666667),
-    "LTFK": (40.2011111111, 25.8822222222),
-    "LUBL": (47.8377777778, 27.7811111111),
-    "LUBM": (47.8625, 28.2125),
-    "LUCH": (45.8438888889, 28.2636111111),
-    "LUCL": (46.0349944444, 28.8518444444),
-    "LUKK": (46.9277777778, 28.9313888889),
-    "LVGZ": (31.2463888889, 34.2761111111),
-    "LWOH": (41.1797222222, 20.7422222222),
-    "LWSK": (41.9613888889, 21.6213888889),
-    "LXGB": (36.1508333333, -5.34944444444),
-    "LYBE": (44.8183333333, 20.3088888889),
-    "LYBJ": (44.9369583333, 20.4425555556),
-    "LYBR": (42.8390277778, 19.8620277778),
-    "LYBT": (44.9352777778, 20.2575),
-    "LYKV": (43.8186111111, 20.5852777778),
-    "LYNI": (43.3372222222, 21.8536111111),
-    "LYNK": (42.7743194444, 18.9151166667),
-    "LYNS": (45.3857416667, 19.8338916667),
-    "LYPG": (42.3591666667, 19.2516666667),
-    "LYPJ": (42.3333333333, 19.25),
-    "LYPO": (42.4223166667, 19.2907777778),
-    "LYPR": (42.5727777778, 21.0358333333),
-    "LYTR": (43.6141888889, 21.0302166667),
-    "LYTV": (42.4044444444, 18.7230555556),
-    "LYUZ": (43.8988861111, 19.6976833333),
-    "LYVR": (45.1466666667, 21.3097222222),
-    "LYZR": (45.3397555556, 20.4540777778),
-    "LZIB": (48.17, 17.2125),
-    "LZKZ": (48.6630555556, 21.2411111111),
-    "LZMA": (49.0652777778, 18.9508333333),
-    "LZMC": (48.4019444444, 17.1183333333),
-    "LZPP": (48.625, 17.8283333333),
-    "LZPW": (49.0297222222, 21.3155555556),
-    "LZSE": (48.6577777778, 17.3297222222),
-    "LZSL": (48.6377777778, 19.1338888889),
-    "LZTN": (48.865, 17.9922222222),
-    "LZTT": (49.0733333333, 20.2408333333),
-    "LZZI": (49.2316666667, 18.6136111111),
-    "MBGT": (21.4444444444, -71.1422222222),
-    "MBMC": (21.8258333333, -71.8025),
-    "MBNC": (21.9172222222, -71.9394444444),
-    "MBPV": (21.7736111111, -72.2658333333),
-    "MBSC": (21.5155555556, -71.5283333333),
-    "MBSY": (21.3333333333, -71.2),
-    "MDAB": (19.1986111111, -69.43),
-    "MDBH": (18.2513888889, -71.1202777778),
-    "MDCR": (17.9288888889, -71.6447222222),
-    "MDCY": (19.27, -69.7375),
-    "MDCZ": (18.9080555556, -70.72),
-    "MDHE": (18.4711111111, -69.9688888889),
-    "MDJB": (18.5755555556, -69.9813888889),
-    "MDLR": (18.4519444444, -68.9116666667),
-    "MDPC": (18.5672222222, -68.3633333333),
-    "MDPO": (19.3214305556, -69.4959055556),
-    "MDPP": (19.7572222222, -70.5697222222),
-    "MDSB": (19.0619444444, -69.3852777778),
-    "MDSD": (18.4294444444, -69.6686111111),
-    "MDSI": (18.5036111111, -69.7616666667),
-    "MDSJ": (18.8333333333, -71.2333333333),
-    "MDST": (19.4091666667, -70.6163888889),
-    "MGBN": (15.4733333333, -88.8372222222),
-    "MGCB": (15.4688888889, -90.4066666667),
-    "MGCT": (14.6941666667, -91.8825),
-    "MGGT": (14.5830555556, -90.5275),
-    "MGPB": (15.7308333333, -88.5836111111),
-    "MGPP": (16.3261111111, -89.4169444444),
-    "MGQC": (15.0108333333, -91.1505555556),
-    "MGQZ": (14.8652777778, -91.5019444444),
-    "MGRT": (14.5208333333, -91.6972222222),
-    "MGSJ": (13.9361111111, -90.8358333333),
-    "MGSM": (29.8927777778, -97.8630555556),
-    "MGTK": (16.9138888889, -89.8663888889),
-    "MHIC": (17.4072222222, -83.9325),
-    "MHLC": (15.7422222222, -86.8533333333),
-    "MHLE": (-14.4166111111, -65.5179722222),
-    "MHLM": (15.4525, -87.9233333333),
-    "MHMA": (14.15, -88.0333333333),
-    "MHNJ": (16.4452777778, -85.9063888889),
-    "MHPL": (15.2608333333, -83.7813888889),
-    "MHRO": (16.3166666667, -86.5225),
-    "MHSB": (14.9166666667, -88.2333333333),
-    "MHSC": (14.3825, -87.6211111111),
-    "MHTE": (15.7758333333, -87.4755555556),
-    "MHTG": (14.0608333333, -87.2169444444),
-    "MHTJ": (15.9266666667, -85.9380555556),
-    "MKBS": (18.4041666667, -76.9688888889),
-    "MKJP": (17.9355555556, -76.7875),
-    "MKJS": (18.5036111111, -77.9133333333),
-    "MKKJ": (18.1986111111, -76.5344444444),
-    "MKNG": (18.34, -78.3383333333),
-    "MKTP": (17.9883333333, -76.8236111111),
-    "MMAA": (16.7566666667, -99.7533333333),
-    "MMAN": (25.8655555556, -100.237222222),
-    "MMAS": (21.7052777778, -102.317777778),
-    "MMBT": (15.7747222222, -96.2608333333),
-    "MMCB": (18.835, -99.2619444444),
-    "MMCC": (29.3319444444, -100.980833333),
-    "MMCE": (18.6536111111, -91.7988888889),
-    "MMCG": (30.3972222222, -107.874722222),
-    "MMCH": (17.5736111111, -99.5141666667),
-    "MMCL": (24.7644444444, -107.474444444),
-    "MMCM": (18.5044444444, -88.3266666667),
-    "MMCN": (27.3925, -109.833055556),
-    "MMCP": (19.8166666667, -90.5002777778),
-    "MMCS": (31.6361111111, -106.428611111),
-    "MMCT": (20.6412944444, -88.4462194444),
-    "MMCU": (28.7027777778, -105.964444444),
-    "MMCV": (23.7038888889, -98.9563888889),
-    "MMCY": (20.5458333333, -100.886388889),
-    "MMCZ": (20.5222222222, -86.9255555556),
-    "MMDM": (22.7402777778, -99.0180555556),
-    "MMDO": (24.1241666667, -104.527777778),
-    "MMEP": (21.4194444444, -104.8425),
-    "MMES": (31.7952777778, -116.6025),
-    "MMGL": (20.5216666667, -103.311111111),
-    "MMGM": (27.9688888889, -110.925),
-    "MMGR": (28.0258333333, -114.023888889),
-    "MMHC": (18.4969444444, -97.4197222222),
-    "MMHO": (29.0958333333, -111.047777778),
-    "MMIA": (19.2769444444, -103.577222222),
-    "MMIM": (21.245, -86.7397222222),
-    "MMIO": (25.5494444444, -100.928611111),
-    "MMIT": (16.4491666667, -95.0936111111),
-    "MMJA": (19.475, -96.7975),
-    "MMLC": (18.0016666667, -102.220277778),
-    "MMLM": (25.685, -109.080555556),
-    "MMLO": (20.9933333333, -101.480833333),
-    "MMLP": (24.0725, -110.362222222),
-    "MMLT": (25.9891666667, -111.348333333),
-    "MMMA": (25.7697222222, -97.5252777778),
-    "MMMD": (20.9369444444, -89.6575),
-    "MMML": (32.6305555556, -115.241388889),
-    "MMMM": (19.8497222222, -101.025277778),
-    "MMMT": (18.1033333333, -94.5805555556),
-    "MMMV": (26.9555555556, -101.47),
-    "MMMX": (19.4361111111, -99.0719444444),
-    "MMMY": (25.7783333333, -100.106666667),
-    "MMMZ": (23.1611111111, -106.265833333),
-    "MMNG": (31.2258333333, -110.975555556),
-    "MMNL": (27.4438888889, -99.5702777778),
-    "MMOX": (16.9997222222, -96.7263888889),
-    "MMPA": (20.6025, -97.4608333333),
-    "MMPB": (19.1580555556, -98.3713888889),
-    "MMPC": (20.0772222222, -98.7822222222),
-    "MMPE": (31.3516666667, -113.525555556),
-    "MMPG": (28.6272222222, -100.535),
-    "MMPN": (19.3966666667, -102.039166667),
-    "MMPR": (20.68, -105.254166667),
-    "MMPS": (15.8766666667, -97.0888888889),
-    "MMQT": (20.6238888889, -100.368611111),
-    "MMRX": (26.0088888889, -98.2283333333),
-    "MMSC": (16.69, -92.53),
-    "MMSD": (23.1516666667, -109.720833333),
-    "MMSF": (30.93, -114.808611111),
-    "MMSL": (22.9475, -109.937080556),
-    "MMSP": (22.2541666667, -100.930555556),
-    "MMSZ": (16.2125, -95.2013888889),
-    "MMTA": (19.5363888889, -98.1733333333),
-    "MMTC": (25.5680555556, -103.410555556),
-    "MMTG": (16.7694444444, -93.3413888889),
-    "MMTJ": (32.5408333333, -116.97),
-    "MMTM": (22.2963888889, -97.8658333333),
-    "MMTN": (22.0380555556, -98.8063888889),
-    "MMTO": (19.3369444444, -99.5658333333),
-    "MMTP": (14.7941666667, -92.37),
-    "MMTX": (19.5983333333, -103.371944444),
-    "MMUN": (21.0363888889, -86.8769444444),
-    "MMVA": (17.9969444444, -92.8172222222),
-    "MMVR": (19.1452777778, -96.1869444444),
-    "MMZC": (22.8969444444, -102.686666667),
-    "MMZH": (17.6013888889, -101.460277778),
-    "MMZM": (20.045, -102.275833333),
-    "MMZO": (19.1447222222, -104.558611111),
-    "MMZP": (20.7558333333, -103.465277778),
-    "MNBL": (11.9888888889, -83.7741666667),
-    "MNBR": (12.1894444444, -86.3538888889),
-    "MNBZ": (14.0416666667, -84.6305555556),
-    "MNCH": (12.6397222222, -87.1383333333),
-    "MNCI": (12.1713888889, -83.0605555556),
-    "MNEP": (-14.4166111111, -65.5179722222),
-    "MNFC": (12.3538888889, -86.1827777778),
-    "MNLN": (12.4277777778, -86.9022222222),
-    "MNMG": (12.1411111111, -86.1680555556),
-    "MNMR": (11.8052777778, -86.5113888889),
-    "MNNG": (11.6666666667, -84.45),
-    "MNPC": (14.0469444444, -83.3866666667),
-    "MNRT": (13.8897222222, -84.4086111111),
-    "MNSC": (11.1330555556, -84.7655555556),
-    "MNSI": (13.7166666667, -84.7769444444),
-    "MNWP": (14.7377777778, -83.9758333333),
-    "MPBO": (9.34083333333, -82.2508333333),
-    "MPCH": (9.45861111111, -82.5166666667),
-    "MPDA": (8.39083333333, -82.4347222222),
-    "MPEJ": (9.35666666667, -79.8675),
-    "MPFS": (9.36305555556, -79.9530555556),
-    "MPHO": (8.91444444444, -79.5994444444),
-    "MPJE": (7.51722222222, -78.1566666667),
-    "MPLP": (8.40666666667, -78.1416666667),
-    "MPMG": (8.97333333333, -79.5555555556),
-    "MPPA": (8.915, -79.5994444444),
-    "MPSA": (8.08555555556, -80.945),
-    "MPTO": (9.07111111111, -79.3833333333),
-    "MRAO": (10.5688888889, -83.5147222222),
-    "MRBA": (9.16694444444, -83.3325),
-    "MRBC": (10.7686111111, -83.5858333333),
-    "MRCC": (8.60111111111, -82.97),
-    "MRCR": (9.86666666667, -85.4833333333),
-    "MRCV": (10.3555555556, -85.8527777778),
-    "MRDK": (8.73333333333, -83.65),
-    "MREC": (10.2019444444, -83.4719444444),
-    "MRFI": (8.91611111111, -83.5072222222),
-    "MRFS": (8.6525, -83.0652777778),
-    "MRGF": (8.65388888889, -83.1819444444),
-    "MRGP": (10.2172222222, -83.7947222222),
-    "MRIA": (9.85, -85.3666666667),
-    "MRLB": (10.5930555556, -85.5441666667),
-    "MRLC": (11.0352777778, -84.7061111111),
-    "MRLE": (8.43333333333, -82.9),
-    "MRLM": (9.95777777778, -83.0219444444),
-    "MRNS": (9.97638888889, -85.6527777778),
-    "MROC": (9.99361111111, -84.2086111111),
-    "MRPD": (9.73194444444, -82.9830555556),
-    "MRPJ": (8.53333333333, -83.3),
-    "MRPM": (8.95083333333, -83.4683333333),
-    "MRPV": (9.95722222222, -84.1419444444),
-    "MRQP": (9.44305555556, -84.1297222222),
-    "MRSG": (10.2883333333, -83.7136111111),
-    "MRSV": (8.82611111111, -82.9588888889),
-    "MRTM": (10.3166666667, -85.8166666667),
-    "MRTR": (9.73333333333, -85.0166666667),
-    "MSET": (13.1625, -87.9047222222),
-    "MSLP": (13.4405555556, -89.0558333333),
-    "MSSC": (22.4922222222, -79.9436111111),
-    "MSSS": (13.7, -89.12),
-    "MTCA": (18.2711111111, -73.7883333333),
-    "MTCH": (19.7325, -72.1947222222),
-    "MTJA": (18.2411111111, -72.5186111111),
-    "MTJE": (18.6630555556, -74.1702777778),
-    "MTPP": (18.58, -72.2925),
-    "MTPX": (19.9336111111, -72.8486111111),
-    "MUBA": (20.3655555556, -74.5063888889),
-    "MUBR": (22.6211111111, -79.1472222222),
-    "MUBY": (20.3963888889, -76.6213888889),
-    "MUCA": (22.0269444444, -78.7894444444),
-    "MUCB": (22.5063888889, -79.4697222222),
-    "MUCC": (22.4611111111, -78.3286111111),
-    "MUCF": (22.15, -80.4141666667),
-    "MUCL": (21.6161111111, -81.5455555556),
-    "MUCM": (21.4202777778, -77.8475),
-    "MUCU": (19.97, -75.8355555556),
-    "MUFL": (21.4997222222, -78.2027777778),
-    "MUGM": (19.9063888889, -75.2069444444),
-    "MUGT": (20.0852777778, -75.1583333333),
-    "MUHA": (22.9891666667, -82.4091666667),
-    "MUHG": (20.7855555556, -76.315),
-    "MUKW": (23.1236111111, -81.3019444444),
-    "MULB": (23.0938888889, -82.4380555556),
-    "MULM": (22.3358333333, -83.6419444444),
-    "MUMG": (22.9697222222, -82.2747222222),
-    "MUML": (23.0072222222, -82.7675),
-    "MUMO": (20.6541666667, -74.9216666667),
-    "MUMZ": (20.2880555556, -77.0891666667),
-    "MUNB": (22.7563888889, -81.9208333333),
-    "MUNC": (20.6886111111, -75.5313888889),
-    "MUNG": (21.8347222222, -82.7838888889),
-    "MUOC": (22.5161111111, -78.5088888889),
-    "MUPB": (23.0327777778, -82.5794444444),
-    "MUPR": (22.4211111111, -83.6775),
-    "MUSA": (22.8713888889, -82.5091666667),
-    "MUSC": (22.4919444444, -79.9436111111),
-    "MUSJ": (22.0952777778, -84.1519444444),
-    "MUSL": (21.5094444444, -77.0175),
-    "MUSN": (21.6425, -82.955),
-    "MUSS": (21.9705555556, -79.4422222222),
-    "MUTD": (21.7883333333, -79.9972222222),
-    "MUVR": (23.0344444444, -81.4352777778),
-    "MUVT": (20.9877777778, -76.9358333333),
-    "MWCB": (19.6866666667, -79.8827777778),
-    "MWCG": (19.2925, -81.3591666667),
-    "MWCL": (19.6666666667, -80.0833333333),
-    "MWCR": (19.2927777778, -81.3575),
-    "MYAB": (24.2875, -77.6844444444),
-    "MYAF": (24.6977777778, -77.7955555556),
-    "MYAK": (24.1586111111, -77.5897222222),
-    "MYAM": (26.5113888889, -77.0833333333),
-    "MYAN": (25.0536111111, -78.0488888889),
-    "MYAO": (26.3179166667, -77.5623055556),
-    "MYAP": (22.4416666667, -73.9708333333),
-    "MYAS": (26.0044444444, -77.3952777778),
-    "MYAT": (26.7452777778, -77.3911111111),
-    "MYAW": (27.2604166667, -78.4022222222),
-    "MYAX": (26.9502777778, -77.5438888889),
-    "MYBC": (25.4169444444, -77.8808333333),
-    "MYBG": (25.7380555556, -77.84),
-    "MYBO": (25.4229166667, -79.2094722222),
-    "MYBS": (25.6997222222, -79.2644444444),
-    "MYBW": (25.402, -77.7884166667),
-    "MYBX": (25.4495833333, -77.7595),
-    "MYCA": (24.6291666667, -75.6736111111),
-    "MYCB": (24.315, -75.4538888889),
-    "MYCC": (25.5552777778, -79.2760555556),
-    "MYCH": (24.1541944444, -75.5202777778),
-    "MYCI": (22.7455555556, -74.1822222222),
-    "MYCP": (22.8297222222, -74.3464166667),
-    "MYCS": (23.7116666667, -80.4133333333),
-    "MYCX": (24.1488888889, -75.3980555556),
-    "MYEB": (24.0892777778, -76.3979166667),
-    "MYEC": (24.7903333333, -76.2946666667),
-    "MYEF": (23.5625, -75.8777777778),
-    "MYEG": (23.4666666667, -75.7816666667),
-    "MYEH": (25.4755555556, -76.6811111111),
-    "MYEL": (23.7755833333, -76.1037222222),
-    "MYEM": (25.2844444444, -76.3308333333),
-    "MYEN": (24.5944444444, -76.8319444444),
-    "MYER": (24.8916666667, -76.1775),
-    "MYES": (24.1688888889, -76.4388888889),
-    "MYEY": (23.3974166667, -75.4970833333),
-    "MYGF": (26.5586111111, -78.6952777778),
-    "MYGW": (26.6861111111, -78.9775),
-    "MYIG": (20.975, -73.6666666667),
-    "MYLD": (23.1788888889, -75.0933333333),
-    "MYLM": (23.6488888889, -75.3233333333),
-    "MYLR": (23.0111944444, -74.9058888889),
-    "MYLS": (23.5827777778, -75.2686111111),
-    "MYMM": (22.3794444444, -73.0133333333),
-    "MYNN": (25.0388888889, -77.4661111111),
-    "MYPI": (25.0791666667, -77.2933333333),
-    "MYRD": (22.1816666667, -75.7294444444),
-    "MYRP": (23.6844444444, -74.8361111111),
-    "MYSM": (24.0630555556, -74.5238888889),
-    "MZBZ": (17.5388888889, -88.3080555556),
-    "NCAI": (-18.825, -159.773611111),
-    "NCAT": (-19.9677777778, -158.12),
-    "NCMG": (-21.8958333333, -157.906666667),
-    "NCMH": (-10.3805555556, -160.999722222),
-    "NCMK": (-20.1366666667, -157.344722222),
-    "NCMN": (-19.2575, -158.938888889),
-    "NCMR": (-19.8426666667, -157.703333333),
-    "NCPY": (-9.01444444444, -158.0325),
-    "NCRG": (-21.2025, -159.805555556),
-    "NFCI": (-17.7430555556, -179.341944444),
-    "NFFN": (-17.7544444444, 177.443333333),
-    "NFFO": (-17.7830555556, 177.216388889),
-    "NFKB": (-17.25, -179.483333333),
-    "NFKD": (-19.0580555556, 178.156944444),
-    "NFMA": (-17.6730555556, 177.098333333),
-    "NFMO": (-18.5669444444, 179.951111111),
-    "NFNA": (-18.0430555556, 178.559166667),
-    "NFNB": (-17.7111111111, 178.758611111),
-    "NFNG": (-18.1155555556, 179.339722222),
-    "NFNH": (-16.7480555556, -179.666944444),
-    "NFNK": (-18.1991666667, -178.816944444),
-    "NFNL": (-16.4666666667, 179.339722222),
-    "NFNM": (-16.6905555556, -179.876944444),
-    "NFNO": (-17.3458333333, 179.421944444),
-    "NFNR": (-12.4825, 177.071111111),
-    "NFSW": (-16.7588888889, 177.545555556),
-    "NFTE": (-21.3833333333, -174.95),
-    "NFTF": (-21.2408333333, -175.15),
-    "NFTL": (-19.7769444444, -174.341111111),
-    "NFTO": (-15.5711111111, -175.630833333),
-    "NFTP": (-15.9766666667, -173.791666667),
-    "NFTV": (-18.5852777778, -173.962777778),
-    "NFVB": (-17.2666666667, -178.983333333),
-    "NGAB": (1.79638888889, 173.040277778),
-    "NGBR": (-1.35472222222, 176.007222222),
-    "NGFU": (-8.51666666667, 179.216666667),
-    "NGMK": (2.05027777778, 173.266666667),
-    "NGNU": (-1.31666666667, 176.416666667),
-    "NGTA": (1.38138888889, 173.146944444),
-    "NGTB": (0.490833333333, 173.828611111),
-    "NGTE": (-1.22361111111, 174.776111111),
-    "NGTR": (-2.61626111111, 176.8021),
-    "NGTU": (3.08638888889, 172.811388889),
-    "NGUK": (0.185277777778, 173.636388889),
-    "NIUE": (-19.08, -169.925555556),
-    "NLWF": (-14.3113888889, -178.066111111),
-    "NLWW": (-13.2380555556, -176.199166667),
-    "NSAS": (-14.1844444444, -169.67),
-    "NSAU": (-13.505, -172.627777778),
-    "NSFA": (-13.8297222222, -172.008333333),
-    "NSFI": (-13.8483333333, -171.741666667),
-    "NSFQ": (-14.2161111111, -169.423611111),
-    "NSMA": (-13.7422222222, -172.258333333),
-    "NSTU": (-14.3308333333, -170.710277778),
-    "NTAA": (-17.5566666667, -149.611388889),
-    "NTAR": (-22.4338888889, -151.360555556),
-    "NTAT": (-23.3652777778, -149.523888889),
-    "NTGA": (-17.3525, -145.509722222),
-    "NTGB": (-15.8197222222, -140.886944444),
-    "NTGC": (-15.1194444444, -148.230555556),
-    "NTGD": (-15.5725, -146.413888889),
-    "NTGE": (-18.4658333333, -136.439444444),
-    "NTGF": (-16.0544444444, -145.656944444),
-    "NTGH": (-17.5477777778, -142.612777778),
-    "NTGI": (-14.4366666667, -146.07),
-    "NTGJ": (-23.0797222222, -134.890277778),
-    "NTGK": (-15.6633333333, -146.884722222),
-    "NTGM": (-16.5847222222, -143.657222222),
-    "NTGN": (-14.1766666667, -141.267222222),
-    "NTGO": (-15.8197222222, -140.886944444),
-    "NTGP": (-14.8094444444, -138.812777778),
-    "NTGQ": (-18.2955555556, -137.016944444),
-    "NTGT": (-14.7125, -145.252777778),
-    "NTGU": (-15.2480555556, -146.616388889),
-    "NTGV": (-14.8680555556, -148.717222222),
-    "NTGW": (-19.285, -138.771944444),
-    "NTGY": (-20.7833333333, -138.567777778),
-    "NTKO": (-16.0469444444, -142.476944444),
-    "NTKR": (-14.4555555556, -145.024444444),
-    "NTMD": (-8.79555555556, -140.228611111),
-    "NTMN": (-9.76861111111, -139.011111111),
-    "NTMP": (-9.35222222222, -140.077777778),
-    "NTTB": (-16.4441666667, -151.751111111),
-    "NTTG": (-14.9541666667, -147.660555556),
-    "NTTH": (-16.6872222222, -151.021666667),
-    "NTTM": (-17.4897222222, -149.761666667),
-    "NTTO": (-18.0747222222, -140.945833333),
-    "NTTP": (-16.4263888889, -152.243611111),
-    "NTTR": (-16.7227777778, -151.465833333),
-    "NTTX": (-21.8083333333, -138.794166667),
-    "NTUV": (-18.78, -138.853055556),
-    "NVSA": (-13.6658333333, 167.711111111),
-    "NVSC": (-13.8516666667, 167.536944444),
-    "NVSE": (-17.0902777778, 168.342777778),
-    "NVSF": (-16.265, 167.924444444),
-    "NVSG": (-15.3066666667, 167.967222222),
-    "NVSH": (-15.4708333333, 168.152222222),
-    "NVSL": (-16.45, 167.816666667),
-    "NVSM": (-16.5841666667, 168.159166667),
-    "NVSN": (-14.9972222222, 168.081111111),
-    "NVSO": (-15.8655555556, 168.171944444),
-    "NVSP": (-16.0797222222, 167.400555556),
-    "NVSQ": (-14.2180555556, 167.587222222),
-    "NVSR": (-15.4666666667, 167.833333333),
-    "NVSS": (-15.5011111111, 167.2225),
-    "NVST": (-16.8911111111, 168.551111111),
-    "NVSU": (-16.3333333333, 168.283333333),
-    "NVSV": (-16.7961111111, 168.176944444),
-    "NVSW": (-15.4166666667, 167.683333333),
-    "NVSX": (-16.5, 167.433333333),
-    "NVVA": (-20.2491666667, 169.771388889),
-    "NVVB": (-19.2344444444, 169.600555556),
-    "NVVD": (-18.7694444444, 169.001388889),
-    "NVVF": (-19.5163888889, 170.231944444),
-    "NVVI": (-18.8563888889, 169.283333333),
-    "NVVQ": (17.54, 168.442),
-    "NVVV": (-17.6991666667, 168.319722222),
-    "NVVW": (-19.455, 169.223888889),
-    "NWWA": (-21.0958333333, 167.803888889),
-    "NWWC": (-19.7211111111, 163.661944444),
-    "NWWD": (-21.0533333333, 164.837777778),
-    "NWWK": (-20.5461111111, 164.255555556),
-    "NWWL": (-20.7747222222, 167.239722222),
-    "NWWM": (-22.2580555556, 166.472777778),
-    "NWWR": (-21.4816666667, 168.0375),
-    "NWWT": (-21.8197222222, 165.861111111),
-    "NWWU": (-20.7911111111, 165.259166667),
-    "NWWV": (-20.6405555556, 166.572777778),
-    "NWWW": (-22.0144444444, 166.212777778),
-    "NWWX": (-21.5202777778, 165.971944444),
-    "NZ0B": (-64.7741666667, -64.0530555556),
-    "NZAA": (-37.0080555556, 174.791666667),
-    "NZAP": (-38.7397222222, 176.084444444),
-    "NZAR": (-37.0297222222, 174.973333333),
-    "NZAS": (-43.9033333333, 171.796666667),
-    "NZAU": (-39.4702777778, 175.680277778),
-    "NZBA": (-46.2433333333, 169.75),
-    "NZCH": (-43.4891666667, 172.532222222),
-    "NZCI": (-43.81, -176.457222222),
-    "NZCS": (-45.0486111111, 169.170555556),
-    "NZCX": (-36.7916666667, 175.508611111),
-    "NZDA": (-35.9397222222, 173.893611111),
-    "NZDH": (-45.8694444444, 170.508611111),
-    "NZDN": (-45.9280555556, 170.198333333),
-    "NZDV": (-40.2283333333, 176.078611111),
-    "NZFF": (-43.3858333333, 172.360555556),
-    "NZFI": (-40.2558333333, 175.605277778),
-    "NZGA": (-38.4086111111, 176.741944444),
-    "NZGB": (-36.2413888889, 175.471944444),
-    "NZGC": (-46.1566666667, 168.898333333),
-    "NZGM": (-42.4616666667, 171.19),
-    "NZGS": (-38.6633333333, 177.978333333),
-    "NZGT": (-43.9066666667, 170.128333333),
-    "NZHK": (-42.7136111111, 170.985277778),
-    "NZHN": (-37.8663888889, 175.331944444),
-    "NZHS": (-39.6466666667, 176.766944444),
-    "NZHT": (-43.8666666667, 169.040277778),
-    "NZIR": (-77.853889, 166.468611),
-    "NZKE": (-36.8083333333, 175.085277778),
-    "NZKI": (-42.425, 173.602222222),
-    "NZKK": (-35.2627777778, 173.911944444),
-    "NZKO": (-35.4528388889, 173.816713889),
-    "NZKT": (-35.07, 173.285277778),
-    "NZLX": (-45.2116666667, 169.373333333),
-    "NZMB": (-36.8475, 174.785277778),
-    "NZMC": (-43.765, 170.133333333),
-    "NZMF": (-44.6733333333, 167.923333333),
-    "NZMK": (-41.1232583333, 172.993897222),
-    "NZMO": (-45.5330555556, 167.65),
-    "NZMS": (-40.9733333333, 175.633611111),
-    "NZNE": (-36.6566666667, 174.655277778),
-    "NZNP": (-39.0086111111, 174.179166667),
-    "NZNR": (-39.4683333333, 176.871666667),
-    "NZNS": (-41.2983333333, 173.221111111),
-    "NZNV": (-46.4122222222, 168.312777778),
-    "NZOH": (-40.2058333333, 175.387777778),
-    "NZOI": (-37.6258333333, 176.422222222),
-    "NZOM": (-41.54, 173.921944444),
-    "NZOU": (-44.97, 171.081666667),
-    "NZPG": (-77.9633333333, 166.524444444),
-    "NZPI": (-36.6516666667, 174.433333333),
-    "NZPM": (-40.3205555556, 175.616944444),
-    "NZPN": (-41.3447222222, 173.958055556),
-    "NZPP": (-40.9047222222, 174.989166667),
-    "NZQN": (-45.0211111111, 168.739166667),
-    "NZRC": (-46.8997222222, 168.101666667),
-    "NZRO": (-38.1091666667, 176.317222222),
-    "NZRU": (-39.4463888889, 175.658333333),
-    "NZSP": (-89.9997222222, 0.0),
-    "NZTG": (-37.6719444444, 176.196111111),
-    "NZTH": (-37.16, 175.549444444),
-    "NZTK": (-40.90375, 172.805286111),
-    "NZTO": (-38.2366666667, 175.892777778),
-    "NZTU": (-44.3027777778, 171.225277778),
-    "NZUK": (-44.235, 170.118333333),
-    "NZVL": (-45.9913888889, 168.813055556),
-    "NZWB": (-41.5183333333, 173.870277778),
-    "NZWD": (-77.8833333333, 166.65),
-    "NZWF": (-44.7252777778, 169.243055556),
-    "NZWG": (-43.5511111111, 172.552777778),
-    "NZWK": (-37.9205555556, 176.914166667),
-    "NZWN": (-41.3272222222, 174.805277778),
-    "NZWO": (-39.0069444444, 177.406666667),
-    "NZWP": (-36.7877777778, 174.630277778),
-    "NZWR": (-35.7683333333, 174.365),
-    "NZWS": (-41.7380555556, 171.580833333),
-    "NZWU": (-39.9622222222, 175.025277778),
-    "NZWV": (-37.43, 175.951944444),
-    "OABN": (34.8097222222, 67.8184166667),
-    "OABT": (31.5587777778, 64.3646944444),
-    "OACC": (34.5264166667, 65.2706388889),
-    "OADZ": (38.46175, 70.8819722222),
-    "OAFR": (32.3661666667, 62.1654722222),
-    "OAFZ": (26.7511111111, 82.155),
-    "OAHN": (37.8901666667, 70.2038611111),
-    "OAHR": (34.2097222222, 62.2277777778),
-    "OAIX": (34.9462222222, 69.2646388889),
-    "OAJL": (34.3991666667, 70.4994444444),
-    "OAKB": (34.5658333333, 69.2122222222),
-    "OAKN": (31.5058333333, 65.8477777778),
-    "OAKS": (33.3335833333, 69.9517222222),
-    "OAMN": (35.9341666667, 64.7591666667),
-    "OAMS": (36.7069444444, 67.2091666667),
-    "OAQN": (34.98575, 63.1176111111),
-    "OASD": (33.3911111111, 62.2608333333),
-    "OASG": (36.7502777778, 65.9122222222),
-    "OASN": (37.5666666667, 71.5),
-    "OATN": (32.6101666667, 65.8663333333),
-    "OATQ": (36.775, 69.5325),
-    "OAUZ": (36.665, 68.9108333333),
-    "OAZI": (31.8638888889, 64.2247222222),
-    "OAZJ": (30.9694722222, 61.8666944444),
-    "OBBI": (26.2708333333, 50.6336111111),
-    "OBBS": (25.9183333333, 50.5905555556),
-    "OEAA": (27.3183333333, 49.5869444444),
-    "OEAB": (18.24, 42.6555555556),
-    "OEAH": (25.2841666667, 49.4861111111),
-    "OEBA": (20.2961111111, 41.6341666667),
-    "OEBH": (19.9838888889, 42.6227777778),
-    "OEBQ": (25.9113888889, 49.5913888889),
-    "OEDF": (26.4711111111, 49.7977777778),
-    "OEDR": (26.2652777778, 50.1519444444),
-    "OEDW": (24.4497222222, 44.1211111111),
-    "OEGN": (16.9011111111, 42.5858333333),
-    "OEGS": (26.3027777778, 43.7744444444),
-    "OEGT": (31.4108333333, 37.2788888889),
-    "OEHL": (27.4377777778, 41.6861111111),
-    "OEHR": (24.1019444444, 49.2222222222),
-    "OEJB": (27.0388888889, 49.405),
-    "OEJF": (21.3480555556, 39.1727777778),
-    "OEJN": (21.6794444444, 39.1563888889),
-    "OEKK": (27.9008333333, 45.5280555556),
-    "OEMA": (24.5533333333, 39.705),
-    "OENG": (17.6113888889, 44.4191666667),
-    "OEPA": (28.335, 46.125),
-    "OEPC": (25.1744444444, 47.4883333333),
-    "OEPF": (24.7102777778, 44.9644444444),
-    "OEPJ": (24.1072222222, 41.0358333333),
-    "OERB": (22.7025, 39.0697222222),
-    "OERF": (29.6263888889, 43.4905555556),
-    "OERK": (24.9575, 46.6986111111),
-    "OERM": (28.0794444444, 48.6108333333),
-    "OERR": (30.9072222222, 41.1383333333),
-    "OERT": (26.7230555556, 50.0305555556),
-    "OERY": (24.7097222222, 46.7252777778),
-    "OESB": (22.5147222222, 53.9597222222),
-    "OESH": (17.4666666667, 47.1211111111),
-    "OESK": (29.785, 40.1),
-    "OESL": (20.4647222222, 45.6194444444),
-    "OETB": (28.3652777778, 36.6188888889),
-    "OETF": (21.4833333333, 40.5441666667),
-    "OETH": (25.2141666667, 46.6405555556),
-    "OETN": (27.8688888889, 48.7683333333),
-    "OETR": (31.6925, 38.7311111111),
-    "OEUD": (25.1516666667, 49.3283333333),
-    "OEWD": (20.5041666667, 45.1994444444),
-    "OEWJ": (26.1975, 36.4761111111),
-    "OEYN": (24.1441666667, 38.0633333333),
-    "OIAA": (30.365, 48.2330555556),
-    "OIAD": (32.4344444444, 48.3975),
-    "OIAG": (30.7452777778, 49.6761111111),
-    "OIAH": (30.3375, 50.8277777778),
-    "OIAI": (32.0022222222, 49.2705555556),
-    "OIAJ": (30.835, 49.5347222222),
-    "OIAM": (30.5561111111, 49.1516666667),
-    "OIAW": (31.3372222222, 48.7619444444),
-    "OIBA": (25.8758333333, 55.0327777778),
-    "OIBB": (28.9447222222, 50.8344444444),
-    "OIBH": (27.2125, 54.3183333333),
-    "OIBI": (27.4838888889, 52.6183333333),
-    "OIBK": (26.5266666667, 53.9816666667),
-    "OIBL": (26.5316666667, 54.8216666667),
-    "OIBP": (27.3794444444, 52.7375),
-    "OIBQ": (29.2591666667, 50.3238888889),
-    "OIBS": (25.9094444444, 54.5391666667),
-    "OIBV": (26.81, 53.3563888889),
-    "OICC": (34.3463888889, 47.1563888889),
-    "OICD": (32.9344444444, 47.4833333333),
-    "OICI": (33.5855555556, 46.4052777778),
-    "OICK": (33.4363888889, 48.2858333333),
-    "OICS": (35.2469444444, 47.0069444444),
-    "OIFE": (32.9294444444, 51.5608333333),
-    "OIFH": (32.5669444444, 51.6913888889),
-    "OIFM": (32.7505555556, 51.8616666667),
-    "OIFP": (32.6208333333, 51.6966666667),
-    "OIFS": (32.2972222222, 50.8422222222),
-    "OIGG": (37.3252777778, 49.6055555556),
-    "OIHH": (34.8680555556, 48.5522222222),
-    "OIHR": (34.1402777778, 49.8483333333),
-    "OIHS": (35.2116666667, 48.6533333333),
-    "OIID": (35.7027777778, 51.475),
-    "OIIE": (35.4161111111, 51.1522222222),
-    "OIIG": (35.6447222222, 51.3805555556),
-    "OIII": (35.6891666667, 51.3133333333),
-    "OIIK": (36.2413888889, 50.0475),
-    "OIIS": (35.5908333333, 53.495),
-    "OIKB": (27.2180555556, 56.3777777778),
-    "OIKJ": (28.7266666667, 57.67),
-    "OIKK": (30.2611111111, 56.9566666667),
-    "OIKM": (29.0838888889, 58.4502777778),
-    "OIKP": (27.1580555556, 56.1722222222),
-    "OIKQ": (26.755, 55.9019444444),
-    "OIKR": (30.2977777778, 56.0519444444),
-    "OIKY": (29.5508333333, 55.6725),
-    "OIMB": (32.8955555556, 59.2755555556),
-    "OIMC": (36.5011111111, 61.0647222222),
-    "OIMJ": (36.4236111111, 55.1058333333),
-    "OIMM": (36.235, 59.6408333333),
-    "OIMN": (37.4930555556, 57.3005555556),
-    "OIMS": (36.1680833333, 57.5951833333),
-    "OIMT": (33.6677777778, 56.8925),
-    "OIMX": (37.6277777778, 56.1730555556),
-    "OINE": (37.3830555556, 55.4519444444),
-    "OING": (36.9091666667, 54.4016666667),
-    "OINJ": (36.6552777778, 52.3497222222),
-    "OINM": (34.1691666667, 51.3175),
-    "OINN": (36.6633333333, 51.4647222222),
-    "OINR": (36.9097222222, 50.6794444444),
-    "OINZ": (36.6436111111, 53.1883333333),
-    "OISD": (28.7213888889, 54.4411111111),
-    "OISF": (28.8919444444, 53.7227777778),
-    "OISJ": (28.5863888889, 53.5788888889),
-    "OISL": (27.6736111111, 54.3813888889),
-    "OISO": (29.7541666667, 52.6941666667),
-    "OISR": (27.3708333333, 53.1891666667),
-    "OISS": (29.5391666667, 52.5894444444),
-    "OISY": (30.7005555556, 51.545),
-    "OITK": (38.4274527778, 44.973575),
-    "OITL": (38.3261111111, 48.4241666667),
-    "OITM": (37.3486111111, 46.1261111111),
-    "OITP": (39.6036111111, 47.8811111111),
-    "OITR": (37.6680555556, 45.0686111111),
-    "OITT": (38.1327777778, 46.2347222222),
-    "OITZ": (36.7741666667, 48.3597222222),
-    "OIYY": (31.9047222222, 54.2763888889),
-    "OIZB": (31.0969444444, 61.5438888889),
-    "OIZC": (25.4433333333, 60.3819444444),
-    "OIZH": (29.4761111111, 60.9058333333),
-    "OIZI": (27.2363888889, 60.72),
-    "OIZJ": (25.6533333333, 57.7991666667),
-    "OJAI": (31.7225, 35.9930555556),
-    "OJAM": (31.9725, 35.9913888889),
-    "OJAQ": (29.6113888889, 35.0180555556),
-    "OJJR": (31.8647222222, 35.2191666667),
-    "OJMF": (32.3561111111, 36.2591666667),
-    "OKAJ": (28.9349166667, 47.7919722222),
-    "OKAS": (29.3466666667, 47.5205555556),
-    "OKBK": (29.2266666667, 47.98),
-    "OLBA": (33.8133333333, 35.4886111111),
-    "OLKA": (34.5891666667, 36.0111111111),
-    "OLRA": (33.8522222222, 35.9902777778),
-    "OMAA": (24.4327777778, 54.6511111111),
-    "OMAD": (24.4283333333, 54.4580555556),
-    "OMAH": (24.0736111111, 52.4633333333),
-    "OMAJ": (24.1872222222, 52.6138888889),
-    "OMAL": (24.2616666667, 55.6091666667),
-    "OMAM": (24.2480555556, 54.5475),
-    "OMAR": (24.7802777778, 52.5597222222),
-    "OMAS": (25.1461111111, 52.8736111111),
-    "OMAZ": (24.8613888889, 53.0777777778),
-    "OMDB": (25.2547222222, 55.3641666667),
-    "OMFJ": (25.1122222222, 56.3238888889),
-    "OMRK": (25.6133333333, 55.9386111111),
-    "OMSJ": (25.3283333333, 55.5169444444),
-    "OOKB": (26.1711111111, 56.2405555556),
-    "OOMA": (20.6752777778, 58.8902777778),
-    "OOMS": (23.5930555556, 58.2844444444),
-    "OOSA": (17.0386111111, 54.0911111111),
-    "OOSQ": (23.0666666667, 57.65),
-    "OOTH": (17.6658333333, 54.0244444444),
-    "OPAB": (34.15, 73.2166666667),
-    "OPBN": (32.9719444444, 70.5247222222),
-    "OPBW": (29.3469444444, 71.7113888889),
-    "OPCH": (35.8863888889, 71.8005555556),
-    "OPCL": (35.4269444444, 74.085),
-    "OPDB": (28.8747222222, 64.4044444444),
-    "OPDG": (29.9611111111, 70.4855555556),
-    "OPDI": (31.9091666667, 70.8963888889),
-    "OPFA": (31.365, 72.9952777778),
-    "OPGD": (25.2330555556, 62.3294444444),
-    "OPGT": (35.9186111111, 74.3336111111),
-    "OPJA": (28.2841666667, 68.4494444444),
-    "OPJI": (25.0677777778, 61.8052777778),
-    "OPKC": (24.9063888889, 67.1605555556),
-    "OPKD": (25.3180555556, 68.3661111111),
-    "OPKH": (27.7925, 66.6427777778),
-    "OPKN": (28.5944444444, 65.4247222222),
-    "OPKT": (33.5705555556, 71.4394444444),
-    "OPLA": (31.5213888889, 74.4033333333),
-    "OPLH": (31.4947222222, 74.3461111111),
-    "OPMA": (33.05, 73.6383333333),
-    "OPMF": (34.3383333333, 73.5083333333),
-    "OPMI": (32.5630555556, 71.5705555556),
-    "OPMJ": (27.335, 68.1427777778),
-    "OPMK": (25.6825, 69.0727777778),
-    "OPMN": (33.0125, 70.0641666667),
-    "OPMP": (25.6836111111, 69.0333333333),
-    "OPMR": (24.8933333333, 66.9386111111),
-    "OPMS": (33.8688888889, 72.4008333333),
-    "OPMT": (30.2030555556, 71.4188888889),
-    "OPNH": (26.2191666667, 68.39),
-    "OPNK": (29.5377777778, 66.0222222222),
-    "OPOK": (30.7408333333, 73.3575),
-    "OPOR": (25.2730555556, 64.5883333333),
-    "OPPC": (33.9025, 70.0713888889),
-    "OPPG": (26.9544444444, 64.1325),
-    "OPPI": (25.2836111111, 63.3327777778),
-    "OPPS": (33.9938888889, 71.5144444444),
-    "OPQS": (33.5611111111, 73.0319444444),
-    "OPQT": (30.2511111111, 66.9375),
-    "OPRK": (28.3852777778, 70.2797222222),
-    "OPRN": (33.6163888889, 73.0991666667),
-    "OPRQ": (30.7580555556, 72.2825),
-    "OPRS": (34.0811111111, 71.9725),
-    "OPRT": (33.8491666667, 73.7977777778),
-    "OPSB": (29.5744444444, 67.8430555556),
-    "OPSD": (35.3347222222, 75.5363888889),
-    "OPSK": (27.7219444444, 68.7916666667),
-    "OPSN": (26.4730555556, 67.7172222222),
-    "OPSR": (32.0486111111, 72.665),
-    "OPSS": (34.8130555556, 72.3519444444),
-    "OPST": (32.5355555556, 74.3638888889),
-    "OPSU": (28.645, 69.1766666667),
-    "OPSW": (31.8894444444, 72.3091666667),
-    "OPTA": (33.9861111111, 72.6113888889),
-    "OPTH": (24.8413888889, 68.8383333333),
-    "OPTU": (25.9861111111, 63.03),
-    "OPWN": (32.3052777778, 69.5694444444),
-    "OPZB": (31.3583333333, 69.4633333333),
-    "ORAT": (33.3394444444, 43.59),
-    "ORBI": (33.2625, 44.2344444444),
-    "ORBM": (36.3058333333, 43.1475),
-    "ORBS": (33.2619444444, 44.2338888889),
-    "ORER": (36.2375, 43.9630555556),
-    "ORMM": (30.5486111111, 47.6622222222),
-    "ORSU": (35.5608333333, 45.3144444444),
-    "ORTL": (30.9357583333, 46.0901111111),
-    "OSAP": (36.1805555556, 37.2241666667),
-    "OSDI": (33.4113888889, 36.5155555556),
-    "OSDZ": (35.2852777778, 40.1758333333),
-    "OSKL": (37.0236111111, 41.1944444444),
-    "OSLK": (35.4008333333, 35.9486111111),
-    "OSPR": (34.5572222222, 38.3166666667),
-    "OTBD": (25.2611111111, 51.565),
-    "OTBH": (25.1172222222, 51.3147222222),
-    "OTHH": (25.2730555556, 51.6080555556),
-    "OYAA": (12.8294444444, 45.0288888889),
-    "OYAT": (14.5511111111, 46.8261111111),
-    "OYBN": (14.7819444444, 45.72),
-    "OYGD": (16.1933611111, 52.1741944444),
-    "OYHD": (14.753, 42.9763361111),
-    "OYRN": (14.6625, 49.375),
-    "OYSN": (15.4763888889, 44.2197222222),
-    "OYSY": (15.9661111111, 48.7880555556),
-    "OYTZ": (13.6858333333, 44.1391666667),
-    "PAAK": (52.2205555556, -174.206111111),
-    "PAAL": (56.0061111111, -160.560833333),
-    "PAAM": (53.9711111111, -166.877222222),
-    "PAAN": (64.1980555556, -147.928611111),
-    "PAAP": (56.2469444444, -134.648055556),
-    "PAAQ": (61.5947222222, -149.088611111),
-    "PABA": (70.1338888889, -143.576944444),
-    "PABE": (60.7797222222, -161.837777778),
-    "PABG": (61.1730555556, -151.045277778),
-    "PABI": (63.9944444444, -145.721388889),
-    "PABL": (65.9816666667, -161.149166667),
-    "PABM": (59.3616666667, -155.257222222),
-    "PABN": (62.4019444444, -142.995555556),
-    "PABR": (71.2852777778, -156.765833333),
-    "PABT": (66.9152777778, -151.528055556),
-    "PABV": (61.4161111111, -149.508333333),
-    "PACD": (55.2055555556, -162.724166667),
-    "PACE": (65.5738888889, -144.780833333),
-    "PACH": (61.5791666667, -159.215555556),
-    "PACI": (66.645, -143.74),
-    "PACK": (60.1491666667, -164.285555556),
-    "PACL": (64.3011111111, -149.12),
-    "PACM": (61.8452777778, -165.571388889),
-    "PACR": (65.8277777778, -144.076111111),
-    "PACS": (54.5825, -164.914444444),
-    "PACV": (60.4916666667, -145.4775),
-    "PACX": (67.2522222222, -150.203888889),
-    "PACY": (60.0819444444, -142.493611111),
-    "PACZ": (61.7802777778, -166.038611111),
-    "PADE": (66.0694444444, -162.766388889),
-    "PADG": (68.0322222222, -162.899166667),
-    "PADK": (51.8777777778, -176.645833333),
-    "PADL": (59.0452777778, -158.503333333),
-    "PADM": (61.8641666667, -162.026111111),
-    "PADQ": (57.75, -152.493611111),
-    "PADU": (53.9, -166.543333333),
-    "PADY": (59.9608333333, -162.881111111),
-    "PAED": (61.2511111111, -149.806388889),
-    "PAEE": (60.2136111111, -162.043888889),
-    "PAEG": (64.7780555556, -141.149722222),
-    "PAEH": (58.6472222222, -162.060555556),
-    "PAEI": (64.6655555556, -147.101388889),
-    "PAEL": (58.1952777778, -136.3475),
-    "PAEM": (62.7861111111, -164.490833333),
-    "PAEN": (60.5730555556, -151.245),
-    "PAEW": (60.9391666667, -164.641111111),
-    "PAFA": (64.815, -147.856111111),
-    "PAFB": (64.8375, -147.614444444),
-    "PAFE": (56.9613888889, -133.910277778),
-    "PAFM": (67.1066388889, -157.857111111),
-    "PAFR": (61.2661111111, -149.653055556),
-    "PAFS": (63.0186111111, -154.358333333),
-    "PAFV": (65.9269444444, -149.84),
-    "PAGA": (64.7361111111, -156.937222222),
-    "PAGB": (68.4797222222, -149.49),
-    "PAGG": (59.8763888889, -163.168611111),
-    "PAGH": (66.8880555556, -157.1625),
-    "PAGK": (62.1547222222, -145.456388889),
-    "PAGL": (64.5505555556, -163.007222222),
-    "PAGM": (63.7666666667, -171.732777778),
-    "PAGN": (57.5036111111, -134.585),
-    "PAGQ": (61.5361111111, -149.813888889),
-    "PAGS": (58.4252777778, -135.7075),
-    "PAGT": (60.4711111111, -164.700833333),
-    "PAGY": (59.46, -135.315555556),
-    "PAHC": (62.1883333333, -159.775),
-    "PAHL": (65.6977777778, -156.351388889),
-    "PAHN": (59.2438888889, -135.523611111),
-    "PAHO": (59.6455555556, -151.476388889),
-    "PAHP": (61.5238888889, -166.146666667),
-    "PAHU": (66.0391666667, -154.264722222),
-    "PAHV": (63.8675, -148.968888889),
-    "PAHX": (62.6922222222, -159.569166667),
-    "PAHY": (55.2063888889, -132.828333333),
-    "PAIG": (59.3241666667, -155.901666667),
-    "PAII": (58.1855555556, -157.375555556),
-    "PAIK": (66.9758333333, -160.436666667),
-    "PAIL": (59.7536111111, -154.910833333),
-    "PAIM": (65.9927777778, -153.704166667),
-    "PAIN": (63.7325, -148.910555556),
-    "PAIW": (65.6225, -168.095),
-    "PAJC": (56.3113888889, -158.373333333),
-    "PAJN": (58.3547222222, -134.576111111),
-    "PAJV": (61.7319444444, -148.926111111),
-    "PAJZ": (59.7266666667, -157.259444444),
-    "PAKD": (57.8058333333, -152.373888889),
-    "PAKF": (54.8475, -163.410277778),
-    "PAKH": (56.9386111111, -154.1825),
-    "PAKI": (59.9330555556, -164.030555556),
-    "PAKK": (64.9394444444, -161.154166667),
-    "PAKL": (58.9819444444, -155.121388889),
-    "PAKN": (58.6766666667, -156.649166667),
-    "PAKO": (52.9416666667, -168.848888889),
-    "PAKP": (68.1336111111, -151.743333333),
-    "PAKT": (55.3555555556, -131.713611111),
-    "PAKU": (70.3308333333, -149.5975),
-    "PAKV": (64.3188888889, -158.741388889),
-    "PAKW": (55.5791666667, -133.076111111),
-    "PAKY": (57.5661111111, -154.453888889),
-    "PALB": (57.535, -153.976666667),
-    "PALG": (61.5363888889, -160.341388889),
-    "PALH": (61.18, -149.971944444),
-    "PALJ": (60.2044444444, -154.318888889),
-    "PALN": (70.9108333333, -153.242222222),
-    "PALP": (70.3441666667, -150.944722222),
-    "PALR": (67.5044444444, -148.483055556),
-    "PALU": (68.875, -166.11),
-    "PAMB": (58.9902777778, -159.05),
-    "PAMC": (62.9527777778, -155.605555556),
-    "PAMD": (59.4497222222, -146.308611111),
-    "PAMH": (63.8861111111, -152.301944444),
-    "PAMK": (63.49, -162.110277778),
-    "PAML": (64.9975, -150.644166667),
-    "PAMM": (55.1311111111, -131.578055556),
-    "PAMO": (62.0952777778, -163.681944444),
-    "PAMR": (61.2141666667, -149.846111111),
-    "PAMX": (61.4369444444, -142.903611111),
-    "PAMY": (60.3713888889, -166.270555556),
-    "PANA": (60.6902777778, -161.978611111),
-    "PANC": (61.1741666667, -149.996111111),
-    "PANI": (61.5816666667, -159.543055556),
-    "PANN": (64.5472222222, -149.073888889),
-    "PANO": (59.9802777778, -154.839166667),
-    "PANR": (58.2544444444, -134.897777778),
-    "PANT": (55.0422222222, -131.572222222),
-    "PANU": (64.7294444444, -158.074166667),
-    "PANV": (62.6466666667, -160.190555556),
-    "PANW": (59.4516666667, -157.373055556),
-    "PAOB": (66.9122222222, -156.897222222),
-    "PAOC": (58.9063888889, -157.711111111),
-    "PAOH": (58.0961111111, -135.409722222),
-    "PAOM": (64.5119444444, -165.445),
-    "PAOO": (60.5413888889, -165.087222222),
-    "PAOR": (62.9611111111, -141.928888889),
-    "PAOT": (66.8844444444, -162.598333333),
-    "PAOU": (56.0075, -161.160277778),
-    "PAPB": (56.5783333333, -169.661388889),
-    "PAPC": (65.2536111111, -166.858611111),
-    "PAPE": (55.9066666667, -159.160833333),
-    "PAPG": (56.8013888889, -132.946111111),
-    "PAPH": (56.9591666667, -158.633333333),
-    "PAPK": (60.7027777778, -161.778333333),
-    "PAPM": (59.0111111111, -161.819444444),
-    "PAPN": (57.5802777778, -157.571944444),
-    "PAPO": (68.3488888889, -166.799444444),
-    "PAPR": (66.8141666667, -150.643611111),
-    "PAQC": (55.5547222222, -133.101666667),
-    "PAQH": (59.755, -161.845277778),
-    "PAQT": (70.21, -151.005555556),
-    "PARC": (68.1147222222, -145.579444444),
-    "PARS": (61.775, -161.319444444),
-    "PARY": (64.7272222222, -155.47),
-    "PASA": (63.6863888889, -170.4925),
-    "PASC": (70.1947222222, -148.465),
-    "PASD": (55.3136111111, -160.521388889),
-    "PASH": (66.2494444444, -166.089444444),
-    "PASI": (57.0469444444, -135.361388889),
-    "PASK": (66.6, -159.985833333),
-    "PASL": (61.7005555556, -157.165833333),
-    "PASM": (62.0608333333, -163.301944444),
-    "PASN": (57.1672222222, -170.220277778),
-    "PASO": (59.4425, -151.704166667),
-    "PAST": (63.3313888889, -149.127222222),
-    "PASV": (61.0972222222, -155.574166667),
-    "PASW": (61.9652777778, -151.191388889),
-    "PASX": (60.475, -151.038333333),
-    "PASY": (52.7122222222, 174.113611111),
-    "PATA": (65.1741666667, -152.109166667),
-    "PATC": (65.5630555556, -167.922222222),
-    "PATE": (65.2402777778, -166.339444444),
-    "PATG": (59.0536111111, -160.396944444),
-    "PATJ": (63.3033333333, -143.001111111),
-    "PATK": (62.3202777778, -150.093611111),
-    "PATL": (62.8941666667, -155.976388889),
-    "PATQ": (70.4672222222, -157.435555556),
-    "PATU": (52.8325, 173.175555556),
-    "PAUK": (62.68, -164.66),
-    "PAUN": (63.8883333333, -160.798888889),
-    "PAUO": (61.7541666667, -150.051666667),
-    "PAVA": (61.5408333333, -165.600833333),
-    "PAVC": (55.1163888889, -162.266111111),
-    "PAVD": (61.1338888889, -146.248333333),
-    "PAVE": (67.0086111111, -146.366388889),
-    "PAVL": (67.7361111111, -164.563611111),
-    "PAWB": (66.3622222222, -147.406666667),
-    "PAWD": (60.1269444444, -149.418888889),
-    "PAWG": (56.4844444444, -132.369722222),
-    "PAWI": (70.6380555556, -159.994722222),
-    "PAWM": (64.6891666667, -163.412777778),
-    "PAWN": (67.5611111111, -162.980277778),
-    "PAWR": (60.7741666667, -148.677777778),
-    "PAWS": (61.5719444444, -149.539444444),
-    "PAWT": (70.6133333333, -159.860277778),
-    "PAXK": (63.0244444444, -145.500555556),
-    "PAYA": (59.5030555556, -139.66),
-    "PCIS": (-2.76666666667, -0.0),
-    "PFAK": (60.9027777778, -161.230555556),
-    "PFAL": (66.5519444444, -152.622222222),
-    "PFCB": (60.0772222222, -147.991944444),
-    "PFCL": (58.8336111111, -158.529444444),
-    "PFEL": (64.615, -162.270555556),
-    "PFKA": (60.8733333333, -162.524444444),
-    "PFKK": (59.4330555556, -154.8025),
-    "PFKO": (63.0305555556, -163.532777778),
-    "PFKT": (65.3313888889, -166.465833333),
-    "PFKU": (64.8758333333, -157.730555556),
-    "PFKW": (60.7902777778, -161.443611111),
-    "PFNO": (66.8175, -161.022222222),
-    "PFSH": (64.3711111111, -161.223888889),
-    "PFTO": (63.3294444444, -142.953611111),
-    "PFWS": (58.7022222222, -157.0025),
-    "PFYU": (66.5713888889, -145.250277778),
-    "PGRO": (14.1744444444, 145.243333333),
-    "PGSN": (15.1194444444, 145.729166667),
-    "PGTW": (13.5, 144.833333333),
-    "PGUA": (13.5838888889, 144.93),
-    "PGUM": (13.4838888889, 144.796944444),
-    "PGWT": (14.9977777778, 145.619166667),
-    "PHBK": (22.0216666667, -159.786666667),
-    "PHDH": (21.5791666667, -158.210277778),
-    "PHHF": (23.8697222222, -166.284722222),
-    "PHHI": (21.4833333333, -158.039444444),
-    "PHHN": (20.7955555556, -156.014166667),
-    "PHIK": (21.3186111111, -157.9225),
-    "PHJH": (20.9627777778, -156.674166667),
-    "PHJR": (21.3072222222, -158.070277778),
-    "PHKO": (19.7386111111, -156.045555556),
-    "PHLI": (21.9761111111, -159.338611111),
-    "PHLU": (21.2111111111, -156.973611111),
-    "PHMK": (21.1527777778, -157.096111111),
-    "PHMU": (20.0011111111, -155.668055556),
-    "PHNG": (21.4491666667, -157.767777778),
-    "PHNL": (21.3158333333, -157.926666667),
-    "PHNY": (20.7855555556, -156.951388889),
-    "PHOG": (20.8986111111, -156.430555556),
-    "PHSF": (19.76, -155.553611111),
-    "PHTO": (19.7202777778, -155.048611111),
-    "PHUP": (20.265, -155.859722222),
-    "PJON": (16.7286111111, -169.534166667),
-    "PKMA": (11.3408333333, 162.327777778),
-    "PKMJ": (7.06472222222, 171.271944444),
-    "PKRO": (9.39666666667, 167.470833333),
-    "PKWA": (8.72, 167.731388889),
-    "PLCH": (1.98611111111, -157.349722222),
-    "PLPA": (5.88333333333, -162.066666667),
-    "PMDY": (28.2013888889, -177.381388889),
-    "POLI": (70.4994444444, -149.879444444),
-    "PPIZ": (69.7327777778, -163.005277778),
-    "PTKK": (7.46166666667, 151.842777778),
-    "PTPN": (6.985, 158.208888889),
-    "PTRO": (7.3675, 134.543888889),
-    "PTSA": (5.35666666667, 162.958333333),
-    "PTYA": (9.49861111111, 138.082222222),
-    "PWAK": (19.2825, 166.636666667),
-    "RCBS": (24.4319444444, 118.359444444),
-    "RCCM": (23.2130555556, 119.4175),
-    "RCDC": (22.6722222222, 120.461666667),
-    "RCDI": (24.855, 121.2375),
-    "RCFG": (26.1597222222, 119.958333333),
-    "RCFN": (22.7566666667, 121.093333333),
-    "RCGI": (22.6744444444, 121.458333333),
-    "RCGM": (25.0555555556, 121.2425),
-    "RCKH": (22.5752777778, 120.350833333),
-    "RCKU": (23.4616666667, 120.392777778),
-    "RCKW": (22.0380555556, 120.730277778),
-    "RCLG": (24.1861111111, 120.653611111),
-    "RCLY": (22.0294444444, 121.527222222),
-    "RCMQ": (24.2644444444, 120.620555556),
-    "RCMT": (26.2238888889, 120.0025),
-    "RCNN": (22.9502777778, 120.205555556),
-    "RCPO": (24.8177777778, 120.939166667),
-    "RCQC": (23.5686111111, 119.628055556),
-    "RCQS": (22.7930555556, 121.181944444),
-    "RCRA": (22.7047222222, 120.280555556),
-    "RCSP": (10.3772222222, 114.366388889),
-    "RCSQ": (22.7, 120.482222222),
-    "RCSS": (25.0694444444, 121.551666667),
-    "RCTP": (25.08, 121.232222222),
-    "RCWA": (23.3708333333, 119.494444444),
-    "RCYU": (24.0230555556, 121.617777778),
-    "RJAA": (35.7647222222, 140.386388889),
-    "RJAF": (36.1666666667, 137.922777778),
-    "RJAH": (36.1808333333, 140.415277778),
-    "RJAK": (36.0347222222, 140.192777778),
-    "RJAM": (24.2894444444, 153.978888889),
-    "RJAN": (34.3694444444, 139.268611111),
-    "RJAW": (24.7838888889, 141.3225),
-    "RJAZ": (34.1894444444, 139.133611111),
-    "RJBB": (34.4341666667, 135.232777778),
-    "RJBD": (33.6622222222, 135.364444444),
-    "RJBE": (34.6327777778, 135.223888889),
-    "RJBH": (34.3669444444, 132.413888889),
-    "RJBK": (34.5908333333, 133.933055556),
-    "RJBT": (35.5127777778, 134.786944444),
-    "RJCA": (43.7944444444, 142.365),
-    "RJCB": (42.7333333333, 143.217222222),
-    "RJCC": (42.775, 141.692222222),
-    "RJCH": (41.77, 140.821944444),
-    "RJCJ": (42.7944444444, 141.666388889),
-    "RJCK": (43.0408333333, 144.193055556),
-    "RJCM": (43.8805555556, 144.163888889),
-    "RJCN": (43.5772222222, 144.959722222),
-    "RJCO": (43.1161111111, 141.38),
-    "RJCR": (45.455, 141.039166667),
-    "RJCT": (42.8902777778, 143.158333333),
-    "RJCW": (45.4038888889, 141.800833333),
-    "RJDA": (32.4822222222, 130.158888889),
-    "RJDB": (33.7488888889, 129.785277778),
-    "RJDC": (33.93, 131.278888889),
-    "RJDK": (33.0136111111, 129.1925),
-    "RJDM": (33.3252777778, 130.413611111),
-    "RJDO": (33.1908333333, 129.090277778),
-    "RJDT": (34.2847222222, 129.330277778),
-    "RJEB": (44.3038888889, 143.403888889),
-    "RJEC": (43.6708333333, 142.4475),
-    "RJEO": (42.0716666667, 139.432777778),
-    "RJER": (45.2419444444, 141.186388889),
-    "RJFA": (33.8830555556, 130.652777778),
-    "RJFC": (30.3855555556, 130.658888889),
-    "RJFE": (32.6661111111, 128.832777778),
-    "RJFF": (33.5863888889, 130.45),
-    "RJFG": (30.5466666667, 130.95),
-    "RJFK": (31.8033333333, 130.719166667),
-    "RJFM": (31.8769444444, 131.448333333),
-    "RJFN": (32.0836111111, 131.451666667),
-    "RJFO": (33.4794444444, 131.737222222),
-    "RJFR": (33.8361111111, 130.946944444),
-    "RJFS": (33.1497222222, 130.302222222),
-    "RJFT": (32.8372222222, 130.855),
-    "RJFU": (32.9225, 129.923333333),
-    "RJFY": (31.3675, 130.845277778),
-    "RJFZ": (33.6852777778, 131.040555556),
-    "RJGG": (34.8583333333, 136.805277778),
-    "RJKA": (28.4305555556, 129.7125),
-    "RJKB": (27.4252777778, 128.700833333),
-    "RJKI": (28.3213888889, 129.928055556),
-    "RJKN": (27.8361111111, 128.881111111),
-    "RJNA": (35.255, 136.924444444),
-    "RJNF": (36.1427777778, 136.223888889),
-    "RJNG": (35.3941666667, 136.869444444),
-    "RJNH": (34.75, 137.703055556),
-    "RJNK": (36.3936111111, 136.407777778),
-    "RJNN": (35.255, 136.924444444),
-    "RJNO": (36.1811111111, 133.324722222),
-    "RJNS": (34.7961111111, 138.189444444),
-    "RJNT": (36.6483333333, 137.187222222),
-    "RJNW": (37.2933333333, 136.962222222),
-    "RJNY": (34.8125, 138.297777778),
-    "RJOA": (34.4352777778, 132.921944444),
-    "RJOB": (34.7569444444, 133.855555556),
-    "RJOC": (35.4136111111, 132.89),
-    "RJOE": (34.5333333333, 136.672222222),
-    "RJOF": (34.0344444444, 131.549166667),
-    "RJOH": (35.4922222222, 133.236388889),
-    "RJOI": (34.1436111111, 132.235555556),
-    "RJOK": (33.5444444444, 133.671388889),
-    "RJOM": (33.8272222222, 132.699722222),
-    "RJOO": (34.7852777778, 135.438055556),
-    "RJOR": (35.53, 134.166388889),
-    "RJOS": (34.1327777778, 134.606388889),
-    "RJOT": (34.2138888889, 134.015555556),
-    "RJOW": (34.6763888889, 131.790277778),
-    "RJOY": (34.5961111111, 135.602777778),
-    "RJOZ": (34.0452777778, 131.051944444),
-    "RJSA": (40.7344444444, 140.690833333),
-    "RJSC": (38.4116666667, 140.371111111),
-    "RJSD": (38.0611111111, 138.414166667),
-    "RJSF": (37.2275, 140.428055556),
-    "RJSH": (40.5563888889, 141.466111111),
-    "RJSI": (39.4308333333, 141.135833333),
-    "RJSK": (39.6155555556, 140.218611111),
-    "RJSM": (40.7030555556, 141.368333333),
-    "RJSN": (37.9558333333, 139.111666667),
-    "RJSO": (41.2327777778, 141.132222222),
-    "RJSR": (40.1919444444, 140.371666667),
-    "RJSS": (38.1394444444, 140.916666667),
-    "RJST": (38.4047222222, 141.219444444),
-    "RJSU": (38.2355555556, 140.923055556),
-    "RJSY": (38.8116666667, 139.786944444),
-    "RJTA": (35.4544444444, 139.45),
-    "RJTC": (35.7108333333, 139.403055556),
-    "RJTE": (34.9869444444, 139.829166667),
-    "RJTF": (35.6716666667, 139.528055556),
-    "RJTH": (33.115, 139.785555556),
-    "RJTI": (35.6361111111, 139.839444444),
-    "RJTJ": (35.8413888889, 139.409722222),
-    "RJTK": (35.3980555556, 139.909722222),
-    "RJTL": (35.7988888889, 140.011111111),
-    "RJTO": (34.7844444444, 139.361388889),
-    "RJTQ": (34.0719444444, 139.559722222),
-    "RJTR": (35.5136111111, 139.393611111),
-    "RJTT": (35.5522222222, 139.779444444),
-    "RJTU": (36.5144444444, 139.870833333),
-    "RJTY": (35.7483333333, 139.348333333),
-    "RKJB": (34.9914055556, 126.382813889),
-    "RKJJ": (35.1255555556, 126.809722222),
-    "RKJK": (35.9036111111, 126.615833333),
-    "RKJM": (34.7588888889, 126.379722222),
-    "RKJU": (35.8783333333, 127.119444444),
-    "RKJY": (34.8397222222, 127.615277778),
-    "RKNC": (37.8836111111, 127.717777778),
-    "RKND": (38.1475, 128.600555556),
-    "RKNN": (37.7533333333, 128.943888889),
-    "RKNW": (37.4380555556, 127.960277778),
-    "RKNY": (38.0611111111, 128.668888889),
-    "RKPC": (33.5111111111, 126.492777778),
-    "RKPD": (33.3969444444, 126.712777778),
-    "RKPE": (35.1411111111, 128.695555556),
-    "RKPK": (35.1794444444, 128.938055556),
-    "RKPP": (35.1708333333, 129.128611111),
-    "RKPS": (35.0883333333, 128.070277778),
-    "RKPU": (35.5933333333, 129.351666667),
-    "RKSG": (36.9605555556, 127.033333333),
-    "RKSI": (37.4633333333, 126.44),
-    "RKSM": (37.4458333333, 127.113888889),
-    "RKSO": (37.0905555556, 127.029444444),
-    "RKSS": (37.5580555556, 126.790555556),
-    "RKSW": (37.2391666667, 127.006944444),
-    "RKTE": (36.5680555556, 127.5),
-    "RKTH": (35.9877777778, 129.420277778),
-    "RKTJ": (35.8563888889, 129.211388889),
-    "RKTN": (35.8938888889, 128.658611111),
-    "RKTU": (36.7163888889, 127.498888889),
-    "RKTY": (36.6316666667, 128.354722222),
-    "ROAH": (26.1955555556, 127.645833333),
-    "RODE": (26.7286111111, 127.761666667),
-    "RODN": (26.3555555556, 127.7675),
-    "ROIG": (24.3444444444, 124.186944444),
-    "ROKJ": (26.3633333333, 126.713611111),
-    "ROKR": (26.1683333333, 127.293333333),
-    "ROMD": (25.8463888889, 131.263333333),
-    "ROMY": (24.7827777778, 125.295),
-    "RORA": (26.5927777778, 127.240277778),
-    "RORE": (26.7225, 127.786944444),
-    "RORH": (24.0583333333, 123.803888889),
-    "RORK": (25.9477777778, 131.321388889),
-    "RORS": (24.8266666667, 125.144722222),
-    "RORT": (24.6538888889, 124.675277778),
-    "RORY": (27.0438888889, 128.401388889),
-    "ROTM": (26.2741666667, 127.756388889),
-    "ROYN": (24.4669444444, 122.977777778),
-    "RPAF": (14.5094444444, 121.018333333),
-    "RPBY": (10.0555555556, 124.435833333),
-    "RPCA": (11.81, 124.83),
-    "RPCU": (10.8580555556, 121.069444444),
-    "RPEN": (11.2025, 119.416111111),
-    "RPLB": (14.7944444444, 120.271388889),
-    "RPLC": (15.1858333333, 120.559722222),
-    "RPLI": (18.1780555556, 120.531666667),
-    "RPLL": (14.5086111111, 121.019444444),
-    "RPLN": (17.0644444444, 122.427222222),
-    "RPLO": (10.8580555556, 121.069444444),
-    "RPLP": (13.1569444444, 123.746111111),
-    "RPLQ": (15.2389638889, 120.367230556),
-    "RPLR": (15.8844444444, 120.601944444),
-    "RPLS": (14.4913166667, 120.893886111),
-    "RPLT": (20.7169444444, 121.816944444),
-    "RPLU": (13.8575, 120.108055556),
-    "RPLV": (15.4380555556, 121.091111111),
-    "RPLX": (14.3855555556, 120.573055556),
-    "RPMA": (6.36776944444, 124.752522222),
-    "RPMB": (6.10555555556, 125.236111111),
-    "RPMC": (7.16472222222, 124.210277778),
-    "RPMD": (7.12555555556, 125.645833333),
-    "RPME": (8.95138888889, 125.478055556),
-    "RPMF": (8.19777777778, 126.324444444),
-    "RPMG": (8.60138888889, 123.334444444),
-    "RPMH": (9.25361111111, 124.706944444),
-    "RPMI": (8.130525, 124.214894444),
-    "RPMJ": (6.05361111111, 121.011111111),
-    "RPML": (8.41444444444, 124.611388889),
-    "RPMM": (7.61722222222, 124.058611111),
-    "RPMN": (5.04694444444, 119.742777778),
-    "RPMO": (8.178525, 123.841386111),
-    "RPMP": (7.82777777778, 123.460277778),
-    "RPMQ": (6.95027777778, 126.2725),
-    "RPMR": (6.05805555556, 125.096111111),
-    "RPMS": (9.75777777778, 125.480833333),
-    "RPMT": (8.36155277778, 124.833325),
-    "RPMV": (7.78613888889, 122.601138889),
-    "RPMW": (9.07211111111, 126.171444444),
-    "RPMY": (8.14055555556, 125.119166667),
-    "RPMZ": (6.92222222222, 122.059444444),
-    "RPNS": (9.85888888889, 126.013888889),
-    "RPPA": (17.0644444444, 122.427222222),
-    "RPPN": (11.05, 114.283333333),
-    "RPSB": (11.1622222222, 123.784444444),
-    "RPSI": (9.85888888889, 126.013888889),
-    "RPSM": (10.1870722222, 124.783411111),
-    "RPSN": (10.0555555556, 124.435833333),
-    "RPUB": (16.375, 120.618888889),
-    "RPUD": (14.1291666667, 122.980277778),
-    "RPUF": (14.9863888889, 120.4925),
-    "RPUG": (16.0347222222, 120.240833333),
-    "RPUH": (12.3613888889, 121.046388889),
-    "RPUI": (15.3255555556, 119.968888889),
-    "RPUJ": (14.9333333333, 120.2),
-    "RPUL": (13.955, 121.124722222),
-    "RPUM": (13.2080555556, 120.605277778),
-    "RPUN": (13.5852777778, 123.270833333),
-    "RPUO": (20.4516666667, 121.98),
-    "RPUP": (14.2927777778, 122.645555556),
-    "RPUQ": (17.5536111111, 120.3575),
-    "RPUR": (15.7303055556, 121.501583333),
-    "RPUS": (16.5955555556, 120.303055556),
-    "RPUT": (17.6380555556, 121.730555556),
-    "RPUV": (13.5775, 124.206111111),
-    "RPUW": (13.3611111111, 121.825277778),
-    "RPUX": (14.8906666667, 120.852722222),
-    "RPUY": (16.9297222222, 121.753333333),
-    "RPUZ": (16.6188888889, 121.252222222),
-    "RPVA": (11.2272222222, 125.027777778),
-    "RPVB": (10.6425, 122.929444444),
-    "RPVC": (12.0725, 124.545),
-    "RPVD": (9.33416666667, 123.301944444),
-    "RPVE": (11.9247222222, 121.955),
-    "RPVF": (12.5022222222, 124.635555556),
-    "RPVG": (11.0355555556, 125.742777778),
-    "RPVH": (10.3766666667, 124.761111111),
-    "RPVI": (10.7130555556, 122.545),
-    "RPVJ": (12.3694444444, 123.629166667),
-    "RPVK": (11.6811111111, 122.377777778),
-    "RPVM": (10.3075, 123.979166667),
-    "RPVO": (11.0558333333, 124.565555556),
-    "RPVP": (9.74194444444, 118.758611111),
-    "RPVR": (11.5975, 122.752777778),
-    "RPVS": (10.7661111111, 121.932222222),
-    "RPVT": (9.66408055556, 123.853247222),
-    "RPVU": (12.3108333333, 122.084444444),
-    "RPVV": (12.1213888889, 120.1),
-    "RPVW": (11.6741666667, 125.478611111),
-    "RPVY": (11.81, 124.83),
-    "RPWA": (6.36776944444, 124.752522222),
-    "RPWC": (7.16527777778, 124.209722222),
-    "RPWD": (7.12555555556, 125.645833333),
-    "RPWE": (8.95138888889, 125.478055556),
-    "RPWG": (8.60138888889, 123.334444444),
-    "RPWI": (8.178525, 123.841386111),
-    "RPWJ": (6.05361111111, 121.011111111),
-    "RPWL": (8.41555555556, 124.611111111),
-    "RPWM": (7.61666666667, 124.0575),
-    "RPWN": (5.04694444444, 119.742777778),
-    "RPWP": (7.82722222222, 123.458333333),
-    "RPWS": (9.7575, 125.479444444),
-    "RPWT": (8.36155277778, 124.833325),
-    "RPWW": (9.07211111111, 126.171444444),
-    "RPWX": (8.130525, 124.214894444),
-    "RPWY": (8.14055555556, 125.119166667),
-    "RPWZ": (8.19777777778, 126.324444444),
-    "RPXC": (15.2389638889, 120.367230556),
-    "RPXG": (13.8575, 120.108055556),
-    "RPXI": (20.7169444444, 121.816944444),
-    "RPXM": (15.4380555556, 121.091111111),
-    "RPXP": (16.6205555556, 120.280555556),
-    "RPXR": (14.3855555556, 120.573055556),
-    "SAAC": (-31.2969444444, -57.9963888889),
-    "SAAG": (-33.0058333333, -58.6130555556),
-    "SAAI": (-35.3477777778, -57.2938888889),
-    "SAAJ": (-34.5458333333, -60.9305555556),
-    "SAAK": (-34.1819444444, -58.2469444444),
-    "SAAP": (-31.7947222222, -60.4802777778),
-    "SAAR": (-32.9033333333, -60.7844444444),
-    "SAAV": (-31.7116666667, -60.8116666667),
-    "SABA": (-34.8222222222, -58.5358333333),
-    "SABE": (-34.5591666667, -58.4155555556),
-    "SACA": (-31.4419444444, -64.2583333333),
-    "SACC": (-31.0066666667, -64.5325),
-    "SACO": (-31.3236111111, -64.2077777778),
-    "SACP": (-31.3557777778, -66.5908888889),
-    "SACT": (-30.3452777778, -66.2936111111),
-    "SADD": (-34.5005555556, -58.6041666667),
-    "SADF": (-34.4530555556, -58.5894444444),
-    "SADJ": (-34.5605555556, -58.7894444444),
-    "SADL": (-34.9722222222, -57.8944444444),
-    "SADM": (-34.6761111111, -58.6425),
-    "SADO": (-34.5333333333, -58.7166666667),
-    "SADP": (-34.6097222222, -58.6125),
-    "SADS": (-34.7313888889, -58.5994444444),
-    "SAEZ": (-34.8222222222, -58.5358333333),
-    "SAHC": (-37.4444444444, -70.2222222222),
-    "SAHE": (-37.8512777778, -71.0094722222),
-    "SAHR": (-39.0005555556, -67.6202777778),
-    "SAHS": (-37.3905, -68.9042777778),
-    "SAHZ": (-38.9755555556, -70.1136111111),
-    "SAME": (-32.8316666667, -68.7927777778),
-    "SAMM": (-35.4838888889, -69.5825),
-    "SAMQ": (-32.8658333333, -68.8722222222),
-    "SAMR": (-34.5880555556, -68.4025),
-    "SANC": (-28.5955555556, -65.7516666667),
-    "SANE": (-27.7655555556, -64.31),
-    "SANH": (-27.6105555556, -64.9483333333),
-    "SANI": (-28.0375, -67.5802777778),
-    "SANL": (-29.3813888889, -66.7958333333),
-    "SANO": (-29.2238888889, -67.4388888889),
-    "SANT": (-26.8408333333, -65.1047222222),
-    "SANU": (-31.5713888889, -68.4180555556),
-    "SANW": (-29.8718888889, -61.9270277778),
-    "SAOC": (-33.0855555556, -64.2613888889),
-    "SAOD": (-31.9411111111, -65.1422222222),
-    "SAOL": (-34.1352777778, -63.3622222222),
-    "SAOM": (-32.6836111111, -62.1577777778),
-    "SAOR": (-33.7297222222, -65.3872222222),
-    "SAOU": (-33.2730555556, -66.3563888889),
-    "SARC": (-27.4452777778, -58.7616666667),
-    "SARE": (-27.4497222222, -59.0561111111),
-    "SARF": (-26.2125, -58.2280555556),
-    "SARI": (-25.7375, -54.4730555556),
-    "SARL": (-29.6891666667, -57.1519444444),
-    "SARM": (-30.2716666667, -57.64),
-    "SARP": (-27.3858333333, -55.9705555556),
-    "SARS": (-26.7563888889, -60.4930555556),
-    "SASA": (-24.8558333333, -65.4861111111),
-    "SASJ": (-24.3927777778, -65.0977777778),
-    "SASO": (-23.1527777778, -64.3291666667),
-    "SASQ": (-22.1622222222, -65.5697222222),
-    "SAST": (-22.6197222222, -63.7936111111),
-    "SATC": (-25.30475, -57.7348333333),
-    "SATG": (-29.1058333333, -59.2186111111),
-    "SATK": (-24.7211111111, -60.5486111111),
-    "SATM": (-29.2230555556, -58.0880555556),
-    "SATO": (-27.5180555556, -55.1238888889),
-    "SATR": (-29.21, -59.6908333333),
-    "SATU": (-29.7705555556, -57.9788888889),
-    "SAVB": (-41.9430555556, -71.5322222222),
-    "SAVC": (-45.785, -67.4655555556),
-    "SAVD": (-42.0305555556, -71.1697222222),
-    "SAVE": (-42.9077777778, -71.1394444444),
-    "SAVH": (-46.5383333333, -68.9658333333),
-    "SAVJ": (-41.3208333333, -69.575),
-    "SAVN": (-40.7513888889, -65.0344444444),
-    "SAVR": (-45.0134444444, -70.8128611111),
-    "SAVS": (-41.5911944444, -65.3397222222),
-    "SAVT": (-43.2102777778, -65.2702777778),
-    "SAVV": (-40.8691666667, -63.0002777778),
-    "SAVY": (-42.7588888889, -65.1025),
-    "SAWA": (-50.3352777778, -72.2483333333),
-    "SAWB": (-64.2383333333, -56.6308333333),
-    "SAWC": (-50.28025, -72.0531944444),
-    "SAWD": (-47.7352777778, -65.9038888889),
-    "SAWE": (-53.7775, -67.7491666667),
-    "SAWG": (-51.6086111111, -69.3125),
-    "SAWH": (-54.8430555556, -68.2955555556),
-    "SAWJ": (-49.3066666667, -67.8025),
-    "SAWM": (-45.7041388889, -70.2436388889),
-    "SAWP": (-46.5380555556, -70.9786111111),
-    "SAWR": (-48.7827777778, -70.1491666667),
-    "SAWS": (-44.0480555556, -70.4591666667),
-    "SAWT": (-51.6063888889, -72.2166666667),
-    "SAWU": (-50.0163888889, -68.5791666667),
-    "SAZA": (-36.8371666667, -59.8807222222),
-    "SAZB": (-38.7247222222, -62.1691666667),
-    "SAZC": (-37.4461111111, -61.8891666667),
-    "SAZD": (-36.3202777778, -57.7216666667),
-    "SAZF": (-36.8908333333, -60.2161111111),
-    "SAZG": (-35.6961111111, -63.7580555556),
-    "SAZH": (-38.3866666667, -60.3294444444),
-    "SAZI": (-36.1869444444, -61.0761111111),
-    "SAZL": (-36.5422222222, -56.7216666667),
-    "SAZM": (-37.9341666667, -57.5733333333),
-    "SAZN": (-38.9488888889, -68.1555555556),
-    "SAZO": (-38.4894444444, -58.8158333333),
-    "SAZP": (-35.8455555556, -61.8577777778),
-    "SAZR": (-36.5880555556, -64.2752777778),
-    "SAZS": (-41.1511111111, -71.1575),
-    "SAZT": (-37.2372222222, -59.2277777778),
-    "SAZV": (-37.2352777778, -57.0291666667),
-    "SAZW": (-38.9394444444, -69.2644444444),
-    "SAZY": (-40.0752777778, -71.1372222222),
-    "SBAA": (-8.34833333333, -49.3013888889),
-    "SBAF": (-22.875, -43.3844444444),
-    "SBAM": (2.07666666667, -50.8622222222),
-    "SBAQ": (-21.8119444444, -48.1327777778),
-    "SBAR": (-10.9838888889, -37.0702777778),
-    "SBAS": (-22.6383333333, -50.4558333333),
-    "SBAT": (-9.86583333333, -56.1061111111),
-    "SBAU": (-21.1411111111, -50.4247222222),
-    "SBAV": (-22.5255555556, -52.9719444444),
-    "SBBE": (-1.37916666667, -48.4761111111),
-    "SBBG": (-31.3902777778, -54.1122222222),
-    "SBBH": (-19.8516666667, -43.9502777778),
-    "SBBI": (-25.405, -49.2319444444),
-    "SBBP": (-22.9791666667, -46.5375),
-    "SBBQ": (-21.2669444444, -43.7608333333),
-    "SBBR": (-15.8625, -47.9125),
-    "SBBT": (-20.5855555556, -48.5958333333),
-    "SBBU": (-22.345, -49.0536111111),
-    "SBBV": (2.84611111111, -60.69),
-    "SBBW": (-15.8611111111, -52.3888888889),
-    "SBBZ": (-22.7661111111, -41.9655555556),
-    "SBCA": (-25.0002777778, -53.5005555556),
-    "SBCB": (-22.9208333333, -42.0713888889),
-    "SBCC": (-9.33388888889, -54.9652777778),
-    "SBCD": (-26.7897222222, -50.9394444444),
-    "SBCF": (-19.6336111111, -43.9686111111),
-    "SBCG": (-20.4686111111, -54.6725),
-    "SBCH": (-27.1341666667, -52.6563888889),
-    "SBCI": (-7.32027777778, -47.4586111111),
-    "SBCJ": (-6.11527777778, -50.0013888889),
-    "SBCM": (-28.7255555556, -49.4247222222),
-    "SBCO": (-29.9458333333, -51.1444444444),
-    "SBCP": (-21.6983333333, -41.3016666667),
-    "SBCR": (-19.0116666667, -57.6727777778),
-    "SBCT": (-25.5283333333, -49.1755555556),
-    "SBCV": (-17.6522222222, -39.2530555556),
-    "SBCX": (-29.1969444444, -51.1875),
-    "SBCY": (-15.6527777778, -56.1166666667),
-    "SBCZ": (-7.6, -72.7694444444),
-    "SBDN": (-22.175, -51.4244444444),
-    "SBEG": (-3.03861111111, -60.0497222222),
-    "SBEK": (-6.23305555556, -57.7766666667),
-    "SBES": (-22.8127777778, -42.0925),
-    "SBFC": (-20.5919444444, -47.3827777778),
-    "SBFI": (-25.5961111111, -54.4869444444),
-    "SBFL": (-27.6725, -48.5477777778),
-    "SBFN": (-3.85472222222, -32.4233333333),
-    "SBFT": (-20.2783333333, -49.1872222222),
-    "SBFU": (-20.7027777778, -46.335),
-    "SBFZ": (-3.77611111111, -38.5325),
-    "SBGL": (-22.8088888889, -43.2436111111),
-    "SBGM": (-10.7861111111, -65.2847222222),
-    "SBGO": (-16.6311111111, -49.2222222222),
-    "SBGP": (-21.7644444444, -48.4047222222),
-    "SBGR": (-23.4322222222, -46.4691666667),
-    "SBGS": (-25.1844444444, -50.1438888889),
-    "SBGW": (-22.7913888889, -45.2047222222),
-    "SBHT": (-3.25388888889, -52.2538888889),
-    "SBIC": (-3.12722222222, -58.4811111111),
-    "SBIH": (-4.24222222222, -56.0005555556),
-    "SBIL": (-14.8158333333, -39.0330555556),
-    "SBIP": (-19.4705555556, -42.4875),
-    "SBIT": (-18.4444444444, -49.2133333333),
-    "SBIZ": (-5.53111111111, -47.46),
-    "SBJC": (-1.41388888889, -48.4605555556),
-    "SBJD": (-23.1816666667, -46.9436111111),
-    "SBJF": (-21.7913888889, -43.3866666667),
-    "SBJP": (-7.26972222222, -35.8961111111),
-    "SBJR": (-22.9875, -43.37),
-    "SBJV": (-26.2247222222, -48.7972222222),
-    "SBKG": (-7.26916666667, -35.895),
-    "SBKP": (-23.0080555556, -47.1344444444),
-    "SBLB": (-7.25027777778, -64.7838888889),
-    "SBLJ": (-27.7819444444, -50.2813888889),
-    "SBLN": (-21.6638888889, -49.7302777778),
-    "SBLO": (-23.3336111111, -51.13),
-    "SBLP": (-13.2619444444, -43.4080555556),
-    "SBLS": (-19.6613888889, -43.8963888889),
-    "SBMA": (-5.36833333333, -49.1377777778),
-    "SBMC": (-13.5505555556, -48.2005555556),
-    "SBMD": (-0.889722222222, -52.6022222222),
-    "SBME": (-22.3458333333, -41.7638888889),
-    "SBMG": (-23.4397222222, -51.9069444444),
-    "SBMK": (-16.7066666667, -43.8188888889),
-    "SBML": (-22.1966666667, -49.9263888889),
-    "SBMN": (-3.14555555556, -59.9861111111),
-    "SBMO": (-9.51027777778, -35.7933333333),
-    "SBMQ": (0.0505555555556, -51.0719444444),
-    "SBMS": (-5.20166666667, -37.3641666667),
-    "SBMT": (-23.5088888889, -46.6375),
-    "SBMY": (-5.81138888889, -61.2786111111),
-    "SBNF": (-26.88, -48.6513888889),
-    "SBNM": (-28.2816666667, -54.1688888889),
-    "SBNT": (-5.91111111111, -35.2477777778),
-    "SBOI": (3.85527777778, -51.7966666667),
-    "SBOU": (-22.9736111111, -49.9113888889),
-    "SBPA": (-29.9941666667, -51.1713888889),
-    "SBPB": (-2.89361111111, -41.7319444444),
-    "SBPC": (-21.8427777778, -46.5677777778),
-    "SBPF": (-28.2438888889, -52.3263888889),
-    "SBPG": (-25.5405555556, -48.5311111111),
-    "SBPJ": (-10.29, -48.3577777778),
-    "SBPK": (-31.7183333333, -52.3275),
-    "SBPL": (-9.36388888889, -40.5638888889),
-    "SBPN": (-10.7191666667, -48.3997222222),
-    "SBPP": (-22.5494444444, -55.7025),
-    "SBPR": (-19.9091666667, -43.9891666667),
-    "SBPS": (-16.4380555556, -39.0777777778),
-    "SBPV": (-8.70916666667, -63.9022222222),
-    "SBQV": (-14.8625, -40.8630555556),
-    "SBRB": (-9.86888888889, -67.8936111111),
-    "SBRF": (-8.12638888889, -34.9233333333),
-    "SBRG": (-32.0825, -52.1663888889),
-    "SBRJ": (-22.9102777778, -43.1630555556),
-    "SBRP": (-21.1341666667, -47.7741666667),
-    "SBRR": (-2.75638888889, -42.8058333333),
-    "SBSC": (-22.9322222222, -43.7188888889),
-    "SBSJ": (-23.2291666667, -45.8613888889),
-    "SBSL": (-2.58861111111, -44.2363888889),
-    "SBSM": (-29.7111111111, -53.6880555556),
-    "SBSN": (-2.42472222222, -54.7858333333),
-    "SBSP": (-23.6266666667, -46.6552777778),
-    "SBSR": (-20.8163888889, -49.4063888889),
-    "SBST": (-23.925, -46.2875),
-    "SBSV": (-12.9108333333, -38.3308333333),
-    "SBTB": (-1.48944444444, -56.3966666667),
-    "SBTE": (-5.05972222222, -42.8233333333),
-    "SBTF": (-3.38277777778, -64.7238888889),
-    "SBTK": (-8.155, -70.7830555556),
-    "SBTL": (-24.3175, -50.6513888889),
-    "SBTS": (2.22333333333, -55.9458333333),
-    "SBTT": (-4.25555555556, -69.9355555556),
-    "SBTU": (-3.785, -49.7194444444),
-    "SBUA": (-0.148333333333, -66.9855555556),
-    "SBUF": (-9.40083333333, -38.2505555556),
-    "SBUG": (-29.7819444444, -57.0380555556),
-    "SBUL": (-18.8827777778, -48.2255555556),
-    "SBUP": (-20.7769444444, -51.5647222222),
-    "SBUR": (-19.765, -47.9647222222),
-    "SBVG": (-21.59, -45.4733333333),
-    "SBVH": (-12.6941666667, -60.0980555556),
-    "SBVT": (-20.2555555556, -40.2888888889),
-    "SBWX": (-2.42472222222, -54.7858333333),
-    "SBYA": (0.6075, -69.1858333333),
-    "SBYS": (-21.9852777778, -47.3380555556),
-    "SBZM": (-21.5130555556, -43.1730555556),
-    "SCAC": (-41.9061111111, -73.7966666667),
-    "SCAP": (-43.6152777778, -71.8069444444),
-    "SCAR": (-18.3483333333, -70.3386111111),
-    "SCBA": (-45.9158333333, -71.6891666667),
-    "SCBE": (-22.1407222222, -70.0626111111),
-    "SCBQ": (-33.5616666667, -70.6883333333),
-    "SCCC": (-46.5816666667, -71.6975),
-    "SCCF": (-22.4986111111, -68.9041666667),
-    "SCCH": (-36.5827777778, -72.0316666667),
-    "SCCI": (-53.0027777778, -70.8547222222),
-    "SCCY": (-45.5941666667, -72.1061111111),
-    "SCDA": (-20.535, -70.1811111111),
-    "SCEL": (-33.3927777778, -70.7855555556),
-    "SCER": (-32.7941388889, -71.5205277778),
-    "SCES": (-26.3111111111, -69.7652777778),
-    "SCFA": (-23.4444444444, -70.445),
-    "SCFM": (-53.2536111111, -70.3191666667),
-    "SCGE": (-37.4016666667, -72.4255555556),
-    "SCGZ": (-54.9308333333, -67.6261111111),
-    "SCHA": (-27.2961111111, -70.4136111111),
-    "SCHR": (-47.2437222222, -72.5876944444),
-    "SCIC": (-34.9669444444, -71.2169444444),
-    "SCIE": (-36.7725, -73.0630555556),
-    "SCIP": (-27.1647222222, -109.421666667),
-    "SCJO": (-40.6113888889, -73.0602777778),
-    "SCLL": (-28.5975, -70.7591666667),
-    "SCNT": (-51.6707222222, -72.5284444444),
-    "SCPC": (-39.2913888889, -71.9208333333),
-    "SCPQ": (-42.3403888889, -73.7156666667),
-    "SCRG": (-34.1736111111, -70.7755555556),
-    "SCRM": (-62.1908333333, -58.9866666667),
-    "SCSE": (-29.9163888889, -71.1911111111),
-    "SCSN": (-33.6566666667, -71.6155555556),
-    "SCST": (-42.4908333333, -73.7744444444),
-    "SCTB": (-33.4563888889, -70.5466666667),
-    "SCTC": (-38.7686111111, -72.6358333333),
-    "SCTE": (-41.4386111111, -73.0938888889),
-    "SCTI": (-33.4933333333, -70.6975),
-    "SCTL": (-35.3776944444, -71.6015277778),
-    "SCTN": (-42.9330555556, -72.6991666667),
-    "SCTO": (-38.2455555556, -72.3486111111),
-    "SCTT": (-25.5638888889, -70.3759444444),
-    "SCVD": (-39.6497222222, -73.0861111111),
-    "SCVL": (-39.7958333333, -73.2413888889),
-    "SCVM": (-32.9497222222, -71.4786111111),
-    "SDAE": (-22.5836111111, -47.8961111111),
-    "SDAM": (-22.8591666667, -47.1080555556),
-    "SDCO": (-23.4830555556, -47.4863888889),
-    "SDMC": (-22.9180555556, -42.8288888889),
-    "SDOW": (-6.77583333333, -51.06),
-    "SDRR": (-23.0930555556, -48.9841666667),
-    "SDRS": (-22.4786111111, -44.4816666667),
-    "SDSC": (-21.8763888889, -47.9033333333),
-    "SEAM": (-1.2125, -78.5741666667),
-    "SECM": (-1.70611111111, -79.3788888889),
-    "SECO": (-0.462777777778, -76.9863888889),
-    "SECU": (-2.88944444444, -78.9841666667),
-    "SEGS": (-0.453611111111, -90.2658333333),
-    "SEGU": (-2.15777777778, -79.8838888889),
-    "SEGZ": (-3.42333333333, -78.5730555556),
-    "SEIB": (0.338333333333, -78.1363888889),
-    "SELA": (0.0922222222222, -76.8691666667),
-    "SELJ": (-1.70416666667, -79.5522222222),
-    "SELM": (-1.50138888889, -79.4808333333),
-    "SELO": (-3.99583333333, -79.3719444444),
-    "SELT": (-0.906666666667, -78.6155555556),
-    "SEMA": (-4.38027777778, -79.9405555556),
-    "SEMC": (-2.29916666667, -78.1205555556),
-    "SEMH": (-3.26888888889, -79.9616666667),
-    "SEMO": (-2.06694444444, -76.9752777778),
-    "SEMT": (-0.945555555556, -80.6780555556),
-    "SEMX": (-2.85083333333, -79.8036111111),
-    "SEMY": (-1.73972222222, -79.6216666667),
-    "SENL": (0.0847222222222, -76.8827777778),
-    "SEPD": (0.0730555555556, -80.0522222222),
-    "SEPV": (-1.04138888889, -80.4719444444),
-    "SEQM": (-0.113333333333, -78.3586111111),
-    "SEQU": (-0.141111111111, -78.4880555556),
-    "SERB": (-1.65361111111, -78.6561111111),
-    "SERO": (-3.43527777778, -79.9777777778),
-    "SESA": (-2.20472222222, -80.9886111111),
-    "SESD": (-0.248055555556, -79.2144444444),
-    "SESM": (-1.50527777778, -78.0627777778),
-    "SEST": (-0.909722222222, -89.6158333333),
-    "SETA": (-2.26083333333, -79.6891666667),
-    "SETE": (-0.986666666667, -77.8194444444),
-    "SETN": (0.978611111111, -79.6266666667),
-    "SETR": (-0.122777777778, -76.3375),
-    "SETU": (0.809444444444, -77.7080555556),
-    "SFAL": (-51.6855555556, -57.7775),
-    "SGAS": (-25.2397222222, -57.5188888889),
-    "SGAY": (-27.3705555556, -56.8538888889),
-    "SGCO": (-23.4416666667, -57.4269444444),
-    "SGES": (-25.4552777778, -54.8433333333),
-    "SGFI": (-22.3597222222, -60.0536111111),
-    "SGIB": (-25.4075, -54.6194444444),
-    "SGME": (-22.0447222222, -60.6216666667),
-    "SGPI": (-26.8813888889, -58.3177777778),
-    "SIMK": (-20.5902777778, -47.3825),
-    "SJDB": (-21.2294444444, -56.4561111111),
-    "SJTC": (-22.1577777778, -49.0683333333),
-    "SKAC": (-0.601111111111, -72.3977777778),
-    "SKAD": (8.51666666667, -77.3),
-    "SKAM": (40.62, 14.9125),
-    "SKAP": (4.07583333333, -73.5625),
-    "SKAR": (4.45361111111, -75.7652777778),
-    "SKAS": (0.505, -76.5008333333),
-    "SKBC": (9.04527777778, -73.9747222222),
-    "SKBG": (7.12638888889, -73.1847222222),
-    "SKBO": (4.70138888889, -74.1469444444),
-    "SKBQ": (10.8894444444, -74.7805555556),
-    "SKBS": (6.20277777778, -77.3944444444),
-    "SKBU": (3.81944444444, -76.9897222222),
-    "SKCC": (7.9275, -72.5113888889),
-    "SKCD": (5.07166666667, -76.6763888889),
-    "SKCG": (10.4422222222, -75.5127777778),
-    "SKCL": (3.54305555556, -76.3813888889),
-    "SKCO": (1.81416666667, -78.7491666667),
-    "SKCU": (7.96833333333, -75.1983333333),
-    "SKCZ": (9.3325, -75.2855555556),
-    "SKEB": (7.59638888889, -74.8088888889),
-    "SKEJ": (7.02416666667, -73.8066666667),
-    "SKFL": (1.59027777778, -75.5638888889),
-    "SKGI": (4.27611111111, -74.7966666667),
-    "SKGO": (4.75805555556, -75.9555555556),
-    "SKGP": (2.57, -77.8983333333),
-    "SKGY": (4.81222222222, -74.0647222222),
-    "SKIB": (4.42138888889, -75.1330555556),
-    "SKIP": (0.861666666667, -77.6716666667),
-    "SKLC": (7.81194444444, -76.7163888889),
-    "SKLG": (-0.182222222222, -74.7705555556),
-    "SKLM": (11.2325, -72.49),
-    "SKLP": (-1.32861111111, -69.5794444444),
-    "SKLT": (-4.19305555556, -69.9425),
-    "SKMD": (6.22, -75.5905555556),
-    "SKMG": (9.28333333333, -74.8394444444),
-    "SKMR": (8.82361111111, -75.8258333333),
-    "SKMU": (1.25361111111, -70.2336111111),
-    "SKMZ": (5.02972222222, -75.465),
-    "SKNQ": (5.7, -77.2833333333),
-    "SKNV": (2.95, -75.2938888889),
-    "SKOC": (8.31472222222, -73.3583333333),
-    "SKOE": (4.78972222222, -71.3483333333),
-    "SKOT": (7.01027777778, -74.7152777778),
-    "SKPB": (12.2213888889, -71.9847222222),
-    "SKPC": (6.18444444444, -67.4930555556),
-    "SKPD": (3.85361111111, -67.9061111111),
-    "SKPE": (4.8125, -75.7394444444),
-    "SKPI": (1.85833333333, -76.0858333333),
-    "SKPP": (2.45416666667, -76.61),
-    "SKPQ": (5.48361111111, -74.6572222222),
-    "SKPS": (1.39638888889, -77.2908333333),
-    "SKPV": (13.3569444444, -81.3583333333),
-    "SKQU": (5.2125, -74.8836111111),
-    "SKRG": (6.16444444444, -75.4230555556),
-    "SKRH": (11.5261111111, -72.9258333333),
-    "SKSA": (6.95805555556, -71.855),
-    "SKSJ": (2.57944444444, -72.6391666667),
-    "SKSM": (11.1194444444, -74.2305555556),
-    "SKSP": (12.5833333333, -81.7111111111),
-    "SKSR": (29.8927777778, -97.8630555556),
-    "SKSV": (2.15194444444, -74.7661111111),
-    "SKTD": (5.43027777778, -71.6580555556),
-    "SKTJ": (12.5836111111, -81.7111111111),
-    "SKTM": (6.45083333333, -71.76),
-    "SKTQ": (0.745833333333, -75.2338888889),
-    "SKTU": (8.07444444444, -76.7411111111),
-    "SKUA": (5.52444444444, -68.6855555556),
-    "SKUC": (7.06861111111, -70.7366666667),
-    "SKUI": (5.69055555556, -76.6411111111),
-    "SKUL": (4.08833333333, -76.235),
-    "SKVG": (0.978888888889, -76.6055555556),
-    "SKVP": (10.435, -73.2494444444),
-    "SKVV": (4.16777777778, -73.6136111111),
-    "SKYP": (5.31888888889, -72.3838888889),
-    "SLAP": (-14.7394444444, -68.4108333333),
-    "SLAS": (-15.7191666667, -63.0922222222),
-    "SLBJ": (-22.7694444444, -64.315),
-    "SLBN": (-13.62675, -65.2738333333),
-    "SLCA": (-20.0069444444, -63.5275),
-    "SLCB": (-17.4208333333, -66.1769444444),
-    "SLCH": (-16.99, -65.1413888889),
-    "SLCN": (-17.5938888889, -69.4341666667),
-    "SLCO": (-11.0402777778, -68.7827777778),
-    "SLCP": (-16.1433333333, -62.0258333333),
-    "SLET": (-17.8113888889, -63.1713888889),
-    "SLGY": (-10.8216666667, -65.3458333333),
-    "SLJO": (-13.0527777778, -64.6616666667),
-    "SLJV": (-16.26475, -62.4704166667),
-    "SLLP": (-16.5130555556, -68.1922222222),
-    "SLMG": (-13.2536111111, -64.0627777778),
-    "SLOR": (-17.9633333333, -67.0761111111),
-    "SLPO": (-19.5433333333, -65.7238888889),
-    "SLPR": (-11.1071666667, -67.5471666667),
-    "SLPS": (-18.9752777778, -57.8205555556),
-    "SLRA": (-13.2636111111, -64.6052777778),
-    "SLRB": (-18.3280555556, -59.7661111111),
-    "SLRI": (-11.0102777778, -66.0733333333),
-    "SLRQ": (-14.4283333333, -67.5013888889),
-    "SLRY": (-14.3061111111, -67.3536111111),
-    "SLSA": (-13.7619444444, -65.435),
-    "SLSB": (-14.8575, -66.7375),
-    "SLSI": (-16.3844444444, -60.9627777778),
-    "SLSM": (-14.9655555556, -65.6336111111),
-    "SLSU": (-19.0069444444, -65.2888888889),
-    "SLTI": (-16.3386111111, -58.4016666667),
-    "SLTJ": (-21.5555555556, -64.7008333333),
-    "SLTR": (-14.8194444444, -64.9183333333),
-    "SLVM": (-21.255, -63.4055555556),
-    "SLVR": (-17.6447222222, -63.1352777778),
-    "SLYA": (-21.9608333333, -63.6516666667),
-    "SMAF": (4.99833333333, -54.9919444444),
-    "SMAM": (3.55, -57.6333333333),
-    "SMAN": (3.65805555556, -54.0361111111),
-    "SMBG": (4.46666666667, -56.4833333333),
-    "SMBN": (5.51666666667, -54.05),
-    "SMBO": (4.2175, -55.4469444444),
-    "SMCA": (3.89861111111, -55.5777777778),
-    "SMCB": (4.85, -55.5833333333),
-    "SMCI": (3.36666666667, -57.3333333333),
-    "SMCO": (5.86583333333, -56.3275),
-    "SMDA": (4.11666666667, -54.6666666667),
-    "SMDJ": (4.00583333333, -55.4816666667),
-    "SMDO": (4.37527777778, -55.4075),
-    "SMDU": (2.52333333333, -56.3241666667),
-    "SMGH": (4.0575, -54.7861111111),
-    "SMJK": (4.93583333333, -55.535),
-    "SMJP": (5.45277777778, -55.1877777778),
-    "SMKA": (4.4, -57.2166666667),
-    "SMKE": (3.6, -56.2858333333),
-    "SMLA": (3.41666666667, -54.0333333333),
-    "SMLT": (4.99611111111, -54.4416666667),
-    "SMMO": (5.6075, -54.4002777778),
-    "SMNI": (5.95555555556, -57.0394444444),
-    "SMPA": (3.34611111111, -55.4416666667),
-    "SMPE": (4.12583333333, -54.6227777778),
-    "SMPG": (4.3975, -55.7930555556),
-    "SMPT": (3.50166666667, -55.0613888889),
-    "SMSI": (1.96611111111, -56.0036111111),
-    "SMSM": (2.33333333333, -56.7833333333),
-    "SMST": (4.35, -54.4166666667),
-    "SMTA": (3.67888888889, -54.0852777778),
-    "SMTB": (3.78333333333, -56.15),
-    "SMTP": (3.15, -55.7166666667),
-    "SMWA": (5.76666666667, -56.6333333333),
-    "SMWS": (5.25027777778, -57.1738888889),
-    "SMZO": (5.81083333333, -55.1905555556),
-    "SNBR": (-12.0791666667, -45.0094444444),
-    "SNFX": (-6.64027777778, -51.99),
-    "SNGI": (-14.2069444444, -42.7511111111),
-    "SNVB": (-13.2963888889, -38.9925),
-    "SOCA": (4.81972222222, -52.3602777778),
-    "SOGS": (4.28333333333, -54.3811111111),
-    "SOOA": (3.6575, -54.0372222222),
-    "SOOG": (3.8975, -51.8038888889),
-    "SOOM": (5.48305555556, -54.0344444444),
-    "SOOR": (4.31472222222, -52.1316666667),
-    "SOOS": (3.61361111111, -53.2041666667),
-    "SPAC": (-4.6075, -77.9408333333),
-    "SPAR": (-11.6833333333, -69.3333333333),
-    "SPAS": (-2.795, -76.4661111111),
-    "SPAY": (-10.7288888889, -73.7663888889),
-    "SPBB": (-6.01888888889, -76.9883333333),
-    "SPBC": (-3.91666666667, -70.5080555556),
-    "SPBR": (-11.4113888889, -69.4886111111),
-    "SPCL": (-8.37777777778, -74.5741666667),
-    "SPCM": (-7.33583333333, -74.9925),
-    "SPEO": (-9.15083333333, -78.5236111111),
-    "SPEP": (-9.76805555556, -70.7063888889),
-    "SPEQ": (-17.1788888889, -70.9305555556),
-    "SPGM": (-9.29, -76.0058333333),
-    "SPHI": (-6.78722222222, -79.8280555556),
-    "SPHO": (-13.1547222222, -74.2041666667),
-    "SPHU": (-11.7830555556, -75.4733333333),
-    "SPHY": (-13.7063888889, -73.3502777778),
-    "SPHZ": (-9.34722222222, -77.5983333333),
-    "SPIM": (-12.0216666667, -77.1141666667),
-    "SPJA": (-6.06805555556, -77.16),
-    "SPJI": (-7.16944444444, -76.7277777778),
-    "SPJJ": (-11.7830555556, -75.4733333333),
-    "SPJL": (-15.4669444444, -70.1580555556),
-    "SPJN": (-15.3575, -75.1355555556),
-    "SPJR": (-7.13638888889, -78.49),
-    "SPLO": (-17.695, -71.3438888889),
-    "SPLP": (-12.1605555556, -76.9988888889),
-    "SPME": (-3.5525, -80.3808333333),
-    "SPMS": (-5.89388888889, -76.1183333333),
-    "SPNC": (-9.87805555556, -76.2041666667),
-    "SPOL": (-11.9286111111, -77.0611111111),
-    "SPPY": (-6.20166666667, -77.8558333333),
-    "SPQT": (-3.78472222222, -73.3086111111),
-    "SPQU": (-16.3408333333, -71.5830555556),
-    "SPRM": (-11.1286111111, -75.3502777778),
-    "SPRU": (-8.08472222222, -79.1094444444),
-    "SPSO": (-13.7447222222, -76.2202777778),
-    "SPST": (-6.50861111111, -76.3730555556),
-    "SPTN": (-18.0533333333, -70.2758333333),
-    "SPTP": (-4.54972222222, -81.2238888889),
-    "SPTU": (-12.6136111111, -69.2288888889),
-    "SPUR": (-5.20555555556, -80.6163888889),
-    "SPYL": (-4.57638888889, -81.2538888889),
-    "SPZA": (-14.8538888889, -74.9613888889),
-    "SPZO": (-13.5355555556, -71.9386111111),
-    "SSAP": (-23.6122222222, -51.385),
-    "SSCK": (-27.1805555556, -52.0511111111),
-    "SSDO": (-22.2005555556, -54.9255555556),
-    "SSER": (-27.66, -52.2761111111),
-    "SSIJ": (-28.37, -53.8455555556),
-    "SSJA": (-27.1727777778, -51.5516666667),
-    "SSOE": (-26.7811111111, -53.5033333333),
-    "SSPB": (-26.2177777778, -52.6941666667),
-    "SSPG": (-25.5405555556, -48.5311111111),
-    "SSUV": (-26.2316666667, -51.0688888889),
-    "SSVI": (-27.0, -51.1575),
-    "SSZR": (-27.9088888889, -54.5222222222),
-    "SUAA": (-34.7891666667, -56.2644444444),
-    "SUAG": (-30.4005555556, -56.5077777778),
-    "SUCA": (-34.4563888889, -57.7705555556),
-    "SUDU": (-33.3586111111, -56.4991666667),
-    "SULS": (-34.855, -55.0941666667),
-    "SUMO": (-32.3377777778, -54.2166666667),
-    "SUMU": (-34.8377777778, -56.0302777778),
-    "SUPE": (-34.9136111111, -54.9205555556),
-    "SUPU": (-32.365, -58.0611111111),
-    "SURV": (-30.9744444444, -55.4761111111),
-    "SUSO": (-31.4397222222, -57.9905555556),
-    "SUTB": (-31.7488888889, -55.9255555556),
-    "SUTR": (-33.195, -54.3472222222),
-    "SUVO": (-31.7391666667, -54.5877777778),
-    "SVAC": (9.55333333333, -69.2377777778),
-    "SVAN": (9.42916666667, -64.4708333333),
-    "SVAT": (4.05166666667, -67.7008333333),
-    "SVBC": (10.1069444444, -64.6888888889),
-    "SVBI": (8.61944444444, -70.2205555556),
-    "SVBL": (10.1833333333, -67.5572222222),
-    "SVBM": (10.0425, -69.3583333333),
-    "SVBS": (10.2497222222, -67.6491666667),
-    "SVCB": (8.12194444444, -63.5369444444),
-    "SVCD": (7.62583333333, -66.1647222222),
-    "SVCJ": (9.64888888889, -68.5752777778),
-    "SVCL": (8.92444444444, -67.4169444444),
-    "SVCN": (6.23194444444, -62.8541666667),
-    "SVCO": (10.1755555556, -70.065),
-    "SVCP": (10.66, -63.2616666667),
-    "SVCR": (11.4147222222, -69.6808333333),
-    "SVCS": (10.2861111111, -66.8158333333),
-    "SVCU": (10.4502777778, -64.1302777778),
-    "SVCZ": (9.37194444444, -66.9227777778),
-    "SVED": (6.715, -61.6388888889),
-    "SVEZ": (7.05972222222, -69.4966666667),
-    "SVFM": (10.485, -66.8436111111),
-    "SVGD": (7.21083333333, -70.7563888889),
-    "SVGI": (10.5738888889, -62.3125),
-    "SVGU": (9.02694444444, -69.755),
-    "SVHG": (10.4622222222, -66.0925),
-    "SVIE": (10.7941666667, -63.9813888889),
-    "SVJC": (11.7808333333, -70.1516666667),
-    "SVJM": (9.90694444444, -67.3794444444),
-    "SVLF": (8.23916666667, -72.2708333333),
-    "SVLO": (11.8086111111, -66.1791666667),
-    "SVMC": (10.5580555556, -71.7277777778),
-    "SVMD": (8.58194444444, -71.1608333333),
-    "SVMG": (10.9125, -63.9663888889),
-    "SVMI": (10.6030555556, -66.9905555556),
-    "SVMT": (9.74916666667, -63.1522222222),
-    "SVPA": (5.61972222222, -67.6058333333),
-    "SVPC": (10.4802777778, -68.0727777778),
-    "SVPM": (7.80111111111, -72.2027777778),
-    "SVPR": (8.28833333333, -62.7602777778),
-    "SVPT": (7.57555555556, -70.1741666667),
-    "SVSA": (7.85222222222, -72.4347222222),
-    "SVSB": (7.80333333333, -71.1655555556),
-    "SVSE": (4.55472222222, -61.1447222222),
-    "SVSO": (7.565, -72.035),
-    "SVSP": (10.2786111111, -68.755),
-    "SVSR": (7.8825, -67.4436111111),
-    "SVST": (8.945, -64.1508333333),
-    "SVSZ": (8.97444444444, -71.9430555556),
-    "SVTC": (9.08888888889, -62.0941666667),
-    "SVTM": (7.24916666667, -61.5288888889),
-    "SVVA": (10.1580555556, -67.9266666667),
-    "SVVG": (8.62416666667, -71.6727777778),
-    "SVVL": (9.34055555556, -70.5838888889),
-    "SVVP": (9.22194444444, -65.9933333333),
-    "SWBC": (-0.980833333333, -62.9188888889),
-    "SWBI": (-2.79611111111, -57.0505555556),
-    "SWCA": (-4.87861111111, -66.8955555556),
-    "SWGN": (-7.22833333333, -48.2408333333),
-    "SWII": (-2.93361111111, -69.6947222222),
-    "SWJI": (-10.8705555556, -61.8466666667),
-    "SWKN": (-17.7247222222, -48.61),
-    "SWKO": (-4.13388888889, -63.1311111111),
-    "SWLC": (-17.8347222222, -50.9561111111),
-    "SWNV": (-16.6280555556, -49.3455555556),
-    "SWRD": (-16.5852777778, -54.7241666667),
-    "SWSI": (42.0158333333, 35.0663888889),
-    "SYCJ": (6.49833333333, -58.2538888889),
-    "SYGO": (6.80722222222, -58.1058333333),
-    "SYKM": (5.86527777778, -60.6141666667),
-    "SYLD": (5.96583333333, -58.2702777778),
-    "SYLT": (3.3725, -59.7891666667),
-    "TAPA": (17.1366666667, -61.7925),
-    "TAPH": (17.6358333333, -61.8269444444),
-    "TBPB": (13.0744444444, -59.4922222222),
-    "TBPO": (13.0958333333, -59.6186111111),
-    "TDCF": (15.3366666667, -61.3919444444),
-    "TDPD": (15.5469444444, -61.3),
-    "TFFF": (14.5908333333, -61.0030555556),
-    "TFFG": (18.0997222222, -63.0469444444),
-    "TFFJ": (17.9, -62.85),
-    "TFFM": (15.8686111111, -61.27),
-    "TFFR": (16.2652777778, -61.5316666667),
-    "TFFS": (15.8644444444, -61.5805555556),
-    "TGPG": (12.1436111111, -61.6166666667),
-    "TGPY": (12.0041666667, -61.7861111111),
-    "TGPZ": (12.4769444444, -61.4722222222),
-    "TIST": (18.3372222222, -64.9733333333),
-    "TISX": (17.7016666667, -64.7983333333),
-    "TJAB": (18.4511111111, -66.6755555556),
-    "TJBQ": (18.4947222222, -67.1294444444),
-    "TJCP": (18.3133333333, -65.3044444444),
-    "TJFA": (18.3088888889, -65.6616666667),
-    "TJFF": (18.4944444444, -67.1294444444),
-    "TJIG": (18.4566666667, -66.0980555556),
-    "TJMZ": (18.2555555556, -67.1483333333),
-    "TJNR": (18.245, -65.6433333333),
-    "TJPS": (18.0080555556, -66.5627777778),
-    "TJSJ": (18.4391666667, -66.0016666667),
-    "TJVQ": (18.1347222222, -65.4936111111),
-    "TKPK": (17.3111111111, -62.7186111111),
-    "TKPN": (17.2055555556, -62.5897222222),
-    "TLPC": (14.02, -60.9927777778),
-    "TLPL": (13.7330555556, -60.9525),
-    "TNCA": (12.5013888889, -70.015),
-    "TNCB": (12.1308333333, -68.2683333333),
-    "TNCC": (12.1886111111, -68.9597222222),
-    "TNCE": (17.4963888889, -62.9791666667),
-    "TNCM": (18.0408333333, -63.1088888889),
-    "TNCS": (17.6455555556, -63.2205555556),
-    "TQPF": (18.2047222222, -63.055),
-    "TRPG": (16.7913888889, -62.1933333333),
-    "TRPM": (33.5869444444, -80.2086111111),
-    "TTCP": (11.1494444444, -60.8319444444),
-    "TTPP": (10.5952777778, -61.3372222222),
-    "TUPA": (18.7275, -64.3280555556),
-    "TUPJ": (18.4447222222, -64.5427777778),
-    "TUPW": (18.4455555556, -64.4280555556),
-    "TVSB": (12.9883333333, -61.2619444444),
-    "TVSC": (12.6988888889, -61.3422222222),
-    "TVSM": (12.8875, -61.18),
-    "TVSU": (12.5986111111, -61.4147222222),
-    "TVSV": (13.1441666667, -61.2108333333),
-    "TXKF": (32.3641666667, -64.6786111111),
-    "UAAA": (43.3519444444, 77.0402777778),
-    "UAAH": (46.8941666667, 75.0047222222),
-    "UACC": (51.0222222222, 71.4672222222),
-    "UACK": (53.33, 69.5966666667),
-    "UACP": (54.7744444444, 69.185),
-    "UADD": (42.8536111111, 71.3036111111),
-    "UAFM": (43.0616666667, 74.4783333333),
-    "UAFO": (40.6088888889, 72.7930555556),
-    "UAII": (42.3644444444, 69.4791666667),
-    "UAKD": (47.7083333333, 67.7333333333),
-    "UAKK": (49.6713888889, 73.3363888889),
-    "UAOO": (44.7069444444, 65.5925),
-    "UARR": (51.1516666667, 51.5455555556),
-    "UASB": (51.5833333333, 75.2166666667),
-    "UASK": (50.0361111111, 82.4941666667),
-    "UASP": (52.195, 77.0738888889),
-    "UASS": (50.3511111111, 80.2341666667),
-    "UATE": (43.86, 51.0919444444),
-    "UATG": (47.1219444444, 51.8213888889),
-    "UATT": (50.245, 57.2033333333),
-    "UAUR": (50.325, 66.96),
-    "UAUU": (53.2063888889, 63.5508333333),
-    "UBBB": (40.4675, 50.0466666667),
-    "UBBG": (40.7377777778, 46.3175),
-    "UBBL": (38.7586111111, 48.8063888889),
-    "UBBY": (41.5622222222, 46.6672222222),
-    "UCFA": (42.1530555556, 77.5638888889),
-    "UCFB": (40.0425, 70.8380555556),
-    "UCFE": (41.4844444444, 71.7336111111),
-    "UCFF": (42.8288888889, 75.3358333333),
-    "UCFG": (42.6536111111, 77.0566666667),
-    "UCFI": (39.8247222222, 69.5686111111),
-    "UCFJ": (40.9441666667, 72.9777777778),
-    "UCFL": (42.5880555556, 76.7130555556),
-    "UCFM": (43.0613055556, 74.4775555556),
-    "UCFN": (41.4413888889, 76.1305555556),
-    "UCFO": (40.6088888889, 72.7930555556),
-    "UCFP": (42.5080555556, 78.4077777778),
-    "UCFS": (40.2716666667, 72.0469444444),
-    "UCFT": (42.5058333333, 72.2630555556),
-    "UCFW": (42.8530555556, 74.8463888889),
-    "UCFX": (41.8777777778, 72.8622222222),
-    "UCFZ": (41.4102777778, 74.0441666667),
-    "UDLS": (41.0483333333, 44.3369444444),
-    "UDSG": (40.7502777778, 43.8591666667),
-    "UDYE": (40.1283333333, 44.4727777778),
-    "UDYZ": (40.1472222222, 44.3958333333),
-    "UEEA": (34.8041666667, -96.6711111111),
-    "UEEE": (62.0930555556, 129.770555556),
-    "UELL": (56.9133333333, 124.911666667),
-    "UEMM": (62.1072222222, 129.543333333),
-    "UENN": (63.2972222222, 118.346944444),
-    "UENW": (63.7561111111, 121.694166667),
-    "UERO": (68.5155555556, 112.479166667),
-    "UERP": (66.4166666667, 112.05),
-    "UERR": (62.5344444444, 114.022222222),
-    "UESG": (68.5380555556, 146.185833333),
-    "UESO": (70.625, 147.896666667),
-    "UESS": (68.7433333333, 161.336666667),
-    "UEST": (71.6975, 128.902777778),
-    "UESU": (65.7383333333, 150.707777778),
-    "UGEE": (40.1483333333, 44.3966666667),
-    "UGGG": (41.6691666667, 44.9547222222),
-    "UGKO": (42.1763888889, 42.4825),
-    "UGSB": (41.6102777778, 41.5994444444),
-    "UGSS": (42.8580555556, 41.1280555556),
-    "UGTB": (41.6691666667, 44.9547222222),
-    "UHBB": (50.4216666667, 127.41),
-    "UHBI": (53.4666666667, 125.8),
-    "UHHH": (48.5277777778, 135.188333333),
-    "UHKK": (50.4083333333, 136.933333333),
-    "UHMA": (64.7347222222, 177.741388889),
-    "UHMD": (64.38, -173.246666667),
-    "UHMK": (67.8469444444, 166.138888889),
-    "UHMM": (59.91, 150.716666667),
-    "UHMO": (64.6652777778, 170.414166667),
-    "UHMP": (67.5, 171.0),
-    "UHPP": (53.1663888889, 158.452777778),
-    "UHPX": (55.1783333333, 166.048333333),
-    "UHSH": (53.515, 142.888333333),
-    "UHSS": (46.8886111111, 142.717222222),
-    "UHWW": (43.3988888889, 132.151388889),
-    "UIAA": (52.0261111111, 113.305),
-    "UIBB": (56.3708333333, 101.698611111),
-    "UIII": (52.2669444444, 104.394722222),
-    "UIKE": (61.275, 108.03),
-    "UITT": (56.8566666667, 105.73),
-    "UIUU": (51.8066666667, 107.438055556),
-    "UK59": (49.8355555556, 36.6863888889),
-    "UK60": (50.025, 36.2666666667),
-    "UKBB": (50.345, 30.895),
-    "UKBC": (49.7988888889, 30.1152777778),
-    "UKBF": (51.25, 33.15),
-    "UKBM": (49.9316666667, 33.6394444444),
-    "UKCC": (48.0733333333, 37.74),
-    "UKCK": (48.7166666667, 37.5333333333),
-    "UKCM": (47.0725, 37.4563888889),
-    "UKCW": (48.418, 39.374),
-    "UKDB": (46.8147222222, 36.7580555556),
-    "UKDD": (48.3566666667, 35.1016666667),
-    "UKDE": (47.8669444444, 35.3158333333),
-    "UKDP": (48.5833333333, 35.1166666667),
-    "UKDR": (48.0430555556, 33.2069444444),
-    "UKFB": (44.6833333333, 33.5833333333),
-    "UKFF": (45.0386111111, 33.9830555556),
-    "UKFK": (45.3725, 36.4013888889),
-    "UKFV": (45.2255555556, 33.3766666667),
-    "UKFW": (44.9188888889, 34.0611111111),
-    "UKHH": (49.3588888889, 26.9338888889),
-    "UKHK": (49.1308333333, 33.4752777778),
-    "UKHP": (49.5738888889, 34.3986111111),
-    "UKHS": (50.8583333333, 34.7625),
-    "UKKK": (50.4016666667, 30.4516666667),
-    "UKKL": (51.4033333333, 31.16),
-    "UKKM": (50.6036111111, 30.1919444444),
-    "UKKO": (50.1583333333, 28.7383333333),
-    "UKKT": (50.4783333333, 30.385),
-    "UKKV": (50.2705555556, 28.7386111111),
-    "UKLA": (49.55, 23.335),
-    "UKLB": (50.1333333333, 25.1666666667),
-    "UKLC": (50.6833333333, 25.4833333333),
-    "UKLF": (49.7822222222, 23.6436111111),
-    "UKLH": (49.36, 26.9333333333),
-    "UKLI": (48.8841666667, 24.6861111111),
-    "UKLL": (49.8125, 23.9561111111),
-    "UKLN": (48.26, 25.9816666667),
-    "UKLO": (48.5305555556, 25.0402777778),
-    "UKLR": (50.6072222222, 26.1416666667),
-    "UKLS": (49.745, 27.27),
-    "UKLT": (49.525, 25.7),
-    "UKLU": (48.6341666667, 22.2633333333),
-    "UKOI": (45.3955555556, 28.8013888889),
-    "UKOM": (46.6688888889, 30.0111111111),
-    "UKON": (47.0580555556, 31.9208333333),
-    "UKOO": (46.4269444444, 30.6780555556),
-    "UKRN": (51.1, 31.8666666667),
-    "UKWW": (49.2397222222, 28.6138888889),
-    "ULAA": (64.6, 40.7166666667),
-    "ULAL": (64.8958333333, 45.7227777778),
-    "ULAM": (67.64, 53.125),
-    "ULDD": (69.7633333333, 61.5633333333),
-    "ULKK": (61.2366666667, 46.6966666667),
-    "ULLI": (59.8, 30.265),
-    "ULMM": (68.7816666667, 32.7505555556),
-    "ULOL": (56.3816666667, 30.61),
-    "ULOO": (57.785, 28.3983333333),
-    "ULPB": (61.885, 34.1566666667),
-    "ULSS": (59.98, 30.5883333333),
-    "ULWW": (59.2816666667, 39.9466666667),
-    "UMBB": (52.1083333333, 23.8980555556),
-    "UMGG": (52.5269444444, 31.0166666667),
-    "UMII": (55.1666666667, 30.1333333333),
-    "UMKK": (54.89, 20.5925),
-    "UMMG": (53.6019444444, 24.0538888889),
-    "UMMM": (53.8644444444, 27.5394444444),
-    "UMMS": (53.8822222222, 28.0305555556),
-    "UMOO": (53.955, 30.095),
-    "UNAA": (53.74, 91.385),
-    "UNBB": (53.3638888889, 83.5419444444),
-    "UNCC": (55.0916666667, 82.9066666667),
-    "UNEE": (55.2697222222, 86.1069444444),
-    "UNIP": (61.59, 89.9733333333),
-    "UNIW": (60.355, 102.31),
-    "UNKL": (56.1716666667, 92.4933333333),
-    "UNKY": (51.6760722222, 94.40515),
-    "UNNT": (55.0125, 82.6505555556),
-    "UNOO": (54.9669444444, 73.31),
-    "UNTT": (56.3866666667, 85.2105555556),
-    "UNWW": (53.81, 86.8783333333),
-    "UOHH": (71.9683333333, 102.486666667),
-    "UOOO": (69.31, 87.3333333333),
-    "UOTT": (65.8, 87.93),
-    "URKA": (45.0020833333, 37.3473055556),
-    "URKH": (44.68, 40.0383333333),
-    "URKK": (45.035, 39.1716666667),
-    "URKM": (44.6533333333, 40.09),
-    "URMG": (43.3882, 45.6996833333),
-    "URML": (42.8166666667, 47.6522222222),
-    "URMM": (44.225, 43.0816666667),
-    "URMN": (43.5133333333, 43.6383333333),
-    "URMO": (43.205, 44.6066666667),
-    "URMT": (45.1091666667, 42.1127777778),
-    "URRR": (47.2580555556, 39.8177777778),
-    "URSS": (43.4458333333, 39.9475),
-    "URWA": (46.2833333333, 48.0061111111),
-    "URWI": (46.3738888889, 44.3308333333),
-    "URWW": (48.7822222222, 44.3447222222),
-    "USCC": (55.3033333333, 61.5066666667),
-    "USCM": (53.3933333333, 58.76),
-    "USDD": (66.59, 66.6102777778),
-    "USHH": (61.0283333333, 69.0866666667),
-    "USKK": (58.5033333333, 49.3483333333),
-    "USMM": (65.48, 72.7033333333),
-    "USMU": (66.0725, 76.5219444444),
-    "USNN": (60.95, 76.4666666667),
-    "USNR": (62.1586111111, 77.3288888889),
-    "USPI": (56.8333333333, 53.4566666667),
-    "USPP": (57.9166666667, 56.0255555556),
-    "USRK": (62.19, 74.535),
-    "USRN": (61.1083333333, 72.65),
-    "USRO": (63.1833333333, 75.27),
-    "USRR": (61.25, 73.5),
-    "USSS": (56.7413888889, 60.8036111111),
-    "USTO": (37.1322222222, -92.0838888889),
-    "USTR": (57.1683333333, 65.3166666667),
-    "USUU": (55.475, 65.4147222222),
-    "UTAA": (37.9916666667, 58.3633333333),
-    "UTAK": (40.0333333333, 52.9833333333),
-    "UTAM": (37.6066666667, 61.9013888889),
-    "UTAT": (41.7647222222, 59.8330555556),
-    "UTAV": (39.0833333333, 63.6133333333),
-    "UTDD": (38.5433333333, 68.825),
-    "UTDK": (37.9883333333, 69.805),
-    "UTDL": (40.2152777778, 69.6947222222),
-    "UTDT": (37.8622222222, 68.8627777778),
-    "UTFF": (40.3588888889, 71.745),
-    "UTFN": (40.9844444444, 71.5566666667),
-    "UTKA": (40.7277777778, 72.2938888889),
-    "UTNN": (42.4863888889, 59.6225),
-    "UTNU": (41.5841666667, 60.6416666667),
-    "UTOD": (37.5022222222, 71.5133333333),
-    "UTSB": (39.775, 64.48),
-    "UTSL": (38.8336111111, 65.9213888889),
-    "UTSS": (39.7005555556, 66.9847222222),
-    "UTST": (37.2863888889, 67.3083333333),
-    "UTTT": (41.2572222222, 69.2816666667),
-    "UUBB": (55.6222222222, 38.0638888889),
-    "UUBP": (53.2141666667, 34.1763888889),
-    "UUDD": (55.4086111111, 37.9061111111),
-    "UUDL": (57.5606666667, 40.1573694444),
-    "UUEE": (55.9716666667, 37.415),
-    "UUEM": (56.8247222222, 35.7575),
-    "UUMO": (55.5116666667, 37.5072222222),
-    "UUMU": (55.8783333333, 38.0616666667),
-    "UUOB": (50.6433333333, 36.59),
-    "UUOO": (51.8141666667, 39.2297222222),
-    "UUWR": (54.6416666667, 39.5716666667),
-    "UUWW": (55.5913888889, 37.2613888889),
-    "UUYH": (63.5666666667, 53.8033333333),
-    "UUYP": (65.1216666667, 57.13),
-    "UUYW": (67.4883333333, 63.99),
-    "UUYY": (61.6475, 50.8455555556),
-    "UWGG": (56.23, 43.7866666667),
-    "UWKD": (55.6077777778, 49.2772222222),
-    "UWKE": (55.5633333333, 52.095),
-    "UWKI": (55.305, 50.6166666667),
-    "UWKS": (56.09, 47.3472222222),
-    "UWLW": (54.4011111111, 48.8027777778),
-    "UWOO": (51.7955555556, 55.4566666667),
-    "UWOR": (51.0716666667, 58.5966666667),
-    "UWPP": (28.9541666667, -98.5197222222),
-    "UWPS": (54.125, 45.215),
-    "UWSS": (51.565, 46.0466666667),
-    "UWUK": (54.44, 53.3883333333),
-    "UWUU": (54.5575, 55.8741666667),
-    "UWWW": (53.5052777778, 50.1644444444),
-    "VAAH": (23.0747222222, 72.6316666667),
-    "VAAK": (20.6988888889, 77.0563888889),
-    "VAAU": (19.8630555556, 75.3980555556),
-    "VABB": (19.0886111111, 72.8677777778),
-    "VABI": (21.9886111111, 82.1111111111),
-    "VABJ": (23.2877777778, 69.67),
-    "VABM": (15.8591666667, 74.6180555556),
-    "VABO": (22.3361111111, 73.2261111111),
-    "VABP": (23.285, 77.3372222222),
-    "VABV": (21.7519444444, 72.185),
-    "VADN": (20.435, 72.8436111111),
-    "VADS": (24.2677777778, 72.2052777778),
-    "VAGO": (15.3805555556, 73.8330555556),
-    "VAID": (22.7216666667, 75.8008333333),
-    "VAJB": (23.1777777778, 80.0519444444),
-    "VAJJ": (19.0980555556, 72.8338888889),
-    "VAJL": (20.9619444444, 75.6266666667),
-    "VAJM": (22.4663888889, 70.0113888889),
-    "VAKD": (21.833333, 76.366667),
-    "VAKE": (23.1125, 70.1002777778),
-    "VAKJ": (24.8194444444, 79.9191666667),
-    "VAKP": (16.6638888889, 74.2880555556),
-    "VAKS": (21.3166666667, 70.27),
-    "VALT": (18.4116666667, 76.4641666667),
-    "VAND": (19.1819444444, 77.3186111111),
-    "VANP": (21.0919444444, 79.0469444444),
-    "VANR": (19.9625, 73.8069444444),
-    "VAOZ": (20.1194444444, 73.9136111111),
-    "VAPO": (18.5819444444, 73.9194444444),
-    "VAPR": (21.6494444444, 69.6563888889),
-    "VARG": (17.0136111111, 73.3277777778),
-    "VARK": (22.3091666667, 70.7794444444),
-    "VARP": (21.1802777778, 81.7386111111),
-    "VASL": (17.6277777778, 75.9347222222),
-    "VASU": (21.115, 72.7427777778),
-    "VAUD": (24.6175, 73.9127777778),
-    "VCBI": (7.18111111111, 79.8836111111),
-    "VCCA": (8.30111111111, 80.4280555556),
-    "VCCB": (7.70555555556, 81.6777777778),
-    "VCCC": (6.82194444444, 79.8861111111),
-    "VCCG": (7.3375, 81.6255555556),
-    "VCCJ": (9.79222222222, 80.07),
-    "VCCK": (5.99388888889, 80.3205555556),
-    "VCCN": (6.552125, 79.9775388889),
-    "VCCT": (8.53888888889, 81.1813888889),
-    "VCCV": (8.74119444444, 80.498),
-    "VCCW": (6.25444444444, 81.235),
-    "VCRI": (6.28888888889, 81.1236111111),
-    "VDBG": (13.0955555556, 103.224166667),
-    "VDKC": (12.0288611111, 105.441305556),
-    "VDKH": (12.255, 104.563611111),
-    "VDKK": (11.6132222222, 102.997611111),
-    "VDMK": (12.4631388889, 107.186861111),
-    "VDPP": (11.5463888889, 104.843888889),
-    "VDRK": (13.7319444444, 106.983611111),
-    "VDSR": (13.4105555556, 103.812777778),
-    "VDST": (13.5313888889, 106.014166667),
-    "VDSV": (10.58, 103.636944444),
-    "VEAN": (28.1747222222, 94.8019444444),
-    "VEAT": (23.8888888889, 91.2408333333),
-    "VEAZ": (23.7461111111, 92.8030555556),
-    "VEBA": (22.5053055556, 88.2966388889),
-    "VEBD": (26.6813888889, 88.3280555556),
-    "VEBG": (25.2608333333, 88.7955555556),
-    "VEBI": (25.7036111111, 91.9786111111),
-    "VEBK": (23.6433333333, 86.1486111111),
-    "VEBS": (20.2441666667, 85.8177777778),
-    "VECA": (27.4622222222, 95.1180555556),
-    "VECC": (22.6547222222, 88.4466666667),
-    "VECK": (22.4668027778, 86.7107),
-    "VECO": (26.3302777778, 89.4669444444),
-    "VEDB": (23.8338888889, 86.425),
-    "VEDZ": (27.9888888889, 94.2233333333),
-    "VEGK": (26.7394444444, 83.4494444444),
-    "VEGT": (26.1061111111, 91.5847222222),
-    "VEGY": (24.7480555556, 84.9425),
-    "VEHK": (21.5791666667, 84.0061111111),
-    "VEIM": (24.7597222222, 93.8969444444),
-    "VEJH": (21.9133333333, 84.0502777778),
-    "VEJP": (18.8797222222, 82.5519444444),
-    "VEJS": (22.8119444444, 86.1675),
-    "VEJT": (26.7305555556, 94.1755555556),
-    "VEKM": (24.135, 91.8105555556),
-    "VEKR": (24.3083333333, 92.0075),
-    "VEKU": (24.9127777778, 92.9786111111),
-    "VEKW": (24.0616666667, 91.6038888889),
-    "VELP": (23.8384416667, 92.6203583333),
-    "VELR": (27.2905555556, 94.0966666667),
-    "VEMH": (25.0, 88.25),
-    "VEMN": (27.4833333333, 95.0175),
-    "VEMR": (25.8838888889, 93.7711111111),
-    "VEMZ": (26.12, 85.3130555556),
-    "VENP": (20.87, 82.5194444444),
-    "VEPG": (28.0661111111, 95.3355555556),
-    "VEPH": (23.4744444444, 87.4277777778),
-    "VEPT": (25.5905555556, 85.0877777778),
-    "VEPU": (25.76, 87.4091666667),
-    "VERC": (23.3147222222, 85.3213888889),
-    "VERK": (22.2563888889, 84.8144444444),
-    "VERL": (26.9963888889, 84.8205555556),
-    "VERU": (26.1411111111, 89.9066666667),
-    "VETJ": (27.9416666667, 96.1347222222),
-    "VETZ": (26.7122222222, 92.7872222222),
-    "VEUK": (20.0975, 83.1833333333),
-    "VEZO": (27.5880555556, 93.8283333333),
-    "VGBR": (22.8010305556, 90.3011638889),
-    "VGCB": (21.4519444444, 91.9641666667),
-    "VGEG": (22.2494444444, 91.8130555556),
-    "VGHS": (23.8427777778, 90.4005555556),
-    "VGIS": (24.1525, 89.0494444444),
-    "VGJR": (23.1836111111, 89.1608333333),
-    "VGRJ": (24.4369444444, 88.6163888889),
-    "VGSD": (25.7591666667, 88.9086111111),
-    "VGSY": (24.9627777778, 91.8672222222),
-    "VGTJ": (23.7783333333, 90.3825),
-    "VGZR": (23.8433333333, 90.3977777778),
-    "VHHH": (22.3088888889, 113.914444444),
-    "VHSK": (22.4363888889, 114.080277778),
-    "VHST": (22.2893722222, 114.152152778),
-    "VIAG": (27.1555555556, 77.9608333333),
-    "VIAL": (25.4388888889, 81.7341666667),
-    "VIAM": (30.3705555556, 76.8177777778),
-    "VIAR": (31.7075, 74.7991666667),
-    "VIBK": (28.0725, 73.2066666667),
-    "VIBL": (26.9883333333, 80.8930555556),
-    "VIBN": (25.4519444444, 82.8588888889),
-    "VIBR": (31.8816666667, 77.1844444444),
-    "VIBT": (30.27, 74.7555555556),
-    "VIBW": (28.8375, 76.1775),
-    "VIBY": (28.4222222222, 79.4497222222),
-    "VICG": (30.6733333333, 76.7883333333),
-    "VICX": (26.4041666667, 80.41),
-    "VIDD": (28.5841666667, 77.2052777778),
-    "VIDN": (30.1872222222, 78.18),
-    "VIDP": (28.5663888889, 77.1030555556),
-    "VIDX": (28.7077777778, 77.3588888889),
-    "VIGG": (32.165, 76.2633333333),
-    "VIGN": (24.6544444444, 77.3472222222),
-    "VIGR": (26.2938888889, 78.2275),
-    "VIHR": (29.1805555556, 75.7530555556),
-    "VIJN": (25.4897222222, 78.5594444444),
-    "VIJO": (26.2513888889, 73.0480555556),
-    "VIJP": (26.8238888889, 75.8097222222),
-    "VIJR": (26.8891666667, 70.8644444444),
-    "VIJU": (32.6897222222, 74.8380555556),
-    "VIKA": (26.4411111111, 80.3633333333),
-    "VIKO": (25.1605555556, 75.8447222222),
-    "VILD": (30.8544444444, 75.9511111111),
-    "VILH": (34.1355555556, 77.5455555556),
-    "VILK": (26.7605555556, 80.8863888889),
-    "VIPK": (32.2336111111, 75.6344444444),
-    "VIPL": (30.315, 76.3633333333),
-    "VIPT": (29.0330555556, 79.4736111111),
-    "VIRB": (26.2502777778, 81.3805555556),
-    "VISM": (31.0816666667, 77.0580555556),
-    "VISP": (29.9941666667, 77.4241666667),
-    "VISR": (33.9866666667, 74.7736111111),
-    "VIST": (24.5572222222, 80.8633333333),
-    "VLAO": (17.9883333333, 102.563333333),
-    "VLHS": (20.2572222222, 100.437222222),
-    "VLLB": (19.8972222222, 102.160833333),
-    "VLLN": (20.9605555556, 101.4025),
-    "VLOS": (20.682, 101.9931),
-    "VLPS": (15.1319444444, 105.781388889),
-    "VLPV": (19.4547222222, 103.218055556),
-    "VLSB": (19.2330555556, 101.733055556),
-    "VLSK": (16.5563888889, 104.759444444),
-    "VLVT": (17.9880555556, 102.563055556),
-    "VLXK": (19.44015, 103.1684),
-    "VMMC": (22.1494444444, 113.591388889),
-    "VNBG": (29.5388888889, 81.1852777778),
-    "VNBJ": (27.1475, 87.0508333333),
-    "VNBP": (27.6780555556, 84.4294444444),
-    "VNBR": (29.5, 81.6666666667),
-    "VNBW": (27.5055555556, 83.4161111111),
-    "VNCG": (26.5705555556, 88.0794444444),
-    "VNDP": (28.9858333333, 82.8191666667),
-    "VNJL": (29.2744444444, 82.1933333333),
-    "VNJP": (26.7086111111, 85.9222222222),
-    "VNKT": (27.6963888889, 85.3591666667),
-    "VNLD": (27.2530555556, 86.67),
-    "VNLK": (27.6875, 86.7316666667),
-    "VNMA": (28.6333333333, 84.0),
-    "VNMG": (27.5772222222, 84.2288888889),
-    "VNMN": (28.9633333333, 80.1480555556),
-    "VNNG": (28.1036111111, 81.6669444444),
-    "VNPK": (28.2002777778, 83.9811111111),
-    "VNPL": (27.5180555556, 86.5844444444),
-    "VNRC": (27.3938888889, 86.0613888889),
-    "VNRK": (28.6272222222, 82.1941666667),
-    "VNRT": (27.3036111111, 86.5505555556),
-    "VNSB": (27.8166666667, 86.7333333333),
-    "VNSI": (27.1594444444, 84.98),
-    "VNSK": (28.5858333333, 81.6358333333),
-    "VNSR": (29.2333333333, 81.2166666667),
-    "VNST": (29.9711111111, 81.8188888889),
-    "VNT1": (29.43, 81.0),
-    "VNTH": (27.0477777778, 86.8577777778),
-    "VNTJ": (27.35, 84.6666666667),
-    "VNTP": (28.5169444444, 81.15),
-    "VNTR": (27.315, 87.1933333333),
-    "VNVT": (26.4833333333, 87.2636111111),
-    "VOAR": (13.0711111111, 79.6911111111),
-    "VOAT": (10.8233333333, 72.1755555556),
-    "VOBG": (12.9497222222, 77.6680555556),
-    "VOBI": (15.1627777778, 76.8827777778),
-    "VOBL": (13.1988888889, 77.7055555556),
-    "VOBM": (15.8591666667, 74.6175),
-    "VOBR": (17.9077777778, 77.4858333333),
-    "VOBZ": (16.5302777778, 80.7966666667),
-    "VOCB": (11.0313888889, 77.0438888889),
-    "VOCC": (9.94972222222, 76.2730555556),
-    "VOCI": (10.1555555556, 76.3913888889),
-    "VOCL": (11.1355555556, 75.9547222222),
-    "VOCP": (14.5097222222, 78.7727777778),
-    "VOCX": (9.15305555556, 92.8191666667),
-    "VODG": (17.6291666667, 78.4033333333),
-    "VODK": (15.833, 79.5),
-    "VOGB": (17.3077777778, 76.9580555556),
-    "VOGO": (15.3808333333, 73.8313888889),
-    "VOHB": (15.3616666667, 75.0847222222),
-    "VOHK": (17.3311111111, 78.3127777778),
-    "VOHS": (17.24, 78.4280555556),
-    "VOHY": (17.4522222222, 78.4611111111),
-    "VOMD": (9.83444444444, 78.0933333333),
-    "VOML": (12.96, 74.8925),
-    "VOMM": (12.9941666667, 80.1802777778),
-    "VOMY": (12.23, 76.6558333333),
-    "VONS": (16.5408333333, 79.3177777778),
-    "VOPB": (11.6455555556, 92.7330555556),
-    "VOPC": (11.9658333333, 79.8127777778),
-    "VOPN": (14.1491666667, 77.7911111111),
-    "VORY": (17.1094444444, 81.8183333333),
-    "VOSM": (11.7819444444, 78.0652777778),
-    "VOSX": (11.0136111111, 77.1597222222),
-    "VOTJ": (10.7197222222, 79.1036111111),
-    "VOTP": (13.6319444444, 79.5430555556),
-    "VOTR": (10.7652777778, 78.7088888889),
-    "VOTV": (8.48194444444, 76.9180555556),
-    "VOTX": (12.9066666667, 80.1211111111),
-    "VOVZ": (17.7211111111, 83.2244444444),
-    "VOWA": (17.9180555556, 79.5986111111),
-    "VOYK": (13.1358333333, 77.6075),
-    "VQBT": (27.5627777778, 90.7463888889),
-    "VQPR": (27.4030555556, 89.4258333333),
-    "VRMG": (-0.693333333333, 73.1555555556),
-    "VRMH": (6.74416666667, 73.1702777778),
-    "VRMK": (1.85916666667, 73.5219444444),
-    "VRMM": (4.19166666667, 73.5288888889),
-    "VRMR": (-0.309444444444, 73.4325),
-    "VRMT": (0.488055555556, 72.9969444444),
-    "VTBD": (13.9125, 100.606666667),
-    "VTBK": (14.1019444444, 99.9169444444),
-    "VTBL": (14.8744444444, 100.663333333),
-    "VTBO": (12.2745722222, 102.318958333),
-    "VTBS": (13.6925, 100.75),
-    "VTBU": (12.6797222222, 101.005),
-    "VTBW": (13.7686111111, 102.315277778),
-    "VTCB": (19.4972222222, 100.285555556),
-    "VTCC": (18.7666666667, 98.9625),
-    "VTCH": (19.3011111111, 97.9747222222),
-    "VTCL": (18.2719444444, 99.5038888889),
-    "VTCN": (18.8077777778, 100.783333333),
-    "VTCO": (18.5444444444, 99.0163888889),
-    "VTCP": (18.1319444444, 100.164444444),
-    "VTCR": (19.893225, 99.8271),
-    "VTCT": (19.9522222222, 99.8827777778),
-    "VTPB": (16.6758333333, 101.195),
-    "VTPH": (12.6338888889, 99.9508333333),
-    "VTPI": (15.2772222222, 100.295833333),
-    "VTPL": (16.8208333333, 101.253888889),
-    "VTPM": (16.6997222222, 98.545),
-    "VTPN": (15.6727777778, 100.136666667),
-    "VTPO": (17.2377777778, 99.8180555556),
-    "VTPP": (16.7827777778, 100.278888889),
-    "VTPT": (16.8961111111, 99.2533333333),
-    "VTPU": (17.6736111111, 100.234722222),
-    "VTPY": (17.2341666667, 99.0577777778),
-    "VTSB": (9.1325, 99.1355555556),
-    "VTSC": (6.51972222222, 101.743333333),
-    "VTSE": (10.7112, 99.3617055556),
-    "VTSF": (8.53944444444, 99.9447222222),
-    "VTSG": (8.09888888889, 98.9861111111),
-    "VTSH": (7.18638888889, 100.607777778),
-    "VTSK": (6.78527777778, 101.153333333),
-    "VTSM": (9.54777777778, 100.062222222),
-    "VTSN": (8.47111111111, 99.9555555556),
-    "VTSP": (8.11305555556, 98.3166666667),
-    "VTSR": (9.7775, 98.5852777778),
-    "VTSS": (6.93305555556, 100.392777778),
-    "VTST": (7.50861111111, 99.6163888889),
-    "VTSY": (6.52666666667, 101.241944444),
-    "VTUD": (17.3863888889, 102.788055556),
-    "VTUI": (17.195, 104.118611111),
-    "VTUJ": (14.8691666667, 103.488888889),
-    "VTUK": (16.4666277778, 102.783661111),
-    "VTUL": (17.4388888889, 101.721944444),
-    "VTUN": (14.9341666667, 102.078611111),
-    "VTUO": (15.2294444444, 103.251111111),
-    "VTUP": (17.4125, 104.777222222),
-    "VTUQ": (14.9494444444, 102.3125),
-    "VTUU": (15.2512777778, 104.870230556),
-    "VTUV": (16.1166666667, 103.773611111),
-    "VTUW": (17.3836111111, 104.642777778),
-    "VVBM": (12.6680555556, 108.12),
-    "VVCI": (20.8191666667, 106.724722222),
-    "VVCL": (11.9427777778, 108.415),
-    "VVCM": (9.17555555556, 105.179444444),
-    "VVCR": (11.9980555556, 109.219444444),
-    "VVCS": (8.7325, 106.628888889),
-    "VVCT": (10.0852777778, 105.711944444),
-    "VVDB": (21.3972222222, 103.007777778),
-    "VVDL": (11.7505555556, 108.373611111),
-    "VVDN": (16.0438888889, 108.199166667),
-    "VVGL": (21.040975, 105.886011111),
-    "VVNB": (21.2216666667, 105.805555556),
-    "VVNS": (21.2147222222, 104.035277778),
-    "VVNT": (12.2180555556, 109.2),
-    "VVPB": (16.4016666667, 107.702777778),
-    "VVPC": (13.955, 109.042222222),
-    "VVPK": (14.0044444444, 108.017222222),
-    "VVPQ": (10.2258333333, 103.960833333),
-    "VVRG": (9.95972222222, 105.133888889),
-    "VVTH": (13.0494444444, 109.333611111),
-    "VVTS": (10.82, 106.661666667),
-    "VVVH": (18.736725, 105.670880556),
-    "VVVT": (10.3702777778, 107.093333333),
-    "VYBG": (21.1819444444, 94.9291666667),
-    "VYBM": (24.2688888889, 97.2461111111),
-    "VYCI": (14.1413888889, 93.3683333333),
-    "VYCZ": (21.9405388889, 96.0895861111),
-    "VYDW": (14.0980555556, 98.2016666667),
-    "VYEL": (19.6191305556, 96.1999388889),
-    "VYHH": (20.7430555556, 96.7916666667),
-    "VYKG": (21.3005555556, 99.6366666667),
-    "VYKI": (25.9883333333, 95.6744444444),
-    "VYKL": (23.1886111111, 94.0508333333),
-    "VYKP": (19.4266666667, 93.5344444444),
-    "VYKT": (10.0491666667, 98.5377777778),
-    "VYLK": (19.6922222222, 97.2147222222),
-    "VYLS": (22.9775, 97.7522222222),
-    "VYLY": (20.9402777778, 94.8225),
-    "VYMD": (21.7019444444, 95.9777777778),
-    "VYME": (12.4433333333, 98.6211111111),
-    "VYMK": (25.3825, 97.3527777778),
-    "VYMM": (16.4447222222, 97.6605555556),
-    "VYMO": (23.0925, 96.645),
-    "VYMS": (20.5166666667, 99.2566666667),
-    "VYNP": (25.3541666667, 97.295),
-    "VYNS": (20.89, 97.7361111111),
-    "VYNT": (19.6191305556, 96.1999388889),
-    "VYPA": (16.8944444444, 97.6752777778),
-    "VYPK": (21.4488888889, 94.4869444444),
-    "VYPN": (16.8127777778, 94.7752777778),
-    "VYPT": (27.3297222222, 97.4261111111),
-    "VYPU": (21.3444444444, 95.1022222222),
-    "VYPY": (18.8244444444, 95.2658333333),
-    "VYST": (20.9416666667, 95.9144444444),
-    "VYSW": (20.1325, 92.8725),
-    "VYTD": (18.4605555556, 94.2994444444),
-    "VYTL": (20.4836111111, 99.9352777778),
-    "VYTO": (19.0311111111, 96.4013888889),
-    "VYYY": (16.9072222222, 96.1330555556),
-    "WAAA": (-5.06166666667, 119.553888889),
-    "WAAB": (-5.48777777778, 122.568333333),
-    "WAAJ": (-2.58666666667, 119.029166667),
-    "WAAL": (-4.31666666667, 122.466666667),
-    "WAAM": (-2.55777777778, 120.324166667),
-    "WAAS": (-2.52944444444, 121.357222222),
-    "WAAT": (-3.045, 119.821666667),
-    "WAAU": (-4.08222222222, 122.416666667),
-    "WABB": (-1.19, 136.107777778),
-    "WABI": (-3.36805555556, 135.496388889),
-    "WABP": (-4.52805555556, 136.887222222),
-    "WABT": (-3.92583333333, 136.378055556),
-    "WADA": (-8.56055555556, 116.094166667),
-    "WADB": (-8.53972222222, 118.687222222),
-    "WADD": (-8.74805555556, 115.1675),
-    "WADL": (-8.75805555556, 116.276388889),
-    "WADT": (-9.40971666667, 119.244494444),
-    "WAJA": (-3.33333333333, 128.916666667),
-    "WAJB": (-3.71666666667, 138.65),
-    "WAJJ": (-2.57694444444, 140.516111111),
-    "WAJW": (-4.09611111111, 138.9525),
-    "WAKE": (-7.16666666667, 139.583333333),
-    "WAKK": (-8.52027777778, 140.418333333),
-    "WALF": (4.13666666667, 117.666944444),
-    "WALL": (-1.26833333333, 116.894444444),
-    "WALP": (1.70361111111, 114.970277778),
-    "WALR": (3.32666666667, 117.565555556),
-    "WALV": (3.45583333333, 117.867222222),
-    "WAMG": (0.636666666667, 122.851944444),
-    "WAMH": (3.68305555556, 125.527777778),
-    "WAML": (-0.918333333333, 119.909444444),
-    "WAMM": (1.54916666667, 124.926388889),
-    "WAMN": (4.00694444444, 126.672777778),
-    "WAMP": (-1.41666666667, 120.6575),
-    "WAMR": (2.04604444444, 128.3248),
-    "WAMT": (0.831944444444, 127.380555556),
-    "WAMW": (-1.03888888889, 122.771666667),
-    "WAPA": (-3.33333333333, 128.916666667),
-    "WAPD": (-5.77166666667, 134.2125),
-    "WAPG": (-3.85583333333, 126.699722222),
-    "WAPL": (-5.66138888889, 132.731388889),
-    "WAPP": (-3.70888888889, 128.09),
-    "WAPR": (-3.25, 127.083333333),
-    "WARI": (-7.61576666667, 111.434116667),
-    "WARJ": (-7.78805555556, 110.431666667),
-    "WARQ": (-7.51611111111, 110.756944444),
-    "WARR": (-7.37972222222, 112.786944444),
-    "WARS": (-6.97138888889, 110.374166667),
-    "WASK": (-3.64388888889, 133.695277778),
-    "WASO": (-2.55, 133.416666667),
-    "WASR": (-0.88, 134.050277778),
-    "WASS": (-0.925833333333, 131.12),
-    "WATA": (-9.33333333333, 124.9),
-    "WATB": (-8.7125, 121.0625),
-    "WATC": (-8.64085555556, 122.236822222),
-    "WATG": (-8.595833, 120.477778),
-    "WATL": (-8.27454444444, 123.002327778),
-    "WATM": (-8.13166666667, 124.5975),
-    "WATO": (-8.48666666667, 119.889166667),
-    "WATS": (-10.4277777778, 121.897777778),
-    "WATT": (-10.1713888889, 123.671111111),
-    "WBAK": (4.63666666667, 114.381111111),
-    "WBGB": (3.17222222222, 113.044444444),
-    "WBGC": (2.63611111111, 113.760555556),
-    "WBGD": (4.21638888889, 115.582777778),
-    "WBGE": (2.61666666667, 114.133333333),
-    "WBGF": (3.45944444444, 115.178611111),
-    "WBGG": (1.48472222222, 110.346388889),
-    "WBGI": (3.97611111111, 115.063333333),
-    "WBGJ": (4.80805555556, 115.010277778),
-    "WBGK": (2.90694444444, 112.075),
-    "WBGL": (3.31305555556, 114.783055556),
-    "WBGM": (4.17805555556, 114.331388889),
-    "WBGN": (1.81361111111, 109.762777778),
-    "WBGP": (2.00972222222, 112.931944444),
-    "WBGQ": (3.98861111111, 115.618888889),
-    "WBGR": (4.325, 113.988333333),
-    "WBGS": (2.26388888889, 111.982777778),
-    "WBGT": (2.17777777778, 111.201944444),
-    "WBGU": (4.55222222222, 115.493888889),
-    "WBGW": (4.84916666667, 115.402777778),
-    "WBGZ": (3.73694444444, 115.469444444),
-    "WBKA": (4.44972222222, 118.596388889),
-    "WBKD": (5.03222222222, 118.323888889),
-    "WBKG": (5.35527777778, 116.165),
-    "WBKK": (5.93722222222, 116.051111111),
-    "WBKL": (5.30055555556, 115.25),
-    "WBKM": (5.39972222222, 118.646388889),
-    "WBKN": (4.40944444444, 115.718888889),
-    "WBKS": (5.90166666667, 118.048611111),
-    "WBKT": (6.92416666667, 116.830833333),
-    "WBKW": (4.31333333333, 118.121944444),
-    "WBMU": (4.05055555556, 114.809166667),
-    "WBSB": (4.94555555556, 114.927777778),
-    "WI1A": (-7.72038888889, 108.489938889),
-    "WIAA": (5.87388888889, 95.3394444444),
-    "WIAM": (-7.34555555556, 108.246388889),
-    "WIAR": (-7.61583333333, 111.433888889),
-    "WIAS": (-7.92611111111, 112.713888889),
-    "WIBB": (0.461111111111, 101.444444444),
-    "WIBD": (1.60916666667, 101.433333333),
-    "WIBR": (-2.1, 99.7044444444),
-    "WICC": (-6.90055555556, 107.576388889),
-    "WICD": (-6.75614444444, 108.539672222),
-    "WICM": (-7.34660277778, 108.246091667),
-    "WIDD": (1.12083333333, 104.118611111),
-    "WIDN": (0.9225, 104.532222222),
-    "WIHH": (-6.26638888889, 106.891111111),
-    "WIHL": (-7.63333333333, 109.05),
-    "WIIA": (-6.29305555556, 106.569722222),
-    "WIIB": (-6.90055555556, 107.576111111),
-    "WIIC": (-6.75583333333, 108.539444444),
-    "WIIH": (-6.26638888889, 106.891111111),
-    "WIII": (-6.12555555556, 106.655833333),
-    "WIIJ": (-7.78805555556, 110.431944444),
-    "WIIL": (-7.645, 109.033888889),
-    "WIIP": (-6.33694444444, 106.764444444),
-    "WIIS": (-6.97305555556, 110.375277778),
-    "WIIT": (-5.24222222222, 105.178888889),
-    "WIKB": (1.12083333333, 104.118611111),
-    "WIKD": (-2.74555555556, 107.754722222),
-    "WIKK": (-2.16277777778, 106.139166667),
-    "WIKL": (-3.28, 102.917222222),
-    "WIKN": (0.9225, 104.532222222),
-    "WIKS": (-0.479166666667, 104.579166667),
-    "WIMB": (1.16638888889, 97.7027777778),
-    "WIME": (1.39916666667, 99.4319444444),
-    "WIMG": (-0.876111111111, 100.3525),
-    "WIMK": (3.55805555556, 98.6716666667),
-    "WIMM": (3.55805555556, 98.6716666667),
-    "WIMS": (1.55472222222, 98.8902777778),
-    "WIOG": (-0.348611111111, 111.7475),
-    "WIOK": (-1.81638888889, 109.963333333),
-    "WIOM": (3.34811944444, 106.25805),
-    "WION": (3.90861111111, 108.387777778),
-    "WIOO": (-0.150555555556, 109.403888889),
-    "WIOP": (0.835833333333, 112.935555556),
-    "WIOS": (0.0636111111111, 111.474722222),
-    "WIPA": (-1.63777777778, 103.644166667),
-    "WIPL": (-3.86388888889, 102.340833333),
-    "WIPP": (-2.89777777778, 104.701111111),
-    "WIPQ": (-3.28583333333, 103.879444444),
-    "WIPR": (-0.352777777778, 102.334722222),
-    "WIPT": (-0.786666666667, 100.280555556),
-    "WIPU": (-2.54222222222, 101.088333333),
-    "WITL": (5.06944444444, 97.2591666667),
-    "WITM": (5.22666666667, 96.9502777778),
-    "WITT": (5.52333333333, 95.4202777778),
-    "WMAJ": (3.89972222222, 100.948611111),
-    "WMAP": (2.04138888889, 103.307222222),
-    "WMAU": (2.38333333333, 103.859444444),
-    "WMBA": (4.21638888889, 100.698611111),
-    "WMBI": (4.86361111111, 100.715277778),
-    "WMBT": (2.81805555556, 104.16),
-    "WMGK": (5.79888888889, 102.490277778),
-    "WMKA": (6.19388888889, 100.4025),
-    "WMKB": (5.46583333333, 100.391111111),
-    "WMKC": (6.16638888889, 102.293611111),
-    "WMKD": (3.77527777778, 103.208888889),
-    "WMKE": (4.53722222222, 103.426388889),
-    "WMKF": (3.11222222222, 101.7025),
-    "WMKI": (4.56777777778, 101.091944444),
-    "WMKJ": (1.64111111111, 103.669444444),
-    "WMKK": (2.74555555556, 101.709722222),
-    "WMKL": (6.32972222222, 99.7286111111),
-    "WMKM": (2.26333333333, 102.251388889),
-    "WMKN": (5.3825, 103.103333333),
-    "WMKP": (5.29694444444, 100.276666667),
-    "WMKS": (3.11138888889, 101.702777778),
-    "WMLU": (4.3375, 113.994166667),
-    "WMPA": (4.24472222222, 100.553333333),
-    "WMPR": (5.76527777778, 103.006944444),
-    "WMSA": (3.13111111111, 101.548055556),
-    "WPDB": (-9.30305555556, 125.286666667),
-    "WPDL": (-8.54655277778, 125.524719444),
-    "WPEC": (-8.48527777778, 126.398888889),
-    "WPOC": (-9.19833333333, 124.352222222),
-    "WPVQ": (-8.88388888889, 126.373055556),
-    "WRBB": (-3.44194444444, 114.761111111),
-    "WRBC": (-3.4125, 115.995555556),
-    "WRBI": (-2.705, 111.673055556),
-    "WRBK": (-3.29277777778, 116.162777778),
-    "WRBP": (-2.225, 113.9425),
-    "WRBS": (-2.50111111111, 112.976944444),
-    "WRKC": (-8.64055555556, 122.236666667),
-    "WRKE": (-8.84888888889, 121.661944444),
-    "WRKG": (-8.59555555556, 120.4775),
-    "WRKK": (-10.1713888889, 123.671111111),
-    "WRKO": (-8.48611111111, 119.889166667),
-    "WRLB": (3.86666666667, 115.683333333),
-    "WRLC": (0.121661111111, 117.476572222),
-    "WRLF": (4.13666666667, 117.666944444),
-    "WRLK": (2.15444444444, 117.432222222),
-    "WRLL": (-1.26805555556, 116.894444444),
-    "WRLR": (3.32638888889, 117.566388889),
-    "WRLS": (-0.484444444444, 117.156944444),
-    "WRLT": (-0.0930555555556, 117.439166667),
-    "WRRA": (-8.56055555556, 116.094444444),
-    "WRRB": (-8.53944444444, 118.687222222),
-    "WRRR": (-8.74833333333, 115.167222222),
-    "WRRS": (-8.48888888889, 117.411944444),
-    "WRRT": (-9.40944444444, 119.246111111),
-    "WRRW": (-9.67, 120.303611111),
-    "WRSC": (-7.19472222222, 111.548055556),
-    "WRSJ": (-7.37972222222, 112.786666667),
-    "WRSQ": (-7.51583333333, 110.756666667),
-    "WRST": (-7.02425, 113.890205556),
-    "WSAG": (1.42361111111, 103.811388889),
-    "WSAP": (1.36027777778, 103.909444444),
-    "WSAT": (1.38722222222, 103.708611111),
-    "WSSL": (1.41694444444, 103.8675),
-    "WSSS": (1.35555555556, 103.987222222),
-    "YABA": (-34.9433333333, 117.808888889),
-    "YAMB": (-27.6405555556, 152.711944444),
-    "YAMC": (-22.9666666667, 145.241666667),
-    "YAMK": (-30.4383333333, 137.136666667),
-    "YAPH": (-23.6466666667, 146.583333333),
-    "YARA": (-37.31, 142.988333333),
-    "YARG": (-16.6369444444, 128.451388889),
-    "YARM": (-30.5283333333, 151.616666667),
-    "YARY": (-26.69, 141.046666667),
-    "YAUR": (-13.3538888889, 141.720833333),
-    "YAYE": (-25.1861111111, 130.975555556),
-    "YBAF": (-27.5702777778, 153.008055556),
-    "YBAM": (-10.9508333333, 142.459444444),
-    "YBAR": (-23.5652777778, 145.306666667),
-    "YBAS": (-23.8069444444, 133.902222222),
-    "YBAU": (-10.15, 142.175),
-    "YBBN": (-27.3841666667, 153.1175),
-    "YBCG": (-28.1644444444, 153.504722222),
-    "YBCK": (-24.4277777778, 145.428611111),
-    "YBCS": (-16.8858333333, 145.755277778),
-    "YBCV": (-26.4133333333, 146.2625),
-    "YBDG": (-36.7394444444, 144.329722222),
-    "YBDV": (-25.8975, 139.3475),
-    "YBGO": (-20.1483333333, 127.973333333),
-    "YBHI": (-32.0016666667, 141.471666667),
-    "YBHM": (-20.3580555556, 148.951666667),
-    "YBIE": (-24.3461111111, 139.46),
-    "YBKE": (-30.0383333333, 145.951666667),
-    "YBKT": (-17.7486111111, 139.534444444),
-    "YBLA": (-36.5516666667, 146.006666667),
-    "YBLN": (-33.6872222222, 115.400277778),
-    "YBLT": (-37.5116666667, 143.791111111),
-    "YBMA": (-20.6638888889, 139.488611111),
-    "YBMC": (-26.6033333333, 153.091111111),
-    "YBMK": (-21.1716666667, 149.179722222),
-    "YBNA": (-28.8333333333, 153.561666667),
-    "YBNS": (-37.8875, 147.567777778),
-    "YBOI": (-9.23333333333, 142.216666667),
-    "YBOK": (-27.4113888889, 151.735277778),
-    "YBOU": (-22.9133333333, 139.899722222),
-    "YBPN": (-20.495, 148.552222222),
-    "YBRK": (-23.3819444444, 150.475277778),
-    "YBRL": (-16.0680555556, 136.300277778),
-    "YBRM": (-17.9497222222, 122.227777778),
-    "YBRN": (-34.6233333333, 143.578333333),
-    "YBRS": (-38.2583333333, 144.426666667),
-    "YBRW": (-29.9733333333, 146.816666667),
-    "YBRY": (-22.6738888889, 119.166111111),
-    "YBSG": (-12.6233333333, 142.086666667),
-    "YBSU": (-26.6033333333, 153.091666667),
-    "YBTH": (-33.41, 149.651666667),
-    "YBTI": (-11.7691666667, 130.619722222),
-    "YBTL": (-19.2525, 146.765277778),
-    "YBTR": (-23.6030555556, 148.806944444),
-    "YBUD": (-24.9038888889, 152.318611111),
-    "YBUN": (-33.3780555556, 115.676944444),
-    "YBWN": (-20.0177777778, 148.215277778),
-    "YBWP": (-12.6786111111, 141.925277778),
-    "YBWX": (-20.8658333333, 115.404722222),
-    "YCAH": (-31.7733333333, 149.61),
-    "YCAR": (-24.8805555556, 113.672222222),
-    "YCBA": (-31.5383333333, 145.793333333),
-    "YCBB": (-31.3333333333, 149.266666667),
-    "YCBG": (-42.8266666667, 147.475),
-    "YCBP": (-29.04, 134.721666667),
-    "YCBR": (-29.5216666667, 148.581666667),
-    "YCCA": (-26.7694444444, 150.616666667),
-    "YCCT": (-10.05, 143.066666667),
-    "YCCY": (-20.6686111111, 140.504444444),
-    "YCDO": (-33.065, 147.208333333),
-    "YCDR": (-26.8016666667, 153.105),
-    "YCDU": (-32.1305555556, 133.709722222),
-    "YCEE": (-33.71, 136.505),
-    "YCFS": (-30.32, 153.116666667),
-    "YCGO": (-17.1427777778, 144.528888889),
-    "YCHT": (-20.0433333333, 146.273333333),
-    "YCIN": (-17.5813888889, 123.828333333),
-    "YCKI": (-11.165, 132.483333333),
-    "YCKN": (-15.4447222222, 145.184444444),
-    "YCMT": (-22.7733333333, 147.62),
-    "YCMU": (-28.03, 145.622222222),
-    "YCMW": (-19.9116666667, 138.125),
-    "YCNK": (-32.7883333333, 151.341666667),
-    "YCNM": (-30.9833333333, 148.375),
-    "YCOE": (-13.7619444444, 143.116666667),
-    "YCOM": (-36.3, 148.973333333),
-    "YCOR": (-35.99, 146.351666667),
-    "YCRG": (-36.1827777778, 147.887777778),
-    "YCRK": (-18.8833333333, 125.916666667),
-    "YCTM": (-34.625, 148.035),
-    "YCUE": (-27.4466666667, 117.918333333),
-    "YCWA": (-22.9666666667, 118.802222222),
-    "YCWL": (-33.6666666667, 136.891666667),
-    "YCWR": (-23.845, 134.598333333),
-    "YDBI": (-28.5916666667, 148.216666667),
-    "YDBY": (-17.37, 123.660555556),
-    "YDKI": (-17.9416666667, 146.14),
-    "YDLQ": (-35.56, 144.946666667),
-    "YDMG": (-17.94, 138.821666667),
-    "YDOC": (-32.65, 151.208333333),
-    "YDPO": (-41.1697222222, 146.430277778),
-    "YDYS": (-22.6222222222, 148.363888889),
-    "YECH": (-36.1572222222, 144.761944444),
-    "YELD": (-12.02, 135.57),
-    "YEML": (-23.5675, 148.179166667),
-    "YESE": (-20.9761111111, 141.006388889),
-    "YESP": (-33.6844444444, 121.822777778),
-    "YEVD": (-29.0933333333, 153.42),
-    "YFBS": (-33.3633333333, 147.935),
-    "YFLI": (-40.0913888889, 147.992777778),
-    "YFRT": (-30.8383333333, 128.115),
-    "YFTZ": (-18.1819444444, 125.558611111),
-    "YGAD": (-32.2416666667, 115.683333333),
-    "YGAY": (-25.6152777778, 151.620833333),
-    "YGDH": (-30.9616666667, 150.25),
-    "YGDI": (-28.5213888889, 150.320277778),
-    "YGEL": (-28.7961111111, 114.7075),
-    "YGFN": (-29.76, 153.03),
-    "YGIG": (-31.465, 115.863333333),
-    "YGLA": (-23.8697222222, 151.222777778),
-    "YGLB": (-34.8016666667, 149.718333333),
-    "YGLG": (-38.2252777778, 144.333055556),
-    "YGLI": (-29.675, 151.69),
-    "YGNB": (-33.7633333333, 150.636666667),
-    "YGPT": (-11.3991666667, 130.425277778),
-    "YGTE": (-13.975, 136.46),
-    "YGTH": (-34.2516666667, 146.066666667),
-    "YGTO": (-41.08, 146.84),
-    "YGWA": (-35.4816666667, 138.751666667),
-    "YGYM": (-26.2833333333, 152.701666667),
-    "YHAY": (-34.5313888889, 144.829722222),
-    "YHBA": (-25.3188888889, 152.880277778),
-    "YHID": (-10.5863888889, 142.29),
-    "YHLC": (-18.2338888889, 127.669722222),
-    "YHML": (-37.6483333333, 142.065),
-    "YHOT": (-37.0475, 147.334166667),
-    "YHOX": (-33.9097222222, 150.852222222),
-    "YHPN": (-35.715, 142.36),
-    "YHSM": (-36.6697222222, 142.172777778),
-    "YHUG": (-20.815, 144.225),
-    "YIMB": (-33.0997222222, 136.459722222),
-    "YIVL": (-29.8883333333, 151.144166667),
-    "YJAB": (-12.6583333333, 132.893333333),
-    "YJBY": (-35.1466666667, 150.696666667),
-    "YJLC": (-20.6683333333, 141.7225),
-    "YJNB": (-30.3033333333, 115.055),
-    "YKBL": (-31.19, 121.598333333),
-    "YKBR": (-27.6916666667, 114.26),
-    "YKBY": (-32.8336111111, 134.293333333),
-    "YKER": (-35.7516666667, 143.94),
-    "YKII": (-39.8775, 143.878333333),
-    "YKKG": (-17.4319444444, 130.808055556),
-    "YKMB": (-17.455, 140.831666667),
-    "YKMP": (-31.0744444444, 152.769722222),
-    "YKNG": (-33.6994444444, 117.655),
-    "YKOW": (-15.4855555556, 141.751388889),
-    "YKRY": (-26.58, 151.841666667),
-    "YKSC": (-35.7138888889, 137.521666667),
-    "YKTN": (-37.225, 144.446666667),
-    "YKUB": (-10.225, 142.223333333),
-    "YLEC": (-30.5983333333, 138.426666667),
-    "YLED": (-37.9183333333, 144.101666667),
-    "YLEG": (-38.495, 145.86),
-    "YLEO": (-28.8780555556, 121.315555556),
-    "YLEV": (-12.4983333333, 135.805),
-    "YLHI": (-31.5383333333, 159.077222222),
-    "YLHR": (-12.7869444444, 143.304722222),
-    "YLIL": (-37.6916666667, 145.366666667),
-    "YLIS": (-28.8280555556, 153.26),
-    "YLOX": (-34.475, 140.663333333),
-    "YLRD": (-29.4566666667, 147.985),
-    "YLRE": (-23.4341666667, 144.280277778),
-    "YLST": (-27.8433333333, 120.703333333),
-    "YLTN": (-28.6136111111, 122.423888889),
-    "YLTV": (-38.2072222222, 146.470277778),
-    "YLVK": (-19.3216666667, 146.801666667),
-    "YLZI": (-14.6733333333, 145.455),
-    "YMAV": (-38.0394444444, 144.469444444),
-    "YMAY": (-36.0677777778, 146.958055556),
-    "YMBA": (-17.0691666667, 145.419166667),
-    "YMBD": (-35.0666666667, 139.226666667),
-    "YMBU": (-37.0333333333, 143.708333333),
-    "YMCO": (-37.5988888889, 149.720833333),
-    "YMDG": (-32.5625, 149.611111111),
-    "YMEK": (-26.6116666667, 118.547777778),
-    "YMEN": (-37.7280555556, 144.901944444),
-    "YMER": (-36.9086111111, 149.901388889),
-    "YMES": (-38.0988888889, 147.149444444),
-    "YMGB": (-12.0944444444, 134.893611111),
-    "YMGD": (-12.0561111111, 134.234166667),
-    "YMGT": (-33.93, 115.1),
-    "YMHB": (-42.8361111111, 147.510277778),
-    "YMIA": (-34.2291666667, 142.085555556),
-    "YMJM": (-34.2652777778, 116.140277778),
-    "YMLT": (-41.5452777778, 147.214166667),
-    "YMMB": (-37.9758333333, 145.102222222),
-    "YMML": (-37.6733333333, 144.843333333),
-    "YMMU": (-22.8033333333, 148.705),
-    "YMND": (-32.7033333333, 151.488333333),
-    "YMNE": (-27.2863888889, 120.554722222),
-    "YMNG": (-36.8883333333, 145.184166667),
-    "YMOG": (-28.1161111111, 117.841666667),
-    "YMOR": (-29.4988888889, 149.844722222),
-    "YMPC": (-37.9322222222, 144.753333333),
-    "YMRB": (-22.0577777778, 148.0775),
-    "YMRW": (-29.2013888889, 116.021944444),
-    "YMRY": (-35.8977777778, 150.144444444),
-    "YMTG": (-37.7455555556, 140.785277778),
-    "YMUI": (-9.91472222222, 144.054166667),
-    "YMWA": (-28.4738888889, 115.517777778),
-    "YMYB": (-25.5133333333, 152.715),
-    "YNAR": (-34.7022222222, 146.512222222),
-    "YNBR": (-30.3191666667, 149.827222222),
-    "YNGU": (-14.7227777778, 134.7475),
-    "YNHL": (-36.3097222222, 141.640833333),
-    "YNRC": (-36.985, 140.718055556),
-    "YNRM": (-32.2144444444, 148.224722222),
-    "YNTN": (-17.685, 141.07),
-    "YNWN": (-23.4177777778, 119.802777778),
-    "YNYN": (-31.5516666667, 147.203333333),
-    "YOLW": (-21.6683333333, 115.113055556),
-    "YOOD": (-27.56, 135.445),
-    "YOOM": (-28.1, 140.196666667),
-    "YORB": (-37.79, 148.61),
-    "YORG": (-33.3816666667, 149.133055556),
-    "YPAD": (-34.945, 138.530555556),
-    "YPAG": (-32.5069444444, 137.716666667),
-    "YPAM": (-18.7552777778, 146.581388889),
-    "YPBO": (-23.1713888889, 117.745555556),
-    "YPCC": (-12.1886111111, 96.8305555556),
-    "YPDN": (-12.4147222222, 130.876666667),
-    "YPEA": (-31.6677777778, 116.015),
-    "YPEC": (-33.0666666667, 151.648333333),
-    "YPED": (-34.7025, 138.620833333),
-    "YPGV": (-12.27, 136.818333333),
-    "YPIR": (-33.2388888889, 137.995),
-    "YPJT": (-32.0972222222, 115.881111111),
-    "YPKA": (-20.7122222222, 116.773333333),
-    "YPKG": (-30.7894444444, 121.461666667),
-    "YPKS": (-33.1313888889, 148.239166667),
-    "YPKT": (-14.2483333333, 129.528333333),
-    "YPKU": (-15.7780555556, 128.7075),
-    "YPLC": (-34.6052777778, 135.880277778),
-    "YPLM": (-22.2355555556, 114.088611111),
-    "YPMP": (-14.8966666667, 141.609444444),
-    "YPMQ": (-31.4358333333, 152.863333333),
-    "YPOD": (-38.3180555556, 141.471111111),
-    "YPPD": (-20.3777777778, 118.626388889),
-    "YPPF": (-34.7933333333, 138.633055556),
-    "YPPH": (-31.9402777778, 115.966944444),
-    "YPSV": (-23.5430555556, 140.703333333),
-    "YPTN": (-14.5211111111, 132.377777778),
-    "YPWR": (-31.1441666667, 136.816944444),
-    "YPXM": (-10.4505555556, 105.690277778),
-    "YQLP": (-26.6086111111, 144.257222222),
-    "YRED": (-27.2066666667, 153.068333333),
-    "YREN": (-34.1966666667, 140.673333333),
-    "YRMD": (-20.7019444444, 143.114722222),
-    "YROI": (-34.65, 142.116666667),
-    "YROM": (-26.545, 148.774722222),
-    "YRTI": (-32.0066666667, 115.539722222),
-    "YSBK": (-33.9244444444, 150.988333333),
-    "YSCB": (-35.3083333333, 149.193888889),
-    "YSCH": (-30.3205555556, 153.116388889),
-    "YSCN": (-34.0402777778, 150.687222222),
-    "YSDU": (-32.2166666667, 148.574722222),
-    "YSGE": (-28.05, 148.595),
-    "YSHK": (-25.8933333333, 113.576666667),
-    "YSHR": (-20.2766666667, 148.755277778),
-    "YSHT": (-36.4288888889, 145.3925),
-    "YSHW": (-33.995, 150.951666667),
-    "YSMI": (-40.835, 145.083333333),
-    "YSNB": (-11.4227777778, 130.653611111),
-    "YSNF": (-29.0413888889, 167.938611111),
-    "YSNW": (-34.9488888889, 150.536944444),
-    "YSPE": (-28.6202777778, 151.490555556),
-    "YSPT": (-27.9216666667, 153.371666667),
-    "YSRI": (-33.6005555556, 150.780833333),
-    "YSRN": (-42.1555555556, 145.291388889),
-    "YSSY": (-33.9461111111, 151.177222222),
-    "YSTH": (-41.3366666667, 148.281666667),
-    "YSTW": (-31.0838888889, 150.846666667),
-    "YSWG": (-35.1652777778, 147.466388889),
-    "YSWH": (-35.3758333333, 143.549444444),
-    "YSWL": (-37.0716666667, 142.74),
-    "YTAM": (-25.8019444444, 149.913333333),
-    "YTEM": (-34.4216666667, 147.511666667),
-    "YTGM": (-27.9863888889, 143.810833333),
-    "YTIB": (-29.4516666667, 142.058333333),
-    "YTMU": (-35.2627777778, 148.240833333),
-    "YTNG": (-24.4938888889, 150.578888889),
-    "YTNK": (-19.6344444444, 134.183333333),
-    "YTOC": (-35.8108333333, 145.604166667),
-    "YTRE": (-31.8886111111, 152.513888889),
-    "YTWB": (-27.5413888889, 151.9125),
-    "YWBL": (-38.2952777778, 142.446666667),
-    "YWDH": (-25.4133333333, 142.666666667),
-    "YWGT": (-36.4158333333, 146.306944444),
-    "YWHA": (-33.0588888889, 137.514444444),
-    "YWHI": (-20.2766666667, 148.755277778),
-    "YWIS": (-22.4733333333, 150.178333333),
-    "YWKB": (-36.3211111111, 142.419444444),
-    "YWKI": (-34.1833333333, 140.03),
-    "YWKS": (-66.6908333333, 111.523611111),
-    "YWLG": (-30.0333333333, 148.125),
-    "YWLM": (-32.795, 151.834444444),
-    "YWLU": (-26.63, 120.22),
-    "YWOL": (-34.5611111111, 150.788611111),
-    "YWRN": (-31.7333333333, 147.803333333),
-    "YWSL": (-38.0916666667, 146.965277778),
-    "YWTN": (-22.3633333333, 143.085),
-    "YWUD": (-33.0433333333, 135.446666667),
-    "YWVA": (-33.2408333333, 151.427777778),
-    "YWWL": (-33.9366666667, 147.191666667),
-    "YWYM": (-15.5113888889, 128.153055556),
-    "YWYY": (-40.9988888889, 145.731111111),
-    "YYMI": (-9.88583333333, 142.771666667),
-    "YYNG": (-34.2555555556, 148.248055556),
-    "YYRM": (-38.5666666667, 146.755),
-    "ZBAA": (40.08, 116.584444444),
-    "ZBBB": (39.9611111111, 116.256388889),
-    "ZBCF": (42.235, 118.908333333),
-    "ZBCZ": (36.2475, 113.126),
-    "ZBDS": (39.4938888889, 109.862222222),
-    "ZBDT": (40.0602777778, 113.481944444),
-    "ZBER": (43.4266666667, 112.098333333),
-    "ZBHD": (36.5238888889, 114.43),
-    "ZBHH": (40.8533333333, 111.821666667),
-    "ZBLA": (49.205, 119.825),
-    "ZBMZ": (49.5666666667, 117.33),
-    "ZBNY": (39.7825, 116.387777778),
-    "ZBOW": (40.5597222222, 109.996666667),
-    "ZBSH": (39.9680555556, 119.731111111),
-    "ZBSJ": (38.2805555556, 114.696388889),
-    "ZBTJ": (39.1238888889, 117.346111111),
-    "ZBTL": (43.5569333333, 122.199783333),
-    "ZBTS": (39.7252777778, 117.993333333),
-    "ZBUH": (39.7919444444, 106.803333333),
-    "ZBUL": (46.1953333333, 122.008333333),
-    "ZBXH": (43.9166666667, 115.963888889),
-    "ZBXT": (36.8827777778, 114.429166667),
-    "ZBYC": (35.1166666667, 111.039722222),
-    "ZBYN": (37.7466666667, 112.628611111),
-    "ZBZJ": (40.7386111111, 114.930277778),
-    "ZGBH": (21.5394444444, 109.293888889),
-    "ZGBS": (23.7194444444, 106.959166667),
-    "ZGCD": (28.9188888889, 111.64),
-    "ZGCJ": (27.4413888889, 109.699722222),
-    "ZGDY": (29.1030555556, 110.443333333),
-    "ZGFS": (23.0825, 113.070833333),
-    "ZGGG": (23.1841666667, 113.265833333),
-    "ZGHA": (28.1888888889, 113.219444444),
-    "ZGHY": (26.9052777778, 112.627777778),
-    "ZGHZ": (23.0483333333, 114.600277778),
-    "ZGKL": (25.2177777778, 110.039166667),
-    "ZGLG": (26.3455555556, 111.612222222),
-    "ZGMX": (24.35, 116.133055556),
-    "ZGNN": (22.6080555556, 108.172222222),
-    "ZGOW": (23.4, 116.683333333),
-    "ZGSD": (22.0069444444, 113.376111111),
-    "ZGSZ": (22.6394444444, 113.812222222),
-    "ZGWZ": (23.4566666667, 111.248055556),
-    "ZGZH": (24.2075, 109.391111111),
-    "ZGZJ": (21.2175, 110.357777778),
-    "ZHCC": (34.5194444444, 113.840833333),
-    "ZHES": (30.3202777778, 109.485),
-    "ZHHH": (30.7836111111, 114.208055556),
-    "ZHLY": (34.7411111111, 112.388333333),
-    "ZHNY": (32.9808333333, 112.615277778),
-    "ZHXF": (32.15, 112.290555556),
-    "ZHYC": (30.5522222222, 111.468611111),
-    "ZJSY": (18.3028972222, 109.412272222),
-    "ZJYX": (16.8327777778, 112.344444444),
-    "ZKPY": (39.0333333333, 125.783333333),
-    "ZLAK": (32.7080555556, 108.931111111),
-    "ZLDH": (40.1611111111, 94.8091666667),
-    "ZLGM": (36.4006111111, 94.7861111111),
-    "ZLGY": (36.0761111111, 106.218055556),
-    "ZLHZ": (33.0636111111, 107.008055556),
-    "ZLIC": (38.3216666667, 106.3925),
-    "ZLJQ": (39.8569444444, 98.3413888889),
-    "ZLLL": (36.5166666667, 103.621666667),
-    "ZLQY": (35.7997222222, 107.602777778),
-    "ZLTS": (34.5583333333, 105.861111111),
-    "ZLXN": (36.5275, 102.042777778),
-    "ZLXY": (34.4458333333, 108.7525),
-    "ZLYA": (36.6369444444, 109.553888889),
-    "ZLYL": (38.2741666667, 109.730277778),
-    "ZLYS": (32.8391666667, 97.0388888889),
-    "ZLZW": (37.5727777778, 105.154444444),
-    "ZMAH": (46.2525, 102.799166667),
-    "ZMAT": (46.3758333333, 96.2191666667),
-    "ZMBH": (46.1705555556, 100.7),
-    "ZMBN": (48.8541666667, 103.484166667),
-    "ZMBS": (46.1016666667, 91.5819444444),
-    "ZMBU": (46.6602777778, 113.285277778),
-    "ZMCD": (48.1355555556, 114.646111111),
-    "ZMDN": (47.7127777778, 96.5241666667),
-    "ZMDZ": (43.6086111111, 104.366944444),
-    "ZMHH": (47.2466666667, 102.826111111),
-    "ZMHU": (46.9, 102.766666667),
-    "ZMKD": (47.9613888889, 91.6258333333),
-    "ZMMG": (45.7666666667, 106.283333333),
-    "ZMMN": (49.6630555556, 100.099166667),
-    "ZMUB": (47.8430555556, 106.766388889),
-    "ZMUG": (49.9733333333, 92.0797222222),
-    "ZMUL": (48.9916666667, 89.9197222222),
-    "ZPBS": (25.0533333333, 99.1683333333),
-    "ZPDL": (25.6511111111, 100.318333333),
-    "ZPDQ": (27.7933333333, 99.6773333333),
-    "ZPJH": (21.975, 100.76),
-    "ZPLC": (23.7383333333, 100.025),
-    "ZPLJ": (26.6791666667, 100.245833333),
-    "ZPMS": (24.4, 98.5477777778),
-    "ZPPP": (24.9922222222, 102.743333333),
-    "ZPSM": (22.7933333333, 100.958888889),
-    "ZPWS": (23.5636111111, 104.333611111),
-    "ZPZT": (27.3277777778, 103.756666667),
-    "ZSAM": (24.5438888889, 118.1275),
-    "ZSAQ": (30.5822222222, 117.050277778),
-    "ZSBB": (32.8475, 117.320277778),
-    "ZSCG": (31.9019444444, 119.781111111),
-    "ZSCN": (28.6, 115.916666667),
-    "ZSDY": (37.5102777778, 118.784444444),
-    "ZSFY": (32.8819444444, 115.734444444),
-    "ZSFZ": (25.9333333333, 119.661666667),
-    "ZSGZ": (25.8516666667, 114.776666667),
-    "ZSHC": (30.2283333333, 120.431666667),
-    "ZSJA": (26.8575, 114.737222222),
-    "ZSJD": (29.3386111111, 117.175833333),
-    "ZSJG": (35.2927777778, 116.346666667),
-    "ZSJJ": (29.4769444444, 115.801111111),
-    "ZSJN": (36.8572222222, 117.216111111),
-    "ZSJU": (28.9658333333, 118.899444444),
-    "ZSLD": (25.6741666667, 116.746388889),
-    "ZSLG": (34.5716666667, 118.873611111),
-    "ZSLQ": (28.5622222222, 121.428611111),
-    "ZSLY": (35.0461111111, 118.411666667),
-    "ZSNB": (29.8247222222, 121.465),
-    "ZSNJ": (31.74, 118.86),
-    "ZSNT": (32.0708333333, 120.975555556),
-    "ZSOF": (31.78, 117.298333333),
-    "ZSPD": (31.1433333333, 121.805277778),
-    "ZSQD": (36.2625, 120.375277778),
-    "ZSQZ": (24.7988888889, 118.589444444),
-    "ZSSH": (33.7772222222, 119.147777778),
-    "ZSSL": (31.1669444444, 121.453611111),
-    "ZSSS": (31.1977777778, 121.336111111),
-    "ZSSZ": (31.2630555556, 120.400555556),
-    "ZSTX": (29.73, 118.252777778),
-    "ZSWF": (36.6466666667, 119.118333333),
-    "ZSWH": (37.1869444444, 122.228888889),
-    "ZSWU": (31.3905555556, 118.409444444),
-    "ZSWX": (31.4944444444, 120.429444444),
-    "ZSWY": (27.7008333333, 118.000277778),
-    "ZSWZ": (27.9119444444, 120.851944444),
-    "ZSXZ": (34.0590555556, 117.555277778),
-    "ZSYA": (32.5616666667, 119.715),
-    "ZSYC": (27.8033333333, 114.308055556),
-    "ZSYN": (33.4258333333, 120.203055556),
-    "ZSYT": (37.4016666667, 121.371666667),
-    "ZSYW": (29.3447222222, 120.032222222),
-    "ZSZS": (29.9341666667, 122.362222222),
-    "ZUAL": (32.1086111111, 80.0527777778),
-    "ZUAS": (26.2605555556, 105.873055556),
-    "ZUBD": (30.5536111111, 97.1086111111),
-    "ZUCK": (29.7188888889, 106.641388889),
-    "ZUDC": (29.3230555556, 100.053333333),
-    "ZUDX": (31.3, 107.5),
-    "ZUGU": (32.3911111111, 105.701944444),
-    "ZUGY": (26.5386111111, 106.800833333),
-    "ZUJZ": (32.8541666667, 103.685277778),
-    "ZUKD": (30.1575, 101.734722222),
-    "ZULB": (25.4525, 107.961666667),
-    "ZULP": (30.6794444444, 107.786111111),
-    "ZULS": (29.2977777778, 90.9119444444),
-    "ZULZ": (28.8527777778, 105.391111111),
-    "ZUMY": (31.43, 104.739722222),
-    "ZUNC": (30.7938888889, 106.159722222),
-    "ZUNP": (26.3227777778, 109.151666667),
-    "ZUNZ": (29.3033333333, 94.3352777778),
-    "ZUQJ": (29.5175, 108.829166667),
-    "ZURK": (29.3516666667, 89.3069444444),
-    "ZUTC": (24.9913888889, 98.4958333333),
-    "ZUTR": (27.8833333333, 109.308888889),
-    "ZUUU": (30.5783333333, 103.946944444),
-    "ZUWX": (30.7977777778, 108.431388889),
-    "ZUXC": (27.9886111111, 102.184166667),
-    "ZUXJ": (30.4202777778, 103.844722222),
-    "ZUYB": (28.8002777778, 104.544444444),
-    "ZUYI": (25.0883333333, 104.958611111),
-    "ZUZH": (26.5423138889, 101.798519444),
-    "ZUZY": (27.59, 106.999722222),
-    "ZWAK": (41.2625, 80.2916666667),
-    "ZWAT": (47.7503611111, 88.0844444444),
-    "ZWBL": (44.895, 82.2997222222),
-    "ZWCM": (38.1494444444, 85.5327777778),
-    "ZWFY": (46.8011111111, 89.5383333333),
-    "ZWHM": (42.8425, 93.6694444444),
-    "ZWKC": (41.7180555556, 82.9869444444),
-    "ZWKL": (41.6163888889, 86.1430555556),
-    "ZWKM": (45.4663888889, 84.9525),
-    "ZWKN": (48.2211111111, 86.9980555556),
-    "ZWNL": (43.4330555556, 83.3802777778),
-    "ZWSH": (39.5433333333, 76.0216666667),
-    "ZWTC": (46.6725, 83.3408333333),
-    "ZWTN": (37.0377777778, 79.8658333333),
-    "ZWTP": (43.0305555556, 89.1005555556),
-    "ZWWW": (43.9069444444, 87.4741666667),
-    "ZWYN": (43.9558333333, 81.3302777778),
-    "ZYAS": (41.1047222222, 122.855833333),
-    "ZYBS": (42.0880555556, 127.548888889),
-    "ZYCC": (43.9961111111, 125.685277778),
-    "ZYCY": (41.5380555556, 120.435),
-    "ZYDD": (40.024444, 124.285833),
-    "ZYDQ": (46.5872222222, 125.228333333),
-    "ZYHB": (45.6233333333, 126.250277778),
-    "ZYHE": (50.1722222222, 127.308611111),
-    "ZYJL": (44.0022222222, 126.395555556),
-    "ZYJM": (46.8433333333, 130.465277778),
-    "ZYJX": (45.3061111111, 130.996666667),
-    "ZYJZ": (41.1013888889, 121.061666667),
-    "ZYLD": (47.7519444444, 129.018888889),
-    "ZYMD": (44.5238888889, 129.568888889),
-    "ZYMH": (52.9211111111, 122.420555556),
-    "ZYQQ": (47.2397222222, 123.918055556),
-    "ZYTL": (38.9655555556, 121.538333333),
-    "ZYTN": (42.2538888889, 125.703888889),
-    "ZYTX": (41.64, 123.483611111),
-    "ZYYJ": (42.8816666667, 129.448333333),
-}
+"""
+icao.py - ICAO station positions
+
+The table lives in icao.dat next to this file: a header, then the codes
+(four ASCII bytes each, sorted) and the latitudes and longitudes as two
+parallel arrays of float64. `data` maps code -> (lat, lon) like the dict
+this module used to hold, but only maps the file into memory on first use.
+"""
+import array, bisect, collections.abc, mmap, os, struct, sys, threading
+
+PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icao.dat')
+# magic, stations
+HEADER = '<4sI'
+MAGIC = b'ICA1'
+
+
+class Codes(object):
+    """The sorted station codes of the table, as a sequence bisect can search."""
+    def __init__(self, view):
+        self.view = view
+
+    def __len__(self):
+        return len(self.view) // 4
+
+    def __getitem__(self, i):
+        return bytes(self.view[4 * i:4 * i + 4]).decode('ascii')
+
+
+class StationTable(collections.abc.Mapping):
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.codes = None
+
+    def load(self):
+        with self.lock:
+            if self.codes is not None:
+                return
+            with open(self.path, 'rb') as f:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, count = struct.unpack_from(HEADER, self.map)
+            if magic != MAGIC:
+                raise ValueError('%s is not a station table' % self.path)
+            pos = struct.calcsize(HEADER)
+            view = memoryview(self.map)
+            codes = view[pos:pos + 4 * count]
+            pos += 4 * count
+            lats = view[pos:pos + 8 * count]
+            lons = view[pos + 8 * count:pos + 16 * count]
+            if sys.byteorder == 'little':
+                self.lats, self.lons = lats.cast('d'), lons.cast('d')
+            else:
+                self.lats, self.lons = array.array('d', lats), array.array('d', lons)
+                self.lats.byteswap()
+                self.lons.byteswap()
+            self.codes = Codes(codes)
+
+    def __getitem__(self, code):
+        if not isinstance(code, str):
+            raise KeyError(code)
+        if self.codes is None:
+            self.load()
+        i = bisect.bisect_left(self.codes, code)
+        if i < len(self.codes) and self.codes[i] == code:
+            return (self.lats[i], self.lons[i])
+        raise KeyError(code)
+
+    def __contains__(self, code):
+        try: self[code]
+        except KeyError: return False
+        return True
+
+    def __iter__(self):
+        if self.codes is None:
+            self.load()
+        for i in range(len(self.codes)):
+            yield self.codes[i]
+
+    def __len__(self):
+        if self.codes is None:
+            self.load()
+        return len(self.codes)
+
+    def items(self):
+        if self.codes is None:
+            self.load()
+        return zip(self, zip(self.lats, self.lons))
+
+
+def write_table(path, stations):
+    """Write {code: (lat, lon)} `stations` as a table file."""
+    codes = sorted(stations)
+    lats = array.array('d', [stations[code][0] for code in codes])
+    lons = array.array('d', [stations[code][1] for code in codes])
+    if sys.byteorder != 'little':
+        lats.byteswap()
+        lons.byteswap()
+    with open(path, 'wb') as f:
+        f.write(struct.pack(HEADER, MAGIC, len(codes)))
+        f.write(''.join(codes).encode('ascii'))
+        f.write(lats.tobytes())
+        f.write(lons.tobytes())
+
+
+data = StationTable(PATH)
@@ -4,6 +4,7 @@ import sys, re, time, traceback
 import socket, asyncore, asynchat, ssl, select
 import os, codecs
 import errno
+import concurrent.futures
 import tools
 
 IRC_CODES = ('001', '002', '003','004', '005', '253', '251', '252', '254', '255', '265', '266', '250', '315', '328', '332', '333', '352', '353', '366', '372', '375', '376', 'QUIT', 'NICK', 'JOIN')
@@ -90,6 +91,14 @@ class Bot(asynchat.async_chat):
         self.hops = dict()
         self.voices = dict()
 
+        # Server capabilities from RPL_ISUPPORT (005), filled in startup.py.
+        # These defaults are what RFC 1459 servers are assumed to support.
+        self.isupport = {
+            'MODES': 3,
+            'CHANMODES': 'b,k,l,imnpst',
+            'PREFIX': '(ov)@+',
+        }
+
         self.use_ssl = False
         self.use_sasl = False
         self.is_connected = False
@@ -111,6 +120,16 @@ class Bot(asynchat.async_chat):
 
         import threading
         self.sending = threading.RLock()
+        # Messages from async handlers are sent from here, in order
+        self.outbox = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        # Channel ban/quiet/exception lists, keyed on (channel, mode).
+        # Filled in startup.py from 367/368, 348/349, 728/729 and MODE
+        self.masklists = dict()
+
+        # Pending channel mode changes, see queue_mode() and flush_modes()
+        self.mode_queue = dict()
+        self.mode_lock = threading.RLock()
 
     # def push(self, *args, **kargs):
     #     asynchat.async_chat.push(self, *args, **kargs)
@@ -418,13 +437,19 @@ class Bot(asynchat.async_chat):
 
         self.sending.release()
 
+    def msg_later(self, recipient, text, log=False, x=False, wait_time=3):
+        '''Like msg(), but queue the message instead of waiting for the
+        flood control delay. Messages are sent in the order given.'''
+        return self.outbox.submit(self.msg, recipient, text, log, x, wait_time)
+
     def notice(self, dest, text):
         self.write(('NOTICE', dest), text)
 
-    def error(self, origin):
+    def error(self, origin, trace=None):
         try:
             import traceback
-            trace = traceback.format_exc()
+            if trace is None:
+                trace = traceback.format_exc()
             print(trace)
             lines = list(reversed(trace.splitlines()))
 
@@ -481,6 +506,152 @@ class Bot(asynchat.async_chat):
         try: self.voices[channel].remove(name)
         except: pass
 
+    def set_isupport(self, tokens):
+        '''Store the KEY=VALUE tokens of an RPL_ISUPPORT (005) line.'''
+        for token in tokens:
+            if not token or ' ' in token:
+                continue
+            if token.startswith('-'):
+                self.isupport.pop(token[1:].upper(), None)
+                continue
+            key, sep, value = token.partition('=')
+            key = key.upper()
+            if key == 'MODES':
+                try: value = int(value)
+                except ValueError: value = 3
+            self.isupport[key] = value if sep else True
+
+    def prefix_modes(self):
+        '''Return the channel modes that give a nick a status (e.g. 'ov').'''
+        prefix = self.isupport.get('PREFIX') or '(ov)@+'
+        if prefix.startswith('(') and ')' in prefix:
+            return prefix[1:prefix.index(')')]
+        return 'ov'
+
+    def parse_modes(self, modes, params):
+        '''Split a mode string and its parameters into a list of
+        (sign, mode, argument) tuples, e.g. ('+', 'o', 'nick').'''
+        chanmodes = (self.isupport.get('CHANMODES') or 'b,k,l,imnpst').split(',')
+        chanmodes += [''] * (4 - len(chanmodes))
+        with_param = chanmodes[0] + chanmodes[1] + self.prefix_modes()
+        param_on_set = chanmodes[2]
+
+        params = list(params)
+        changes = list()
+        sign = '+'
+        for mode in modes:
+            if mode in '+-':
+                sign = mode
+                continue
+            arg = None
+            if mode in with_param or (sign == '+' and mode in param_on_set):
+                if params:
+                    arg = params.pop(0)
+            changes.append((sign, mode, arg))
+        return changes
+
+    def list_modes(self):
+        '''Return the channel modes that are lists (e.g. 'eIbq').'''
+        return (self.isupport.get('CHANMODES') or 'b').split(',')[0]
+
+    def get_masklist(self, channel, mode, create=False):
+        key = (channel.lower(), mode)
+        if create and key not in self.masklists:
+            self.masklists[key] = tools.MaskList()
+        return self.masklists.get(key)
+
+    def list_room(self, channel, mode):
+        '''Return how many more entries the server's MAXLIST allows for
+        `mode` in `channel`, counting queued additions, or None if unknown.'''
+        maxlist = self.isupport.get('MAXLIST')
+        if not isinstance(maxlist, str):
+            return None
+        for group in maxlist.split(','):
+            modes, sep, limit = group.partition(':')
+            if mode in modes and limit.isdigit():
+                break
+        else:
+            return None
+
+        masklist = self.get_masklist(channel, mode)
+        if masklist is None or not masklist.complete:
+            return None
+        used = 0
+        for each in modes:
+            # Lists we don't keep (e.g. +I) can't be counted
+            masklist = self.get_masklist(channel, each)
+            if masklist is not None:
+                if not masklist.complete:
+                    return None
+                used += len(masklist)
+        with self.mode_lock:
+            pending = self.mode_queue.get(channel.lower(), (channel, []))[1]
+            used += len([c for c in pending if c[0] == '+' and c[1] in modes])
+        return max(0, int(limit) - used)
+
+    def has_mode(self, channel, mode, arg):
+        '''Return True/False if our tracked state knows whether `arg` has
+        `mode` in `channel`, or None when we can't tell.'''
+        masklist = self.get_masklist(channel, mode)
+        if masklist is not None:
+            if not masklist.complete:
+                return None
+            return arg in masklist
+        table = {'o': self.ops, 'h': self.hops, 'v': self.voices}.get(mode)
+        if table is None or channel not in table:
+            return None
+        arg = arg.lower()
+        return any(name.lower() == arg for name in table[channel])
+
+    def queue_mode(self, channel, sign, mode, arg=None):
+        '''Queue a mode change for `channel`. Changes that our tracked state
+        says are already in effect, or that are already queued, are dropped.
+        Returns True if the change was queued.'''
+        known = self.has_mode(channel, mode, arg) if arg else None
+        if known is not None and known == (sign == '+'):
+            return False
+
+        change = (sign, mode, arg)
+        with self.mode_lock:
+            pending = self.mode_queue.setdefault(channel.lower(), (channel, []))[1]
+            if change in pending:
+                return False
+            # Adding and removing the same thing cancels out
+            opposite = ('-' if sign == '+' else '+', mode, arg)
+            if opposite in pending:
+                pending.remove(opposite)
+                return False
+            pending.append(change)
+        return True
+
+    def flush_modes(self, channel=None):
+        '''Send the queued mode changes for `channel` (or every channel),
+        packing as many as the server's MODES limit allows into each line.'''
+        with self.mode_lock:
+            if channel is None:
+                queued = list(self.mode_queue.values())
+                self.mode_queue.clear()
+            else:
+                queued = [self.mode_queue.pop(channel.lower(), (channel, []))]
+
+        try: per_line = max(1, int(self.isupport.get('MODES') or 3))
+        except ValueError: per_line = 3
+
+        for channel, pending in queued:
+            while pending:
+                batch, pending = pending[:per_line], pending[per_line:]
+                modes = str()
+                args = list()
+                sign = None
+                for change_sign, mode, arg in batch:
+                    if change_sign != sign:
+                        modes += change_sign
+                        sign = change_sign
+                    modes += mode
+                    if arg is not None:
+                        args.append(arg)
+                self.write(['MODE', channel, modes] + args)
+
 class TestBot(Bot):
     def f_ping(self, origin, match, args):
         delay = m.group(1)
@@ -10,31 +10,44 @@ def is_chan_admin(kenni, input, a):
             return True
     return False
 
-def voice(kenni, input):
+def get_targets(kenni, input):
     """
-    Command to voice users in a room. If no nick is given,
-    kenni will voice the nick who sent the command
+    Split '.command [#channel] [nick ...]' into the channel and a list of
+    nicks. Nicks may be separated by spaces or commas. If no nick is given
+    the nick who sent the command is used.
     """
     text = input.group().split()
-    argc = len(text)
-    nick = input.nick
     channel = input.sender
     if not tools.isChan(input.sender, False):
         channel = None
-    if argc >= 2 and text[1] is not None:
-        if tools.isChan(text[1], False):
-            channel = text[1]
-            if argc >= 3 and text[2] is not None:
-                nick = text[2]
-        else:
-            nick = text[1]
+    args = text[1:]
+    if args and tools.isChan(args[0], False):
+        channel = args[0]
+        args = args[1:]
+    nicks = [nick for arg in args for nick in arg.split(',') if nick]
+    if not nicks:
+        nicks = [input.nick]
+    return channel, nicks
+
+def change_modes(kenni, input, sign, mode):
+    channel, nicks = get_targets(kenni, input)
     if channel is not None:
         if not is_chan_admin(kenni,input,channel):
             return kenni.say('You must be an admin to perform this operation')
-        kenni.write(['MODE', channel, "+v", nick])
+        for nick in nicks:
+            kenni.queue_mode(channel, sign, mode, nick)
+        kenni.flush_modes(channel)
+
+def voice(kenni, input):
+    """
+    Command to voice users in a room. If no nick is given,
+    kenni will voice the nick who sent the command. Several nicks
+    may be given at once.
+    """
+    change_modes(kenni, input, '+', 'v')
 voice.commands = ['voice']
 voice.priority = 'low'
-voice.example = '.voice ##example or .voice ##example nick'
+voice.example = '.voice ##example or .voice ##example nick1 nick2'
 
 def mode(kenni, input):
     """
@@ -87,76 +100,30 @@ invite.priority = 'low'
 def devoice(kenni, input):
     """
     Command to devoice users in a room. If no nick is given,
-    kenni will devoice the nick who sent the command
+    kenni will devoice the nick who sent the command. Several nicks
+    may be given at once.
     """
-    text = input.group().split()
-    argc = len(text)
-    nick = input.nick
-    channel = input.sender
-    if not tools.isChan(input.sender, False):
-        channel = None
-    if argc >= 2 and text[1] is not None:
-        if tools.isChan(text[1], False):
-            channel = text[1]
-            if argc >= 3 and text[2] is not None:
-                nick = text[2]
-        else:
-            nick = text[1]
-    if channel is not None:
-        if not is_chan_admin(kenni,input,channel):
-            return kenni.say('You must be an admin to perform this operation')
-        kenni.write(['MODE', channel, "-v", nick])
+    change_modes(kenni, input, '-', 'v')
 devoice.commands = ['devoice']
 devoice.priority = 'low'
-devoice.example = '.devoice ##example or .devoice ##example nick'
+devoice.example = '.devoice ##example or .devoice ##example nick1 nick2'
 
 def op(kenni, input):
     """
     Command to op users in a room. If no nick is given,
-    kenni will op the nick who sent the command
+    kenni will op the nick who sent the command. Several nicks
+    may be given at once.
     """
-    text = input.group().split()
-    argc = len(text)
-    nick = input.nick
-    channel = input.sender
-    if not tools.isChan(input.sender, False):
-        channel = None
-    if argc >= 2 and text[1] is not None:
-        if tools.isChan(text[1], False):
-            channel = text[1]
-            if argc >= 3 and text[2] is not None:
-                nick = text[2]
-        else:
-            nick = text[1]
-    if channel is not None:
-        if not is_chan_admin(kenni,input,channel):
-            return kenni.say('You must be an admin to perform this operation')
-        kenni.write(['MODE', channel, "+o", nick])
+    change_modes(kenni, input, '+', 'o')
 op.commands = ['op']
 op.priority = 'low'
-op.example = '.op ##example or .op ##example nick'
+op.example = '.op ##example or .op ##example nick1 nick2'
 
 def deop(kenni, input):
-    text = input.group().split()
-    argc = len(text)
-    nick = input.nick
-    channel = input.sender
-    if not tools.isChan(input.sender, False):
-        channel = None
-    if argc >= 2 and text[1] is not None:
-        if tools.isChan(text[1], False):
-            channel = text[1]
-            if argc >= 3 and text[2] is not None:
-                nick = text[2]
-        else:
-            nick = text[1]
-    if channel is not None:
-        if not is_chan_admin(kenni,input,channel):
-            return kenni.say('You must be an admin to perform this operation')
-        kenni.write(['MODE', channel, "-o", nick])
+    change_modes(kenni, input, '-', 'o')
 deop.commands = ['deop']
 deop.priority = 'low'
-deop.example = '.deop ##example or .deop ##example nick'
+deop.example = '.deop ##example or .deop ##example nick1 nick2'
 
 def kick(kenni, input):
     text = input.group().split()
@@ -200,72 +167,86 @@ def configureHostMask (mask, kenni):
     else:
         return mask
 
-def ban (kenni, input):
+def change_masks(kenni, input, sign, mode):
     """
-    This give admins the ability to ban a user.
-    The bot must be a Channel Operator for this command to work.
+    Shared by ban/unban/quiet/unquiet: '.command [#channel] mask [mask ...]'
+    where each mask is a nick or a nick!user@host pattern. When removing,
+    wildcard patterns are matched against the list the bot has on record,
+    so '.unban *spam*' lifts every ban containing 'spam'.
     """
     text = input.group().split()
     argc = len(text)
     if argc < 2: return
-    opt = text[1]
-    banmask = opt
     channel = input.sender
-    if tools.isChan(opt, False):
+    masks = text[1:]
+    if tools.isChan(text[1], False):
         if argc < 3: return
-        channel = opt
-        banmask = text[2]
+        channel = text[1]
+        masks = text[2:]
     if not is_chan_admin(kenni,input,channel):
         return kenni.say('You must be an admin to perform this operation')
-    banmask = configureHostMask(banmask, kenni)
-    if banmask == '': return
-    kenni.write(['MODE', channel, '+b', banmask])
+    masklist = kenni.get_masklist(channel, mode)
+    if masklist is not None and not masklist.complete:
+        masklist = None
+    for mask in masks:
+        if sign == '-' and masklist is not None:
+            matches = find_masks(kenni, masklist, mask)
+            if matches is not None:
+                if not matches:
+                    kenni.say('Nothing on the +%s list matches %s' % (mode, mask))
+                for match in matches:
+                    kenni.queue_mode(channel, sign, mode, match)
+                continue
+        try: mask = configureHostMask(mask, kenni)
+        except KeyError:
+            kenni.say("I don't know the hostmask of %s" % mask)
+            continue
+        if mask == '': continue
+        if sign == '+' and kenni.list_room(channel, mode) == 0:
+            kenni.say('The +%s list for %s is full, not adding %s' % (mode, channel, mask))
+            continue
+        kenni.queue_mode(channel, sign, mode, mask)
+    kenni.flush_modes(channel)
+
+def find_masks(kenni, masklist, mask):
+    """
+    Look up the entries of `masklist` a .unban/.unquiet argument refers to.
+    Returns None when it should be sent to the server as given.
+    """
+    if '*' in mask or '?' in mask:
+        return masklist.find(mask)
+    if "!" not in mask and "@" not in mask and ":" not in mask:
+        nick = mask.lower()
+        if nick in kenni.hostmasks and nick in kenni.idents:
+            return masklist.covering('%s!%s@%s' % (nick, kenni.idents[nick], kenni.hostmasks[nick]))
+    return None
+
+def ban (kenni, input):
+    """
+    This give admins the ability to ban a user.
+    The bot must be a Channel Operator for this command to work.
+    """
+    change_masks(kenni, input, '+', 'b')
 ban.commands = ['ban']
 ban.priority = 'high'
+ban.example = '.ban [#chan] nick1 nick2!*@*'
 
 def unban (kenni, input):
     """
     This give admins the ability to unban a user.
     The bot must be a Channel Operator for this command to work.
     """
-    text = input.group().split()
-    argc = len(text)
-    if argc < 2: return
-    opt = text[1]
-    banmask = opt
-    channel = input.sender
-    if tools.isChan(opt, False):
-        if argc < 3: return
-        channel = opt
-        banmask = text[2]
-    if not is_chan_admin(kenni,input,channel):
-        return kenni.say('You must be an admin to perform this operation')
-    banmask = configureHostMask(banmask, kenni)
-    if banmask == '': return
-    kenni.write(['MODE', channel, '-b', banmask])
+    change_masks(kenni, input, '-', 'b')
 unban.commands = ['unban']
 unban.priority = 'high'
+unban.example = '.unban [#chan] nick or .unban *spam*'
 
 def quiet (kenni, input):
    """
    This gives admins the ability to quiet a user.
    The bot must be a Channel Operator for this command to work
    """
-   text = input.group().split()
-   argc = len(text)
-   if argc < 2: return
-   opt = text[1]
-   banmask = opt
-   channel = input.sender
-   if tools.isChan(opt, False):
-       if argc < 3: return
-       channel = opt
-       banmask = text[2]
-   if not is_chan_admin(kenni, input, channel):
-       return kenni.say('You must be an admin to perform this operation')
-   quietmask = configureHostMask(banmask, kenni)
-   if quietmask == '': return
-   kenni.write(['MODE', channel, '+q', quietmask])
+   change_masks(kenni, input, '+', 'q')
 quiet.commands = ['quiet']
 quiet.priority = 'high'
 
@@ -274,21 +255,7 @@ def unquiet (kenni, input):
    This gives admins the ability to unquiet a user.
    The bot must be a Channel Operator for this command to work
    """
-   text = input.group().split()
-   argc = len(text)
-   if argc < 2: return
-   opt = text[1]
-   banmask = opt
-   channel = input.sender
-   if tools.isChan(opt, False):
-       if argc < 3: return
-       channel = opt
-       banmask = text[2]
-   if not is_chan_admin(kenni, input, channel):
-       return kenni.say('You must be an admin to perform this operation')
-   quietmask = configureHostMask(banmask, kenni)
-   if quietmask == '': return
-   kenni.write(['MODE', channel, '-q', quietmask])
+   change_masks(kenni, input, '-', 'q')
 unquiet.commands = ['unquiet']
 unquiet.priority = 'high'
 
@@ -296,15 +263,17 @@ def kickban (kenni, input):
    """
    This gives admins the ability to kickban a user.
    The bot must be a Channel Operator for this command to work
-   .kickban [#chan] user1 user!*@* get out of here
+   .kickban [#chan] user1,user2 get out of here
    """
    text = input.group().split()
    argc = len(text)
+   if argc < 2: return
    channel = input.sender
    opt = text[1]
    nick = opt
    reasonidx = "Your behavior is not conductive to the desired environment"
    if tools.isChan(opt, False):
+       if argc < 3: return
        channel = opt
        nick = text[2]
        if(argc >3):
@@ -314,10 +283,24 @@ def kickban (kenni, input):
            reasonidx = " ".join(text[2:])
    if not is_chan_admin(kenni, input, channel):
        return kenni.say('You must be an admin to perform this operation')
-   mask = configureHostMask(nick,kenni)
-   if mask == '': return
-   kenni.write(['MODE', channel, '+b', mask])
-   kickx(kenni, channel, nick, input.nick, reasonidx)
+   nicks = [nic for nic in nick.split(",") if nic]
+   banned = list()
+   for nic in nicks:
+       try: mask = configureHostMask(nic, kenni)
+       except KeyError:
+           kenni.say("I don't know the hostmask of %s" % nic)
+           continue
+       if mask == '': continue
+       if kenni.list_room(channel, 'b') == 0:
+           kenni.say('The +b list for %s is full, not adding %s' % (channel, mask))
+           continue
+       kenni.queue_mode(channel, '+', 'b', mask)
+       banned.append(nic)
+   # Ban everyone first so nobody can rejoin in between kicks, and only
+   # kick who was banned
+   kenni.flush_modes(channel)
+   for nic in banned:
+       kickx(kenni, channel, nic, input.nick, reasonidx)
 kickban.commands = ['kickban', 'kb', 'kban']
 kickban.priority = 'high'
 
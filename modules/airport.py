@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+import heapq, math, re
+import icao
+
+EARTH_RADIUS = 6371.0
+NEAREST = 5
+MAX_NEAREST = 10
+
+r_coords = re.compile(r'^(-?\d+(?:\.\d+)?)\s*[, ]\s*(-?\d+(?:\.\d+)?)$')
+
+
+def to_xyz(lat, lon):
+    lat, lon = math.radians(lat), math.radians(lon)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat))
+
+
+def distance(lat1, lon1, lat2, lon2):
+    '''Great circle distance in km (haversine formula).'''
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2 +
+         math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS * math.asin(min(1, math.sqrt(a)))
+
+
+class KDTree(object):
+    '''
+    A k-d tree over the stations as points on the unit sphere, in 3D so
+    that there's no trouble at the poles or the date line. The straight
+    line distance between two such points grows with their great circle
+    distance, so the nearest points in the tree are the nearest stations.
+    Nodes are (point, code, axis, left, right) tuples.
+    '''
+    def __init__(self, stations):
+        self.root = self.build([(to_xyz(lat, lon), code) for code, (lat, lon) in stations], 0)
+
+    def build(self, points, depth):
+        if not points:
+            return None
+        axis = depth % 3
+        points.sort(key=lambda p: p[0][axis])
+        mid = len(points) // 2
+        return (points[mid][0], points[mid][1], axis,
+                self.build(points[:mid], depth + 1), self.build(points[mid + 1:], depth + 1))
+
+    def nearest(self, point, n=1, skip=None):
+        '''Return the codes of the `n` stations nearest to the (x, y, z)
+        `point`, nearest first, leaving out the code `skip`.'''
+        best = list()
+        # Depth first, visiting the far side of a split only if it can
+        # still hold something closer than the n-th best so far
+        def visit(node):
+            if node is None:
+                return
+            p, code, axis, left, right = node
+            d = (p[0] - point[0]) ** 2 + (p[1] - point[1]) ** 2 + (p[2] - point[2]) ** 2
+            if code != skip:
+                if len(best) < n:
+                    heapq.heappush(best, (-d, code))
+                elif d < -best[0][0]:
+                    heapq.heapreplace(best, (-d, code))
+            diff = point[axis] - p[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            visit(near)
+            if len(best) < n or diff * diff < -best[0][0]:
+                visit(far)
+        visit(self.root)
+        return [code for d, code in sorted(best, reverse=True)]
+
+
+tree = KDTree(icao.data.items())
+
+
+def locate(code):
+    '''Return (lat, lon) of the station `code`, or None.'''
+    return icao.data.get(code.upper())
+
+
+def nearest(lat, lon, n=1, skip=None):
+    '''Return [(km, code, lat, lon)] for the `n` stations nearest to the
+    given position, nearest first.'''
+    results = list()
+    for code in tree.nearest(to_xyz(lat, lon), n, skip):
+        slat, slon = icao.data[code]
+        results.append((distance(lat, lon, slat, slon), code, slat, slon))
+    return results
+
+
+def f_icao(kenni, input):
+    '''.icao <code> -- where an ICAO station is; .icao near <code | lat, lon> [n] -- the nearest stations'''
+    query = (input.group(2) or '').strip()
+    if not query:
+        return kenni.say('Please give an ICAO code, or "near" and a code or coordinates.')
+
+    if not query.lower().startswith('near '):
+        position = locate(query)
+        if position is None:
+            return kenni.say('No station %s found.' % query.upper())
+        return kenni.say('%s: %.4f, %.4f' % (query.upper(), position[0], position[1]))
+
+    query = query[5:].strip()
+    n = NEAREST
+    parts = query.rsplit(' ', 1)
+    if len(parts) == 2 and parts[1].isdigit() and (r_coords.match(parts[0]) or locate(parts[0])):
+        query, n = parts[0], min(int(parts[1]), MAX_NEAREST) or 1
+
+    skip = None
+    match = r_coords.match(query)
+    if match:
+        lat, lon = float(match.group(1)), float(match.group(2))
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            return kenni.say('Those are not valid coordinates.')
+        origin = '%.4f, %.4f' % (lat, lon)
+    else:
+        position = locate(query)
+        if position is None:
+            return kenni.say('No station %s found.' % query.upper())
+        lat, lon = position
+        skip = origin = query.upper()
+
+    results = nearest(lat, lon, n, skip)
+    kenni.say('Nearest to %s: %s' % (origin, ', '.join('%s (%.0f km)' % (code, km)
+                                                      for km, code, slat, slon in results)))
+f_icao.commands = ['icao', 'airport']
+f_icao.example = '.icao near EGLL 3'
+
+if __name__ == '__main__':
+    print(__doc__.strip())
@@ -2,7 +2,6 @@
 import re
 import web
 import html.parser
-import requests
 import random
 from bs4 import BeautifulSoup
 def stripHTML(input):
@@ -14,7 +13,7 @@ def stripHTML(input):
     input = re.sub(pass3, "", input)
 def button(kenni, input):
     url = "http://willyoupressthebutton.com"
-    page = BeautifulSoup(web.get(url), 'html.parser')
+    page = BeautifulSoup(web.get(url, use_cache=False), 'html.parser')
     reward = page.find("div", id="cond")
     but = page.find("div", id="res")
     kenni.say("The button reads" + reward.text.replace("  "," ").replace("  "," ").lower() + "BUT" + but.text.replace("  "," ").replace("  ", " ").lower() + ", will you push the button?")
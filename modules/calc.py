@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 #coding=utf-8
 
+import asyncio
 import html.parser
 import json
 import re
@@ -15,7 +16,7 @@ r_tag = re.compile(r'<(?!!)[^>]+>')
 WAKEY_NOTFOUND = "Please sign up for WolframAlpha's API to use this function. http://products.wolframalpha.com/api/"
 
 
-def math(kenni, input):
+async def math(kenni, input):
     if not input.group(2):
         return kenni.say("No search term.")
 
@@ -28,7 +29,7 @@ def math(kenni, input):
 
     re_answer = re.compile(r'<script type="\S+; mode=display".*?>(.*?)</script>')
 
-    page = web.get(url + txt)
+    page = await web.aget(url + txt)
 
     results = re_answer.findall(page.decode('utf-8'))
 
@@ -39,7 +40,7 @@ def math(kenni, input):
 math.commands = ['math']
 
 
-def get_wa(search, appid):
+async def get_wa(search, appid):
     txt = search
     txt = txt.decode('utf-8')
     txt = txt.encode('utf-8')
@@ -48,8 +49,13 @@ def get_wa(search, appid):
     uri = 'https://api.wolframalpha.com/v2/query?reinterpret=true&appid=' + appid
     uri += '&input=' + txt
 
-    page = web.get(uri)
+    page = await web.aget(uri)
 
+    # Parsing takes a while, keep it off the event loop
+    return await asyncio.to_thread(parse_wa, page)
+
+
+def parse_wa(page):
     try:
         from bs4 import BeautifulSoup
     except ImportError:
@@ -73,7 +79,7 @@ def get_wa(search, appid):
     return answer
 
 
-def wa(kenni, input):
+async def wa(kenni, input):
     if not hasattr(kenni.config, 'wolframalpha_apikey'):
         return kenni.say(WAKEY_NOTFOUND)
 
@@ -87,7 +93,7 @@ def wa(kenni, input):
     txt = txt.decode('utf-8')
     txt = txt.encode('utf-8')
 
-    result = get_wa(txt, appid)
+    result = await get_wa(txt, appid)
 
     if not result:
         return kenni.say("No results found.")
@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
-import re, math, time, urllib.request, urllib.parse, urllib.error, locale, socket, struct, datetime
-from decimal import Decimal as dec
+import re, math, time, struct, datetime
+import asyncio, difflib, functools, threading, zoneinfo
+
+try:
+    from babel import dates as babel_dates
+except ImportError:
+    babel_dates = None
 
 
 TimeZones = {'KST': 9, 'CADT': 10.5, 'EETDST': 3, 'MESZ': 2, 'WADT': 9,
@@ -184,6 +189,146 @@ TimeZones.update(TZ1)
 TimeZones.update(TZ3)
 
 r_local = re.compile(r'\([a-z]+_[A-Z]+\)')
+r_abbr = re.compile(r'^[A-Z]{2,6}$')
+
+# Common names that aren't the city a zone is named after
+CITY_ALIASES = {
+    'nyc': 'America/New_York', 'ny': 'America/New_York', 'boston': 'America/New_York',
+    'washington': 'America/New_York', 'dc': 'America/New_York', 'miami': 'America/New_York',
+    'atlanta': 'America/New_York', 'houston': 'America/Chicago', 'dallas': 'America/Chicago',
+    'san francisco': 'America/Los_Angeles', 'sf': 'America/Los_Angeles', 'la': 'America/Los_Angeles',
+    'seattle': 'America/Los_Angeles', 'beijing': 'Asia/Shanghai', 'delhi': 'Asia/Kolkata',
+    'new delhi': 'Asia/Kolkata', 'mumbai': 'Asia/Kolkata', 'bangalore': 'Asia/Kolkata',
+    'kyiv': 'Europe/Kyiv', 'hanoi': 'Asia/Bangkok', 'saint petersburg': 'Europe/Moscow',
+}
+MAX_ZONES = 6
+
+
+@functools.lru_cache(maxsize=128)
+def get_zone(name):
+    '''Return the ZoneInfo called `name`, or None.'''
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+class ZoneIndex(object):
+    '''
+    Lookup tables built once from the tz database: zone names by
+    lowercased name and by city (the last part of the name), and for each
+    abbreviation the zones using it in winter or summer this year, with
+    the UTC offset it stands for there.
+    '''
+    def __init__(self):
+        self.names = dict()
+        self.cities = dict()
+        self.abbreviations = dict()
+        year = datetime.datetime.utcnow().year
+        instants = [datetime.datetime(year, 1, 15, tzinfo=datetime.timezone.utc),
+                    datetime.datetime(year, 7, 15, tzinfo=datetime.timezone.utc)]
+        for name in sorted(zoneinfo.available_timezones()):
+            self.names[name.lower()] = name
+            if '/' in name and not name.startswith('Etc/'):
+                city = name.rsplit('/', 1)[1].replace('_', ' ').lower()
+                self.cities.setdefault(city, name)
+            zone = zoneinfo.ZoneInfo(name)
+            for instant in instants:
+                local = instant.astimezone(zone)
+                abbr = local.tzname()
+                if abbr and r_abbr.match(abbr):
+                    candidates = self.abbreviations.setdefault(abbr, dict())
+                    candidates.setdefault(name, local.utcoffset())
+        for alias, name in CITY_ALIASES.items():
+            if name in zoneinfo.available_timezones():
+                self.cities.setdefault(alias, name)
+
+    def zone(self, text):
+        '''Return the zone name for an Olson name or a city, or None.'''
+        text = text.strip().lower()
+        return self.names.get(text) or self.cities.get(text.replace('_', ' '))
+
+    def fuzzy(self, text):
+        '''Return the zone name for a misspelt city, or None.'''
+        text = text.strip().lower()
+        if len(text) < 4:
+            return None
+        close = difflib.get_close_matches(text, self.cities, n=1, cutoff=0.8)
+        return self.cities[close[0]] if close else None
+
+    def abbreviation(self, abbr):
+        '''Return the UTC offset (a timedelta) that `abbr` stands for, or
+        None. Where zones disagree (CST is both Chicago and Shanghai) the
+        static TimeZones table breaks the tie, then the most common one.'''
+        candidates = self.abbreviations.get(abbr)
+        if not candidates:
+            return None
+        offsets = list(candidates.values())
+        if abbr in TimeZones:
+            wanted = datetime.timedelta(hours=TimeZones[abbr])
+            if wanted in offsets:
+                return wanted
+        return max(set(offsets), key=offsets.count)
+
+
+zone_index = None
+zone_index_lock = threading.Lock()
+
+
+def get_zone_index():
+    global zone_index
+    with zone_index_lock:
+        if zone_index is None:
+            zone_index = ZoneIndex()
+        return zone_index
+
+
+def resolve(text):
+    '''Return (label, tzinfo) for an abbreviation, Olson name or city,
+    or None.'''
+    index = get_zone_index()
+    name = index.zone(text)
+    if name is not None:
+        return name, get_zone(name)
+    abbr = text.upper()
+    offset = index.abbreviation(abbr)
+    if offset is None and abbr in TimeZones:
+        offset = datetime.timedelta(hours=TimeZones[abbr])
+    if offset is not None:
+        return abbr, datetime.timezone(offset, abbr)
+    name = index.fuzzy(text)
+    if name is not None:
+        return name, get_zone(name)
+    return None
+
+
+def resolve_many(text):
+    '''Split `text` into places, longest match first so "new york" stays
+    together. Returns [(label, tzinfo)], or None if a word is unknown.'''
+    words = text.replace(',', ' ').split()
+    found = list()
+    while words:
+        for n in range(min(3, len(words)), 0, -1):
+            result = resolve(' '.join(words[:n]))
+            if result is not None:
+                found.append(result)
+                del words[:n]
+                break
+        else:
+            return None
+    return found
+
+
+def localized(tag, when):
+    '''Format `when` for the locale `tag` (e.g. de_DE) without touching
+    the process-wide locale, which needs babel; without it the C locale
+    names are used.'''
+    if babel_dates is not None:
+        try:
+            return babel_dates.format_datetime(when, "EEEE, dd MMMM yyyy HH:mm:ss'Z'", locale=tag)
+        except Exception:
+            pass
+    return when.strftime("%A, %d %B %Y %H:%M:%SZ")
 
 
 def f_time(kenni, input):
@@ -201,19 +346,13 @@ def f_time(kenni, input):
         tz = People[input.nick]
 
     TZ = tz.upper()
-    if len(tz) > 30: return
+    if len(tz) > 100: return
 
     if (TZ == 'UTC') or (TZ == 'Z'):
         msg = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
         kenni.msg(input.sender, msg)
     elif r_local.match(tz): # thanks to Mark Shoulsdon (clsn)
-        locale.setlocale(locale.LC_TIME, (tz[1:-1], 'UTF-8'))
-        msg = time.strftime("%A, %d %B %Y %H:%M:%SZ", time.gmtime())
-        kenni.msg(input.sender, msg)
-    elif TZ in TimeZones:
-        offset = TimeZones[TZ] * 3600
-        timenow = time.gmtime(time.time() + offset)
-        msg = time.strftime("%a, %d %b %Y %H:%M:%S " + str(TZ), timenow)
+        msg = localized(tz[1:-1], datetime.datetime.now(datetime.timezone.utc))
         kenni.msg(input.sender, msg)
     elif tz and tz[0] in ('+', '-') and 4 <= len(tz) <= 6:
         import re
@@ -237,15 +376,23 @@ def f_time(kenni, input):
     else:
         try: t = float(tz)
         except ValueError:
-            import os, re, subprocess
-            r_tz = re.compile(r'^[A-Za-z]+(?:/[A-Za-z_]+)*$')
-            if r_tz.match(tz) and os.path.isfile('/usr/share/zoneinfo/' + tz):
-                cmd, PIPE = 'TZ=%s date' % tz, subprocess.PIPE
-                proc = subprocess.Popen(cmd, shell=True, stdout=PIPE)
-                kenni.msg(input.sender, proc.communicate()[0])
-            else:
+            places = resolve_many(tz)
+            if not places or len(places) > MAX_ZONES:
                 error = "Sorry, I don't know about the '%s' timezone." % tz
-                kenni.msg(input.sender, error)
+                return kenni.msg(input.sender, error)
+            if len(places) == 1:
+                label, zone = places[0]
+                now = datetime.datetime.now(zone)
+                msg = now.strftime('%a, %d %b %Y %H:%M:%S ') + now.tzname()
+                if label != now.tzname():
+                    msg += ' (%s)' % label
+                return kenni.msg(input.sender, msg)
+            times = list()
+            for label, zone in places:
+                now = datetime.datetime.now(zone)
+                place = label.rsplit('/', 1)[-1].replace('_', ' ')
+                times.append(place + now.strftime(' %a %H:%M') + ('' if place == now.tzname() else ' ' + now.tzname()))
+            kenni.msg(input.sender, ' | '.join(times))
         else:
             if t >= 100 or t <= -100:
                 return kenni.say('Time requested is too far away.')
@@ -267,7 +414,7 @@ def f_time(kenni, input):
             kenni.msg(input.sender, msg)
 f_time.commands = ['t', 'time']
 f_time.name = 't'
-f_time.example = '.t UTC'
+f_time.example = '.t tokyo london nyc'
 
 
 def beats(kenni, input):
@@ -295,38 +442,167 @@ yi.commands = ['yi']
 yi.priority = 'low'
 
 
-def tock(kenni, input):
-    """Shows the time from the USNO's atomic clock."""
-    u = urllib.request.urlopen('http://tycho.usno.navy.mil/cgi-bin/timer.pl')
-    info = u.info()
-    u.close()
-    kenni.say('"' + info['Date'] + '" - tycho.usno.navy.mil')
-tock.commands = ['tock']
-tock.priority = 'high'
-
-
-def npl(kenni, input):
+NTP_SERVERS = ['ntp1.npl.co.uk', 'ntp2.npl.co.uk']
+NTP_TIMEOUT = 2
+NTP_CACHE = 300
+NTP_EPOCH = 2208988800
+
+
+class SNTPProtocol(asyncio.DatagramProtocol):
+    '''One SNTP (RFC 4330) request and its answer.'''
+    def __init__(self, future):
+        self.future = future
+        self.sent = None
+
+    def connection_made(self, transport):
+        self.sent = time.time()
+        seconds = int(self.sent) + NTP_EPOCH
+        self.stamp = struct.pack('!II', seconds, int((self.sent % 1) * 2 ** 32))
+        # LI 0, version 3, mode 3 (client), our time as transmit timestamp
+        transport.sendto(b'\x1b' + 39 * b'\0' + self.stamp)
+
+    def datagram_received(self, data, addr):
+        received = time.time()
+        if self.future.done() or len(data) < 48:
+            return
+        mode, stratum = data[0] & 7, data[1]
+        # The server echoes our transmit timestamp as its originate one
+        if mode != 4 or stratum == 0 or data[24:32] != self.stamp:
+            return
+        t2, t3 = ntp_time(data[32:40]), ntp_time(data[40:48])
+        offset = ((t2 - self.sent) + (t3 - received)) / 2
+        delay = (received - self.sent) - (t3 - t2)
+        self.future.set_result((offset, delay))
+
+    def error_received(self, exc):
+        if not self.future.done():
+            self.future.set_exception(exc)
+
+
+def ntp_time(data):
+    seconds, fraction = struct.unpack('!II', data)
+    return seconds - NTP_EPOCH + fraction / 2 ** 32
+
+
+async def sntp_query(server, timeout=NTP_TIMEOUT):
+    '''Return (offset, delay) in seconds from one SNTP server: how far
+    our clock is behind its, and the network round trip. `server` may
+    be host:port.'''
+    host, port = server.rsplit(':', 1) if server.count(':') == 1 else (server, 123)
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    transport, protocol = await asyncio.wait_for(loop.create_datagram_endpoint(
+        lambda: SNTPProtocol(future), remote_addr=(host, int(port))), timeout)
+    try:
+        return await asyncio.wait_for(future, timeout)
+    finally:
+        transport.close()
+
+
+class ClockOffset(object):
+    '''
+    The bot's clock offset as measured against the configured NTP
+    servers. All of them are asked at once and the answer with the
+    shortest round trip is kept for `ttl` seconds, so repeated commands
+    don't go back to the network.
+    '''
+    def __init__(self):
+        self.offset = None
+        self.delay = None
+        self.server = None
+        self.measured = 0
+        self.failures = dict()
+        self.task = None
+
+    async def get(self, servers, ttl):
+        '''Return (offset, delay, server, age), measuring again if the last
+        measurement is older than `ttl`. If that fails the old measurement
+        is returned, when there is one.'''
+        if self.offset is None or time.time() - self.measured > ttl:
+            if self.task is None or self.task.done():
+                self.task = asyncio.ensure_future(self.measure(servers))
+            try:
+                await asyncio.shield(self.task)
+            except (OSError, asyncio.TimeoutError):
+                if self.offset is None:
+                    raise
+        return self.offset, self.delay, self.server, time.time() - self.measured
+
+    async def measure(self, servers):
+        results = await asyncio.gather(*[sntp_query(server) for server in servers],
+                                       return_exceptions=True)
+        best = None
+        for server, result in zip(servers, results):
+            if isinstance(result, BaseException):
+                self.failures[server] = self.failures.get(server, 0) + 1
+            elif best is None or result[1] < best[1][1]:
+                best = (server, result)
+        if best is None:
+            raise IOError('No NTP server answered.')
+        self.server, (self.offset, self.delay) = best
+        self.measured = time.time()
+
+    def stats(self):
+        '''Return the last measurement and the failures per server.'''
+        return {'offset': self.offset, 'delay': self.delay, 'server': self.server,
+                'age': time.time() - self.measured if self.offset is not None else None,
+                'failures': dict(self.failures)}
+
+
+clock_offset = ClockOffset()
+
+
+async def ntp_now(kenni):
+    servers = getattr(kenni.config, 'ntp_servers', None) or NTP_SERVERS
+    ttl = getattr(kenni.config, 'ntp_cache', NTP_CACHE)
+    offset, delay, server, age = await clock_offset.get(servers, ttl)
+    if age > ttl:
+        server += ', measured %d minutes ago' % (age // 60)
+    return time.time() + offset, offset, server
+
+
+async def npl(kenni, input):
     """Shows the time from NPL's SNTP server."""
-    # for server in ('ntp1.npl.co.uk', 'ntp2.npl.co.uk'):
-    client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    client.sendto('\x1b' + 47 * '\0', ('ntp1.npl.co.uk', 123))
-    data, address = client.recvfrom(1024)
-    if data:
-        buf = struct.unpack('B' * 48, data)
-        d = dec('0.0')
-        for i in range(8):
-            d += dec(buf[32 + i]) * dec(str(math.pow(2, (3 - i) * 8)))
-        d -= dec(2208988800)
-        a, b = str(d).split('.')
-        f = '%Y-%m-%d %H:%M:%S'
-        result = datetime.datetime.fromtimestamp(d).strftime(f) + '.' + b[:6]
-        kenni.say(result + ' - ntp1.npl.co.uk')
-    else: kenni.say('No data received, sorry')
+    try:
+        now, offset, server = await ntp_now(kenni)
+    except (OSError, asyncio.TimeoutError):
+        return kenni.say('No data received, sorry')
+    f = '%Y-%m-%d %H:%M:%S'
+    result = datetime.datetime.fromtimestamp(now).strftime(f) + '.%06d' % ((now % 1) * 1000000)
+    kenni.say(result + ' - ' + server + ' (our clock is %+.3fs off)' % -offset)
 npl.commands = ['npl']
 npl.priority = 'high'
 npl.rate = 30
 
 
+async def tock(kenni, input):
+    """Shows the time from an NTP server."""
+    try:
+        now, offset, server = await ntp_now(kenni)
+    except (OSError, asyncio.TimeoutError):
+        return kenni.say('No data received, sorry')
+    kenni.say('"' + time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime(now)) + '" - ' + server)
+tock.commands = ['tock']
+tock.priority = 'high'
+
+
+def drift(kenni, input):
+    """Shows how far the bot's clock is off, as last measured by NTP."""
+    if not input.admin:
+        return
+    stats = clock_offset.stats()
+    if stats['offset'] is None:
+        msg = 'No NTP measurement yet, try .npl'
+    else:
+        msg = 'Clock is %+.3fs off by %s (round trip %.0f ms, %ds ago)' % (
+            -stats['offset'], stats['server'], stats['delay'] * 1000, stats['age'])
+    if stats['failures']:
+        msg += '; failures: ' + ', '.join('%s %d' % item for item in sorted(stats['failures'].items()))
+    kenni.say(msg)
+drift.commands = ['drift']
+drift.priority = 'low'
+
+
 def easter(kenni, input):
     """.easter <yyyy> -- calculate the date for Easter given a year"""
     bad_input = "Please input a valid year!"
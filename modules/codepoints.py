@@ -1,60 +1,351 @@
 #!/usr/bin/env python3
-import re, unicodedata
+import array, bisect, mmap, os, re, struct, sys, threading, time, unicodedata
 from itertools import islice
 import web
 import random
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+UCD_URL = 'http://www.unicode.org/Public/UCD/latest/ucd/UnicodeData.txt'
+INDEX_PATH = os.path.expanduser('~/Kenni/config/unicode_names.idx')
+# magic, native byte order, entries, ranges, name bytes, tokens, token
+# bytes, postings
+INDEX_HEADER = '<4sB3xIIIIII'
+INDEX_MAGIC = b'KUN2'
+r_token = re.compile(b'\\w+')
+
+INDEX_RETRY = 60
+INDEX_MAX_RETRY = 3600
+
+index = None
+index_thread = None
+index_lock = threading.Lock()
+# When building the index last failed, and how long to wait after that
+index_failed = None
+index_retry = None
+
+
+class Tokens(object):
+    """The sorted tokens of a NameIndex, as a sequence bisect can search."""
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]])
+
+
+class NameIndex(object):
+    """
+    Codepoint names from UnicodeData.txt, memory-mapped from a file made
+    by build_index(). The file holds sorted arrays of codepoints and of
+    range starts and ends (ranges such as CJK ideographs stay one entry),
+    offsets into a blob of names, and the blob itself: the names one per
+    line, so a regexp can search all of them at once. For word searches
+    there is also an inverted index: the sorted words ("tokens") of all
+    names, each with a posting list of the entries it occurs in.
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = struct.unpack_from(INDEX_HEADER, self.map)
+        magic, little, count, ranges, size, tokens, token_size, postings = header
+        if magic != INDEX_MAGIC or little != (sys.byteorder == 'little'):
+            raise ValueError('%s is not an index for this machine' % path)
+        view = memoryview(self.map)
+        pos = struct.calcsize(INDEX_HEADER)
+        arrays = list()
+        for length in (count, ranges, ranges, count + ranges + 1, tokens + 1, tokens + 1, postings):
+            arrays.append(view[pos:pos + 4 * length].cast('I'))
+            pos += 4 * length
+        self.codepoints, self.starts, self.ends, self.offsets = arrays[:4]
+        token_offsets, self.posting_offsets, self.postings = arrays[4:]
+        self.count = count
+        self.blob_start = pos
+        self.blob = view[pos:pos + size]
+        self.tokens = Tokens(token_offsets, view[pos + size:pos + size + token_size])
+
+    def entry(self, i):
+        """Return (codepoint, name) of entry `i`, ranges coming last."""
+        name = bytes(self.blob[self.offsets[i]:self.offsets[i + 1] - 1]).decode('ascii')
+        if i < self.count:
+            return self.codepoints[i], name
+        return self.starts[i - self.count], name
+
+    def name(self, cp):
+        i = bisect.bisect_left(self.codepoints, cp)
+        if i < self.count and self.codepoints[i] == cp:
+            return self.entry(i)[1]
+        return None
+
+    def range_name(self, cp):
+        i = bisect.bisect_right(self.starts, cp) - 1
+        if i >= 0 and cp <= self.ends[i]:
+            return self.entry(self.count + i)[1]
+        return None
 
-cp_names = dict()
-cp_ranges = dict()
-data_loaded = False
+    def token_range(self, word, prefix=False):
+        """Return the (start, end) indexes of the tokens equal to `word`, or
+        starting with it if `prefix` is true."""
+        lo = bisect.bisect_left(self.tokens, word)
+        if prefix:
+            return lo, bisect.bisect_left(self.tokens, word + b'\xff', lo)
+        if lo < len(self.tokens) and self.tokens[lo] == word:
+            return lo, lo + 1
+        return lo, lo
+
+    def posting_count(self, span):
+        return self.posting_offsets[span[1]] - self.posting_offsets[span[0]]
+
+    def posting_set(self, span):
+        entries = set()
+        for t in range(*span):
+            entries.update(self.postings[self.posting_offsets[t]:self.posting_offsets[t + 1]])
+        return entries
+
+    def lookup_words(self, words, exact_last=False):
+        """
+        Return the entries whose names have a token starting with each of
+        `words` (the last one matching a whole token if `exact_last`). The
+        posting lists are intersected smallest first, stopping once few
+        enough entries are left to check directly.
+        """
+        spans = [self.token_range(word, not (exact_last and i == len(words) - 1))
+                 for i, word in enumerate(words)]
+        spans.sort(key=self.posting_count)
+        entries = self.posting_set(spans[0])
+        for span in spans[1:]:
+            if len(entries) <= 16:
+                break
+            entries &= self.posting_set(span)
+        return entries
+
+    def search(self, regexp, literal=None, entries=None):
+        """
+        Yield (codepoint, name) for every entry whose name matches the
+        bytes `regexp`, which should use re.M if it anchors with ^ or $.
+        Only the given `entries`, or only names containing the bytes
+        `literal`, are tried if either is given.
+        """
+        if entries is not None:
+            for i in sorted(entries):
+                if regexp.search(self.blob[self.offsets[i]:self.offsets[i + 1] - 1]):
+                    yield self.entry(i)
+            return
+        total = len(self.offsets) - 1
+        pos = 0
+        while True:
+            if literal is not None:
+                # Start at the next name that has the literal in it
+                found = self.map.find(literal, self.blob_start + pos, self.blob_start + len(self.blob))
+                if found < 0:
+                    return
+                pos = self.offsets[bisect.bisect_right(self.offsets, found - self.blob_start) - 1]
+            match = regexp.search(self.blob, pos)
+            if match is None:
+                return
+            i = bisect.bisect_right(self.offsets, match.start()) - 1
+            if i >= total:
+                return
+            # A match in the blob can reach into the next names (\s, [^...],
+            # lookaheads), so the name has to match on its own too
+            if regexp.search(self.blob[self.offsets[i]:self.offsets[i + 1] - 1]):
+                yield self.entry(i)
+            pos = self.offsets[i + 1]
+
+
+def required_literal(pattern):
+    """
+    Return the longest run of literal characters every match of the
+    regexp `pattern` has to contain, or None if there's no such run of at
+    least two characters.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return None
+    state = getattr(parsed, 'state', None) or parsed.pattern
+    if state.flags & re.IGNORECASE:
+        return None
+    runs = ['']
+    for op, av in parsed:
+        if op == sre_parse.BRANCH:
+            return None
+        elif op == sre_parse.LITERAL:
+            runs[-1] += chr(av)
+        else:
+            runs.append('')
+    literal = max(runs, key=len)
+    return literal.encode('utf-8') if len(literal) >= 2 else None
 
 
-def load_data():
-    all_code = web.get('http://www.unicode.org/Public/UCD/latest/ucd/UnicodeData.txt')
-    all_code = all_code.decode('utf-8')
-    for line in all_code.split('\n'):
+def parse_ucd(text):
+    """Return ({codepoint: name}, [(start, end, name)]) from UnicodeData.txt."""
+    names = dict()
+    ranges = dict()
+    for line in text.split('\n'):
         parts = line.split(';')
-        if len(parts) >= 10:
-            name = parts[1]
-            name_parts = name.split(',')
-            name_part_tmp = name_parts[0].replace('<', '')
-
-            ## look for codepoint ranges
-            if 'First>' in name:
-                if name_part_tmp not in cp_ranges:
-                    cp_ranges[name_part_tmp] = list()
-                cp_ranges[name_part_tmp].append(parts[0])
-            elif 'Last>' in name:
-                if name_part_tmp not in cp_ranges:
-                    cp_ranges[name_part_tmp] = list()
-                cp_ranges[name_part_tmp].append(parts[0])
-
-            if parts[10]:
-                name += ' ' + str(parts[10])
-
-            ## remove '<' and '>' from names (usually only on ranges)
-            name = name.replace('<', '')
-            name = name.replace('>', '')
-            cp_names[parts[0]] = name
-
-    ## generate codepoints for ranges founded above
-    for cp_range in cp_ranges:
-        cps = cp_ranges[cp_range]
-        start = cps[0]
-        end = cps[1]
-
-        for number in range(int(start, 16), int(end, 16)):
-            cp_names['%04X' % (number)] = cp_range
+        if len(parts) < 11:
+            continue
+        cp = int(parts[0], 16)
+        name = parts[1]
+        if name.startswith('<') and name.endswith(', First>'):
+            ranges[name[1:-8]] = [cp, cp]
+            continue
+        if name.startswith('<') and name.endswith(', Last>'):
+            ranges.setdefault(name[1:-7], [cp, cp])[1] = cp
+            continue
+        if parts[10]:
+            name += ' ' + parts[10]
+        names[cp] = name.replace('<', '').replace('>', '')
+    return names, sorted((start, end, name) for name, (start, end) in ranges.items())
+
+
+def names_from_unicodedata():
+    """The same as parse_ucd() for the Unicode version Python ships, for
+    when UnicodeData.txt can't be fetched. Names ending in the codepoint
+    (CJK UNIFIED IDEOGRAPH-4E00 and so on) are made into ranges."""
+    names = dict()
+    ranges = list()
+    for cp in range(0x110000):
+        name = unicodedata.name(chr(cp), None)
+        if name is None:
+            continue
+        suffix = '-%04X' % cp
+        if not name.endswith(suffix):
+            names[cp] = name
+            continue
+        name = name[:-len(suffix)]
+        if ranges and ranges[-1][1] == cp - 1 and ranges[-1][2] == name:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp, name])
+    return names, [tuple(r) for r in ranges]
+
+
+def build_index(path=INDEX_PATH, text=None):
+    """Write the NameIndex file for UnicodeData.txt `text`, or for Python's
+    own unicodedata if it's None."""
+    names, ranges = parse_ucd(text) if text is not None else names_from_unicodedata()
+    codepoints = sorted(names)
+    entries = [names[cp] for cp in codepoints] + [name for start, end, name in ranges]
+    blob = ''.join(name + '\n' for name in entries).encode('ascii', 'replace')
+    offsets = array.array('I', [0])
+    posting_lists = dict()
+    for i, name in enumerate(entries):
+        offsets.append(offsets[-1] + len(name) + 1)
+        for token in set(r_token.findall(name.encode('ascii', 'replace'))):
+            posting_lists.setdefault(token, []).append(i)
+    tokens = sorted(posting_lists)
+    token_offsets = array.array('I', [0])
+    posting_offsets = array.array('I', [0])
+    postings = array.array('I')
+    for token in tokens:
+        token_offsets.append(token_offsets[-1] + len(token))
+        postings.extend(posting_lists[token])
+        posting_offsets.append(len(postings))
+
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(struct.pack(INDEX_HEADER, INDEX_MAGIC, sys.byteorder == 'little',
+                            len(codepoints), len(ranges), len(blob),
+                            len(tokens), token_offsets[-1], len(postings)))
+        f.write(array.array('I', codepoints).tobytes())
+        f.write(array.array('I', [r[0] for r in ranges]).tobytes())
+        f.write(array.array('I', [r[1] for r in ranges]).tobytes())
+        f.write(offsets.tobytes())
+        f.write(token_offsets.tobytes())
+        f.write(posting_offsets.tobytes())
+        f.write(postings.tobytes())
+        f.write(blob)
+        f.write(b''.join(tokens))
+    os.replace(tmp, path)
+
+
+def fetch_and_build():
+    global index, index_thread, index_failed, index_retry
+    try:
+        text = web.get(UCD_URL).decode('utf-8')
+    except Exception as e:
+        print('Could not fetch UnicodeData.txt (%s), using unicodedata instead' % e, file=sys.stderr)
+        text = None
+    try:
+        os.makedirs(os.path.dirname(INDEX_PATH), exist_ok=True)
+        build_index(INDEX_PATH, text)
+        built = NameIndex(INDEX_PATH)
+    except Exception as e:
+        with index_lock:
+            index_thread = None
+            index_failed = time.time()
+            index_retry = INDEX_RETRY if index_retry is None else min(index_retry * 2, INDEX_MAX_RETRY)
+        print('Could not build %s (%s), retrying in %ds' % (INDEX_PATH, e, index_retry), file=sys.stderr)
+        return
+    with index_lock:
+        index = built
+
+
+def get_index(wait=True):
+    """
+    Return the NameIndex, or None if it isn't built yet and `wait` is
+    false or building it failed. A missing index is built in the
+    background, and tried again with a growing delay if that fails.
+    """
+    global index, index_thread
+    with index_lock:
+        retry = index_failed is None or time.time() - index_failed >= index_retry
+        if index is None and index_thread is None and retry:
+            try:
+                index = NameIndex(INDEX_PATH)
+            except (OSError, ValueError, struct.error):
+                index_thread = threading.Thread(target=fetch_and_build)
+                index_thread.daemon = True
+                index_thread.start()
+        thread = index_thread
+    if index is None and wait and thread is not None:
+        thread.join()
+    return index
+
+
+def lookup_name(cp):
+    names = get_index(wait=False)
+    name = names.name(cp) if names is not None else None
+    if name is None:
+        name = unicodedata.name(chr(cp), None)
+    if name is None and names is not None:
+        name = names.range_name(cp)
+    return name
 
 
-def about(u, cp=None, name=None):
-    global data_loaded
+def setup(kenni):
+    get_index(wait=False)
 
-    ## load UnicodeData
-    if not data_loaded:
-        load_data()
-        data_loaded = True
 
+def scan_unicodedata(regexp):
+    """Yield (codepoint, name) for the names in unicodedata matching the
+    bytes `regexp`, for when there's no index."""
+    for cp in range(0x110000):
+        name = unicodedata.name(chr(cp), None)
+        if name is not None and regexp.search(name.encode('ascii', 'replace')):
+            yield cp, name
+
+
+def search_names(regexp, literal=None, words=None, exact_last=False):
+    """Yield (codepoint, name) for the names matching the bytes `regexp`
+    from the index, narrowed down by `literal` or by `words` as for
+    NameIndex.lookup_words(), or from unicodedata without an index."""
+    names = get_index()
+    if names is None:
+        return scan_unicodedata(regexp)
+    entries = names.lookup_words(words, exact_last) if words else None
+    return names.search(regexp, literal, entries)
+
+
+def about(u, cp=None, name=None):
     if cp is None:
         ## cp is not provided, we can safely grab the codepoint
         cp = ord(u)
@@ -63,13 +354,7 @@ def about(u, cp=None, name=None):
         cp = int(cp, 16)
 
     if name is None:
-        name = 'No Name Found'
-        ## we need the U+XXXX numbers
-        ## which are hex numbers
-        ## it is how the numbers are formatted in the UnicodeData file
-        search_cp = '%04X' % (cp)
-        if search_cp in cp_names:
-            name = cp_names[search_cp]
+        name = lookup_name(cp) or 'No Name Found'
 
     ## TODO: Replace this...
     if not unicodedata.combining(u):
@@ -81,34 +366,25 @@ def about(u, cp=None, name=None):
 
 
 def codepoint_simple(arg):
-    global data_loaded
-
-    ## load UnicodeData
-    if not data_loaded:
-        load_data()
-        data_loaded = True
-
     arg = arg.upper()
+    # Every name that matches has a word starting with each run of letters
+    # and digits in the query, which the inverted index can look up
+    tokens = r_token.findall(arg.encode('utf-8'))
+    exact = bool(tokens) and arg.endswith(tokens[-1].decode('utf-8'))
 
-    r_label = re.compile('\\b' + arg.replace(' ', '.*\\b') + '\\b')
+    r_label = re.compile(('\\b' + arg.replace(' ', '.*\\b') + '\\b').encode('utf-8'))
 
     results = list()
 
     ## loop over all codepoints that we have
-    for cp in cp_names:
-        u = chr(int(cp, 16))
-        name = cp_names[cp]
-        if r_label.search(name):
-            results.append((len(name), u, cp, name))
+    for cp, name in search_names(r_label, words=tokens, exact_last=exact):
+        results.append((len(name), chr(cp), '%04X' % cp, name))
 
     if not results:
-        r_label = re.compile('\\b' + arg.replace(' ', '.*\\b'))
+        r_label = re.compile(('\\b' + arg.replace(' ', '.*\\b')).encode('utf-8'))
 
-        for cp in cp_names:
-            u = chr(int(cp, 16))
-            name = cp_names[cp]
-            if r_label.search(name):
-                results.append((len(name), u, cp, name))
+        for cp, name in search_names(r_label, words=tokens):
+            results.append((len(name), chr(cp), '%04X' % cp, name))
 
     if not results:
         return None
@@ -118,33 +394,22 @@ def codepoint_simple(arg):
 
 
 def codepoint_extended(arg):
-    global data_loaded
-
-    ## load UnicodeData
-    if not data_loaded:
-        load_data()
-        data_loaded = True
-
     arg = arg.upper()
-    try: r_search = re.compile(arg)
+    try: r_search = re.compile(arg.encode('utf-8'), re.M)
     except: raise ValueError('Broken regexp: %r' % arg)
 
-    ## loop over all codepoints that we have
-    for cp in cp_names:
-        u = chr(int(cp, 16))
-        name = '-'
-        name = cp_names[cp]
-        if r_search.search(name):
-            yield about(u, cp, name)
+    ## loop over the codepoints whose names have the regexp's literal text
+    for cp, name in search_names(r_search, required_literal(arg)):
+        yield about(chr(cp), '%04X' % cp, name)
 
 
 def u(kenni, input):
     '''Look up unicode information.'''
-    arg = input.bytes[3:]
+    arg = input.split(' ', 1)[1] if ' ' in input else ''
     # kenni.msg('#inamidst', '%r' % arg)
     if not arg:
         return kenni.say('You gave me zero length input.')
-    elif not arg.strip(b' '):
+    elif not arg.strip(' '):
         if len(arg) > 1: return kenni.say('%s SPACEs (U+0020)' % len(arg))
         return kenni.say('1 SPACE (U+0020)')
 
@@ -188,7 +453,7 @@ def u(kenni, input):
                 kenni.say(result)
             else: kenni.say('Sorry, no results for %r.' % arg)
     else:
-        text = arg.decode('utf-8')
+        text = arg
         if len(text) <= 3:
             ## look up less than three podecoints
             for u in text:
@@ -203,4 +468,6 @@ u.commands = ['u', 'unicode']
 u.example = '.u 203D'
 
 if __name__ == '__main__':
-    print(__doc__.strip())
+    ## build the index, from a UnicodeData.txt if one is given
+    text = open(sys.argv[1], encoding='utf-8').read() if len(sys.argv) > 1 else None
+    build_index(INDEX_PATH, text)
@@ -5,7 +5,6 @@ import web
 from bs4 import BeautifulSoup
 import re
 import tools
-import requests
 import html.parser
 from modules import unicode as uc
 
@@ -47,8 +46,10 @@ def xkcd(kenni, input):
     '''.xkcd - Print all available information about the most recent (or specified) XKCD clip.'''
 
     def tryToGetJSON (site_url):
+        # Old comics never change, the current one does once in a while
+        ttl = 600 if site_url == 'https://xkcd.com/info.0.json' else 86400
         try:
-            page = web.get(xkcd_url)
+            page = web.get(xkcd_url, ttl=ttl, stale=True)
         except:
             return kenni.say('Failed to access xkcd.com: <' + xkcd_url + '>')
         try:
@@ -102,10 +103,10 @@ def hellomouse(kenni, input):
            url += "?id=" + input.group(2)
        else:
            random = True
-    page = BeautifulSoup(requests.get(url).text, 'html.parser')
+    page = BeautifulSoup(web.get(url, use_cache=not random), 'html.parser')
     if random:
        url = "https://hellomouse.net" + page.find('div', class_="comic").find('a', text="Random")['href']
-       page = BeautifulSoup(requests.get(url).text, 'html.parser')
+       page = BeautifulSoup(web.get(url), 'html.parser')
     title = page.find('div', class_="comic").find('h1').text
     text = page.find('div', class_="comic").find('small').text
     kenni.say(title + " - " + text + " - " + url)
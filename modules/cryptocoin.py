@@ -1,68 +1,183 @@
 #!/usr/bin/env python3
-import locale
+import asyncio
 import json
+import threading
+import time
 import web
+
+LISTINGS_URL = 'https://api.coinmarketcap.com/v2/listings/'
+TICKER_URL = 'https://api.coinmarketcap.com/v2/ticker/'
+LISTINGS_REFRESH = 3600
+TICKER_TTL = 60
+TOP_TICKERS = 100
+MAX_COINS = 5
+
+
 def nicecurrency(c):
-    locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
     if not c:
         return "Data Not Found"
-    else:
-        return locale.currency(float(c), grouping=True)
+    c = float(c)
+    return ('-$' if c < 0 else '$') + '{:,.2f}'.format(abs(c))
 
 def nicenum(c):
-    locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
     if not c:
         return "Data Not Found"
     else:
-        return locale.format("%d", float(c), grouping=True)
+        return '{:,d}'.format(int(float(c)))
+
 def nicedeci(c):
-    locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
     if not c:
         return "Data Not Found"
     else:
-        return locale.format("%.5f", float(c))
+        return '%.5f' % float(c)
 
-def cryptocoin(kenni, input): 
-    try:
-        page = web.get("https://api.coinmarketcap.com/v2/listings/")
-    except:
-        return kenni.say('[CryptoCoin] Connection to API Listings did not succeed.')
-    try:
-        data = json.loads(page.decode('utf-8'))["data"]
-    except:
-        return kenni.say("[CryptoCoin] Couldn't make sense of information from API")
-    currency = None
+
+class Listings(object):
+    '''
+    The CoinMarketCap listings as lowercased name -> id and symbol -> id
+    maps, swapped in whole on each refresh. Where several coins share a
+    symbol the first listed wins, as a name match always does.
+    '''
+    def __init__(self):
+        self.by_name = None
+        self.by_symbol = None
+        self.updated = 0
+
+    async def refresh(self):
+        page = await web.aget(LISTINGS_URL, use_cache=False)
+        by_name, by_symbol = dict(), dict()
+        for coin in json.loads(page.decode('utf-8'))['data']:
+            by_name.setdefault(coin['name'].lower(), coin['id'])
+            by_symbol.setdefault(coin['symbol'].lower(), coin['id'])
+        self.by_name, self.by_symbol = by_name, by_symbol
+        self.updated = time.time()
+
+    def find(self, text):
+        text = text.lower()
+        return self.by_name.get(text) or self.by_symbol.get(text)
+
+
+class Tickers(object):
+    '''
+    Tickers by coin id, each kept for TICKER_TTL seconds. One request for
+    the top TOP_TICKERS coins covers most lookups at once; only coins
+    outside it are fetched on their own, concurrently.
+    '''
+    def __init__(self):
+        self.entries = dict()
+
+    def fresh(self, coin):
+        entry = self.entries.get(coin)
+        if entry is not None and entry[0] > time.time():
+            return entry[1]
+        return None
+
+    def store(self, data):
+        expires = time.time() + TICKER_TTL
+        self.entries[data['id']] = (expires, data)
+
+    async def fetch_one(self, coin):
+        page = await web.aget(TICKER_URL + str(coin) + '/', use_cache=False)
+        self.store(json.loads(page.decode('utf-8'))['data'])
+
+    async def get(self, coins):
+        '''Return {id: ticker} for the ids in `coins`. A coin whose own
+        request failed maps to the exception instead, so the others can
+        still be shown.'''
+        missing = [coin for coin in coins if self.fresh(coin) is None]
+        if missing:
+            page = await web.aget(TICKER_URL + '?limit=%d' % TOP_TICKERS, use_cache=False)
+            for data in json.loads(page.decode('utf-8'))['data'].values():
+                self.store(data)
+            missing = [coin for coin in missing if self.fresh(coin) is None]
+        failed = dict()
+        if missing:
+            results = await asyncio.gather(*[self.fetch_one(coin) for coin in missing],
+                                           return_exceptions=True)
+            failed = dict((coin, result) for coin, result in zip(missing, results)
+                          if isinstance(result, Exception))
+        return dict((coin, failed.get(coin) or self.fresh(coin)) for coin in coins)
+
+
+class Refresher(threading.Thread):
+    '''Reloads the listings every LISTINGS_REFRESH seconds.'''
+    def __init__(self, listings):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.listings = listings
+        self.stopping = threading.Event()
+
+    def run(self):
+        while not self.stopping.is_set():
+            try:
+                web.run(self.listings.refresh())
+            except Exception:
+                pass
+            self.stopping.wait(LISTINGS_REFRESH)
+
+    def stop(self):
+        self.stopping.set()
+
+
+listings = Listings()
+tickers = Tickers()
+
+
+def setup(kenni):
+    if getattr(kenni, 'cc_refresher', None) is not None:
+        kenni.cc_refresher.stop()
+    kenni.cc_refresher = Refresher(listings)
+    kenni.cc_refresher.start()
+
+
+def describe(data):
+    quotes = data["quotes"]["USD"]
+    sevdchange = quotes['percent_change_7d']
+    if not sevdchange:
+        sevdchange = "Data Not Found"
+    else:
+        sevdchange = str(sevdchange) + "%"
+    return (data["name"] + " (" + data["symbol"] + ") - Price (USD): " + nicecurrency(quotes["price"]) + " - Market Cap (USD): " + nicecurrency(quotes['market_cap']) + " - In Circulation: " + nicenum(data["circulating_supply"]) + " - Max: "
++ nicenum(data['max_supply']) +  " - Volume (24 hours - USD): " + nicecurrency(quotes['volume_24h']) + " - 1 hour: " + str(quotes['percent_change_1h']) + "% - 24 hours: " + str(quotes['percent_change_24h']) + "% - 7 days: " + sevdchange)
+
+
+async def cryptocoin(kenni, input):
     text = input.group(2)
     if not text:
         return kenni.say("You must enter a currency to proceed")
-    for x in data:
-        if x["name"].lower() == text.lower():
-            currency = x["id"]
-            break
-        elif x["symbol"].lower() == text.lower():
-            currency = x["id"]
-            break
-    if currency is None:
-        kenni.say("Currency not found")
-    else:
-        currency = str(currency)
-        try:
-            page = web.get("https://api.coinmarketcap.com/v2/ticker/" + currency +"/")
-        except:
-            return kenni.say('[CryptoCoin] Connection to API Ticker did not succeed.')
+    if listings.by_name is None:
         try:
-            data = json.loads(page.decode('utf-8'))["data"]
-        except:
+            await listings.refresh()
+        except IOError:
+            return kenni.say('[CryptoCoin] Connection to API Listings did not succeed.')
+        except (ValueError, KeyError):
             return kenni.say("[CryptoCoin] Couldn't make sense of information from API")
-        quotes = data["quotes"]["USD"]
-        sevdchange = quotes['percent_change_7d']
-        if not sevdchange:
-            sevdchange = "Data Not Found"
+
+    # A full name may have spaces in it, otherwise each word is a coin
+    coin = listings.find(text.strip())
+    if coin is not None:
+        wanted = [(text.strip(), coin)]
+    else:
+        wanted = [(word, listings.find(word)) for word in text.split()[:MAX_COINS]]
+    found = [coin for word, coin in wanted if coin is not None]
+    if not found:
+        return kenni.say("Currency not found")
+
+    try:
+        data = await tickers.get(found)
+    except IOError:
+        return kenni.say('[CryptoCoin] Connection to API Ticker did not succeed.')
+    except (ValueError, KeyError):
+        return kenni.say("[CryptoCoin] Couldn't make sense of information from API")
+    for word, coin in wanted:
+        if coin is None:
+            kenni.say("Currency not found: " + word)
+        elif isinstance(data[coin], IOError):
+            kenni.say('[CryptoCoin] Could not get the ticker for ' + word)
+        elif isinstance(data[coin], Exception) or data[coin] is None:
+            kenni.say("[CryptoCoin] Couldn't make sense of information from API for " + word)
         else:
-            sevdchange = str(sevdchange) + "%"
-        kenni.say(data["name"] + " (" + data["symbol"] + ") - Price (USD): " + nicecurrency(quotes["price"]) + " - Market Cap (USD): " + nicecurrency(quotes['market_cap']) + " - In Circulation: " + nicenum(data["circulating_supply"]) + " - Max: " 
-+ nicenum(data['max_supply']) +  " - Volume (24 hours - USD): " + nicecurrency(quotes['volume_24h']) + " - 1 hour: " + str(quotes['percent_change_1h']) + "% - 24 hours: " + str(quotes['percent_change_24h']) + "% - 7 days: " + sevdchange)
+            kenni.say(describe(data[coin]))
 cryptocoin.commands = ['cryptocoin', 'cc']
-cryptocoin.example = '.cryptocoin'
+cryptocoin.example = '.cc btc eth xmr'
 cryptocoin.rate = 20
-
@@ -39,7 +39,7 @@ def etymology(word):
         raise ValueError("Word too long: %s[...]" % word[:10])
     word = {'axe': 'ax/axe'}.get(word, word)
 
-    bytes = web.get(etyuri % word)
+    bytes = web.get(etyuri % word, stale=True)
     definitions = r_definition.findall(bytes.decode('utf-8'))
 
     if not definitions:
@@ -7,7 +7,7 @@ def excuse(kenni, input):
     a = re.compile('<a [\s\S]+>(.*)</a>')
 
     try:
-        page = web.get('http://programmingexcuses.com/')
+        page = web.get('http://programmingexcuses.com/', use_cache=False)
     except:
         return kenni.say("I'm all out of excuses!")
 
@@ -10,7 +10,7 @@ def food(kenni, input):
     url = 'http://www.whatthefuckshouldimakefordinner.com'
     if txt == '-v':
         url = 'http://whatthefuckshouldimakefordinner.com/veg.php'
-    page = web.get(url)
+    page = web.get(url, use_cache=False)
 
     results = re_mark.findall(page.decode('utf-8'))
 
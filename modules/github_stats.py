@@ -1,26 +1,161 @@
 #!/usr/bin/env python3
+import collections
+import itertools
 import json
 import random
 import re
+import threading
+import time
 import traceback
-import urllib.request, urllib.error, urllib.parse
 import urllib.parse
+import web
 
 # For information about the Github API check out https://developer.github.com/v3/
 
 BASE_URL = "https://api.github.com"
 DEFAULT_HEADER = { "Accept": "application/vnd.github.v3+json" }
+FRESH = 60
+RESERVE = 2
+PER_PAGE = 100
+MAX_PAGES = 10
+MAX_CACHED = 512
+SHOWN = 5
+r_link = re.compile(r'<([^>]+)>;\s*rel="(\w+)"')
+r_page = re.compile(r'[?&]page=(\d+)')
+
+
+class RateLimited(IOError):
+    pass
+
+
+class GitHubClient(object):
+    '''
+    Talks to the GitHub API with the optional github_token from the
+    config. Responses are kept with their ETag: within FRESH seconds
+    they're used as they are, after that they're revalidated, and a 304
+    doesn't count against the rate limit. The X-RateLimit headers are
+    tracked for each resource (core, search), and once fewer than RESERVE
+    requests remain we stop asking until the reset time, answering from
+    the cache where we can.
+    '''
+    def __init__(self, token=None):
+        self.token = token
+        self.lock = threading.Lock()
+        self.cache = collections.OrderedDict()
+        self.limits = dict()
+
+    def resource(self, url):
+        return 'search' if urllib.parse.urlsplit(url).path.startswith('/search/') else 'core'
+
+    def headers(self, entry):
+        headers = dict(DEFAULT_HEADER)
+        if self.token:
+            headers['Authorization'] = 'token ' + self.token
+        if entry is not None and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        return headers
+
+    def limited(self, resource):
+        '''Return the seconds until `resource` may be used again, or 0.'''
+        with self.lock:
+            remaining, reset = self.limits.get(resource, (None, 0))
+        if remaining is not None and remaining < RESERVE and reset > time.time():
+            return reset - time.time()
+        return 0
+
+    def fetch(self, url):
+        '''Return (content, {rel: url}) for `url`, the second being the
+        pages its Link header points to.'''
+        with self.lock:
+            entry = self.cache.get(url)
+        if entry is not None and entry['fetched'] > time.time() - FRESH:
+            return entry['content'], entry['links']
+        resource = self.resource(url)
+        wait = self.limited(resource)
+        if wait:
+            if entry is not None:
+                return entry['content'], entry['links']
+            raise RateLimited('GitHub rate limit reached, try again in %d minutes' % (wait // 60 + 1))
+
+        with web.request(url, headers=self.headers(entry)) as u:
+            remaining = u.headers.get('X-RateLimit-Remaining')
+            if remaining and remaining.isdigit():
+                reset = u.headers.get('X-RateLimit-Reset', '0')
+                with self.lock:
+                    self.limits[u.headers.get('X-RateLimit-Resource', resource)] = (
+                        int(remaining), int(reset) if reset.isdigit() else 0)
+            if u.code == 304 and entry is not None:
+                u.read()
+                entry['fetched'] = time.time()
+                return entry['content'], entry['links']
+            web.check_status(u)
+            content = json.loads(u.read().decode('utf-8'))
+            links = dict((rel, link) for link, rel in r_link.findall(u.headers.get('Link') or ''))
+            entry = {'etag': u.headers.get('ETag'), 'content': content,
+                     'links': links, 'fetched': time.time()}
+        with self.lock:
+            self.cache[url] = entry
+            self.cache.move_to_end(url)
+            while len(self.cache) > MAX_CACHED:
+                self.cache.popitem(last=False)
+        return content, entry['links']
+
+    def get(self, url):
+        return self.fetch(url)[0]
+
+    def first_page(self, url):
+        if '?' not in url:
+            url += '?per_page=%d' % PER_PAGE
+        return url
+
+    def items(self, url, max_pages=MAX_PAGES):
+        '''Yield the items of a list, following the Link header's next
+        pages only as far as they're consumed.'''
+        url = self.first_page(url)
+        for page in range(max_pages):
+            content, links = self.fetch(url)
+            for item in content:
+                yield item
+            url = links.get('next')
+            if url is None:
+                return
+
+    def count(self, url):
+        '''Return how many items a list has. Only its first page and, if
+        there are more, its last are fetched: the last page's number says
+        how many full pages come before it.'''
+        content, links = self.fetch(self.first_page(url))
+        page = r_page.search(links.get('last') or '')
+        if page is None:
+            return len(content)
+        return (int(page.group(1)) - 1) * PER_PAGE + len(self.get(links['last']))
+
+
+client = GitHubClient()
+
+
+def setup(kenni):
+    client.token = getattr(kenni.config, 'github_token', None)
+
 
 def fetch_github(kenni, url, term):
     t = urllib.parse.quote(term)
     if '%' in term:
         t = urllib.parse.quote(term.replace('%', ''))
 
-    request = urllib.request.Request(url % t, headers=DEFAULT_HEADER)
+    try:
+        return client.get(url % t)
+    except Exception as e:
+        kenni.say("An error occurred fetching information from Github: {0}".format(e))
+        return None
+
+def fetch_github_list(kenni, url, term):
+    t = urllib.parse.quote(term.replace('%', ''))
 
     try:
-        content = json.loads(urllib.request.urlopen(request).read())
-        return content
+        # The first page is cached, so counting after it costs at most one
+        # more request, for the last page
+        return list(itertools.islice(client.items(url % t), SHOWN)), client.count(url % t)
     except Exception as e:
         kenni.say("An error occurred fetching information from Github: {0}".format(e))
         return None
@@ -59,15 +194,14 @@ def github_user_search(kenni, term):
 def github_prs(kenni, project):
     pr_url = BASE_URL + "/repos/%s/pulls"
 
-    content = fetch_github(kenni, pr_url, project)
-    if content is None: return
-
-    num_pulls = len(content)
+    result = fetch_github_list(kenni, pr_url, project)
+    if result is None: return
+    content, num_pulls = result
 
     kenni.say("{0} has {1} open PRs".format(project, num_pulls))
     if num_pulls > 0:
-        list_pulls = min(num_pulls, 5)
-        titles = ", ".join([ x["title"] for x in content[:5] ])
+        list_pulls = len(content)
+        titles = ", ".join([ x["title"] for x in content ])
         kenni.say("Latest {0} PRs: {1}".format(list_pulls, titles))
 
 # User info
@@ -103,15 +237,14 @@ def github_user(kenni, login):
 def github_contribs(kenni, project):
     contrib_url = BASE_URL + "/repos/%s/contributors"
 
-    content = fetch_github(kenni, contrib_url, project)
-    if content is None: return
-
-    num_contribs = len(content)
+    result = fetch_github_list(kenni, contrib_url, project)
+    if result is None: return
+    content, num_contribs = result
 
     kenni.say("This repo has {0} contributors".format(num_contribs))
     if num_contribs > 0:
-        list_contribs = min(num_contribs, 5)
-        contribs = ", ".join([ "{0} ({1} contributions)".format(x["login"], x["contributions"]) for x in content[:5] ])
+        list_contribs = len(content)
+        contribs = ", ".join([ "{0} ({1} contributions)".format(x["login"], x["contributions"]) for x in content ])
         kenni.say("Top {0} contributors: {1}".format(list_contribs, contribs))
 
 # kenni commands start here
@@ -1,29 +1,30 @@
 #!/usr/bin/env python3
-import os, random
-from modules import unicode as uc
+import tools
 
-def insult(kenni, input):
-    """ insults <target> with configured language insult """
+def get_corpus(kenni):
     try:
-        insultFilename = os.path.expanduser('~/Kenni/config/insult.'+ kenni.config.insult_lang +'.txt')
-    except:
+        return tools.corpus('~/Kenni/config/insult.' + kenni.config.insult_lang + '.txt')
+    except AttributeError:
         kenni.say("You need to configure the default language!")
+        return None
+
+def insult(kenni, input):
+    """ insults <target> with configured language insult """
+    corpus = get_corpus(kenni)
+    if corpus is None:
         return
 
     target = input.group(2)
     if not target:
         return kenni.say('.i <target>!')
-    target.encode('utf-8')
     target = (target).strip()
-    try:
-        fn = open(insultFilename, "r")
-    except IOError as e:
-        generateDatabase(kenni, insultFilename)
-        fn = open(insultFilename, "r")
-    lines = fn.readlines()
-    fn.close()
-    random.seed()
-    kenni.say(target + ': ' + uc.decode(random.choice(lines)))
+    line = corpus.choice()
+    if line is None:
+        generateDatabase(kenni, corpus)
+        line = corpus.choice()
+        if line is None:
+            return kenni.say('No insults yet, add some with .iadd')
+    kenni.say(target + ': ' + line)
 
 insult.commands = ['i', 'insult']
 insult.priority = 'medium'
@@ -31,37 +32,28 @@ insult.example = '.i <target>'
 
 def addinsult(kenni, input):
     """.iadd <insult> -- adds a harsh adjetive to the insult database"""
-    try:
-        insultFilename = os.path.expanduser('~/Kenni/config/insult.'+ kenni.config.insult_lang +'.txt')
-    except:
-        kenni.say("You need to configure the default language!")
+    corpus = get_corpus(kenni)
+    if corpus is None:
         return
 
-    text = input.group(2)
-    text = uc.encode(text)
-    fn = open(insultFilename, "a")
-    fn.write(text)
-    fn.write("\n")
-    fn.close()
+    text = (input.group(2) or '').strip()
+    if not text:
+        return kenni.say('.iadd <insult>')
+    corpus.add(text)
     kenni.say("Insult added.")
 addinsult.commands = ['iadd']
 addinsult.priority = 'medium'
 addinsult.example = '.iadd Bad Person'
 addinsult.rate = 30
 
-def generateDatabase(kenni, insultFilename):
+def generateDatabase(kenni, corpus):
     if kenni.config.insult_lang == "english":
         insultList = ['fuck you', 'stupid', 'asshole', 'you suck']
     elif kenni.config.insult_lang == "spanish":
         insultList = ['puto', 'trolo', 'forro', 'insurrecto', 'trolita', 'aguafiestas', 'actualizame esta gil', 'apestoso usuario de windows']
     else:
         return # silent fail due lack of configuration
-    fn = open(insultFilename, "a")
-
-    for insult in insultList:
-        fn.write(insult)
-        fn.write("\n")
-    fn.close()
+    corpus.add(*insultList)
 
     kenni.say(kenni.config.insult_lang + " insult database created.")
 
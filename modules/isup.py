@@ -20,7 +20,7 @@ def isup(kenni, input):
         else:
             site = 'http://' + site
     try:
-        response = web.get(site)
+        response = web.get(site, use_cache=False)
     except Exception as e:
         kenni.say(site + ' looks down from here.')
         return
@@ -10,7 +10,7 @@ base = 'https://status.mojang.com/check'
 def mcstatus(kenni, input):
     response = "[MC Status] "
     try:
-        page = web.get(base)
+        page = web.get(base, ttl=60)
     except IOError as err:
         return kenni.say('Could not access given address. (Detailed error: %s)' % (err))
     try:
@@ -2,13 +2,16 @@
 import copy
 import datetime
 import feedparser
+import os
 import weather
 import re
 import sqlite3
 import string
 import textwrap
+import threading
 import time
 import urllib.request, urllib.parse, urllib.error
+import xml.etree.ElementTree as ET
 import web
 import tools
 
@@ -131,10 +134,15 @@ re_fips = re.compile(r'County FIPS:</.*?>(\S+)</td></tr>')
 re_state = re.compile(r'State:</span></td><td class="info"><a href="/state/\S\S.asp">\S\S \[([A-Za-z ]+)\]</a></td></tr>')
 re_city = re.compile(r'City:</span></td><td class="info"><a href="/city/\S+.asp">(.*)</a></td></tr>')
 re_zip = re.compile(r'^(\d{5})\-?(\d{4})?$')
+re_zone_link = re.compile(r'<a href="wwaatmget\.php\?x=(\w+)')
+re_tag_text = re.compile(r'>([^<>]+)<')
 more_info = 'Complete weather watches, warnings, and advisories for {0}, available here: {1} -- You may also PM the bot to get more details.'
 warning_list = 'https://alerts.weather.gov/cap/us.php?x=1'
 stop = False
-CHANNEL = '##weather'
+POLL_INTERVAL = 120
+PUSH_PER_POLL = 5
+ATOM = '{http://www.w3.org/2005/Atom}'
+CAP = '{urn:oasis:names:tc:emergency:cap:1.1}'
 
 def colourize(text):
     for condition in conditions:
@@ -143,18 +151,236 @@ def colourize(text):
     return text
 
 
+class GeoCache(object):
+    '''
+    Where places are in the alert feeds, kept in SQLite so a county or
+    ZIP code is only ever looked up upstream once: county names map to
+    the zone codes listed on each state's page (fetched whole, the first
+    time a county in that state is asked for), ZIP codes to a county code
+    and a place name.
+    '''
+    def __init__(self, fn):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(fn, check_same_thread=False)
+        self.db.execute('CREATE TABLE IF NOT EXISTS counties '
+                        '(state TEXT, county TEXT, code TEXT, PRIMARY KEY (state, county))')
+        self.db.execute('CREATE TABLE IF NOT EXISTS zips (zip TEXT PRIMARY KEY, code TEXT, location TEXT)')
+        self.db.commit()
+
+    def county(self, state, county):
+        '''Return the zone code of `county` in `state` (its abbreviation),
+        or None.'''
+        with self.lock:
+            known = self.db.execute('SELECT 1 FROM counties WHERE state = ? LIMIT 1', (state,)).fetchone()
+        if not known:
+            lines = web.get(county_list.format(state)).decode('utf-8', 'ignore').split('\n')
+            rows = dict()
+            for i, line in enumerate(lines[:-2]):
+                link = re_zone_link.search(line)
+                name = link and re_tag_text.search(lines[i + 2])
+                if name:
+                    rows.setdefault(name.group(1).strip().lower(), link.group(1))
+            with self.lock:
+                self.db.executemany('INSERT OR REPLACE INTO counties VALUES (?, ?, ?)',
+                                    [(state, name, code) for name, code in rows.items()])
+                self.db.commit()
+        with self.lock:
+            row = self.db.execute('SELECT code FROM counties WHERE state = ? AND county = ?',
+                                  (state, county)).fetchone()
+        return row and row[0]
+
+    def zip_code(self, zip_code):
+        '''Return (county code, location) for `zip_code`. Raises ValueError
+        with a message to show if it can't be resolved.'''
+        with self.lock:
+            row = self.db.execute('SELECT code, location FROM zips WHERE zip = ?', (zip_code,)).fetchone()
+        if row:
+            return row
+        pagez = web.get(zip_code_lookup.format(zip_code)).decode('utf-8', 'ignore')
+        fips = re_fips.findall(pagez)
+        if not fips:
+            raise ValueError('ZIP code does not exist.')
+        state = re_state.findall(pagez)
+        city = re_city.findall(pagez)
+        if not state and not city:
+            raise ValueError('Could not match ZIP code to a state')
+        try:
+            state = states[state[0].lower()].upper()
+            row = (state + 'C' + fips[0], city[0] + ', ' + state)
+        except (IndexError, KeyError):
+            raise ValueError('Could not parse state or city from database.')
+        with self.lock:
+            self.db.execute('INSERT OR REPLACE INTO zips VALUES (?, ?, ?)', (zip_code,) + row)
+            self.db.commit()
+        return row
+
+
+class Alert(object):
+    def __init__(self, id, title, summary, link, updated, codes):
+        self.id = id
+        self.title = title
+        self.summary = summary
+        self.link = link
+        self.updated = updated
+        self.codes = codes
+
+
+def parse_alerts(page):
+    '''Return the Alerts in a CAP Atom feed.'''
+    result = list()
+    for entry in ET.fromstring(page).iter(ATOM + 'entry'):
+        codes = set()
+        for geocode in entry.iter(CAP + 'geocode'):
+            names = [e.text for e in geocode.iter() if e.tag.endswith('valueName')]
+            values = [e.text for e in geocode.iter() if e.tag.endswith('}value') or e.tag == 'value']
+            for name, value in zip(names, values):
+                if name == 'UGC' and value:
+                    codes.update(value.split())
+        if not codes:
+            # The "no active alerts" placeholder
+            continue
+        try:
+            updated = datetime.datetime.fromisoformat(entry.findtext(ATOM + 'updated')).timestamp()
+        except (TypeError, ValueError):
+            updated = 0
+        link = entry.find(ATOM + 'link')
+        result.append(Alert(entry.findtext(ATOM + 'id'), (entry.findtext(ATOM + 'title') or '').strip(),
+                            (entry.findtext(ATOM + 'summary') or '').strip(),
+                            link.get('href') if link is not None else None, updated, codes))
+    return result
+
+
+class AlertPoller(threading.Thread):
+    '''
+    Polls the national CAP feed every POLL_INTERVAL seconds with
+    conditional GETs, and indexes the active alerts by zone and county
+    code so lookups don't have to go upstream. Alerts that weren't in the
+    previous poll go to the channels subscribed to their area in the
+    nws_alerts config (channel -> list of codes, state abbreviations or
+    '*').
+    '''
+    def __init__(self, kenni):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.kenni = kenni
+        self.by_code = dict()
+        self.ids = None
+        self.updated = 0
+        self.validators = dict()
+        self.stopping = threading.Event()
+
+    def run(self):
+        while not self.stopping.is_set():
+            try:
+                self.poll()
+            except Exception:
+                pass
+            self.stopping.wait(POLL_INTERVAL)
+
+    def stop(self):
+        self.stopping.set()
+
+    def fresh(self):
+        return self.updated > time.time() - 3 * POLL_INTERVAL
+
+    def poll(self):
+        with web.request(warning_list, headers=self.validators) as u:
+            if u.code == 304:
+                self.updated = time.time()
+                return
+            web.check_status(u)
+            page = u.read()
+            validators = dict()
+            if u.headers.get('ETag'):
+                validators['If-None-Match'] = u.headers['ETag']
+            if u.headers.get('Last-Modified'):
+                validators['If-Modified-Since'] = u.headers['Last-Modified']
+        current = parse_alerts(page)
+        by_code = dict()
+        for alert in sorted(current, key=lambda alert: alert.updated, reverse=True):
+            for code in alert.codes:
+                by_code.setdefault(code, list()).append(alert)
+        previous, self.ids = self.ids, set(alert.id for alert in current)
+        self.by_code = by_code
+        self.validators = validators
+        self.updated = time.time()
+        # Nothing is new on the first poll, it's just what's active
+        if previous is not None:
+            self.push([alert for alert in current if alert.id not in previous])
+
+    def push(self, new):
+        subscriptions = getattr(self.kenni.config, 'nws_alerts', None) or dict()
+        for channel, areas in subscriptions.items():
+            areas = [area.upper() for area in areas]
+            wanted = [alert for alert in new if '*' in areas or
+                      any(code in areas or code[:2] in areas for code in alert.codes)]
+            for alert in wanted[:PUSH_PER_POLL]:
+                self.kenni.msg_later(channel, colourize(alert.title) + (' ' + alert.link if alert.link else ''))
+            if len(wanted) > PUSH_PER_POLL:
+                self.kenni.msg_later(channel, '... and %d more alerts.' % (len(wanted) - PUSH_PER_POLL))
+
+    def lookup(self, code):
+        '''Return [(title, summary)] of the active alerts for `code`, most
+        recent first.'''
+        return [(colourize(alert.title), alert.summary) for alert in self.by_code.get(code, ())]
+
+
+def setup(kenni):
+    configdir = os.path.expanduser('~/Kenni/config')
+    os.makedirs(configdir, exist_ok=True)
+    kenni.nws_geo = GeoCache(os.path.join(configdir, 'nws.sqlite'))
+    if getattr(kenni, 'nws_poller', None) is not None:
+        kenni.nws_poller.stop()
+    kenni.nws_poller = AlertPoller(kenni)
+    kenni.nws_poller.start()
+
+
+def fetch_alerts(master_url):
+    '''Return [(title, summary)] from the alert feed at `master_url`, most
+    recent first.'''
+    feed = feedparser.parse(web.get(master_url))
+    warnings_dict = dict()
+    for item in feed.entries:
+        if nomsg[:51] == colourize(item['title']):
+            return list()
+        else:
+            warnings_dict[colourize(str(item['title']))] = str(item['summary'])
+
+    ## let us sort it so the most recent thing is first, then second, etc...
+    warn_keys = list(warnings_dict.keys())
+    find_issue = re.compile('issued (\S+) (\S+) at (\S+):(\S+)(\S)M')
+    warn_keys_dt = dict()
+    for warn in warn_keys:
+        warn_dt = find_issue.findall(warn)
+        if len(warn_dt) > 0:
+            warn_dt = warn_dt[0]
+            month = months[warn_dt[0]]
+            day = int(warn_dt[1])
+            hour = int(warn_dt[2])
+            minute = int(warn_dt[3])
+            if warn_dt[-1] == 'P':
+                if hour < 12:
+                    hour += 12
+            year = datetime.datetime.now().year
+
+            hour -= 1
+            warn_keys_dt[warn] = datetime.datetime(year, month, day, hour, minute)
+
+    warn_list_dt = sorted(warn_keys_dt, key=warn_keys_dt.get, reverse=True)
+    return [(key, warnings_dict[key]) for key in warn_list_dt]
+
+
 def nws_lookup(kenni, input):
     ''' Look up weather watches, warnings, and advisories. '''
     text = input.group(2)
     if not text:
         return kenni.say('You need to provide some input.')
     bits = text.split(',')
-    master_url = False
+    code = False
     if len(bits) == 2:
         ## county given
         county = bits[0]
         state = bits[1]
-        url_part1 = 'https://alerts.weather.gov'
         state = (state).strip().lower()
         county = (county).strip().lower()
         reverse_lookup = list()
@@ -165,21 +391,9 @@ def nws_lookup(kenni, input):
         if state not in states and len(reverse_lookup) < 1:
             kenni.say('State not found.')
             return
-        url1 = county_list.format(states[state])
-        page1 = web.get(url1).split('\n')
-        prev1 = str()
-        prev2 = str()
-        url_part2 = str()
-        for line in page1:
-            mystr = '>' + str(county) + '<'
-            if mystr in line.lower():
-                url_part2 = prev2[9:40]
-                break
-            prev2 = prev1
-            prev1 = line
-        if not url_part2:
+        code = kenni.nws_geo.county(states[state], county)
+        if not code:
             return kenni.say('Could not find county.')
-        master_url = 'https://alerts.weather.gov/cap/' + url_part2
         location = text
     elif len(bits) == 1:
         ## zip code
@@ -193,72 +407,33 @@ def nws_lookup(kenni, input):
                     zip_code = zips[0][0]
                 except:
                     return kenni.say('ZIP could not be validated.')
-            urlz = zip_code_lookup.format(zip_code)
-            pagez = web.get(urlz)
-            fips = re_fips.findall(pagez.decode('utf-8',"ignore"))
-            if fips:
-                state = re_state.findall(pagez.decode('utf-8', "ignore"))
-                city = re_city.findall(pagez.decode('utf-8', "ignore"))
-                if not state and not city:
-                    return kenni.say('Could not match ZIP code to a state')
-                try:
-                    state = state[0].lower()
-                    state = states[state].upper()
-                    location = city[0] + ', ' + state
-                    fips_combo = str(state) + 'C' + str(fips[0])
-                    master_url = alerts.format(fips_combo)
-                except:
-                    return kenni.say('Could not parse state or city from database.')
-            else:
-                return kenni.say('ZIP code does not exist.')
+            try:
+                code, location = kenni.nws_geo.zip_code(zip_code)
+            except ValueError as e:
+                return kenni.say(str(e))
 
-    if not master_url:
+    if not code:
         return kenni.say('Invalid input. Please enter a ZIP code or a county and state pairing, such as \'Franklin, Ohio\'')
 
-    feed = feedparser.parse(master_url)
-    warnings_dict = dict()
-    for item in feed.entries:
-        if nomsg[:51] == colourize(item['title']):
-            return kenni.say(nomsg.format(location))
-        else:
-            warnings_dict[colourize(str(item['title']))] = str(item['summary'])
+    master_url = alerts.format(code)
+    if kenni.nws_poller.fresh():
+        warnings = kenni.nws_poller.lookup(code)
+    else:
+        warnings = fetch_alerts(master_url)
+    if not warnings:
+        return kenni.say(nomsg.format(location))
 
-    if len(warnings_dict) > 0:
-        ## if we have any alerts...
-        ## let us sort it so the most recent thing is first, then second, etc...
-        warn_keys = list(warnings_dict.keys())
-        find_issue = re.compile('issued (\S+) (\S+) at (\S+):(\S+)(\S)M')
-        warn_keys_dt = dict()
-        for warn in warn_keys:
-            warn_dt = find_issue.findall(warn)
-            if len(warn_dt) > 0:
-                warn_dt = warn_dt[0]
-                month = months[warn_dt[0]]
-                day = int(warn_dt[1])
-                hour = int(warn_dt[2])
-                minute = int(warn_dt[3])
-                if warn_dt[-1] == 'P':
-                    if hour < 12:
-                        hour += 12
-                year = datetime.datetime.now().year
-
-                hour -= 1
-                warn_keys_dt[warn] = datetime.datetime(year, month, day, hour, minute)
-
-        warn_list_dt = sorted(warn_keys_dt, key=warn_keys_dt.get, reverse=True)
-        #print 'warn_list_dt', warn_list_dt
-
-        if tools.isChan(input.sender, False) and not (input.group(1)).startswith('nws-more'):
-            ## if queried in channel
-            for key in warn_list_dt:
-                kenni.say(key)
-            kenni.say(more_info.format(location, master_url))
-        else:
-            ## if queried in private message
-            for key in warn_list_dt:
-                kenni.say(key)
-                kenni.say(warnings_dict[key])
-            kenni.say(more_info.format(location, master_url))
+    if tools.isChan(input.sender, False) and not (input.group(1)).startswith('nws-more'):
+        ## if queried in channel
+        for title, summary in warnings:
+            kenni.say(title)
+        kenni.say(more_info.format(location, master_url))
+    else:
+        ## if queried in private message
+        for title, summary in warnings:
+            kenni.say(title)
+            kenni.say(summary)
+        kenni.say(more_info.format(location, master_url))
 nws_lookup.commands = ['nws', 'nws-more']
 nws_lookup.priority = 'high'
 nws_lookup.thread = True
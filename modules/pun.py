@@ -6,7 +6,7 @@ import web
 def puns(kenni, input):
     url = 'http://www.punoftheday.com/cgi-bin/randompun.pl'
     exp = re.compile(r'<div class="dropshadow1">\n<p>(.*?)</p>\n</div>')
-    page = web.get(url)
+    page = web.get(url, use_cache=False)
 
     result = exp.search(page.decode('utf-8'))
     if result:
@@ -2,7 +2,6 @@
 import re
 import web
 import html.parser
-import requests
 import random
 import tools
 from bs4 import BeautifulSoup
@@ -2,7 +2,6 @@
 import re
 import web
 import html.parser
-import requests
 import random
 from bs4 import BeautifulSoup
 def stripHTML(input):
@@ -14,7 +13,7 @@ def stripHTML(input):
     input = re.sub(pass3, "", input)
 def rather(kenni, input):
     url = "http://either.io/"
-    page = BeautifulSoup(web.get(url), 'html.parser')
+    page = BeautifulSoup(web.get(url, use_cache=False), 'html.parser')
     result1 = page.find("div", class_="result-1")
     result2 = page.find("div", class_="result-2")
     option1 = result1.find("span", class_="option-text").text.lower() + " (" + result1.find("div", class_="percentage").find("span").text.lower() + "%)"
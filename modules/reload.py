@@ -11,6 +11,7 @@ def f_reload(kenni, input):
         return kenni.say('What?')
 
     if (not name) or (name == '*'):
+        kenni.cancel_tasks()
         kenni.variables = None
         kenni.commands = None
         kenni.setup()
@@ -2,7 +2,6 @@
 import re
 import web
 import html.parser
-import requests
 import tools
 from bs4 import BeautifulSoup
 def colorize(text):
@@ -40,7 +39,7 @@ def google(kenni, input):
         kenni.say("Please enter a query")
     else:
         url = "https://www.google.com/search?safe=strict&query=" + query.replace(" ","%20")
-        page = BeautifulSoup(requests.get(url).text, 'html.parser')
+        page = BeautifulSoup(web.get(url), 'html.parser')
         results = page.find_all("div", class_="g")
         if(len(results) <1):
             kenni.say("No results found")
@@ -1,12 +1,27 @@
 #!/usr/bin/env python3
-import threading, time, sys
+import threading, time, sys, os
 import tools
+import web
+
+# Channel list modes we keep a copy of, and how the server lists them:
+# mode -> (entry numeric, end of list numeric)
+LIST_NUMERICS = {
+    'b': ('367', '368'),
+    'e': ('348', '349'),
+    'q': ('728', '729'),
+}
 
 def setup(kenni):
     # by clsn
     kenni.data = {}
     refresh_delay = 300.0
 
+    # Keep HTTP responses on disk as well, so they survive restarts
+    if getattr(kenni.config, 'http_cache', None):
+        try: web.cache.open_disk(os.path.expanduser(kenni.config.http_cache))
+        except Exception as e:
+            print('Could not open the HTTP cache %s: %s' % (kenni.config.http_cache, e), file=sys.stderr)
+
     if hasattr(kenni.config, 'refresh_delay'):
         try: refresh_delay = float(kenni.config.refresh_delay)
         except: pass
@@ -78,6 +93,16 @@ nick.priority = 'high'
 
 
 
+def isupport(kenni, input):
+    # input.args is (nick, TOKEN, TOKEN=value, ..., 'are supported by this server')
+    if len(input.args) < 3:
+        return
+    kenni.set_isupport(input.args[1:-1])
+isupport.rule = r'(.*)'
+isupport.event = '005'
+isupport.priority = 'high'
+isupport.thread = False
+
 # Method for populating op/hop/voice information in channels on join
 def privs_on_join(kenni, input):
     if not input.mode_target or not tools.isChan(input.mode_target, False):
@@ -86,13 +111,15 @@ def privs_on_join(kenni, input):
     if input.names and len(input.names) > 0:
         split_names = input.names.split()
         for name in split_names:
-            nick_mode, nick = name[0], name[1:]
-            if nick_mode == '@':
+            # With multi-prefix a nick can carry several prefixes, e.g. @+nick
+            nick = name.lstrip('~&@%+')
+            nick_modes = name[:len(name) - len(nick)]
+            if '@' in nick_modes:
                 kenni.add_op(channel, nick)
-            elif nick_mode == '%':
+            if '%' in nick_modes:
                 kenni.add_halfop(channel, nick)
-            elif nick_mode == '+':
-                kenni.add_voice(channel, nick_mode + nick)
+            if '+' in nick_modes:
+                kenni.add_voice(channel, nick)
 privs_on_join.rule = r'(.*)'
 privs_on_join.event = '353'
 privs_on_join.priority = 'high'
@@ -115,6 +142,80 @@ new_Join_Hostmask.rule = r'(.*)'
 new_Join_Hostmask.event = 'JOIN'
 new_Join_Hostmask.priority = 'high'
 
+def request_lists(kenni, input):
+    if input.nick != kenni.nick or not tools.isChan(input.sender, False):
+        return
+    # On servers where q is a status mode (owner) it isn't a list
+    for mode in kenni.list_modes():
+        if mode in LIST_NUMERICS:
+            kenni.write(['MODE', input.sender, mode])
+request_lists.rule = r'(.*)'
+request_lists.event = 'JOIN'
+request_lists.priority = 'high'
+
+def list_entry(kenni, channel, mode, entry):
+    masklist = kenni.get_masklist(channel, mode)
+    if masklist is None or masklist.complete:
+        # First entry of a fresh listing, start over
+        masklist = tools.MaskList()
+        kenni.masklists[(channel.lower(), mode)] = masklist
+    setter = set_at = None
+    if len(entry) > 1: setter = entry[1]
+    if len(entry) > 2: set_at = entry[2]
+    masklist.add(entry[0], setter, set_at)
+
+def list_end(kenni, channel, mode):
+    masklist = kenni.get_masklist(channel, mode)
+    if masklist is None or masklist.complete:
+        # The list is empty
+        masklist = tools.MaskList()
+        kenni.masklists[(channel.lower(), mode)] = masklist
+    masklist.complete = True
+
+# input.args is (nick, channel, mask, setter, time)
+def ban_list(kenni, input):
+    list_entry(kenni, input.args[1], 'b', input.args[2:])
+ban_list.rule = r'(.*)'
+ban_list.event = '367'
+ban_list.priority = 'high'
+ban_list.thread = False
+
+def ban_list_end(kenni, input):
+    list_end(kenni, input.args[1], 'b')
+ban_list_end.rule = r'(.*)'
+ban_list_end.event = '368'
+ban_list_end.priority = 'high'
+ban_list_end.thread = False
+
+def except_list(kenni, input):
+    list_entry(kenni, input.args[1], 'e', input.args[2:])
+except_list.rule = r'(.*)'
+except_list.event = '348'
+except_list.priority = 'high'
+except_list.thread = False
+
+def except_list_end(kenni, input):
+    list_end(kenni, input.args[1], 'e')
+except_list_end.rule = r'(.*)'
+except_list_end.event = '349'
+except_list_end.priority = 'high'
+except_list_end.thread = False
+
+# input.args is (nick, channel, 'q', mask, setter, time)
+def quiet_list(kenni, input):
+    list_entry(kenni, input.args[1], input.args[2], input.args[3:])
+quiet_list.rule = r'(.*)'
+quiet_list.event = '728'
+quiet_list.priority = 'high'
+quiet_list.thread = False
+
+def quiet_list_end(kenni, input):
+    list_end(kenni, input.args[1], input.args[2])
+quiet_list_end.rule = r'(.*)'
+quiet_list_end.event = '729'
+quiet_list_end.priority = 'high'
+quiet_list_end.thread = False
+
 # Method for tracking changes to ops/hops/voices in channels
 def track_priv_change(kenni, input):
     if not input.sender or not tools.isChan(input.sender, False):
@@ -122,32 +223,37 @@ def track_priv_change(kenni, input):
 
     channel = input.sender
 
-    if input.mode:
-        add_mode = input.mode.startswith('+')
-        del_mode = input.mode.startswith('-')
-
-        # Check that this is a mode change and that it is a mode change on a user
-        if (add_mode or del_mode) and input.mode_target and len(input.mode_target) > 0:
-            mode_change = input.mode[1:]
-            mode_target = input.mode_target
-
-            if add_mode:
-                if mode_change == 'o':
-                    kenni.add_op(channel, mode_target)
-                elif mode_change == 'h':
-                    kenni.add_halfop(channel, mode_target)
-                elif mode_change == 'v':
-                    kenni.add_voice(channel, mode_target)
+    # input.args is (channel, modes, param, param, ...)
+    if len(input.args) < 3:
+        return
+
+    for sign, mode_change, mode_target in kenni.parse_modes(input.args[1], input.args[2:]):
+        if not mode_target:
+            continue
+        masklist = kenni.get_masklist(channel, mode_change)
+        if masklist is not None:
+            if sign == '+':
+                masklist.add(mode_target, input.nick, str(int(time.time())))
             else:
-                if mode_change == 'o':
-                    kenni.del_op(channel, mode_target)
-                elif mode_change == 'h':
-                    kenni.del_halfop(channel, mode_target)
-                elif mode_change == 'v':
-                    kenni.del_voice(channel, mode_target)
+                masklist.remove(mode_target)
+        elif sign == '+':
+            if mode_change == 'o':
+                kenni.add_op(channel, mode_target)
+            elif mode_change == 'h':
+                kenni.add_halfop(channel, mode_target)
+            elif mode_change == 'v':
+                kenni.add_voice(channel, mode_target)
+        else:
+            if mode_change == 'o':
+                kenni.del_op(channel, mode_target)
+            elif mode_change == 'h':
+                kenni.del_halfop(channel, mode_target)
+            elif mode_change == 'v':
+                kenni.del_voice(channel, mode_target)
 track_priv_change.rule = r'(.*)'
 track_priv_change.event = 'MODE'
 track_priv_change.priority = 'high'
+track_priv_change.thread = False
 
 if __name__ == '__main__':
     print(__doc__.strip())
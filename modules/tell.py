@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os, re, time, random
+import sqlite3
 import threading
 import tools
 
@@ -24,33 +25,110 @@ def loadReminders(fn, lock):
     return result
 
 
-def dumpReminders(fn, data, lock):
-    lock.acquire()
-    try:
-        f = open(fn, 'w')
-        for tellee in data.keys():
-            for remindon in data[tellee]:
-                line = '\t'.join((tellee,) + remindon)
-                try: f.write(line + '\n')
-                except IOError: break
-        try: f.close()
-        except IOError: pass
-    finally:
-        lock.release()
-    return True
+class TellStore(object):
+    '''
+    Pending reminders in a SQLite database in WAL mode, one row each,
+    looked up by the lowercased tellee. Adding or delivering a reminder
+    writes only its own rows. The keys with something pending are also
+    indexed in memory, exact ones in a set and wildcards in a prefix trie,
+    so checking a nick that has nothing waiting is a hash probe and a walk
+    of at most len(nick) nodes, without the lock or the disk.
+    '''
+    def __init__(self, fn):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(fn, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute('CREATE TABLE IF NOT EXISTS reminders (id INTEGER PRIMARY KEY, '
+                        'key TEXT, tellee TEXT, teller TEXT, verb TEXT, timenow TEXT, msg TEXT)')
+        self.db.execute('CREATE INDEX IF NOT EXISTS reminders_key ON reminders (key)')
+        self.db.commit()
+        self.exact = set()
+        # Trie nodes are dicts of char -> node; the '' entry of a node is
+        # the tuple of wildcard keys whose prefix ends there. It's replaced
+        # rather than changed in place, so matching() can read it unlocked.
+        self.trie = dict()
+        for row in self.db.execute('SELECT DISTINCT key FROM reminders'):
+            self.index(row[0])
+
+    def index(self, key):
+        if not key.endswith('*'):
+            self.exact.add(key)
+            return
+        node = self.trie
+        for char in key.rstrip('*:'):
+            node = node.setdefault(char, dict())
+        if key not in node.get('', ()):
+            node[''] = node.get('', ()) + (key,)
+
+    def unindex(self, key):
+        if not key.endswith('*'):
+            self.exact.discard(key)
+            return
+        node = self.trie
+        for char in key.rstrip('*:'):
+            node = node.get(char)
+            if node is None:
+                return
+        node[''] = tuple(k for k in node.get('', ()) if k != key)
+
+    def add(self, tellee, teller, verb, timenow, msg):
+        with self.lock:
+            self.db.execute('INSERT INTO reminders (key, tellee, teller, verb, timenow, msg) '
+                            'VALUES (?, ?, ?, ?, ?, ?)', (tellee.lower(), tellee, teller, verb, timenow, msg))
+            self.db.commit()
+            self.index(tellee.lower())
+
+    def take(self, key):
+        '''Remove and return [(teller, verb, timenow, msg)] for `key`.'''
+        with self.lock:
+            rows = self.db.execute('SELECT teller, verb, timenow, msg FROM reminders '
+                                   'WHERE key = ? ORDER BY id', (key,)).fetchall()
+            self.db.execute('DELETE FROM reminders WHERE key = ?', (key,))
+            self.db.commit()
+            self.unindex(key)
+        return rows
+
+    def matching(self, nick):
+        '''Return the keys with reminders for `nick`: its own, and
+        wildcards such as "nick*" that it starts with.'''
+        nick = nick.lower()
+        node = self.trie
+        found = list(node.get('', ()))
+        for char in nick:
+            node = node.get(char)
+            if node is None:
+                break
+            found.extend(node.get('', ()))
+        if nick in self.exact:
+            found.append(nick)
+        if len(found) > 1:
+            found.sort(reverse=True)
+        return found
+
+    def migrate(self, fn):
+        '''Import the reminders from an old tab separated .tell.db file and
+        set it aside as .migrated.'''
+        old = loadReminders(fn, self.lock)
+        with self.lock:
+            for tellee, reminders in old.items():
+                self.db.executemany('INSERT INTO reminders (key, tellee, teller, verb, timenow, msg) '
+                                    'VALUES (?, ?, ?, ?, ?, ?)',
+                                    [(tellee.lower(), tellee) + tuple(r) for r in reminders])
+                self.index(tellee.lower())
+            self.db.commit()
+        os.rename(fn, fn + '.migrated')
 
 
 def setup(self):
-    fn = self.nick + '-' + self.config.host + '.tell.db'
-    self.tell_filename = os.path.join(os.path.expanduser('~/Kenni/config'), fn)
-    if not os.path.exists(self.tell_filename):
-        try: f = open(self.tell_filename, 'w')
-        except OSError: pass
-        else:
-            f.write('')
-            f.close()
-    self.tell_lock = threading.Lock()
-    self.reminders = loadReminders(self.tell_filename, self.tell_lock)  # @@ tell
+    fn = self.nick + '-' + self.config.host + '.tell'
+    configdir = os.path.expanduser('~/Kenni/config')
+    os.makedirs(configdir, exist_ok=True)
+    self.tell_filename = os.path.join(configdir, fn + '.sqlite')
+    self.reminders = TellStore(self.tell_filename)
+    old = os.path.join(configdir, fn + '.db')
+    if os.path.exists(old):
+        self.reminders.migrate(old)
 
 
 def f_remind(kenni, input):
@@ -77,15 +155,11 @@ def f_remind(kenni, input):
         verb, tellee, msg = input.groups()
 
     ## handle unicode
-    verb = verb.decode('utf-8')
-    tellee = tellee.encode('utf-8').decode('utf-8')
-    msg = msg.encode('utf-8').decode('utf-8')
+    if isinstance(verb, bytes):
+        verb = verb.decode('utf-8')
 
     tellee = tellee.rstrip('.,:;')
 
-    if not os.path.exists(kenni.tell_filename):
-        return
-
     timenow = time.strftime('%d %b %H:%MZ', time.gmtime())
     whogets = list()
     for tellee in tellee.split(','):
@@ -93,16 +167,9 @@ def f_remind(kenni, input):
             kenni.say('Nickname %s is too long.' % (tellee))
             continue
         if not tellee.lower() in (teller.lower(), kenni.nick):  # @@
-            kenni.tell_lock.acquire()
-            try:
-                if not tellee.lower() in whogets:
-                    whogets.append(tellee)
-                    if tellee not in kenni.reminders:
-                        kenni.reminders[tellee] = [(teller, verb, timenow, msg)]
-                    else:
-                        kenni.reminders[tellee].append((teller, verb, timenow, msg))
-            finally:
-                kenni.tell_lock.release()
+            if not tellee.lower() in whogets:
+                whogets.append(tellee)
+                kenni.reminders.add(tellee, teller, verb, timenow, msg)
     response = str()
     if teller.lower() == tellee.lower() or tellee.lower() == 'me':
         response = 'You can %s yourself that.' % (verb)
@@ -124,8 +191,6 @@ def f_remind(kenni, input):
         elif rand > 0.999: response = 'yeah, sure, whatever'
 
     kenni.say(response)
-
-    dumpReminders(kenni.tell_filename, kenni.reminders, kenni.tell_lock) # @@ tell
 f_remind.rule = ('$nick', ['[tTyY]ell', '[aA]sk'], r'(\S+) (.*)')
 f_remind.commands = ['tell', 'to', 'yell']
 
@@ -135,18 +200,10 @@ def getReminders(kenni, channel, key, tellee):
     template = '%s: %s <%s> %s %s %s'
     today = time.strftime('%d %b', time.gmtime())
 
-    kenni.tell_lock.acquire()
-
-    try:
-        for (teller, verb, datetime, msg) in kenni.reminders[key]:
-            if datetime.startswith(today):
-                datetime = datetime[len(today) + 1:]
-            lines.append(template % (tellee, datetime, teller, verb, tellee, msg))
-
-        try: del kenni.reminders[key]
-        except KeyError: kenni.msg(channel, 'Er...')
-    finally:
-        kenni.tell_lock.release()
+    for (teller, verb, datetime, msg) in kenni.reminders.take(key):
+        if datetime.startswith(today):
+            datetime = datetime[len(today) + 1:]
+        lines.append(template % (tellee, datetime, teller, verb, tellee, msg))
 
     return lines
 
@@ -157,18 +214,9 @@ def message(kenni, input):
     tellee = input.nick
     channel = input.sender
 
-    if not os: return
-    if not os.path.exists(kenni.tell_filename):
-        return
-
     reminders = []
-    remkeys = list(reversed(sorted(kenni.reminders.keys())))
-    for remkey in remkeys:
-        if not remkey.endswith('*') or remkey.endswith(':'):
-            if tellee.lower() == remkey.lower():
-                reminders.extend(getReminders(kenni, channel, remkey, tellee))
-        elif tellee.lower().startswith(remkey.rstrip('*:').lower()):
-            reminders.extend(getReminders(kenni, channel, remkey, tellee))
+    for remkey in kenni.reminders.matching(tellee):
+        reminders.extend(getReminders(kenni, channel, remkey, tellee))
 
     for line in reminders[:maximum]:
         kenni.say(line)
@@ -177,9 +225,6 @@ def message(kenni, input):
         kenni.say('Further messages sent privately')
         for line in reminders[maximum:]:
             kenni.msg(tellee, line)
-
-    if len(list(kenni.reminders.keys())) != remkeys:
-        dumpReminders(kenni.tell_filename, kenni.reminders, kenni.tell_lock)  # @@ tell
 message.rule = r'(.*)'
 message.priority = 'low'
 
@@ -7,7 +7,7 @@ import urllib.parse
 from modules import unicode as uc
 
 
-def translate(kenni, input):
+async def translate(kenni, input):
     base = 'https://translate.yandex.net/api/v1.5/tr.json/translate?key='
     if not hasattr(kenni.config, 'yandex_apikey'):
         return kenni.say('Please sign up for a Yandex API key')
@@ -18,7 +18,7 @@ def translate(kenni, input):
         return kenni.say("No search term!")
     response = "["
     try:
-        page = web.get(base+urllib.parse.quote_plus(txt))
+        page = await web.aget(base+urllib.parse.quote_plus(txt))
     except IOError as err:
         return kenni.say('Could not access given address. (Detailed error: %s)' % (err))
     try:
@@ -15,7 +15,7 @@ def urban(kenni, input):
     if not txt:
         return kenni.say("No search term!")
     try:
-        page = web.get(base + txt.replace(" ","%20"))
+        page = web.get(base + txt.replace(" ","%20"), use_cache=False)
     except IOError as err:
         return kenni.say('Could not access given address. (Detailed error: %s)' % (err))
     try:
@@ -1,51 +1,105 @@
 #!/usr/bin/env python3
+import codecs
+import html.parser
+import collections
 import json
 import re
+import threading
 from html.entities import name2codepoint
 from modules import unicode as uc
 import time
 import urllib.request, urllib.error, urllib.parse
 import web
 import sys
+import tools
 
 BAD_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.gif', '.pdf',
                   '.doc', '.docx', '.deb', '.rpm', '.exe', '.zip', '.7z', '.gz',
                   '.tar', '.webm', '.mp4', '.mp3', '.avi', '.mpeg', '.mpg',
                   '.ogv', '.ogg', '.java')
 url_finder = re.compile(r'(?iu)(%s?(http|https)(://\S+\.?\S+/?\S+?))' )
+re_links = re.compile(r'(?i)\bhttps?://[^\s<>"\x01]+')
 r_entity = re.compile(r'&[A-Za-z0-9#]+;')
 INVALID_WEBSITE = 0x01
+# Titles are read from the page in chunks of TITLE_CHUNK bytes, giving up
+# after TITLE_MAX_BYTES
+TITLE_CHUNK = 4096
+TITLE_MAX_BYTES = 262144
+TITLE_SNIFF_BYTES = 1024
+# How long found titles, and failures or non-HTML pages, are remembered
+TITLE_TTL = 3600
+TITLE_FAIL_TTL = 300
+TITLE_CACHE_SIZE = 2048
+# Automatic link previews, see PreviewPipeline
+PREVIEW_WORKERS = 4
+PREVIEW_PER_CHANNEL = 1
+PREVIEW_BACKLOG = 5
+PREVIEW_PER_MESSAGE = 3
+PREVIEW_WINDOW = 600
+re_charset = re.compile(br'''(?i)<meta[^>]+charset=["']?([A-Za-z0-9_:.-]+)''')
 HTML_ENTITIES = { 'apos': "'" }
 
 
-def noteuri(kenni, input):
-    uri = input.group(1).encode('utf-8')
-    if not hasattr(kenni, 'last_seen_uri'):
-        kenni.last_seen_uri = {}
-    kenni.last_seen_uri[input.sender] = uri
-noteuri.rule = r'(?u).*(http[s]?://[^<> "\x01]+)[,.]?'
-noteuri.priority = 'low'
+def get_page(url):
+    return web.get_more(url)
 
 
-def get_page(url):
-    req = urllib.request.Request(url, headers={'Accept':'*/*'})
-    req.add_header('User-Agent', 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.71 Safari/537.36')
-    u = urllib.request.urlopen(req)
-    contents = u.read(262144)
-    out = dict()
-    try:
-        con = (contents).decode('utf-8')
-    except:
-        con = (contents).decode('iso-8859-1')
-    out['code'] = u.code
-    out['read'] = con
-    out['geturl'] = u.geturl()
-    out['headers'] = u.headers
-    out['url'] = u.url
-    return out['code'], out
+class TitleParser(html.parser.HTMLParser):
+    """
+    Incremental parser that collects the page <title>, or og:title as a
+    fallback, and notes when there's no point in reading any further.
+    """
+    def __init__(self):
+        html.parser.HTMLParser.__init__(self, convert_charrefs=True)
+        self.in_title = False
+        self.title = None
+        self.og_title = None
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'title' and self.title is None:
+            self.in_title = True
+            self.title = str()
+        elif tag == 'meta':
+            attrs = dict(attrs)
+            if attrs.get('property') == 'og:title' and attrs.get('content'):
+                self.og_title = attrs['content']
+                self.done = True
+        elif tag == 'body':
+            # The title lives in <head>
+            self.done = True
+
+    def handle_endtag(self, tag):
+        if tag == 'title' and self.in_title:
+            self.in_title = False
+            self.done = True
+        elif tag == 'head':
+            self.done = True
+
+    def handle_data(self, data):
+        if self.in_title:
+            self.title += data
+
+
+def known_charset(charset):
+    """Return `charset` if Python has a codec for it, otherwise None."""
+    if charset:
+        try:
+            codecs.lookup(charset)
+            return charset
+        except LookupError:
+            pass
+    return None
 
 
-def find_title(url):
+def sniff_charset(head):
+    match = re_charset.search(head)
+    if match:
+        return known_charset(match.group(1).decode('ascii', 'ignore'))
+    return None
+
+
+def fetch_title(url):
     """
     This finds the title when provided with a string of a URL.
     """
@@ -63,62 +117,143 @@ def find_title(url):
 
     url = uc.decode(url)
 
-    msg = str()
-    k = 0
-    status = False
-
-    while not status:
-        if 'i.imgur' not in url:
-            real_parts = url.split('?')
-            if real_parts and real_parts[0].endswith(BAD_EXTENSIONS):
-                break
-
-        k += 1
-        if k > 3:
-            break
-
-        status, msg = get_page(url)
+    if 'i.imgur' not in url:
+        real_parts = url.split('?')
+        if real_parts and real_parts[0].endswith(BAD_EXTENSIONS):
+            return False, 'Bad extension'
 
-        if type(msg) == type(dict()) and 'code' in msg:
-            status = msg['code']
-        else:
-            continue
-
-        time.sleep(0.5)
-
-
-    if not status:
-        return False, msg
+    try:
+        u = web.request(url)
+        web.check_status(u)
+    except Exception as e:
+        return False, str(e)
+
+    # Only the headers have been read so far, so anything that isn't HTML
+    # is turned away without downloading it
+    with u:
+        mtype = u.headers.get('content-type')
+        if not mtype:
+            print('failed mtype:', str(u.headers))
+            return False, 'mtype failed'
+        if not (('/html' in mtype) or ('/xhtml' in mtype)):
+            return False, str(mtype)
+
+        # Servers send all sorts in here ("utf8mb4", "none"...)
+        charset = known_charset(u.headers.get_content_charset())
+        parser = TitleParser()
+        decoder = None
+        received = 0
+        pending = b''
+        try:
+            while not parser.done and received < TITLE_MAX_BYTES:
+                chunk = u.read(TITLE_CHUNK)
+                if not chunk:
+                    break
+                received += len(chunk)
+                if decoder is None:
+                    # Wait for enough of the page to find a <meta charset>
+                    pending += chunk
+                    if len(pending) < TITLE_SNIFF_BYTES and not re_charset.search(pending):
+                        continue
+                    chunk, pending = pending, b''
+                    charset = charset or sniff_charset(chunk) or 'utf-8'
+                    decoder = codecs.getincrementaldecoder(charset)(errors='replace')
+                parser.feed(decoder.decode(chunk))
+        except Exception as e:
+            return False, str(e)
+        if decoder is None and pending:
+            charset = charset or sniff_charset(pending) or 'utf-8'
+            parser.feed(pending.decode(charset, 'replace'))
+
+    title = parser.title or parser.og_title
+    if title:
+        title = ' '.join(title.split())
 
-    useful = msg
+    if title and len(title) > 350:
+        title = title[:350] + '\x0F[...]'
 
-    info = useful['headers']
-    page = useful['read']
+    if title:
+        return True, title
+    else:
+        return False, 'No Title'
 
+def normalize_url(url):
+    """
+    Reduce a URL to the form titles are cached under: lowercase scheme
+    and host, no default port and no fragment.
+    """
+    if not url.lower().startswith('http'):
+        url = 'http://' + url
     try:
-        mtype = info['content-type']
-    except:
-        print('failed mtype:', str(info))
-        return False, 'mtype failed'
-    if not (('/html' in mtype) or ('/xhtml' in mtype)):
-        return False, str(mtype)
+        parts = urllib.parse.urlsplit(url)
+        host = (parts.hostname or '').lower()
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    if port and (scheme, port) not in (('http', 80), ('https', 443)):
+        host += ':%d' % port
+    fragment = parts.fragment if parts.fragment.startswith('!') else ''
+    return urllib.parse.urlunsplit((scheme, host, parts.path or '/', parts.query, fragment))
+
+
+class TitleCache(object):
+    """
+    Remembers the outcome of fetch_title() per normalized URL, and makes
+    concurrent lookups of the same URL share a single fetch.
+    """
+    def __init__(self, size=TITLE_CACHE_SIZE):
+        self.size = size
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
+        self.in_flight = dict()
+
+    def lookup(self, url, fetch):
+        key = normalize_url(url)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires, result = entry
+                if expires > time.time():
+                    self.entries.move_to_end(key)
+                    return result
+                del self.entries[key]
+            waiter = self.in_flight.get(key)
+            if waiter is None:
+                waiter = self.in_flight[key] = [threading.Event(), None]
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            waiter[0].wait()
+            return waiter[1]
+
+        result = (False, 'No Title')
+        try:
+            result = fetch(url)
+        finally:
+            ttl = TITLE_TTL if result[0] else TITLE_FAIL_TTL
+            with self.lock:
+                self.entries[key] = (time.time() + ttl, result)
+                while len(self.entries) > self.size:
+                    self.entries.popitem(last=False)
+                del self.in_flight[key]
+            waiter[1] = result
+            waiter[0].set()
+        return result
 
-    content = page
 
+title_cache = TitleCache()
 
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(content, 'html.parser')
-    title = soup.title.string
 
-    if len(title) > 350:
-        title = title[:350] + '\x0F[...]'
+def find_title(url):
+    """
+    Like fetch_title(), but answered from title_cache when possible.
+    """
+    return title_cache.lookup(url, fetch_title)
 
 
-    if title:
-        return True, title
-    else:
-        return False, 'No Title'
-
 def remove_nonprint(text):
     new = str()
     for char in text:
@@ -151,15 +286,140 @@ show_title_demand.commands = ['title']
 show_title_demand.priority = 'high'
 
 
-def collect_links(kenni, input):
-    link = input.groups()
+class PreviewPipeline(object):
+    """
+    Fetches previews for links seen in channels on a fixed number of
+    worker threads. Each channel has its own backlog of at most
+    PREVIEW_BACKLOG links and at most PREVIEW_PER_CHANNEL previews in
+    progress, and channels take turns, so a link flood in one channel is
+    dropped rather than holding up the others. A link already previewed
+    in a channel within PREVIEW_WINDOW seconds is skipped.
+    """
+    def __init__(self, kenni, workers=PREVIEW_WORKERS):
+        self.kenni = kenni
+        self.workers = workers
+        self.cond = threading.Condition()
+        self.pending = dict()
+        self.active = dict()
+        self.ready = collections.deque()
+        self.seen = dict()
+        self.threads = list()
+        self.stopped = False
+        self.dropped = 0
+
+    def submit(self, channel, url):
+        """
+        Queue a preview of `url` for `channel`. Returns False if it was a
+        duplicate or the channel's backlog is full.
+        """
+        # Channel names are case insensitive, and "#Foo" and "#foo" must
+        # share one backlog and one limit
+        channel = channel.lower()
+        key = (channel, normalize_url(url))
+        now = time.time()
+        with self.cond:
+            if self.seen.get(key, 0) > now - PREVIEW_WINDOW:
+                return False
+            backlog = self.pending.setdefault(channel, collections.deque())
+            if len(backlog) >= PREVIEW_BACKLOG:
+                self.dropped += 1
+                return False
+            if len(self.seen) > 4096:
+                self.seen = dict((k, t) for k, t in self.seen.items() if t > now - PREVIEW_WINDOW)
+            self.seen[key] = now
+            backlog.append(url)
+            self.schedule(channel)
+            if len(self.threads) < self.workers:
+                thread = threading.Thread(target=self.work)
+                thread.daemon = True
+                thread.start()
+                self.threads.append(thread)
+        return True
+
+    def schedule(self, channel):
+        # Caller holds self.cond
+        if (self.pending.get(channel) and channel not in self.ready and
+                self.active.get(channel, 0) < PREVIEW_PER_CHANNEL):
+            self.ready.append(channel)
+            self.cond.notify()
+
+    def stop(self):
+        with self.cond:
+            self.stopped = True
+            self.cond.notify_all()
+
+    def work(self):
+        while True:
+            with self.cond:
+                while not self.ready and not self.stopped:
+                    self.cond.wait()
+                if self.stopped:
+                    return
+                channel = self.ready.popleft()
+                url = self.pending[channel].popleft()
+                self.active[channel] = self.active.get(channel, 0) + 1
+                self.schedule(channel)
+            try:
+                text = preview(self.kenni, url)
+                if text:
+                    self.kenni.msg(channel, text)
+            except Exception as e:
+                print('Preview of %s failed: %s' % (url, e), file=sys.stderr)
+            finally:
+                with self.cond:
+                    self.active[channel] -= 1
+                    self.schedule(channel)
+
+
+def preview(kenni, url):
+    """
+    Build the preview line for `url`. Modules can add handlers for their
+    own sites to kenni.previewers as name: (regexp, function), where the
+    function takes (kenni, url, match) and returns the line or None.
+    """
+    for name, (regexp, handler) in list(kenni.previewers.items()):
+        match = regexp.search(url)
+        if match:
+            return handler(kenni, url, match)
+    passs, page_title = find_title(url)
+    if passs:
+        host = urllib.parse.urlsplit(normalize_url(url)).hostname or url
+        return '[ %s ] - %s' % (page_title, host)
+    return None
+
+
+def previews_enabled(kenni, channel):
+    channels = getattr(kenni.config, 'previews', [])
+    return '*' in channels or channel in channels or channel.lower() in channels
+
+
+def setup(kenni):
+    if getattr(kenni, 'link_previews', None) is not None:
+        kenni.link_previews.stop()
+    kenni.link_previews = PreviewPipeline(kenni)
+
+
+def note_links(kenni, input):
+    links = [link.rstrip('.,;:!?)\'"') for link in re_links.findall(input)]
+    if not links:
+        return
     channel = input.sender
-    link = link[0]
     if not hasattr(kenni, 'last_seen_uri'):
         kenni.last_seen_uri = dict()
-    kenni.last_seen_uri[channel] = link
-collect_links.rule = '(?iu).*(%s?(http|https)(://\S+)).*'
-collect_links.priority = 'low'
+    kenni.last_seen_uri[channel] = links[-1]
+
+    # Commands such as .title handle links themselves
+    prefix = kenni.config.prefix
+    if hasattr(kenni.config, 'prefixes') and channel in kenni.config.prefixes:
+        prefix = kenni.config.prefixes[channel]
+    if re.match(prefix, input):
+        return
+    if tools.isChan(channel, False) and previews_enabled(kenni, channel):
+        for link in links[:PREVIEW_PER_MESSAGE]:
+            kenni.link_previews.submit(channel, link)
+note_links.rule = r'(?i).*https?://'
+note_links.priority = 'low'
+
 
 re_meta = re.compile('(?i)content="\S+;\s*?url=(\S+)"\s*?>')
 
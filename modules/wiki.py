@@ -1,25 +1,180 @@
 #!/usr/bin/env python3
+import asyncio
+import collections
+import html.parser
+import json
 import re
+import time
+import urllib.error, urllib.parse
 import web
 import tools
-import wikipedia
-def wiki(kenni, input):
-    query = input.group(2)
-    if not query:
-        kenni.say("Please enter a query")
+
+API_URL = 'https://en.wikipedia.org/w/api.php?'
+SUMMARY_URL = 'https://en.wikipedia.org/api/rest_v1/page/summary/'
+HTML_URL = 'https://en.wikipedia.org/api/rest_v1/page/html/'
+SUMMARY_TTL = 3600
+SEARCH_TTL = 6 * 3600
+DISAMBIGUATION_TTL = 24 * 3600
+MAX_CACHED = 1024
+NAMESPACES = ('Category:', 'File:', 'Help:', 'Portal:', 'Special:', 'Template:', 'Wikipedia:')
+
+
+class Memo(object):
+    '''A dict whose entries expire after `ttl` seconds, holding at most
+    MAX_CACHED of them (the least recently stored go first).'''
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.entries = collections.OrderedDict()
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < time.time():
+            return None
+        return entry[1]
+
+    def put(self, key, value):
+        self.entries[key] = (time.time() + self.ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > MAX_CACHED:
+            self.entries.popitem(last=False)
+        return value
+
+
+summaries = Memo(SUMMARY_TTL)
+searches = Memo(SEARCH_TTL)
+disambiguations = Memo(DISAMBIGUATION_TTL)
+
+
+def title_key(title):
+    # Titles are case sensitive bar their first letter ("MIT" and "Mit"
+    # are different pages)
+    title = title.replace('_', ' ').strip()
+    return title[:1].upper() + title[1:]
+
+
+async def search(query):
+    '''Return the title of the best search result for `query`, or None.'''
+    title = searches.get(query)
+    if title is None:
+        uri = API_URL + web.urlencode({'action': 'opensearch', 'search': query, 'limit': 1,
+                                       'namespace': 0, 'format': 'json'})
+        results = json.loads((await web.aget(uri, use_cache=False)).decode('utf-8'))
+        title = searches.put(query, results[1][0] if results[1] else '')
+    return title or None
+
+
+async def summary(title, negative=True):
+    '''Return the page/summary JSON for `title`, or None if there's no
+    such page. A remembered "no such page" is only trusted if `negative`
+    is true.'''
+    data = summaries.get(title_key(title))
+    if data is None or (not data and not negative):
+        uri = SUMMARY_URL + urllib.parse.quote(title.replace(' ', '_'), safe='')
+        try:
+            data = json.loads((await web.aget(uri, use_cache=False)).decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            if e.code != 404:
+                raise
+            data = dict()
+        # A missing page is remembered under the title asked for only,
+        # never under a canonical title
+        summaries.put(title_key(title), data)
+        if data.get('title'):
+            summaries.put(title_key(data['title']), data)
+    return data or None
+
+
+class FirstOption(html.parser.HTMLParser):
+    '''Finds the first article linked from a list item, which on a
+    disambiguation page is the first (usually the primary) meaning.'''
+    def __init__(self):
+        html.parser.HTMLParser.__init__(self)
+        self.depth = 0
+        self.choice = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'li':
+            self.depth += 1
+        elif tag == 'a' and self.depth and self.choice is None:
+            attrs = dict(attrs)
+            # Parsoid marks links within Wikipedia as mw:WikiLink (other
+            # wikis get mw:WikiLink/Interwiki)
+            title = attrs.get('title') or ''
+            if 'mw:WikiLink' in (attrs.get('rel') or '').split() and title \
+                    and not title.startswith(NAMESPACES):
+                self.choice = title
+
+    def handle_endtag(self, tag):
+        if tag == 'li' and self.depth:
+            self.depth -= 1
+
+
+async def disambiguate(title):
+    '''Return the first article a disambiguation page lists.'''
+    choice = disambiguations.get(title_key(title))
+    if choice is None:
+        uri = HTML_URL + urllib.parse.quote(title.replace(' ', '_'), safe='')
+        parser = FirstOption()
+        parser.feed((await web.aget(uri, use_cache=False)).decode('utf-8', 'replace'))
+        choice = disambiguations.put(title_key(title), parser.choice or '')
+    return choice or None
+
+
+def drop(task):
+    if task.done():
+        if not task.cancelled():
+            task.exception()
     else:
-        results = wikipedia.search(query)
-        if not results:
-            kenni.say("No results found")
-        else:
+        task.cancel()
+
+
+async def lookup(query):
+    '''Return the summary of the page a search for `query` finds first.
+    The query is also tried as a title while the search is running, which
+    saves a round trip whenever it's what the search finds.'''
+    title = searches.get(query)
+    if title is None:
+        direct = asyncio.ensure_future(summary(query))
+        try:
+            title = await search(query)
+        except:
+            drop(direct)
+            raise
+        if title is None:
+            drop(direct)
+            return None
+        if title_key(title) == title_key(query):
             try:
-               page = wikipedia.page(results[0])
-            except wikipedia.DisambiguationError as err:
-               page = wikipedia.page(err.options[0])
-            wikiTitle = page.title
-            wikiUrl = page.url
-            wikiSummary = page.summary[:tools.charlimit-len(wikiUrl)-15] + " [...]"
-        kenni.say(wikiTitle + " : " + wikiSummary + " - " + wikiUrl)
+                data = await direct
+            except Exception:
+                # It was only a guess, the search worked so try again below
+                data = None
+        else:
+            drop(direct)
+            data = None
+        if data is None:
+            data = await summary(title, negative=False)
+    elif not title:
+        return None
+    else:
+        data = await summary(title, negative=False)
+    if data is not None and data.get('type') == 'disambiguation':
+        choice = await disambiguate(data['title'])
+        data = choice and await summary(choice)
+    return data
+
+
+async def wiki(kenni, input):
+    query = input.group(2)
+    if not query:
+        return kenni.say("Please enter a query")
+    data = await lookup(query.strip())
+    if not data or not data.get('extract'):
+        return kenni.say("No results found")
+    wikiTitle = data['title']
+    wikiUrl = data['content_urls']['desktop']['page']
+    wikiSummary = data['extract'][:tools.charlimit-len(wikiUrl)-15] + " [...]"
+    kenni.say(wikiTitle + " : " + wikiSummary + " - " + wikiUrl)
 wiki.commands = ['wikipedia', 'wiki']
 
 if __name__ == '__main__':
@@ -17,7 +17,7 @@ def text(html):
 def wiktionary(word):
     bytes = None
     try:
-         bytes = web.get(uri % web.quote(word)).decode('utf-8')
+         bytes = web.get(uri % web.quote(word), stale=True).decode('utf-8')
     except:
           return None,None
     bytes = r_ul.sub('', bytes)
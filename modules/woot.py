@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import feedparser
+import web
 
 api = "https://api.woot.com/1/sales/current.rss/www.woot.com"
 
@@ -7,7 +8,7 @@ api = "https://api.woot.com/1/sales/current.rss/www.woot.com"
 def woot(kenni, input):
     """ .woot -- pulls the latest information from woot.com """
     output = str()
-    parsed = feedparser.parse(api)
+    parsed = feedparser.parse(web.get(api, ttl=300))
     if not parsed['entries']:
         kenni.say("No item currently available.")
         return
@@ -4,12 +4,10 @@ from urllib.error import HTTPError
 from urllib.parse import quote
 from urllib.parse import urlencode
 import random
-import requests
 import json
 import pprint
 import sys
-import urllib.request, urllib.parse, urllib.error
-import argparse
+import web
 
 def request(host, path, api_key, url_params=None):
 
@@ -21,9 +19,11 @@ def request(host, path, api_key, url_params=None):
 
     print(('Querying {0} ...'.format(url)))
 
-    response = requests.request('GET', url, headers=headers, params=url_params)
+    if url_params:
+        url += '?' + urlencode(url_params)
+    response = web.get(url, headers=headers)
 
-    return response.json()
+    return json.loads(response.decode('utf-8'))
 
 def yelp(kenni, input):
     if not hasattr(kenni.config, 'yelp_apikey'):
@@ -1,12 +1,137 @@
 #!/usr/bin/env python3# vim: set fileencoding=UTF-8 :
+import collections
+import datetime
 import json
 import re
+import threading
+import time
 import traceback
-import re, urllib.request, urllib.parse, urllib.error, gzip, io
+import zoneinfo
+import re, urllib.request, urllib.parse, urllib.error
 import web
-from html.parser import HTMLParser
+import html
 
 BASE_URL = "https://www.googleapis.com/youtube/v3/"
+yt_catch = re.compile('http[s]*:\/\/[w\.]*(youtube.com/watch\S*v=|youtu.be/)([\w-]+)')
+r_video_id = re.compile(r'^[\w-]{11}$')
+VIDEO_TTL = 3600
+BATCH_SIZE = 50
+BATCH_WINDOW = 0.05
+MAX_CACHED = 4096
+ERROR_TTL = 60
+SEARCH_COST = 100
+PACIFIC = zoneinfo.ZoneInfo('America/Los_Angeles')
+
+
+class VideoService(object):
+    """
+    Video metadata from videos.list, cached for VIDEO_TTL seconds. IDs
+    asked for at about the same time, by commands or by links pasted in
+    a channel, go out together: the first caller waits BATCH_WINDOW
+    seconds for company and then fetches up to BATCH_SIZE IDs per call
+    for everyone. Quota units spent are counted per (Pacific) day, the
+    way YouTube counts them.
+    """
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.cache = collections.OrderedDict()
+        self.pending = collections.OrderedDict()
+        self.errors = collections.OrderedDict()
+        self.fetching = False
+        self.quota = dict()
+        self.calls = 0
+        self.hits = 0
+        self.misses = 0
+
+    def charge(self, units):
+        day = datetime.datetime.now(PACIFIC).date().isoformat()
+        with self.cond:
+            self.quota = {day: self.quota.get(day, 0) + units}
+            self.calls += 1
+
+    def cached(self, vid_id):
+        entry = self.cache.get(vid_id)
+        if entry is not None and entry[0] > time.time():
+            return entry
+        return None
+
+    def get(self, key, ids):
+        """Return {id: item} for `ids`, where item is the videos.list
+        resource or None if YouTube doesn't know the video."""
+        ids = list(dict.fromkeys(ids))
+        with self.cond:
+            for vid_id in ids:
+                if self.cached(vid_id) is not None:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+                    self.errors.pop(vid_id, None)
+                    self.pending[vid_id] = key
+            lead = self.pending and not self.fetching
+            if lead:
+                self.fetching = True
+        if lead:
+            self.fetch_pending()
+        with self.cond:
+            while True:
+                for vid_id in ids:
+                    if vid_id in self.errors:
+                        raise self.errors[vid_id][1]
+                if all(self.cached(vid_id) is not None for vid_id in ids):
+                    return dict((vid_id, self.cached(vid_id)[1]) for vid_id in ids)
+                self.cond.wait()
+
+    def fetch_pending(self):
+        time.sleep(BATCH_WINDOW)
+        while True:
+            with self.cond:
+                batch = list(self.pending.items())[:BATCH_SIZE]
+                if not batch:
+                    self.fetching = False
+                    self.cond.notify_all()
+                    return
+                for vid_id, key in batch:
+                    del self.pending[vid_id]
+            ids = [vid_id for vid_id, key in batch]
+            try:
+                found = self.fetch(batch[0][1], ids)
+            except Exception as e:
+                now = time.time()
+                with self.cond:
+                    for vid_id in ids:
+                        self.errors[vid_id] = (now, e)
+                        self.errors.move_to_end(vid_id)
+                    # Errors are only kept for the callers waiting on them,
+                    # drop the ones nobody came back for
+                    while self.errors and (len(self.errors) > MAX_CACHED or
+                                           next(iter(self.errors.values()))[0] < now - ERROR_TTL):
+                        self.errors.popitem(last=False)
+                    self.cond.notify_all()
+                continue
+            expires = time.time() + VIDEO_TTL
+            with self.cond:
+                for vid_id in ids:
+                    self.cache[vid_id] = (expires, found.get(vid_id))
+                    self.cache.move_to_end(vid_id)
+                while len(self.cache) > MAX_CACHED:
+                    self.cache.popitem(last=False)
+                self.cond.notify_all()
+
+    def fetch(self, key, ids):
+        query = web.urlencode({'part': 'snippet,contentDetails,statistics',
+                               'id': ','.join(ids), 'key': key})
+        result = json.loads(web.get(BASE_URL + 'videos?' + query, use_cache=False))
+        self.charge(1)
+        return dict((item['id'], item) for item in result.get('items', ()))
+
+    def stats(self):
+        day = datetime.datetime.now(PACIFIC).date().isoformat()
+        with self.cond:
+            return {'quota': self.quota.get(day, 0), 'calls': self.calls, 'hits': self.hits,
+                    'misses': self.misses, 'cached': len(self.cache)}
+
+
+videos = VideoService()
 
 
 def colorize(text):
@@ -20,9 +145,9 @@ def ytsearch(kenni, trigger):
         return kenni.say('Please sign up for a Google Developer API key to use this function.')
     key = kenni.config.google_dev_apikey
 
-    query = trigger.group(2).strip().replace(" ","%20")
-    uri = BASE_URL + "search?part=snippet&type=video&q=" + query + "&key=" + key
-    result = json.loads(web.get(uri).decode('utf-8'))
+    query = web.urlencode({'part': 'snippet', 'type': 'video', 'q': trigger.group(2).strip(), 'key': key})
+    result = json.loads(web.get(BASE_URL + "search?" + query).decode('utf-8'))
+    videos.charge(SEARCH_COST)
 
     num_results = result['pageInfo']['totalResults']
     entry_text = []
@@ -75,27 +200,36 @@ youtube_search.rate = 10
 
 
 def ytinfo(kenni, input):
-    video_entry = ytget(kenni, input)
+    if not hasattr(kenni.config, 'google_dev_apikey'):
+        return kenni.say('Please sign up for a Google Developer API key to use this function.')
 
-    title = video_entry['title']
-    if len(title) > 50:
-        title = title[:50] + ' ...'
-    title = colorize(title)
+    ids = video_ids(input.group(2)) or [input.group(2).strip()]
+    found = videos.get(kenni.config.google_dev_apikey, ids[:BATCH_SIZE])
+    for vid_id in ids[:BATCH_SIZE]:
+        if found[vid_id] is None:
+            kenni.say('Video %s not found through the YouTube API.' % vid_id)
+            continue
+        video_entry = parse_video(vid_id, found[vid_id])
+
+        title = video_entry['title']
+        if len(title) > 50:
+            title = title[:50] + ' ...'
+        title = colorize(title)
 
-    link = video_entry['link']
-    author = video_entry['uploader']
-    description = video_entry["description"]
+        link = video_entry['link']
+        author = video_entry['uploader']
+        description = video_entry["description"]
 
-    if len(description) > 75:
-        description = description[:75] + ' ...'
+        if len(description) > 75:
+            description = description[:75] + ' ...'
 
-    duration = video_entry["length"]
-    favorites = video_entry["favourites"]
-    views = video_entry["views"]
+        duration = video_entry["length"]
+        favorites = video_entry["favourites"]
+        views = video_entry["views"]
 
-    entry_text = "{0} by {1} ({2}). Description: {3}; Duration: {4}; Favorites: {5}; Views: {6}".format(title, author, link, description, duration, favorites, views)
+        entry_text = "{0} by {1} ({2}). Description: {3}; Duration: {4}; Favorites: {5}; Views: {6}".format(title, author, link, description, duration, favorites, views)
 
-    kenni.say(entry_text)
+        kenni.say(entry_text)
 
 
 def youtube_info(kenni, input):
@@ -146,10 +280,16 @@ def title(kenni, match):
         return
 
     video_info = ytget(kenni, match)
-    if video_info is 'err':
+    if video_info == 'err':
         return
 
-    #combine variables and print
+    kenni.say(format_title(video_info))
+
+    return True
+
+
+def format_title(video_info):
+    #combine variables
     message = '[YouTube] Title: ' + process_title(video_info['title']) + \
               ' | Uploader: ' + video_info['uploader'] + \
               ' | Uploaded: ' + video_info['uploaded'] + \
@@ -160,9 +300,7 @@ def title(kenni, match):
               ' | Dislikes: ' + video_info['dislikes'] + \
               ' | Link: ' + video_info['link']
 
-    kenni.say(HTMLParser().unescape(message))
-
-    return True
+    return html.unescape(message)
 
 
 def ytget(kenni, trigger):
@@ -172,11 +310,7 @@ def ytget(kenni, trigger):
     key = kenni.config.google_dev_apikey
 
     try:
-        vid_id = trigger.group(2)
-        uri = BASE_URL + "videos?part=snippet,contentDetails,statistics&id=" + vid_id + "&key=" + key
-        bytes = web.get(uri)
-        result = json.loads(bytes)
-        video_entry = result['items'][0]
+        return fetch_video(key, trigger.group(2))
     except IndexError:
         kenni.say('Video not found through the YouTube API.')
         return 'err'
@@ -185,6 +319,27 @@ def ytget(kenni, trigger):
         traceback.print_exc()
         return 'err'
 
+
+def video_ids(text):
+    """The video IDs in `text`, given bare or as links."""
+    ids = list()
+    for word in text.split():
+        match = yt_catch.match(word)
+        if match:
+            ids.append(match.group(2))
+        elif r_video_id.match(word):
+            ids.append(word)
+    return ids
+
+
+def fetch_video(key, vid_id):
+    video_entry = videos.get(key, [vid_id])[vid_id]
+    if video_entry is None:
+        raise IndexError(vid_id)
+    return parse_video(vid_id, video_entry)
+
+
+def parse_video(vid_id, video_entry):
     vid_info = {}
     vid_info['link'] = 'https://youtu.be/' + vid_id
 
@@ -268,12 +423,36 @@ def ytget(kenni, trigger):
     return vid_info
 
 
+def preview(kenni, url, match):
+    """Link preview for YouTube videos, see url.PreviewPipeline"""
+    if not hasattr(kenni.config, 'google_dev_apikey'):
+        return None
+    try:
+        return format_title(fetch_video(kenni.config.google_dev_apikey, match.group(2)))
+    except Exception:
+        traceback.print_exc()
+        return None
+
+
+def setup(kenni):
+    kenni.previewers['youtube'] = (yt_catch, preview)
+
+
 def yt_title(kenni, trigger):
-    yt_catch = re.compile('http[s]*:\/\/[w\.]*(youtube.com/watch\S*v=|youtu.be/)([\w-]+)')
     yt_match = yt_catch.match(trigger.group(2))
     title(kenni, yt_match)
 yt_title.commands = ['ytitle']
 
 
+def yt_quota(kenni, input):
+    """Shows the YouTube API quota used today and the metadata cache hits."""
+    if not input.admin:
+        return
+    stats = videos.stats()
+    kenni.say('YouTube API: %d quota units today in %d calls; videos cached: %d, hits: %d, misses: %d' % (
+        stats['quota'], stats['calls'], stats['cached'], stats['hits'], stats['misses']))
+yt_quota.commands = ['ytquota']
+
+
 if __name__ == '__main__':
     print(__doc__.strip())
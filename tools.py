@@ -1,4 +1,11 @@
 #!/usr/bin/env python3
+import os
+import random
+import re
+import threading
+from array import array
+from functools import lru_cache
+
 charlimit = 450
 def isChan(chan, checkprefix):
     if not chan:
@@ -10,6 +17,161 @@ def isChan(chan, checkprefix):
     else:
         return False
 
+@lru_cache(maxsize=256)
+def wildcard_re(pattern):
+    '''Compile an IRC style wildcard pattern (* and ?) to a regexp.'''
+    pattern = re.escape(pattern.lower()).replace(r'\*', '.*').replace(r'\?', '.')
+    return re.compile(pattern + r'\Z', re.S)
+
+def wildcard_match(pattern, text):
+    return wildcard_re(pattern).match(text.lower()) is not None
+
+class MaskList(object):
+    '''
+    One channel list mode (bans, quiets, exceptions...). Entries are kept
+    in a dict keyed on the lowercased mask, and additionally indexed on
+    their host part so the masks covering a given user can be found
+    without testing every entry.
+    '''
+    def __init__(self):
+        self.entries = dict()
+        self.by_host = dict()
+        self.wild = set()
+        self.complete = False
+        self.lock = threading.Lock()
+
+    def _host(self, key):
+        if '!' not in key or '@' not in key:
+            return None
+        host = key.rsplit('@', 1)[1]
+        if '*' in host or '?' in host:
+            return None
+        return host
+
+    def add(self, mask, setter=None, set_at=None):
+        key = mask.lower()
+        with self.lock:
+            self.entries[key] = (mask, setter, set_at)
+            host = self._host(key)
+            if host is None:
+                self.wild.add(key)
+            else:
+                self.by_host.setdefault(host, set()).add(key)
+
+    def remove(self, mask):
+        key = mask.lower()
+        with self.lock:
+            if self.entries.pop(key, None) is None:
+                return False
+            host = self._host(key)
+            if host is None:
+                self.wild.discard(key)
+            else:
+                self.by_host[host].discard(key)
+                if not self.by_host[host]:
+                    del self.by_host[host]
+        return True
+
+    def __contains__(self, mask):
+        return mask.lower() in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def find(self, pattern):
+        '''Return the masks in the list matched by the wildcard `pattern`.'''
+        regexp = wildcard_re(pattern)
+        with self.lock:
+            return [self.entries[key][0] for key in self.entries if regexp.match(key)]
+
+    def covering(self, hostmask):
+        '''Return the masks in the list that apply to `hostmask`
+        (nick!user@host).'''
+        hostmask = hostmask.lower()
+        host = hostmask.rsplit('@', 1)[-1]
+        with self.lock:
+            candidates = self.by_host.get(host, set()) | self.wild
+            return [self.entries[key][0] for key in candidates if wildcard_re(key).match(hostmask)]
+
+class Corpus(object):
+    '''
+    A file with one response per line (insults and the like). Only the
+    byte offsets of the non-blank lines are kept in memory, so picking a
+    random line is one seek and one readline however large the file is.
+    The offsets are rebuilt when the file's mtime or size changes behind
+    our back; appends made through add() just extend them.
+    '''
+    def __init__(self, path):
+        self.path = path
+        self.offsets = array('Q')
+        self.signature = None
+        self.newline = True
+        self.lock = threading.Lock()
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _refresh(self):
+        signature = self._stat()
+        if signature == self.signature:
+            return
+        offsets = array('Q')
+        pos, line = 0, b'\n'
+        if signature is not None:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        offsets.append(pos)
+                    pos += len(line)
+        self.offsets = offsets
+        self.newline = line.endswith(b'\n')
+        self.signature = signature
+
+    def __len__(self):
+        with self.lock:
+            self._refresh()
+            return len(self.offsets)
+
+    def choice(self):
+        '''Return a random line, or None if there are none.'''
+        with self.lock:
+            self._refresh()
+            if not self.offsets:
+                return None
+            with open(self.path, 'rb') as f:
+                f.seek(self.offsets[random.randrange(len(self.offsets))])
+                line = f.readline()
+        return line.decode('utf-8', 'replace').strip()
 
+    def add(self, *lines):
+        '''Append `lines` to the file.'''
+        lines = [line.strip() for line in lines if line.strip()]
+        with self.lock:
+            self._refresh()
+            with open(self.path, 'ab') as f:
+                pos = f.tell()
+                if not self.newline:
+                    f.write(b'\n')
+                    pos += 1
+                for line in lines:
+                    self.offsets.append(pos)
+                    data = line.encode('utf-8') + b'\n'
+                    f.write(data)
+                    pos += len(data)
+            self.newline = True
+            self.signature = self._stat()
 
+corpora = dict()
+corpora_lock = threading.Lock()
 
+def corpus(path):
+    '''Return the shared Corpus for `path`.'''
+    path = os.path.abspath(os.path.expanduser(path))
+    with corpora_lock:
+        if path not in corpora:
+            corpora[path] = Corpus(path)
+        return corpora[path]
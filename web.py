@@ -3,11 +3,66 @@ import re
 import urllib
 from html.entities import name2codepoint
 from modules import unicode as uc
-import urllib.request
+import urllib.request, urllib.error, urllib.parse
+import asyncio
+import base64
+import collections
+import email.parser
+import email.utils
+import hashlib
+import http.client
+import json
+import os
+import socket
+import sqlite3
+import ssl
 import sys
+import threading
+import time
+import zlib
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 r_entity = re.compile(r'&([^;\s]+);')
 
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.71 Safari/537.36'
+# Seconds to wait on connecting or reading, unless a call asks otherwise
+DEFAULT_TIMEOUT = 20
+MAX_PER_HOST = 4
+MAX_REDIRECTS = 10
+# Size bounds of the in-memory response cache
+CACHE_MAX_BYTES = 16 * 1024 * 1024
+CACHE_MAX_ENTRY = 2 * 1024 * 1024
+# A host whose requests fail BREAKER_FAILURES times in a row isn't
+# contacted for BREAKER_COOLDOWN seconds, doubling up to
+# BREAKER_MAX_COOLDOWN while it stays down. Past MAX_PER_HOST requests in
+# progress, at most HOST_QUEUE more may wait for a connection to a host.
+BREAKER_FAILURES = 5
+BREAKER_COOLDOWN = 30
+BREAKER_MAX_COOLDOWN = 600
+HOST_QUEUE = 8
+
+# Compressed responses are decoded as they are read, and refused if they
+# would decode to more than MAX_DECODED bytes
+MAX_DECODED = 32 * 1024 * 1024
+# Decompressors that can't cap their output are given this many compressed
+# bytes per call, and the pool reads bodies READ_SIZE bytes at a time
+FEED_SIZE = 64
+READ_SIZE = 64 * 1024
+# brotli 1.2 can stop decoding once it has produced a given amount
+BROTLI_LIMIT = brotli is not None and hasattr(brotli.Decompressor, 'can_accept_more_data')
+ENCODINGS = ['gzip', 'deflate'] + (['br'] if brotli else []) + (['zstd'] if zstandard else [])
+ACCEPT_ENCODING = ', '.join(ENCODINGS)
+
+# Characters left alone when quoting a URL that contains non-ASCII text
+SAFE_CHARS = "/%:@&=+$,;~!*'()?#[]"
+
 
 class Grab(urllib.request.URLopener):
     def __init__(self, *args):
@@ -18,56 +73,1169 @@ class Grab(urllib.request.URLopener):
         return urllib.addinfourl(fp, [headers, errcode], "http:" + url)
 urllib.request._urlopener = Grab()
 
-def get(uri):
+
+class ContentTooLarge(IOError):
+    '''Raised when a compressed response decodes to more than the
+    allowed size.'''
+
+
+class Decoder(object):
+    '''Incremental decoder for a Content-Encoding that refuses to produce
+    more than `limit` bytes, so a small compressed "bomb" can't exhaust
+    memory.'''
+    def __init__(self, encoding, limit=MAX_DECODED):
+        self.encoding = encoding
+        self.limit = limit
+        self.size = 0
+        self.obj = None
+        if encoding in ('gzip', 'x-gzip'):
+            self.obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == 'br':
+            self.obj = brotli.Decompressor()
+        elif encoding == 'zstd':
+            self.obj = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, data):
+        if not data:
+            return b''
+        if self.obj is None:
+            # deflate should be zlib wrapped, but some servers send it raw
+            wrapped = len(data) >= 2 and data[0] & 0x0f == 8 and (data[0] << 8 | data[1]) % 31 == 0
+            self.obj = zlib.decompressobj(zlib.MAX_WBITS if wrapped else -zlib.MAX_WBITS)
+        # Each call may produce at most one byte more than the limit allows,
+        # which is enough to tell it's been exceeded
+        if self.encoding == 'br' and BROTLI_LIMIT:
+            return self.count(self.obj.process(data, output_buffer_limit=self.limit - self.size + 1))
+        if self.encoding in ('br', 'zstd'):
+            # These can't be told to stop, so feed them a little at a time
+            out = list()
+            for i in range(0, len(data), FEED_SIZE):
+                if self.encoding == 'br':
+                    out.append(self.count(self.obj.process(data[i:i + FEED_SIZE])))
+                else:
+                    out.append(self.count(self.obj.decompress(data[i:i + FEED_SIZE])))
+            return b''.join(out)
+        try:
+            return self.count(self.obj.decompress(data, self.limit - self.size + 1))
+        except zlib.error as e:
+            raise IOError('Bad %s data: %s' % (self.encoding, e))
+
+    def flush(self):
+        if self.obj is None or self.encoding in ('br', 'zstd'):
+            return b''
+        return self.count(self.obj.flush())
+
+    def count(self, out):
+        self.size += len(out)
+        if self.size > self.limit:
+            raise ContentTooLarge('Response decodes to more than %d bytes' % self.limit)
+        return out
+
+
+def decoder_for(headers):
+    '''Return a Decoder for the response with these headers, or None if it
+    isn't encoded or uses an encoding we don't know. The headers are
+    changed to describe the decoded body.'''
+    encoding = (headers.get('Content-Encoding') or '').strip().lower()
+    if encoding not in ENCODINGS and encoding != 'x-gzip':
+        return None
+    del headers['Content-Encoding']
+    del headers['Content-Length']
+    return Decoder(encoding)
+
+
+class Response(object):
+    '''A response handed out by the connection pool. Reading the body to
+    the end or closing the response gives the connection back to the pool
+    so the next request to that host can reuse it. A compressed body is
+    decoded as it's read.'''
+    def __init__(self, pool, key, conn, resp, url, method='GET'):
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._resp = resp
+        self.url = url
+        self.code = self.status = resp.status
+        self.reason = resp.reason
+        self.headers = resp.msg
+        self._decoder = decoder_for(self.headers) if method != 'HEAD' else None
+        self._buffer = b''
+
+    def geturl(self):
+        return self.url
+
+    def info(self):
+        return self.headers
+
+    def read(self, amt=None):
+        if self._decoder is None:
+            return self._read(amt)
+        while self._conn is not None and (amt is None or len(self._buffer) < amt):
+            data = self._read(None if amt is None else max(amt, 8192))
+            try:
+                self._buffer += self._decoder.decompress(data)
+                if self._conn is None:
+                    self._buffer += self._decoder.flush()
+            except:
+                self._release(False)
+                raise
+        if amt is None:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def _read(self, amt):
+        if self._conn is None:
+            return b''
+        try:
+            data = self._resp.read() if amt is None else self._resp.read(amt)
+        except:
+            self._release(False)
+            raise
+        if self._resp.isclosed():
+            self._release(True)
+        return data
+
+    def close(self):
+        # A body we haven't read yet leaves the connection unusable
+        self._release(self._resp.isclosed())
+
+    def _release(self, reuse):
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._pool.release(self._key, conn, reuse and not self._resp.will_close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class PoolBusy(socket.timeout):
+    '''Raised when no connection to a host came free in time. That's our
+    own contention, so it doesn't count against the host's health.'''
+
+
+class ConnectionPool(object):
+    '''Keeps HTTP/1.1 connections open per (scheme, host, port) so that
+    repeated requests to the same site skip the DNS, TCP and TLS setup.'''
+    def __init__(self, max_per_host=4, idle_timeout=60):
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self.lock = threading.Lock()
+        self.idle = dict()
+        self.slots = dict()
+        self.context = ssl.create_default_context()
+
+    def _slot(self, key):
+        with self.lock:
+            if key not in self.slots:
+                self.slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            return self.slots[key]
+
+    def acquire(self, key, timeout):
+        '''Return (connection, reused) for `key`, waiting at most `timeout`
+        seconds if max_per_host connections to it are already busy.'''
+        if not self._slot(key).acquire(timeout=timeout):
+            raise PoolBusy('Too many connections to %s' % key[1])
+        now = time.time()
+        with self.lock:
+            idle = self.idle.get(key, [])
+            while idle:
+                conn, released = idle.pop()
+                if now - released < self.idle_timeout:
+                    return conn, True
+                conn.close()
+        scheme, host, port = key
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=self.context)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        return conn, False
+
+    def release(self, key, conn, reuse=True):
+        if reuse:
+            with self.lock:
+                self.idle.setdefault(key, []).append((conn, time.time()))
+        else:
+            conn.close()
+        self._slot(key).release()
+
+    def clear(self):
+        with self.lock:
+            for key in self.idle:
+                for conn, released in self.idle[key]:
+                    conn.close()
+            self.idle.clear()
+
+    def urlopen(self, method, uri, body=None, headers=None, timeout=None):
+        '''Send a single request, without following redirects.'''
+        parts = urllib.parse.urlsplit(uri)
+        scheme = parts.scheme.lower()
+        if scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError('Unsupported URL: %r' % uri)
+        host = parts.hostname.encode('idna').decode('ascii')
+        port = parts.port or (443 if scheme == 'https' else 80)
+        path = urllib.parse.quote(parts.path or '/', safe=SAFE_CHARS)
+        if parts.query:
+            path += '?' + urllib.parse.quote(parts.query, safe=SAFE_CHARS)
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT
+
+        all_headers = {'User-Agent': USER_AGENT, 'Accept': '*/*', 'Accept-Encoding': ACCEPT_ENCODING}
+        all_headers.update(headers or {})
+
+        key = (scheme, host, port)
+        for attempt in (1, 2):
+            conn, reused = self.acquire(key, timeout)
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            try:
+                conn.request(method, path, body, all_headers)
+                resp = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    BrokenPipeError, http.client.BadStatusLine):
+                self.release(key, conn, False)
+                # The server may have dropped an idle connection, retry
+                # once on a fresh one
+                if reused and attempt == 1:
+                    continue
+                raise
+            except:
+                self.release(key, conn, False)
+                raise
+            if method == 'HEAD':
+                resp.read()
+            return Response(self, key, conn, resp, uri, method)
+
+
+pool = ConnectionPool(MAX_PER_HOST)
+
+
+class HostUnavailable(IOError):
+    '''Raised instead of contacting a host that keeps failing or already
+    has too many requests outstanding.'''
+
+
+class HostHealth(object):
+    def __init__(self):
+        self.failures = 0
+        self.opened = None
+        self.cooldown = BREAKER_COOLDOWN
+        self.trial = False
+        self.outstanding = 0
+        self.requests = 0
+        self.errors = 0
+        self.error_rate = 0.0
+        self.latency = None
+
+
+class CircuitBreaker(object):
+    '''Tracks the error rate and latency of every host and keeps a dead
+    or overloaded one from tying up the threads and tasks calling it.
+
+    After `failures` failed requests in a row (connection errors, timeouts,
+    5xx and 429 responses) the host's circuit opens and requests to it
+    raise HostUnavailable at once. When the cooldown has passed a single
+    request is let through: if it succeeds the circuit closes, if not it
+    opens again for twice as long. Independently, requests to a host are
+    refused while `max_outstanding` are already in progress.'''
+    def __init__(self, failures=BREAKER_FAILURES, cooldown=BREAKER_COOLDOWN,
+                 max_cooldown=BREAKER_MAX_COOLDOWN, max_outstanding=MAX_PER_HOST + HOST_QUEUE):
+        self.failures = failures
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_outstanding = max_outstanding
+        self.lock = threading.Lock()
+        self.hosts = dict()
+
+    def admit(self, host):
+        '''Count a request to `host` as outstanding, or raise
+        HostUnavailable. Every admitted request must be passed to done().'''
+        now = time.time()
+        with self.lock:
+            health = self.hosts.get(host)
+            if health is None:
+                health = self.hosts[host] = HostHealth()
+            if health.opened is not None:
+                wait = health.opened + health.cooldown - now
+                if wait > 0 or health.trial:
+                    raise HostUnavailable('%s is not responding, trying again in %d seconds'
+                                          % (host, max(wait, 1)))
+            if health.outstanding >= self.max_outstanding:
+                raise HostUnavailable('Too many requests to %s in progress' % host)
+            if health.opened is not None:
+                health.trial = True
+            health.outstanding += 1
+
+    def done(self, host, ok, elapsed=None):
+        '''Record how an admitted request went. `ok` is None for requests
+        that ended for reasons that say nothing about the host, such as
+        cancellation.'''
+        now = time.time()
+        with self.lock:
+            health = self.hosts[host]
+            health.outstanding -= 1
+            trial, health.trial = health.trial, False
+            if ok is None:
+                return
+            health.requests += 1
+            health.error_rate = 0.9 * health.error_rate + (0 if ok else 0.1)
+            if ok:
+                if elapsed is not None:
+                    if health.latency is None:
+                        health.latency = elapsed
+                    else:
+                        health.latency = 0.8 * health.latency + 0.2 * elapsed
+                health.failures = 0
+                health.opened = None
+                health.cooldown = self.cooldown
+                return
+            health.errors += 1
+            health.failures += 1
+            if trial:
+                health.cooldown = min(health.cooldown * 2, self.max_cooldown)
+                health.opened = now
+            elif health.opened is None and health.failures >= self.failures:
+                health.opened = now
+
+    def stats(self):
+        '''Return {host: {'state', 'requests', 'errors', 'error_rate',
+        'latency', 'outstanding'}}. error_rate and latency (in seconds)
+        are moving averages over recent requests.'''
+        now = time.time()
+        out = dict()
+        with self.lock:
+            for host, health in self.hosts.items():
+                if health.opened is None:
+                    state = 'closed'
+                elif health.opened + health.cooldown > now and not health.trial:
+                    state = 'open'
+                else:
+                    state = 'half-open'
+                out[host] = {'state': state, 'requests': health.requests,
+                             'errors': health.errors, 'error_rate': health.error_rate,
+                             'latency': health.latency, 'outstanding': health.outstanding}
+        return out
+
+    def reset(self, host=None):
+        with self.lock:
+            for name, health in self.hosts.items():
+                if host is None or name == host:
+                    health.failures = 0
+                    health.opened = None
+                    health.cooldown = self.cooldown
+
+
+breakers = CircuitBreaker()
+
+
+def healthy(code):
+    return code < 500 and code != 429
+
+
+def request(uri, method='GET', data=None, headers=None, timeout=None, redirects=MAX_REDIRECTS):
+    '''Send a request through the shared connection pool, following
+    redirects, and return a Response. The caller has to read() the body to
+    the end or close() the response (it's also a context manager).
+    `timeout` is in seconds and defaults to DEFAULT_TIMEOUT. Raises
+    HostUnavailable if the circuit breaker is holding requests back.'''
+    while True:
+        host = transport is None and urllib.parse.urlsplit(uri).hostname
+        if host:
+            breakers.admit(host)
+        ok = None
+        started = time.time()
+        try:
+            if transport is not None:
+                u = transport.urlopen(method, uri, data, headers, timeout)
+            else:
+                u = pool.urlopen(method, uri, data, headers, timeout)
+            ok = healthy(u.code)
+        except PoolBusy:
+            raise
+        except (OSError, http.client.HTTPException):
+            ok = False
+            raise
+        finally:
+            if host:
+                breakers.done(host, ok, time.time() - started)
+        location = u.headers.get('Location')
+        if u.code not in (301, 302, 303, 307, 308) or not location or redirects <= 0:
+            return u
+        # Drain small bodies so the connection can be reused
+        length = u.headers.get('Content-Length')
+        if length and length.isdigit() and int(length) <= 65536:
+            u.read()
+        u.close()
+        redirects -= 1
+        uri = urllib.parse.urljoin(uri, location)
+        if u.code == 303 or (u.code in (301, 302) and method == 'POST'):
+            method, data = 'GET', None
+
+
+def check_status(u):
+    if u.code >= 400:
+        if hasattr(u, 'close'):
+            u.close()
+        raise urllib.error.HTTPError(u.url, u.code, u.reason, u.headers, None)
+
+
+class CacheEntry(object):
+    def __init__(self, url, headers, body, expires, stored=None):
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.expires = expires
+        self.stored = stored or time.time()
+
+    def header(self, name):
+        name = name.lower()
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+
+class ResponseCache(object):
+    '''Two tier cache for GET responses: an LRU in memory bounded by
+    the total size of the bodies, backed by an optional SQLite file.
+    Responses are kept for as long as Cache-Control/Expires allow (or for
+    the ttl a caller asks for), and entries with an ETag or Last-Modified
+    are revalidated with a conditional request once they go stale.'''
+    def __init__(self, max_bytes=CACHE_MAX_BYTES, max_entry=CACHE_MAX_ENTRY):
+        self.max_bytes = max_bytes
+        self.max_entry = max_entry
+        self.size = 0
+        self.entries = collections.OrderedDict()
+        self.lock = threading.RLock()
+        self.db = None
+        self.metrics = dict()
+
+    def open_disk(self, path, max_age=7 * 86400):
+        '''Also keep responses in the SQLite database at `path`. Entries
+        stored more than `max_age` seconds ago are dropped.'''
+        with self.lock:
+            db = sqlite3.connect(path, check_same_thread=False)
+            db.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, '
+                       'url TEXT, headers TEXT, body BLOB, expires REAL, stored REAL)')
+            db.execute('DELETE FROM responses WHERE stored < ?', (time.time() - max_age,))
+            db.commit()
+            self.db = db
+
+    def count(self, host, name, amount=1):
+        with self.lock:
+            if host not in self.metrics:
+                self.metrics[host] = {'hits': 0, 'misses': 0, 'revalidated': 0,
+                                      'stale': 0, 'bytes': 0}
+            self.metrics[host][name] += amount
+
+    def stats(self):
+        '''Return {host: {'hits', 'misses', 'revalidated', 'stale', 'bytes'}}
+        where stale counts expired entries served because the host was
+        unavailable, and bytes is the amount served from the cache instead
+        of the network.'''
+        with self.lock:
+            return dict((host, dict(counts)) for host, counts in self.metrics.items())
+
+    def peek(self, key):
+        '''Return the entry for `key` if it's in memory, without going
+        to the disk.'''
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                return entry
+            if self.db is None:
+                return None
+            row = self.db.execute('SELECT url, headers, body, expires, stored FROM responses WHERE key = ?',
+                                  (self._disk_key(key),)).fetchone()
+        if row is None:
+            return None
+        entry = CacheEntry(row[0], [tuple(h) for h in json.loads(row[1])], row[2], row[3], row[4])
+        self._remember(key, entry)
+        return entry
+
+    def put(self, key, entry):
+        self._remember(key, entry)
+        with self.lock:
+            if self.db is not None:
+                self.db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                                (self._disk_key(key), entry.url, json.dumps(entry.headers),
+                                 entry.body, entry.expires, entry.stored))
+                self.db.commit()
+
+    def _remember(self, key, entry):
+        with self.lock:
+            # Drop what was there even if the new body is too big to keep,
+            # it's out of date
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old.body)
+            if len(entry.body) > self.max_entry:
+                return
+            self.entries[key] = entry
+            self.size += len(entry.body)
+            while self.size > self.max_bytes:
+                key, old = self.entries.popitem(last=False)
+                self.size -= len(old.body)
+
+    def _disk_key(self, key):
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+            if self.db is not None:
+                self.db.execute('DELETE FROM responses')
+                self.db.commit()
+
+
+cache = ResponseCache()
+
+
+def lifetime(headers, now):
+    '''How many seconds a response may be served from the cache, according
+    to its Cache-Control and Expires headers. None means don't store it.'''
+    directives = dict()
+    for part in (headers.get('Cache-Control') or '').split(','):
+        name, sep, value = part.strip().partition('=')
+        directives[name.lower()] = value.strip('"')
+    if 'no-store' in directives:
+        return None
+    if 'no-cache' in directives:
+        return 0
+    if 'max-age' in directives:
+        try: age = int(headers.get('Age') or 0)
+        except ValueError: age = 0
+        try: return max(0, int(directives['max-age']) - age)
+        except ValueError: return 0
+    if headers.get('Expires'):
+        try:
+            expires = email.utils.parsedate_to_datetime(headers['Expires']).timestamp()
+            date = headers.get('Date')
+            date = email.utils.parsedate_to_datetime(date).timestamp() if date else now
+        except (TypeError, ValueError):
+            return 0
+        return max(0, expires - date)
+    return 0
+
+
+class AsyncResponse(object):
+    '''A response from the coroutine API, with the whole body read. It can
+    also stand in for a Response, as replayed responses do.'''
+    def __init__(self, url, code, reason, headers, body):
+        self.url = url
+        self.code = self.status = code
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        self.pos = 0
+
+    def geturl(self):
+        return self.url
+
+    def getcode(self):
+        return self.code
+
+    def info(self):
+        return self.headers
+
+    def read(self, amt=None):
+        end = len(self.body) if amt is None else self.pos + amt
+        data = self.body[self.pos:end]
+        self.pos += len(data)
+        return data
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class AsyncConnectionPool(object):
+    '''The event loop side of ConnectionPool: keep-alive connections made
+    with asyncio streams, at most max_per_host busy per host.'''
+    def __init__(self, max_per_host=4, idle_timeout=60):
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self.idle = dict()
+        self.slots = dict()
+        self.context = ssl.create_default_context()
+
+    async def acquire(self, key, state=None):
+        '''Return (reader, writer, reused) for `key`. state['slot'] is set
+        once a connection slot is ours, so that a caller timing out can
+        tell waiting on our own pool from waiting on the host.'''
+        if key not in self.slots:
+            self.slots[key] = asyncio.Semaphore(self.max_per_host)
+        await self.slots[key].acquire()
+        if state is not None:
+            state['slot'] = True
+        now = time.time()
+        idle = self.idle.get(key, [])
+        while idle:
+            reader, writer, released = idle.pop()
+            if now - released < self.idle_timeout and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        scheme, host, port = key
+        try:
+            if scheme == 'https':
+                reader, writer = await asyncio.open_connection(host, port, ssl=self.context)
+            else:
+                reader, writer = await asyncio.open_connection(host, port)
+        except:
+            self.slots[key].release()
+            raise
+        return reader, writer, False
+
+    def release(self, key, reader, writer, reuse=True):
+        if reuse:
+            self.idle.setdefault(key, []).append((reader, writer, time.time()))
+        else:
+            writer.close()
+        self.slots[key].release()
+
+    async def urlopen(self, method, uri, body=None, headers=None, limit=None, state=None):
+        '''Send a single request, without following redirects, and read
+        the response. At most `limit` bytes of the body are read. `state`
+        is passed on to acquire().'''
+        parts = urllib.parse.urlsplit(uri)
+        scheme = parts.scheme.lower()
+        if scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError('Unsupported URL: %r' % uri)
+        host = parts.hostname.encode('idna').decode('ascii')
+        port = parts.port or (443 if scheme == 'https' else 80)
+        path = urllib.parse.quote(parts.path or '/', safe=SAFE_CHARS)
+        if parts.query:
+            path += '?' + urllib.parse.quote(parts.query, safe=SAFE_CHARS)
+
+        all_headers = {'User-Agent': USER_AGENT, 'Accept': '*/*', 'Accept-Encoding': ACCEPT_ENCODING}
+        all_headers.update(headers or {})
+        all_headers['Host'] = host if parts.port is None else '%s:%s' % (host, port)
+        if body is not None:
+            all_headers['Content-Length'] = str(len(body))
+        lines = ['%s %s HTTP/1.1' % (method, path)]
+        lines.extend('%s: %s' % item for item in all_headers.items())
+        data = ('\r\n'.join(lines) + '\r\n\r\n').encode('iso-8859-1') + (body or b'')
+
+        key = (scheme, host, port)
+        for attempt in (1, 2):
+            reader, writer, reused = await self.acquire(key, state)
+            try:
+                writer.write(data)
+                await writer.drain()
+                status_line = await reader.readline()
+                if not status_line and reused and attempt == 1:
+                    # The server dropped the idle connection, retry once
+                    self.release(key, reader, writer, False)
+                    continue
+                response, reuse = await self.read_response(reader, method, status_line, limit)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self.release(key, reader, writer, False)
+                if reused and attempt == 1:
+                    continue
+                raise
+            except BaseException:
+                # Also on cancellation: the connection is in an unknown state
+                self.release(key, reader, writer, False)
+                raise
+            self.release(key, reader, writer, reuse)
+            response.url = uri
+            return response
+
+    async def read_response(self, reader, method, status_line, limit):
+        try:
+            version, code, reason = status_line.decode('iso-8859-1').rstrip('\r\n').split(' ', 2)
+        except ValueError:
+            try:
+                version, code = status_line.decode('iso-8859-1').split()
+                reason = ''
+            except ValueError:
+                raise http.client.BadStatusLine(status_line)
+        code = int(code)
+
+        header_lines = list()
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            header_lines.append(line)
+        headers = email.parser.Parser(_class=http.client.HTTPMessage).parsestr(
+            b''.join(header_lines).decode('iso-8859-1'))
+
+        reuse = version == 'HTTP/1.1'
+        if (headers.get('Connection') or '').lower() == 'close':
+            reuse = False
+        elif (headers.get('Connection') or '').lower() == 'keep-alive':
+            reuse = True
+
+        # Read the length first, decoder_for() drops it
+        length = headers.get('Content-Length', '').strip()
+        decoder = decoder_for(headers) if method != 'HEAD' else None
+        parts = list()
+        size = 0
+
+        def feed(data):
+            # Decode as we go, so a bomb is refused before it's all in
+            # memory; returns whether we have `limit` bytes yet
+            nonlocal size
+            if decoder is not None:
+                data = decoder.decompress(data)
+            parts.append(data)
+            size += len(data)
+            return limit is not None and size >= limit
+
+        full = False
+        if method == 'HEAD' or code in (204, 304) or 100 <= code < 200:
+            pass
+        elif (headers.get('Transfer-Encoding') or '').lower() == 'chunked':
+            while True:
+                chunk_size = int((await reader.readline()).split(b';')[0].strip() or b'0', 16)
+                if chunk_size == 0:
+                    # Skip any trailers
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                while chunk_size > 0 and not full:
+                    data = await reader.readexactly(min(chunk_size, READ_SIZE))
+                    chunk_size -= len(data)
+                    full = feed(data)
+                if full:
+                    reuse = False
+                    break
+                await reader.readexactly(2)
+        elif length.isdigit():
+            length = int(length)
+            while length > 0 and not full:
+                data = await reader.readexactly(min(length, READ_SIZE))
+                length -= len(data)
+                full = feed(data)
+            if length:
+                reuse = False
+        else:
+            while not full:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    break
+                full = feed(data)
+            reuse = False
+        if decoder is not None and not full:
+            feed(decoder.flush())
+        body = b''.join(parts)
+        if limit is not None:
+            body = body[:limit]
+        return AsyncResponse(None, code, reason, headers, body), reuse
+
+
+apool = AsyncConnectionPool(MAX_PER_HOST)
+loop = None
+loop_thread = None
+loop_lock = threading.Lock()
+
+
+def get_loop():
+    '''Return the event loop the coroutine API runs on, starting it in a
+    background thread the first time.'''
+    global loop, loop_thread
+    with loop_lock:
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            loop_thread = threading.Thread(target=loop.run_forever, name='web event loop')
+            loop_thread.daemon = True
+            loop_thread.start()
+    return loop
+
+
+def run(coro, timeout=None):
+    '''Run a coroutine on the web event loop from an ordinary thread and
+    return its result. This is what the blocking get/head/post use.'''
+    if threading.current_thread() is loop_thread:
+        coro.close()
+        raise RuntimeError('Blocking web call made on the event loop, await the coroutine version instead')
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result(timeout)
+
+
+async def arequest(uri, method='GET', data=None, headers=None, timeout=None, redirects=MAX_REDIRECTS, limit=None):
+    '''Coroutine version of request(). Follows redirects and returns an
+    AsyncResponse with the body (or its first `limit` bytes) read.
+    `timeout` covers the whole exchange and defaults to DEFAULT_TIMEOUT.
+    Raises HostUnavailable if the circuit breaker is holding requests back.'''
+    if timeout is None:
+        timeout = DEFAULT_TIMEOUT
+
+    deadline = time.time() + timeout
+    while True:
+        host = transport is None and urllib.parse.urlsplit(uri).hostname
+        if host:
+            breakers.admit(host)
+        ok = None
+        started = time.time()
+        state = dict()
+        if transport is not None:
+            opening = transport.aurlopen(method, uri, data, headers, limit)
+            state['slot'] = True
+        else:
+            opening = apool.urlopen(method, uri, data, headers, limit, state)
+        try:
+            u = await asyncio.wait_for(opening, max(deadline - started, 0))
+            ok = healthy(u.code)
+        except asyncio.TimeoutError:
+            if not state.get('slot'):
+                raise PoolBusy('Too many connections to %s' % host)
+            ok = False
+            raise socket.timeout('Timed out fetching %s' % uri)
+        except (OSError, http.client.HTTPException):
+            ok = False
+            raise
+        finally:
+            if host:
+                breakers.done(host, ok, time.time() - started)
+        location = u.headers.get('Location')
+        if u.code not in (301, 302, 303, 307, 308) or not location or redirects <= 0:
+            return u
+        redirects -= 1
+        uri = urllib.parse.urljoin(uri, location)
+        if u.code == 303 or (u.code in (301, 302) and method == 'POST'):
+            method, data = 'GET', None
+
+
+def parse_headers(items):
+    return email.parser.Parser(_class=http.client.HTTPMessage).parsestr(
+        ''.join('%s: %s\r\n' % tuple(item) for item in items) + '\r\n')
+
+
+class FixtureStore(object):
+    '''Recorded responses, kept as one JSON file per request in the
+    directory `path`. Requests are told apart by method, URL and body;
+    request headers are ignored so that, say, conditional requests still
+    find their recording.'''
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        os.makedirs(self.path, exist_ok=True)
+
+    def filename(self, method, uri, body):
+        digest = hashlib.sha1(('%s %s\n' % (method, uri)).encode('utf-8') + (body or b''))
+        return os.path.join(self.path, digest.hexdigest() + '.json')
+
+    def load(self, method, uri, body=None):
+        try:
+            with open(self.filename(method, uri, body)) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        return AsyncResponse(data['url'], data['code'], data['reason'],
+                             parse_headers(data['headers']), base64.b64decode(data['body']))
+
+    def save(self, method, uri, body, response):
+        data = {'method': method, 'request': uri, 'url': response.url,
+                'code': response.code, 'reason': response.reason,
+                'headers': list(response.headers.items()),
+                'body': base64.b64encode(response.body).decode('ascii')}
+        with open(self.filename(method, uri, body), 'w') as f:
+            json.dump(data, f, indent=1)
+
+
+class ReplayTransport(object):
+    '''Answers every request from a FixtureStore instead of the network,
+    raising IOError for requests that weren't recorded. Each response is
+    delayed by `latency` seconds (or latency(uri) if it's a function) to
+    stand in for the network. The time spent waiting adds up in
+    `network`.'''
+    def __init__(self, store, latency=0):
+        self.store = store
+        self.latency = latency
+        self.network = 0.0
+        self.lock = threading.Lock()
+
+    def delay(self, uri):
+        return self.latency(uri) if callable(self.latency) else self.latency
+
+    def waited(self, started):
+        with self.lock:
+            self.network += time.time() - started
+
+    def fetch(self, method, uri, body, headers, timeout):
+        response = self.store.load(method, uri, body)
+        if response is None:
+            raise IOError('No recording of %s %s' % (method, uri))
+        return response
+
+    async def afetch(self, method, uri, body, headers):
+        return self.fetch(method, uri, body, headers, None)
+
+    def urlopen(self, method, uri, body=None, headers=None, timeout=None):
+        started = time.time()
+        time.sleep(self.delay(uri))
+        try:
+            return self.fetch(method, uri, body, headers, timeout)
+        finally:
+            self.waited(started)
+
+    async def aurlopen(self, method, uri, body=None, headers=None, limit=None):
+        started = time.time()
+        await asyncio.sleep(self.delay(uri))
+        try:
+            response = await self.afetch(method, uri, body, headers)
+        finally:
+            self.waited(started)
+        if limit is not None:
+            response.body = response.body[:limit]
+        return response
+
+
+class RecordTransport(ReplayTransport):
+    '''Makes requests over the network as usual and saves the responses
+    into a FixtureStore for ReplayTransport. With `overwrite` false,
+    requests that were recorded before are replayed instead.'''
+    def __init__(self, store, overwrite=False):
+        ReplayTransport.__init__(self, store)
+        self.overwrite = overwrite
+
+    def fetch(self, method, uri, body, headers, timeout):
+        response = None if self.overwrite else self.store.load(method, uri, body)
+        if response is None:
+            with pool.urlopen(method, uri, body, headers, timeout) as u:
+                response = AsyncResponse(uri, u.code, u.reason, u.headers, u.read())
+            self.store.save(method, uri, body, response)
+        return response
+
+    async def afetch(self, method, uri, body, headers):
+        response = None if self.overwrite else self.store.load(method, uri, body)
+        if response is None:
+            response = await apool.urlopen(method, uri, body, headers)
+            self.store.save(method, uri, body, response)
+        return response
+
+
+transport = None
+shimmed = dict()
+
+
+def set_transport(new):
+    '''Send all requests through `new` (a ReplayTransport or
+    RecordTransport), or back over the network if it's None. This covers
+    urllib.request.urlopen and, when it's installed, the requests library
+    too, for code that doesn't use this module.'''
+    global transport
+    transport = new
+    if new is not None and not shimmed:
+        shimmed['urlopen'] = urllib.request.urlopen
+        urllib.request.urlopen = shim_urlopen
+        try:
+            import requests.adapters
+        except ImportError:
+            pass
+        else:
+            shimmed['send'] = requests.adapters.HTTPAdapter.send
+            requests.adapters.HTTPAdapter.send = shim_send
+    elif new is None and shimmed:
+        urllib.request.urlopen = shimmed.pop('urlopen')
+        if 'send' in shimmed:
+            import requests.adapters
+            requests.adapters.HTTPAdapter.send = shimmed.pop('send')
+
+
+def shim_urlopen(url, data=None, timeout=None, **kwargs):
+    if isinstance(url, urllib.request.Request):
+        method, uri, headers = url.get_method(), url.full_url, dict(url.header_items())
+        data = url.data if data is None else data
+    else:
+        method, uri, headers = 'POST' if data is not None else 'GET', url, None
+    u = request(uri, method, data, headers, timeout)
+    check_status(u)
+    return u
+
+
+def shim_send(adapter, prepared, timeout=None, **kwargs):
+    import requests
+    body = prepared.body
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    if isinstance(timeout, tuple):
+        timeout = timeout[-1]
+    u = request(prepared.url, prepared.method, body, dict(prepared.headers), timeout, redirects=0)
+    response = requests.models.Response()
+    response.status_code = u.code
+    response.reason = u.reason
+    response.headers = requests.structures.CaseInsensitiveDict(u.headers.items())
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response._content = u.read()
+    response.url = u.url
+    response.request = prepared
+    response.connection = adapter
+    return response
+
+
+def cache_key(uri, headers):
+    key = uri
+    if headers:
+        key += '\n' + '\n'.join('%s: %s' % item for item in sorted(headers.items()))
+    return key
+
+
+def conditional_headers(entry, headers):
+    request_headers = dict(headers or {})
+    if entry is not None:
+        if entry.header('ETag'):
+            request_headers['If-None-Match'] = entry.header('ETag')
+        if entry.header('Last-Modified'):
+            request_headers['If-Modified-Since'] = entry.header('Last-Modified')
+    return request_headers
+
+
+def revalidated(key, entry, u, now, ttl):
+    '''Refresh a cache entry from a 304 response and return its body.'''
+    host = urllib.parse.urlsplit(entry.url).hostname
+    # Headers sent with a 304 update the stored ones
+    updated = dict((k.lower(), (k, v)) for k, v in entry.headers)
+    for k, v in u.headers.items():
+        updated[k.lower()] = (k, v)
+    entry.headers = list(updated.values())
+    fresh = lifetime(u.headers, now) if ttl is None else ttl
+    entry.expires = now + (fresh or 0)
+    cache.put(key, entry)
+    cache.count(host, 'revalidated')
+    cache.count(host, 'bytes', len(entry.body))
+    return entry.body
+
+
+def store(key, u, body, now, ttl):
+    cache.count(urllib.parse.urlsplit(u.url).hostname, 'misses')
+    fresh = lifetime(u.headers, now) if ttl is None else ttl
+    validators = u.headers.get('ETag') or u.headers.get('Last-Modified')
+    if u.code == 200 and fresh is not None and (fresh > 0 or validators):
+        cache.put(key, CacheEntry(u.url, list(u.headers.items()), body, now + fresh))
+
+
+async def off_loop(func, *args):
+    '''Call `func`, in a worker thread if the response cache has a disk
+    tier, so SQLite doesn't hold up the event loop.'''
+    if cache.db is None:
+        return func(*args)
+    return await asyncio.to_thread(func, *args)
+
+
+async def aget(uri, timeout=None, headers=None, ttl=None, use_cache=True, stale=False):
+    '''Coroutine version of get(). Responses are cached as described for
+    ResponseCache; `ttl` overrides the lifetime the server's headers give.
+    With `stale`, an expired response is returned when the circuit breaker
+    is holding requests to the host back, rather than HostUnavailable.'''
     if not uri.startswith('http'):
         return
-    req = urllib.request.Request(uri, headers={'Accept':'*/*'})
-    req.add_header('User-Agent', 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.71 Safari/537.36')
-    u = urllib.request.urlopen(req)
-    bytes = u.read()
-    u.close()
-    return bytes
+    if not use_cache:
+        u = await arequest(uri, headers=headers, timeout=timeout)
+        check_status(u)
+        return u.body
+
+    key = cache_key(uri, headers)
+    now = time.time()
+    entry = cache.peek(key)
+    if entry is None:
+        entry = await off_loop(cache.get, key)
+    if entry is not None and entry.expires > now:
+        host = urllib.parse.urlsplit(uri).hostname
+        cache.count(host, 'hits')
+        cache.count(host, 'bytes', len(entry.body))
+        return entry.body
+
+    try:
+        u = await arequest(uri, headers=conditional_headers(entry, headers), timeout=timeout)
+    except HostUnavailable:
+        # Better an old answer than none while the site is down
+        if entry is None or not stale:
+            raise
+        host = urllib.parse.urlsplit(uri).hostname
+        cache.count(host, 'stale')
+        cache.count(host, 'bytes', len(entry.body))
+        return entry.body
+    if u.code == 304 and entry is not None:
+        return await off_loop(revalidated, key, entry, u, now, ttl)
+    check_status(u)
+    await off_loop(store, key, u, u.body, now, ttl)
+    return u.body
 
 
-def head(uri):
+async def ahead(uri, timeout=None):
     if not uri.startswith('http'):
         return
-    u = urllib.request.urlopen(uri)
-    info = u.info()
-    u.close()
-    return info
+    u = await arequest(uri, method='HEAD', timeout=timeout)
+    check_status(u)
+    return u.info()
 
 
-def head_info(uri):
+async def ahead_info(uri, timeout=None):
     if not uri.startswith('http'):
         return
+    u = await arequest(uri, method='HEAD', timeout=timeout)
     output = dict()
-
-    u = urllib.request.urlopen(uri)
-    if hasattr(u, 'geturl'):
-        output['geturl'] = u.geturl()
-    if hasattr(u, 'code'):
-        output['code'] = u.code
-    if hasattr(u, 'url'):
-        output['url'] = u.url
-    if hasattr(u, 'headers'):
-        output['headers'] = u.headers
-    if hasattr(u, 'info'):
-        output['info'] = u.info()
-
-    u.close()
+    output['geturl'] = u.geturl()
+    output['code'] = u.code
+    output['url'] = u.url
+    output['headers'] = u.headers
+    output['info'] = u.info()
     return output
 
 
-def post(uri, query):
+async def apost(uri, query, timeout=None, headers=None):
     if not uri.startswith('http'):
         return
-    data = urllib.parse.urlencode(query)
-    u = urllib.request.urlopen(uri, data)
-    bytes = u.read()
-    u.close()
-    return bytes
+    data = urllib.parse.urlencode(query).encode('utf-8')
+    all_headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+    all_headers.update(headers or {})
+    u = await arequest(uri, 'POST', data, all_headers, timeout)
+    check_status(u)
+    return u.body
+
+
+def get(uri, timeout=None, headers=None, ttl=None, use_cache=True, stale=False):
+    return run(aget(uri, timeout, headers, ttl, use_cache, stale))
+
+
+def get_more(uri, timeout=None, headers=None, limit=262144):
+    '''Fetch up to `limit` bytes of `uri`, returns (code, info) where info
+    holds the decoded page and some details about the response.'''
+    with request(uri, headers=headers, timeout=timeout) as u:
+        contents = u.read(limit)
+    try:
+        con = contents.decode('utf-8')
+    except UnicodeDecodeError:
+        con = contents.decode('iso-8859-1')
+    out = dict()
+    out['code'] = u.code
+    out['read'] = con
+    out['geturl'] = u.geturl()
+    out['headers'] = u.headers
+    out['url'] = u.url
+    return out['code'], out
+
+
+def head(uri, timeout=None):
+    return run(ahead(uri, timeout))
+
+
+def head_info(uri, timeout=None):
+    return run(ahead_info(uri, timeout))
+
 
+def post(uri, query, timeout=None, headers=None):
+    return run(apost(uri, query, timeout, headers))
 
 
 def entity(match):
@@ -143,7 +1311,7 @@ def get_urllib_object(uri, timeout):
             try: info = info[0]
             except: pass
         if status.startswith('3'):
-            uri = urlparse.urljoin(uri, info['Location'])
+            uri = urllib.parse.urljoin(uri, info['Location'])
         else: break
         redirects += 1
         if redirects >= 50: